@@ -27,6 +27,7 @@ from gevent.hub import Hub
 from ..exceptions import HostArgumentException
 from ..constants import DEFAULT_RETRIES, RETRY_DELAY
 from ..output import HostOutput
+from ..retry import RetryPolicy
 
 
 Hub.NOT_ERROR = (Exception,)
@@ -46,7 +47,8 @@ class BaseParallelSSHClient(object):
                  allow_agent=True,
                  num_retries=DEFAULT_RETRIES,
                  timeout=120, pool_size=10,
-                 host_config=None, retry_delay=RETRY_DELAY):
+                 host_config=None, retry_delay=RETRY_DELAY,
+                 retry_policy=None):
         if isinstance(hosts, str) or isinstance(hosts, bytes):
             raise TypeError(
                 "Hosts must be list or other iterable, not string. "
@@ -59,12 +61,15 @@ class BaseParallelSSHClient(object):
         self.password = password
         self.port = port
         self.pkey = pkey
-        self.num_retries = num_retries
+        self.retry_policy = retry_policy if retry_policy is not None \
+            else RetryPolicy(num_retries=num_retries, retry_delay=retry_delay,
+                             backoff=1, max_delay=retry_delay, jitter=False)
+        self.num_retries = self.retry_policy.num_retries
         self.timeout = timeout
         # To hold host clients
         self.host_clients = {}
         self.host_config = host_config if host_config else {}
-        self.retry_delay = retry_delay
+        self.retry_delay = self.retry_policy.retry_delay
         self.cmds = None
 
     def run_command(self, command, user=None, stop_on_errors=True,
@@ -73,33 +78,45 @@ class BaseParallelSSHClient(object):
                     *args, **kwargs):
         greenlet_timeout = kwargs.pop('greenlet_timeout', None)
         output = {}
-        if host_args:
-            try:
-                cmds = [self.pool.spawn(self._run_command, host,
-                                        command % host_args[host_i],
-                                        user=user, encoding=encoding,
-                                        use_pty=use_pty, shell=shell,
-                                        *args, **kwargs)
-                        for host_i, host in enumerate(self.hosts)]
-            except IndexError:
-                raise HostArgumentException(
-                    "Number of host arguments provided does not match "
-                    "number of hosts ")
-        else:
-            cmds = [self.pool.spawn(
-                self._run_command, host, command,
-                user=user, encoding=encoding, use_pty=use_pty, shell=shell,
-                *args, **kwargs)
-                    for host in self.hosts]
+        cmds = [self.pool.spawn(self._run_command, host, _command,
+                                user=user, encoding=encoding,
+                                use_pty=use_pty, shell=shell,
+                                *args, **kwargs)
+                for host, _command in self._host_commands(command, host_args)]
         for cmd in cmds:
             try:
-                self.get_output(cmd, output, timeout=greenlet_timeout)
+                self.get_output(cmd, output, timeout=greenlet_timeout,
+                                encoding=encoding,
+                                output_mode=kwargs.get('output_mode'))
             except Exception:
                 if stop_on_errors:
                     raise
         self.cmds = cmds
         return output
 
+    def _host_args(self, host_args):
+        """Yield ``(host, host_arg)`` tuples for each host in ``self.hosts``.
+
+        Neither hosts nor ``host_args`` need to be indexable.
+
+        :raises: :py:class:`pssh.exceptions.HostArgumentException` on fewer
+          host arguments than hosts."""
+        host_args = iter(host_args)
+        for host in self.hosts:
+            try:
+                host_arg = next(host_args)
+            except StopIteration:
+                raise HostArgumentException(
+                    "Number of host arguments provided does not match "
+                    "number of hosts ")
+            yield host, host_arg
+
+    def _host_commands(self, command, host_args):
+        if host_args:
+            return ((host, command % host_arg)
+                    for host, host_arg in self._host_args(host_args))
+        return ((host, command) for host in self.hosts)
+
     def get_last_output(self, cmds=None):
         """Get output for last commands executed by ``run_command``
 
@@ -127,7 +144,8 @@ class BaseParallelSSHClient(object):
     def _run_command(self, host, command, *args, **kwargs):
         raise NotImplementedError
 
-    def get_output(self, cmd, output, timeout=None):
+    def get_output(self, cmd, output, timeout=None, encoding=None,
+                   output_mode=None):
         """Get output from command.
 
         :param cmd: Command to get output from
@@ -136,6 +154,12 @@ class BaseParallelSSHClient(object):
           :py:class:`pssh.output.HostOutput` values to be updated with output
           from cmd
         :type output: dict
+        :param encoding: (Optional) Encoding output generators were made with,
+          to record in host output.
+        :type encoding: str
+        :param output_mode: (Optional) Output mode output generators were
+          made with, to record in host output.
+        :type output_mode: str
         :rtype: None"""
         try:
             (channel, host, stdout, stderr, stdin) = cmd.get(timeout=timeout)
@@ -145,10 +169,12 @@ class BaseParallelSSHClient(object):
                 output, host, None, None, None, None, None, cmd, exception=ex)
             raise
         self._update_host_output(output, host, self._get_exit_code(channel),
-                                 channel, stdout, stderr, stdin, cmd)
+                                 channel, stdout, stderr, stdin, cmd,
+                                 encoding=encoding, output_mode=output_mode)
 
     def _update_host_output(self, output, host, exit_code, channel, stdout,
-                            stderr, stdin, cmd, exception=None):
+                            stderr, stdin, cmd, exception=None,
+                            encoding=None, output_mode=None):
         """Update host output with given data"""
         if host in output:
             new_host = "_".join([host,
@@ -159,7 +185,8 @@ class BaseParallelSSHClient(object):
                            "key for %s to %s", host, host, new_host)
             host = new_host
         output[host] = HostOutput(host, cmd, channel, stdout, stderr, stdin,
-                                  exit_code=exit_code, exception=exception)
+                                  exit_code=exit_code, exception=exception,
+                                  encoding=encoding, output_mode=output_mode)
 
     def join(self, output, consume_output=False):
         raise NotImplementedError
@@ -201,7 +228,8 @@ class BaseParallelSSHClient(object):
             return
         return self._get_exit_code(host_output.channel)
 
-    def copy_file(self, local_file, remote_file, recurse=False, copy_args=None):
+    def copy_file(self, local_file, remote_file, recurse=False, copy_args=None,
+                  **kwargs):
         """Copy local file to remote file in parallel
 
         This function returns a list of greenlets which can be
@@ -227,8 +255,11 @@ class BaseParallelSSHClient(object):
         :param copy_args: (Optional) format local_file and remote_file strings
           with per-host arguments in ``copy_args``. ``copy_args`` length must
           equal length of host list -
-          :py:class:`pssh.exceptions.HostArgumentException` is raised otherwise
-        :type copy_args: tuple or list
+          :py:class:`pssh.exceptions.HostArgumentException` is
+          raised otherwise. Hosts and ``copy_args`` may be any iterable,
+          including generators, but are consumed in full as one greenlet
+          per host is returned - memory use grows with number of hosts.
+        :type copy_args: iterable
 
         :rtype: List(:py:class:`gevent.Greenlet`) of greenlets for remote copy
           commands
@@ -247,27 +278,23 @@ class BaseParallelSSHClient(object):
 
         """
         if copy_args:
-            try:
-                return [self.pool.spawn(self._copy_file, host,
-                                        local_file % copy_args[host_i],
-                                        remote_file % copy_args[host_i],
-                                        {'recurse': recurse})
-                        for host_i, host in enumerate(self.hosts)]
-            except IndexError:
-                raise HostArgumentException(
-                    "Number of per-host copy arguments provided does not match "
-                    "number of hosts")
+            return [self.pool.spawn(self._copy_file, host,
+                                    local_file % copy_arg,
+                                    remote_file % copy_arg,
+                                    recurse=recurse, **kwargs)
+                    for host, copy_arg in self._host_args(copy_args)]
         else:
             return [self.pool.spawn(self._copy_file, host, local_file,
-                                    remote_file, {'recurse': recurse})
+                                    remote_file, recurse=recurse, **kwargs)
                     for host in self.hosts]
 
-    def _copy_file(self, host, local_file, remote_file, recurse=False):
+    def _copy_file(self, host, local_file, remote_file, recurse=False,
+                   **kwargs):
         """Make sftp client, copy file"""
         try:
             self._make_ssh_client(host)
             return self.host_clients[host].copy_file(local_file, remote_file,
-                                                     recurse=recurse)
+                                                     recurse=recurse, **kwargs)
         except Exception as ex:
             ex.host = host
             raise ex
@@ -311,8 +338,11 @@ class BaseParallelSSHClient(object):
         :param copy_args: (Optional) Format remote_file and local_file strings
           with per-host arguments in ``copy_args``. ``copy_args`` length must
           equal length of host list -
-          :py:class:`pssh.exceptions.HostArgumentException` is raised otherwise
-        :type copy_args: tuple or list
+          :py:class:`pssh.exceptions.HostArgumentException` is
+          raised otherwise. Hosts and ``copy_args`` may be any iterable,
+          including generators, but are consumed in full as one greenlet
+          per host is returned - memory use grows with number of hosts.
+        :type copy_args: iterable
         :rtype: list(:py:class:`gevent.Greenlet`) of greenlets for remote copy
           commands
         :raises: :py:class:`ValueError` when a directory is supplied to
@@ -332,16 +362,11 @@ class BaseParallelSSHClient(object):
 
         """
         if copy_args:
-            try:
-                return [self.pool.spawn(
-                    self._copy_remote_file, host,
-                    remote_file % copy_args[host_i],
-                    local_file % copy_args[host_i], recurse=recurse, **kwargs)
-                    for host_i, host in enumerate(self.hosts)]
-            except IndexError:
-                raise HostArgumentException(
-                    "Number of per-host copy arguments provided does not match "
-                    "number of hosts")
+            return [self.pool.spawn(
+                self._copy_remote_file, host,
+                remote_file % copy_arg,
+                local_file % copy_arg, recurse=recurse, **kwargs)
+                for host, copy_arg in self._host_args(copy_args)]
         else:
             return [self.pool.spawn(
                 self._copy_remote_file, host, remote_file,
@@ -56,7 +56,8 @@ class ParallelSSHClient(BaseParallelSSHClient):
                  timeout=120, pool_size=10, proxy_host=None, proxy_port=22,
                  proxy_user=None, proxy_password=None, proxy_pkey=None,
                  agent=None, allow_agent=True, host_config=None,
-                 channel_timeout=None, retry_delay=RETRY_DELAY):
+                 channel_timeout=None, retry_delay=RETRY_DELAY,
+                 retry_policy=None):
         """
         :param hosts: Hosts to connect to
         :type hosts: list(str)
@@ -77,12 +78,16 @@ class ParallelSSHClient(BaseParallelSSHClient):
         :param retry_delay: Number of seconds to wait between retries. Defaults
           to :py:class:`pssh.constants.RETRY_DELAY`
         :type retry_delay: int
+        :param retry_policy: (Optional) Policy for number of connection
+          attempts and delay between them, for example with exponential
+          backoff. Defaults to a fixed delay of ``retry_delay`` between
+          ``num_retries`` attempts. Overrides ``num_retries`` and
+          ``retry_delay`` if set.
+        :type retry_policy: :py:class:`pssh.retry.RetryPolicy`
         :param timeout: (Optional) Number of seconds to wait before connection
           and authentication attempt times out. Note that total time before
-          timeout will be
-          ``timeout`` * ``num_retries`` + (5 * (``num_retries``-1)) number of
-          seconds, where (5 * (``num_retries``-1)) refers to a five (5) second
-          delay between retries.
+          timeout will be up to ``timeout`` * ``num_retries`` plus delays
+          between retries as per ``retry_policy``.
         :type timeout: int
         :param forward_ssh_agent: (Optional) Turn on/off SSH agent forwarding -
           equivalent to `ssh -A` from the `ssh` command line utility.
@@ -127,7 +132,8 @@ class ParallelSSHClient(BaseParallelSSHClient):
             self, hosts, user=user, password=password, port=port, pkey=pkey,
             allow_agent=allow_agent, num_retries=num_retries,
             timeout=timeout, pool_size=pool_size,
-            host_config=host_config, retry_delay=retry_delay)
+            host_config=host_config, retry_delay=retry_delay,
+            retry_policy=retry_policy)
         self.forward_ssh_agent = forward_ssh_agent
         self.proxy_host, self.proxy_port, self.proxy_user, \
             self.proxy_password, self.proxy_pkey = proxy_host, proxy_port, \
@@ -252,7 +258,7 @@ class ParallelSSHClient(BaseParallelSSHClient):
             logger.error("Failed to run on host %s", host)
             raise ex
 
-    def get_output(self, cmd, output, encoding='utf-8'):
+    def get_output(self, cmd, output, encoding='utf-8', output_mode=None):
         """Get output from command greenlet.
 
         `output` parameter is modified in-place.
@@ -263,6 +269,8 @@ class ParallelSSHClient(BaseParallelSSHClient):
           :py:class:`pssh.output.HostOutput` values to be updated with output
           from cmd
         :type output: dict
+        :param output_mode: Not used - output of this client is always
+          decoded lines.
         :rtype: None"""
         try:
             (channel, host, stdout, stderr, stdin) = cmd.get()
@@ -341,4 +349,4 @@ class ParallelSSHClient(BaseParallelSSHClient):
                 proxy_user=self.proxy_user, proxy_password=self.proxy_password,
                 proxy_pkey=self.proxy_pkey, allow_agent=self.allow_agent,
                 agent=self.agent, channel_timeout=self.channel_timeout,
-                **paramiko_kwargs)
+                retry_policy=self.retry_policy, **paramiko_kwargs)
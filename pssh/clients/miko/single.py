@@ -30,7 +30,8 @@ from paramiko.ssh_exception import ChannelException  # noqa: E402
 
 from ...exceptions import UnknownHostException, AuthenticationException, \
     ConnectionErrorException, SSHException  # noqa: E402
-from ...constants import DEFAULT_RETRIES  # noqa: E402
+from ...constants import DEFAULT_RETRIES, RETRY_DELAY  # noqa: E402
+from ...retry import RetryPolicy  # noqa: E402
 from ...utils import read_openssh_config  # noqa: E402
 
 host_logger = logging.getLogger('pssh.host_logger')
@@ -51,6 +52,7 @@ class SSHClient(object):
                  allow_agent=True, timeout=10, proxy_host=None,
                  proxy_port=22, proxy_user=None, proxy_password=None,
                  proxy_pkey=None, channel_timeout=None,
+                 retry_delay=RETRY_DELAY, retry_policy=None,
                  _openssh_config_file=None,
                  **paramiko_kwargs):
         """
@@ -70,6 +72,15 @@ class SSHClient(object):
         :param num_retries: (Optional) Number of retries for connection attempts
           before the client gives up. Defaults to 3.
         :type num_retries: int
+        :param retry_delay: Number of seconds to wait between retries. Defaults
+          to :py:class:`pssh.constants.RETRY_DELAY`
+        :type retry_delay: int
+        :param retry_policy: (Optional) Policy for number of connection
+          attempts and delay between them, for example with exponential
+          backoff. Defaults to a fixed delay of ``retry_delay`` between
+          ``num_retries`` attempts. Overrides ``num_retries`` and
+          ``retry_delay`` if set.
+        :type retry_policy: :py:class:`pssh.retry.RetryPolicy`
         :param timeout: (Optional) Number of seconds to timeout connection
           attempts before the client gives up
         :type timeout: int
@@ -122,7 +133,10 @@ class SSHClient(object):
         self.allow_agent = allow_agent
         if agent:
             self.client._agent = agent
-        self.num_retries = num_retries
+        self.retry_policy = retry_policy if retry_policy is not None \
+            else RetryPolicy(num_retries=num_retries, retry_delay=retry_delay,
+                             backoff=1, max_delay=retry_delay, jitter=False)
+        self.num_retries = self.retry_policy.num_retries
         self.timeout = timeout
         self.channel_timeout = channel_timeout
         self.proxy_host, self.proxy_port, self.proxy_user, \
@@ -201,7 +215,7 @@ class SSHClient(object):
             logger.error("Could not resolve host '%s' - retry %s/%s",
                          host, retries, self.num_retries)
             while retries < self.num_retries:
-                sleep(5)
+                self.retry_policy.sleep(retries)
                 return self._connect(client, host, port,
                                      sock=sock,
                                      retries=retries+1,
@@ -213,7 +227,7 @@ class SSHClient(object):
             logger.error("Error connecting to host '%s:%s' - retry %s/%s",
                          host, self.port, retries, self.num_retries)
             while retries < self.num_retries:
-                sleep(5)
+                self.retry_policy.sleep(retries)
                 return self._connect(client, host, port,
                                      sock=sock,
                                      retries=retries+1,
@@ -308,10 +322,14 @@ class SSHClient(object):
         :type callback_args: tuple
         """
         prefix = '' if prefix is None else prefix
-        for line in output_buffer:
-            output = line.strip().decode(encoding)
-            host_logger.info("[%s]%s\t%s", self.host, prefix, output)
-            yield output
+        if not host_logger.isEnabledFor(logging.INFO):
+            for line in output_buffer:
+                yield line.strip().decode(encoding)
+        else:
+            for line in output_buffer:
+                output = line.strip().decode(encoding)
+                host_logger.info("[%s]%s\t%s", self.host, prefix, output)
+                yield output
         if callback:
             callback(*callback_args)
 
@@ -16,8 +16,15 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 
 import os
+from hashlib import sha256
+from socket import error as sock_error
+from time import time
 
-from ...exceptions import PKeyFileError
+from ssh2.exceptions import SocketDisconnectError, SocketRecvError, \
+    SocketSendError
+
+from ...exceptions import PKeyFileError, SessionError
+from ...constants import PROGRESS_INTERVAL
 
 
 def _validate_pkey_path(pkey, host=None):
@@ -32,3 +39,148 @@ def _validate_pkey_path(pkey, host=None):
         ex.host = host
         raise ex
     return pkey
+
+
+_SOCKET_ERRORS = (SocketDisconnectError, SocketRecvError, SocketSendError,
+                  sock_error)
+
+
+def _session_failed(client, ex):
+    """Whether exception raised by client is due to its session having
+    failed, rather than the request made on the session."""
+    if not client.is_alive():
+        return True
+    if isinstance(ex, SessionError) and ex.args:
+        ex = ex.args[0]
+    return isinstance(ex, _SOCKET_ERRORS)
+
+
+def _sort_addrs(addr_infos, port=None):
+    """Order ``(family, sockaddr)`` of addresses from
+    :py:func:`socket.getaddrinfo` for connection attempts, alternating
+    between address families starting with the first family returned, as
+    per RFC 8305. Port of addresses is replaced with ``port`` if set."""
+    families = []
+    by_family = {}
+    for family, _, _, _, sockaddr in addr_infos:
+        if port is not None:
+            sockaddr = (sockaddr[0], port) + tuple(sockaddr[2:])
+        if family not in by_family:
+            families.append(family)
+            by_family[family] = []
+        if sockaddr not in by_family[family]:
+            by_family[family].append(sockaddr)
+    addrs = []
+    while any(by_family.values()):
+        for family in families:
+            if by_family[family]:
+                addrs.append((family, by_family[family].pop(0)))
+    return addrs
+
+
+def _replace_file(src, dst):
+    """Rename local file, replacing destination if it exists."""
+    try:
+        replace = os.replace
+    except AttributeError:
+        # Python 2 - rename replaces destination on POSIX only
+        if os.name == 'nt' and os.path.exists(dst):
+            os.remove(dst)
+        replace = os.rename
+    replace(src, dst)
+
+
+def _validate_output_mode(output_mode):
+    if output_mode not in ('lines', 'bytes', 'chunks'):
+        raise ValueError("Invalid output mode %s - must be one of "
+                         "'lines', 'bytes' or 'chunks'" % (output_mode,))
+
+
+def _file_digest(path, block_size=1024*1024):
+    digest = sha256()
+    with open(path, 'rb') as fh:
+        data = fh.read(block_size)
+        while data:
+            digest.update(data)
+            data = fh.read(block_size)
+    return digest.hexdigest()
+
+
+def _local_manifest(local_dir, checksum=False, cache=None):
+    """Walk local directory and return ``(dirs, files)`` manifest of it.
+
+    ``dirs`` is a list of directory paths in top-down order and ``files`` a
+    dictionary of file path to ``(size, mtime, digest)``. Paths are relative
+    to ``local_dir`` and use ``/`` as separator.
+
+    SHA256 digests are only calculated with ``checksum``, otherwise they are
+    ``None``. Digests in ``cache``, a dictionary of file path to
+    ``(size, mtime, digest)``, are re-used for files whose size and
+    modification time have not changed and ``cache`` is updated in place."""
+    def _raise(ex):
+        raise ex
+    cache = {} if cache is None else cache
+    dirs = []
+    files = {}
+    for root, dir_names, file_names in os.walk(
+            local_dir, onerror=_raise, followlinks=True):
+        rel_root = os.path.relpath(root, local_dir)
+        rel_parts = [] if rel_root == os.curdir else \
+            rel_root.split(os.path.sep)
+        dirs.extend('/'.join(rel_parts + [dir_name])
+                    for dir_name in sorted(dir_names))
+        for file_name in file_names:
+            path = os.path.join(root, file_name)
+            _stat = os.stat(path)
+            digest = None
+            if checksum:
+                cached = cache.get(path)
+                if cached is not None and \
+                        cached[:2] == (_stat.st_size, _stat.st_mtime):
+                    digest = cached[2]
+                else:
+                    digest = _file_digest(path)
+                    cache[path] = (_stat.st_size, _stat.st_mtime, digest)
+            files['/'.join(rel_parts + [file_name])] = (
+                _stat.st_size, _stat.st_mtime, digest)
+    return dirs, files
+
+
+def _manifest_changed(local_entry, remote_entry):
+    """Whether a remote file with manifest entry ``remote_entry`` is out of
+    date with a local file with manifest entry ``local_entry``.
+
+    Files are compared by digest when both entries have one, otherwise by
+    modification time, and always by size."""
+    if remote_entry is None:
+        return True
+    size, mtime, digest = local_entry
+    remote_size, remote_mtime, remote_digest = remote_entry
+    if size != remote_size:
+        return True
+    if digest is not None and remote_digest is not None:
+        return digest != remote_digest
+    return int(mtime) != int(remote_mtime)
+
+
+class _Progress(object):
+    """Transfer progress function wrapper that calls ``func`` at most once
+    every ``interval`` seconds, other than for completed files."""
+
+    def __init__(self, func, interval=PROGRESS_INTERVAL):
+        self.func = func
+        self.interval = interval
+        self._last = 0
+
+    def __call__(self, host, path, done, total):
+        now = time()
+        if done < total and now - self._last < self.interval:
+            return
+        self._last = now
+        self.func(host, path, done, total)
+
+
+def _throttle_progress(progress):
+    if progress is None or isinstance(progress, _Progress):
+        return progress
+    return _Progress(progress)
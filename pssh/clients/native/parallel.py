@@ -16,16 +16,28 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 
 import logging
-from collections import deque
-from gevent import sleep
+import os
+from socket import gaierror as sock_gaierror
+from time import time
+from weakref import ref
+from collections import deque, defaultdict
+try:
+    from shlex import quote
+except ImportError:
+    from pipes import quote
+from gevent import sleep, joinall, spawn, Timeout as GTimeout
 from gevent.lock import RLock
+from gevent.queue import Queue, Empty
 
 from ..base_pssh import BaseParallelSSHClient
-from ...constants import DEFAULT_RETRIES, RETRY_DELAY
+from ...constants import DEFAULT_RETRIES, RETRY_DELAY, RELAY_SCP_COMMAND, \
+    SCP_BLOCK_SIZE
 from .single import SSHClient
-from ...exceptions import ProxyError, Timeout, HostArgumentException
+from ...exceptions import ProxyError, Timeout, SCPError, SessionError, \
+    ConnectionErrorException, UnknownHostException
 from .tunnel import Tunnel
-from .common import _validate_pkey_path
+from .resolver import HostResolver
+from .common import _validate_pkey_path, _local_manifest, _session_failed
 
 
 logger = logging.getLogger(__name__)
@@ -39,7 +51,9 @@ class ParallelSSHClient(BaseParallelSSHClient):
                  allow_agent=True, host_config=None, retry_delay=RETRY_DELAY,
                  proxy_host=None, proxy_port=22,
                  proxy_user=None, proxy_password=None, proxy_pkey=None,
-                 forward_ssh_agent=True, tunnel_timeout=None):
+                 forward_ssh_agent=True, tunnel_timeout=None,
+                 session_pool=None, keepalive_seconds=None,
+                 retry_policy=None, circuit_breaker=None, resolver=None):
         """
         :param hosts: Hosts to connect to
         :type hosts: list(str)
@@ -99,6 +113,40 @@ class ParallelSSHClient(BaseParallelSSHClient):
         :param tunnel_timeout: (Optional) Timeout setting for proxy tunnel
           connections.
         :type tunnel_timeout: float
+        :param session_pool: (Optional) Pool to get clients for hosts from,
+          so that clients are shared with other parallel and single clients
+          using the same pool. Clients are leased from the pool until their
+          session fails or this client is deleted. Not used for hosts
+          connected to via ``proxy_host``.
+        :type session_pool:
+          :py:class:`pssh.clients.native.session_pool.SessionPool`
+        :param keepalive_seconds: (Optional) Interval of keepalive messages
+          sent on idle sessions. A background greenlet sends keepalives to
+          all hosts' sessions not used for this many seconds and reconnects
+          hosts whose sessions have been dropped. Keepalive is disabled by
+          default - :py:class:`pssh.constants.KEEPALIVE_INTERVAL` is a
+          suitable interval for enabling it.
+        :type keepalive_seconds: int
+        :param retry_policy: (Optional) Policy for number of connection
+          attempts and delay between them, for example with exponential
+          backoff. Defaults to a fixed delay of ``retry_delay`` between
+          ``num_retries`` attempts. Overrides ``num_retries`` and
+          ``retry_delay`` if set.
+        :type retry_policy: :py:class:`pssh.retry.RetryPolicy`
+        :param circuit_breaker: (Optional) Circuit breaker recording
+          connection failures per host. Connections to hosts that have
+          failed repeatedly fail fast with
+          :py:class:`pssh.exceptions.ConnectionErrorException` instead of
+          taking up pool slots for all retries. May be shared by clients to
+          remember failures across clients.
+        :type circuit_breaker: :py:class:`pssh.retry.CircuitBreaker`
+        :param resolver: (Optional) Resolver to resolve and cache addresses
+          of hosts with. All hosts are resolved concurrently before
+          connecting to them. May be shared by clients to share cached
+          addresses. Defaults to a new
+          :py:class:`pssh.clients.native.resolver.HostResolver`. Not used
+          for hosts connected to via ``proxy_host``.
+        :type resolver: :py:class:`pssh.clients.native.resolver.HostResolver`
 
         :raises: :py:class:`pssh.exceptions.PKeyFileError` on errors finding
           provided private key.
@@ -107,7 +155,8 @@ class ParallelSSHClient(BaseParallelSSHClient):
             self, hosts, user=user, password=password, port=port, pkey=pkey,
             allow_agent=allow_agent, num_retries=num_retries,
             timeout=timeout, pool_size=pool_size,
-            host_config=host_config, retry_delay=retry_delay)
+            host_config=host_config, retry_delay=retry_delay,
+            retry_policy=retry_policy)
         self.pkey = _validate_pkey_path(pkey)
         self.proxy_host = proxy_host
         self.proxy_port = proxy_port
@@ -118,13 +167,33 @@ class ParallelSSHClient(BaseParallelSSHClient):
         self._tunnel = None
         self._tunnel_in_q = None
         self._tunnel_out_q = None
-        self._tunnel_lock = None
         self._tunnel_timeout = tunnel_timeout
-        self._clients_lock = RLock()
+        self._tunnel_lock = RLock()
+        self._host_locks = defaultdict(RLock)
+        self._sync_cache = {}
+        self.session_pool = session_pool
+        # Clients leased from session pool
+        self._pooled_clients = set()
+        # References to host output holding leased clients, see
+        # imap_run_command
+        self._output_refs = set()
+        self.keepalive_seconds = keepalive_seconds
+        self._keepalive_greenlet = None
+        # Number of times each host's session has been re-established
+        self.reconnects = defaultdict(int)
+        self.circuit_breaker = circuit_breaker
+        self.resolver = resolver if resolver is not None else HostResolver()
+
+    def __del__(self):
+        # Pooled clients are disconnected by their pool once no longer
+        # leased by any client
+        for client in list(getattr(self, '_pooled_clients', ())):
+            self._release_client(client)
 
     def run_command(self, command, sudo=False, user=None, stop_on_errors=True,
                     use_pty=False, host_args=None, shell=None,
-                    encoding='utf-8', timeout=None, greenlet_timeout=None):
+                    encoding='utf-8', timeout=None, greenlet_timeout=None,
+                    output_mode='lines'):
         """Run command on all hosts in parallel, honoring self.pool_size,
         and return output dictionary.
 
@@ -167,8 +236,11 @@ class ParallelSSHClient(BaseParallelSSHClient):
         :param host_args: (Optional) Format command string with per-host
           arguments in ``host_args``. ``host_args`` length must equal length of
           host list - :py:class:`pssh.exceptions.HostArgumentException` is
-          raised otherwise
-        :type host_args: tuple or list
+          raised otherwise. Hosts and ``host_args`` may be any iterable,
+          including generators, but are consumed in full as output for all
+          hosts is returned at once - use :py:func:`imap_run_command` for
+          memory use bounded by ``pool_size``.
+        :type host_args: iterable
         :param encoding: Encoding to use for output. Must be valid
           `Python codec <https://docs.python.org/library/codecs.html>`_
         :type encoding: str
@@ -189,6 +261,13 @@ class ParallelSSHClient(BaseParallelSSHClient):
           ``BaseException`` and thus **can not be caught** by
           ``stop_on_errors=False``.
         :type greenlet_timeout: float
+        :param output_mode: (Optional) ``lines`` (default) for decoded lines
+          of output, ``bytes`` for undecoded lines or ``chunks`` for undecoded
+          chunks of output as they are read from the channel. Raw modes skip
+          decoding and ``host_logger`` logging and are suited to bulk or
+          binary output. Output mode and encoding are kept in host output and
+          used by ``join`` unless overridden.
+        :type output_mode: str
         :rtype: Dictionary with host as key and
           :py:class:`pssh.output.HostOutput` as value as per
           :py:func:`pssh.pssh_client.ParallelSSHClient.get_output`
@@ -213,27 +292,233 @@ class ParallelSSHClient(BaseParallelSSHClient):
           specific errors such as
           :py:class:`ssh2.exceptions.SocketDisconnectError` et al.
         """
+        self._resolve_hosts(self.hosts)
         return BaseParallelSSHClient.run_command(
             self, command, stop_on_errors=stop_on_errors, host_args=host_args,
             user=user, shell=shell, sudo=sudo,
             encoding=encoding, use_pty=use_pty, timeout=timeout,
-            greenlet_timeout=greenlet_timeout)
+            greenlet_timeout=greenlet_timeout, output_mode=output_mode)
+
+    def run_commands(self, commands, sudo=False, user=None,
+                     stop_on_errors=True, use_pty=False, shell=None,
+                     encoding='utf-8', timeout=None, greenlet_timeout=None,
+                     output_mode='lines'):
+        """Run multiple commands on all hosts in parallel, honoring
+        self.pool_size, and return output dictionaries per command.
+
+        Commands for a host run concurrently, each on its own channel over
+        the host's single authenticated session, so connection and
+        authentication happen only once per host regardless of number of
+        commands. ``pool_size`` bounds number of hosts being connected to and
+        starting their commands at any one time, not number of commands.
+
+        This function will block until all commands have been received
+        by remote servers and then return immediately.
+
+        Accepts the same arguments as ``run_command`` other than
+        ``host_args``.
+
+        :param commands: Commands to run on each host.
+        :type commands: list(str)
+
+        :rtype: list of output dictionaries, one for each command in order of
+          ``commands``. Each dictionary has host as key and
+          :py:class:`pssh.output.HostOutput` as value as per
+          :py:func:`pssh.clients.native.parallel.ParallelSSHClient.run_command`
+          and can be passed to ``join`` et al.
+
+        :raises: Same exceptions as ``run_command``.
+        """
+        self._resolve_hosts(self.hosts)
+        commands = list(commands)
+        kwargs = dict(user=user, shell=shell, sudo=sudo, encoding=encoding,
+                      use_pty=use_pty, timeout=timeout,
+                      output_mode=output_mode)
+        host_cmds = [self.pool.spawn(self._run_commands, host, commands,
+                                     **kwargs)
+                     for host in self.hosts]
+        outputs = [{} for _ in commands]
+        for host_cmd in host_cmds:
+            try:
+                cmds = host_cmd.get(timeout=greenlet_timeout)
+            except Exception as ex:
+                # Failed to connect - same exception for all commands
+                for output in outputs:
+                    self._update_host_output(
+                        output, ex.host, None, None, None, None, None,
+                        host_cmd, exception=ex)
+                if stop_on_errors:
+                    raise
+                continue
+            for output, cmd in zip(outputs, cmds):
+                try:
+                    self.get_output(cmd, output, timeout=greenlet_timeout,
+                                    encoding=encoding,
+                                    output_mode=output_mode)
+                except Exception:
+                    if stop_on_errors:
+                        raise
+        return outputs
+
+    def _run_commands(self, host, commands, **kwargs):
+        """Connect to host and start all commands on it concurrently.
+
+        :rtype: list(:py:class:`gevent.Greenlet`) of started commands"""
+        try:
+            self._make_ssh_client(host)
+        except Exception as ex:
+            ex.host = host
+            logger.error("Failed to connect to host %s - %s", host, ex)
+            raise ex
+        cmds = [spawn(self._run_command, host, command, **kwargs)
+                for command in commands]
+        # Pool slot of host is held until its commands have started
+        joinall(cmds)
+        return cmds
+
+    def imap_run_command(self, command, sudo=False, user=None,
+                         stop_on_errors=True, use_pty=False, host_args=None,
+                         shell=None, encoding='utf-8', timeout=None,
+                         greenlet_timeout=None, output_mode='lines'):
+        """Run command on all hosts in parallel, honoring self.pool_size,
+        and yield host output as it becomes available.
+
+        Unlike ``run_command``, output is not returned in a dictionary once
+        commands have started on all hosts. Instead,
+        :py:class:`pssh.output.HostOutput` for each host is yielded as soon as
+        that host has accepted the command, in order of completion rather
+        than order of hosts. Slow or unreachable hosts do not delay output
+        from other hosts.
+
+        Example:
+
+        .. code-block:: python
+
+          for host_out in client.imap_run_command('uname'):
+              for line in host_out.stdout:
+                  print(line)
+
+        Parameters and exceptions raised are as per
+        :py:func:`ParallelSSHClient.run_command`. With ``stop_on_errors=False``
+        host output with ``exception`` set is yielded for hosts that failed.
+
+        Hosts and ``host_args`` may be any iterable, including generators.
+        Both are consumed lazily and commands are only started as pool slots
+        become available, so memory use is bounded by ``pool_size`` rather than
+        number of hosts. Client does not keep references to completed
+        greenlets - ``self.cmds`` is not updated.
+
+        Clients of hosts whose output has been yielded are not kept in
+        ``self.host_clients``. Each host's client is instead referenced by
+        the ``client`` attribute of its output and is disconnected, or
+        released to ``session_pool``, once its output is no longer referenced.
+
+        :param greenlet_timeout: (Optional) Greenlet timeout setting.
+          If set, :py:class:`gevent.Timeout` is raised if no output is
+          available from any host after ``greenlet_timeout`` seconds.
+        :type greenlet_timeout: float
+
+        :rtype: Generator of :py:class:`pssh.output.HostOutput`
+        """
+        kwargs = dict(user=user, shell=shell, sudo=sudo, encoding=encoding,
+                      use_pty=use_pty, timeout=timeout,
+                      output_mode=output_mode)
+        for cmd in self._imap_spawn(
+                self._run_command, self._host_commands(command, host_args),
+                kwargs, timeout=greenlet_timeout):
+            output = {}
+            try:
+                self.get_output(cmd, output, encoding=encoding,
+                                output_mode=output_mode)
+            except Exception:
+                if stop_on_errors:
+                    raise
+            host_out = output.popitem()[1]
+            self._detach_client(host_out)
+            yield host_out
+
+    def _imap_spawn(self, func, args_iter, kwargs, timeout=None):
+        """Spawn ``func`` with each tuple of arguments in ``args_iter`` as
+        pool slots become available and yield greenlets in order of
+        completion.
+
+        Arguments are consumed lazily and no more than ``self.pool_size``
+        greenlets are pending at any one time."""
+        done = Queue()
+        pending = 0
+        for args in args_iter:
+            while pending and (self.pool.full() or not done.empty()):
+                pending -= 1
+                yield self._get_done(done, timeout)
+            greenlet = self.pool.spawn(func, *args, **kwargs)
+            greenlet.link(done.put)
+            pending += 1
+        while pending:
+            pending -= 1
+            yield self._get_done(done, timeout)
+
+    def _get_done(self, done, timeout):
+        try:
+            return done.get(timeout=timeout)
+        except Empty:
+            raise GTimeout(timeout)
+
+    def _detach_client(self, host_out):
+        """Move client of host from ``host_clients`` to host output, so that
+        clients are not kept for hosts whose output is no longer referenced.
+        """
+        host = host_out.host
+        client = self.host_clients.pop(host, None)
+        lock = self._host_locks.get(host)
+        if lock is not None and lock.acquire(blocking=False):
+            del self._host_locks[host]
+            lock.release()
+        if client is None:
+            return
+        host_out.client = client
+        if client not in self._pooled_clients:
+            # Disconnected by its destructor along with host output
+            return
+        self._pooled_clients.discard(client)
+        output_refs = self._output_refs
+        session_pool = self.session_pool
+
+        def _release(output_ref):
+            output_refs.discard(output_ref)
+            session_pool.release(client)
+        output_refs.add(ref(host_out, _release))
 
     def _run_command(self, host, command, sudo=False, user=None,
                      shell=None, use_pty=False,
-                     encoding='utf-8', timeout=None):
+                     encoding='utf-8', timeout=None, output_mode='lines'):
         """Make SSHClient if needed, run command on host"""
         try:
             self._make_ssh_client(host)
-            return self.host_clients[host].run_command(
-                command, sudo=sudo, user=user, shell=shell,
-                use_pty=use_pty, encoding=encoding, timeout=timeout)
+            client = self.host_clients[host]
+            try:
+                return client.run_command(
+                    command, sudo=sudo, user=user, shell=shell,
+                    use_pty=use_pty, encoding=encoding, timeout=timeout,
+                    output_mode=output_mode)
+            except Exception as ex:
+                if not _session_failed(client, ex):
+                    raise
+                # Command is run once more on a new session
+                logger.warning("Session to host %s failed - %s - "
+                               "reconnecting", host, ex)
+                self._discard_client(host, client)
+                self._make_ssh_client(host)
+                return self.host_clients[host].run_command(
+                    command, sudo=sudo, user=user, shell=shell,
+                    use_pty=use_pty, encoding=encoding, timeout=timeout,
+                    output_mode=output_mode)
         except Exception as ex:
             ex.host = host
             logger.error("Failed to run on host %s - %s", host, ex)
             raise ex
 
-    def join(self, output, consume_output=False, timeout=None):
+    def join(self, output, consume_output=False, timeout=None,
+             encoding=None, output_mode=None):
         """Wait until all remote commands in output have finished
         and retrieve exit codes. Does *not* block other commands from
         running in parallel.
@@ -251,18 +536,26 @@ class ParallelSSHClient(BaseParallelSSHClient):
           otherwise the channel output pending to be consumed always results
           in the channel not being finished.
         :type timeout: int
+        :param encoding: (Optional) Encoding to use for output generators.
+          Defaults to encoding used for ``run_command``.
+        :type encoding: str
+        :param output_mode: (Optional) Output mode to use for output
+          generators. Defaults to ``output_mode`` used for ``run_command``.
+        :type output_mode: str
 
         :raises: :py:class:`pssh.exceptions.Timeout` on timeout requested and
           reached with commands still running.
 
         :rtype: ``None``"""
         for host, host_out in output.items():
-            if host not in self.host_clients or self.host_clients[host] is None:
+            client = host_out.client if host_out.client is not None \
+                else self.host_clients.get(host)
+            if client is None:
                 continue
-            client = self.host_clients[host]
             channel = host_out.channel
             stdout, stderr = self.reset_output_generators(
-                host_out, client=client, channel=channel, timeout=timeout)
+                host_out, client=client, channel=channel, timeout=timeout,
+                encoding=encoding, output_mode=output_mode)
             try:
                 client.wait_finished(channel, timeout=timeout)
             except Timeout:
@@ -282,7 +575,7 @@ class ParallelSSHClient(BaseParallelSSHClient):
 
     def reset_output_generators(self, host_out, timeout=None,
                                 client=None, channel=None,
-                                encoding='utf-8'):
+                                encoding=None, output_mode=None):
         """Reset output generators for host output.
 
         :param host_out: Host output
@@ -294,18 +587,29 @@ class ParallelSSHClient(BaseParallelSSHClient):
         :param timeout: (Optional) Timeout setting
         :type timeout: int
         :param encoding: (Optional) Encoding to use for output. Must be valid
-          `Python codec <https://docs.python.org/library/codecs.html>`_
+          `Python codec <https://docs.python.org/library/codecs.html>`_.
+          Defaults to encoding of host output, or ``utf-8``.
         :type encoding: str
+        :param output_mode: (Optional) One of ``lines``, ``bytes`` or
+          ``chunks`` - see
+          :py:func:`pssh.clients.native.single.SSHClient.run_command`.
+          Defaults to output mode of host output, or ``lines``.
+        :type output_mode: str
 
         :rtype: tuple(stdout, stderr)
         """
         channel = host_out.channel if channel is None else channel
-        client = self.host_clients[host_out.host] if client is None else client
-        stdout = client.read_output_buffer(
-            client.read_output(channel, timeout=timeout), encoding=encoding)
-        stderr = client.read_output_buffer(
-            client.read_stderr(channel, timeout=timeout),
-            prefix='\t[err]', encoding=encoding)
+        if client is None:
+            client = host_out.client if host_out.client is not None \
+                else self.host_clients[host_out.host]
+        if encoding is None:
+            encoding = host_out.encoding if host_out.encoding else 'utf-8'
+        if output_mode is None:
+            output_mode = host_out.output_mode if host_out.output_mode \
+                else 'lines'
+        stdout, stderr = client.get_output_generators(
+            channel, timeout=timeout, encoding=encoding,
+            output_mode=output_mode)
         host_out.stdout = stdout
         host_out.stderr = stderr
         return stdout, stderr
@@ -323,7 +627,12 @@ class ParallelSSHClient(BaseParallelSSHClient):
         return channel.get_exit_status()
 
     def _start_tunnel_thread(self):
-        self._tunnel_lock = RLock()
+        with self._tunnel_lock:
+            if self._tunnel is not None:
+                return
+            self._init_tunnel()
+
+    def _init_tunnel(self):
         self._tunnel_in_q = deque()
         self._tunnel_out_q = deque()
         self._tunnel = Tunnel(
@@ -344,44 +653,209 @@ class ParallelSSHClient(BaseParallelSSHClient):
                 logger.error(msg, self._tunnel.exception)
                 raise ProxyError(msg, self._tunnel.exception)
 
+    def connect_all(self, hosts=None, timeout=None):
+        """Connect and authenticate to hosts in parallel without running any
+        commands.
+
+        Clients connected this way are re-used by subsequent ``run_command``
+        and copy calls which then only need to open a channel.
+
+        :param hosts: (Optional) Hosts to connect to. Defaults to all hosts of
+          this client.
+        :type hosts: list(str)
+        :param timeout: (Optional) Seconds to wait for all connections to
+          complete, including waiting for pool slots to connect to hosts in.
+          Hosts not connected by then have their connection attempt
+          cancelled or not started.
+        :type timeout: int
+
+        :rtype: dict of host to ``None`` for hosts connected successfully or
+          exception raised for hosts that failed to connect. Hosts that did not
+          connect in time have :py:class:`pssh.exceptions.Timeout`"""
+        hosts = self.hosts if hosts is None else hosts
+        deadline = time() + timeout if timeout is not None else None
+        self._resolve_hosts(hosts)
+        cmds = []
+        for host in hosts:
+            if deadline is not None and (
+                    self.pool.wait_available(
+                        timeout=max(deadline - time(), 0)) <= 0
+                    or time() >= deadline):
+                # Deadline reached before a pool slot was available - host
+                # is not connected to
+                cmds.append((host, None))
+                continue
+            cmds.append((host, self.pool.spawn(self._make_ssh_client, host)))
+        joinall([cmd for _, cmd in cmds if cmd is not None],
+                timeout=max(deadline - time(), 0)
+                if deadline is not None else None)
+        results = {}
+        for host, cmd in cmds:
+            if cmd is None or not cmd.ready():
+                if cmd is not None:
+                    cmd.kill()
+                results[host] = Timeout(
+                    "Timeout of %s sec(s) reached connecting to host %s",
+                    timeout, host)
+                continue
+            results[host] = cmd.exception
+            if cmd.exception is not None:
+                logger.error("Failed to connect to host %s - %s",
+                             host, cmd.exception)
+        return results
+
+    def _get_tunnel_port(self, host, port):
+        max_wait = self.timeout if self.timeout is not None else 60
+        result = self._tunnel.request_tunnel(host, port)
+        logger.debug("Waiting on tunnel to open listening port for %s:%s",
+                     host, port)
+        try:
+            listen_port = result.get(timeout=max_wait)
+        except GTimeout:
+            self._tunnel.cancel_request(host, port, result)
+            raise Timeout("Timed out waiting on tunnel to "
+                          "open listening port")
+        except BaseException:
+            self._tunnel.cancel_request(host, port, result)
+            raise
+        if listen_port is None:
+            msg = "Tunnel could not open listening port for %s:%s - %s"
+            logger.error(msg, host, port, self._tunnel.exception)
+            raise ProxyError(msg, host, port, self._tunnel.exception)
+        return listen_port
+
+    def _start_keepalive(self):
+        if not self.keepalive_seconds or self._keepalive_greenlet is not None:
+            return
+        self._keepalive_greenlet = spawn(
+            _keepalive_loop, ref(self), self.keepalive_seconds)
+
+    def _send_keepalives(self):
+        """Send keepalives to all hosts' sessions that have been idle for
+        ``keepalive_seconds`` in one pass and reconnect hosts whose sessions
+        are dead.
+
+        :returns: Number of seconds until next keepalive is due.
+        """
+        now = time()
+        next_due = self.keepalive_seconds
+        for host, client in list(self.host_clients.items()):
+            if client is None or client.last_activity is None:
+                continue
+            idle = now - client.last_activity
+            if idle < self.keepalive_seconds:
+                next_due = min(next_due, self.keepalive_seconds - idle)
+                continue
+            try:
+                if not client.is_alive():
+                    raise SessionError("Socket is closed")
+                client.keepalive()
+            except Exception as ex:
+                logger.warning("Session to host %s is dead - %s - "
+                               "reconnecting", host, ex)
+                self._discard_client(host, client)
+                spawn(self._reconnect, host)
+        return max(next_due, 1)
+
+    def _discard_client(self, host, client):
+        """Disconnect failed client of host so that a new client is made
+        on next request, counting reconnects of host."""
+        with self._host_locks[host]:
+            if self.host_clients.get(host) is not client:
+                return
+            self.host_clients[host] = None
+            self.reconnects[host] += 1
+        if client in self._pooled_clients:
+            self._release_client(client)
+            # Disconnected once released by all its holders
+            self.session_pool.remove(client)
+        else:
+            client.disconnect()
+
+    def _release_client(self, client):
+        self._pooled_clients.discard(client)
+        self.session_pool.release(client)
+
+    def _reconnect(self, host):
+        try:
+            self._make_ssh_client(host)
+        except Exception as ex:
+            logger.error("Could not reconnect to host %s - %s", host, ex)
+
     def _make_ssh_client(self, host):
-        auth_thread_pool = True
-        if self.proxy_host is not None and self._tunnel is None:
+        if self.proxy_host is not None:
             self._start_tunnel_thread()
+        self._start_keepalive()
         logger.debug("Make client request for host %s, host in clients: %s",
                      host, host in self.host_clients)
-        with self._clients_lock:
-            if host not in self.host_clients or self.host_clients[host] is None:
-                _user, _port, _password, _pkey = self._get_host_config_values(
-                    host)
-                proxy_host = None if self.proxy_host is None else '127.0.0.1'
-                if proxy_host is not None:
-                    auth_thread_pool = False
-                    _wait = 0.0
-                    max_wait = self.timeout if self.timeout is not None else 60
-                    with self._tunnel_lock:
-                        self._tunnel_in_q.append((host, _port))
-                    while True:
-                        if _wait >= max_wait:
-                            raise Timeout("Timed out waiting on tunnel to "
-                                          "open listening port")
-                        try:
-                            _port = self._tunnel_out_q.pop()
-                        except IndexError:
-                            logger.debug(
-                                "Waiting on tunnel to open listening port")
-                            sleep(.5)
-                            _wait += .5
-                        else:
-                            break
-                self.host_clients[host] = SSHClient(
-                    host, user=_user, password=_password, port=_port,
-                    pkey=_pkey, num_retries=self.num_retries,
-                    timeout=self.timeout,
-                    allow_agent=self.allow_agent, retry_delay=self.retry_delay,
-                    proxy_host=proxy_host, _auth_thread_pool=auth_thread_pool)
-
-    def copy_file(self, local_file, remote_file, recurse=False, copy_args=None):
+        client = self.host_clients.get(host)
+        if client is not None and client.is_alive():
+            return
+        # Only one client per host is made, while clients for other hosts
+        # connect concurrently
+        with self._host_locks[host]:
+            client = self.host_clients.get(host)
+            if client is not None and not client.is_alive():
+                logger.warning("Session to host %s is closed - reconnecting",
+                               host)
+                self._discard_client(host, client)
+            if self.host_clients.get(host) is not None:
+                return
+            if self.circuit_breaker is None:
+                self.host_clients[host] = self._connect_client(host)
+                return
+            self.circuit_breaker.check(host)
+            try:
+                self.host_clients[host] = self._connect_client(host)
+            except (ConnectionErrorException, UnknownHostException, Timeout):
+                self.circuit_breaker.record_failure(host)
+                raise
+            self.circuit_breaker.record_success(host)
+
+    def _resolve_hosts(self, hosts):
+        """Resolve addresses of hosts without clients concurrently ahead of
+        connecting to them. Host generators are not consumed."""
+        if self.proxy_host is not None \
+           or not isinstance(hosts, (list, tuple, set)):
+            return
+        self.resolver.resolve_all(
+            host for host in hosts if self.host_clients.get(host) is None)
+
+    def _connect_client(self, host):
+        _user, _port, _password, _pkey = self._get_host_config_values(host)
+        if self.proxy_host is not None:
+            _port = self._get_tunnel_port(host, _port)
+            return SSHClient(
+                host, user=_user, password=_password, port=_port,
+                pkey=_pkey, timeout=self.timeout,
+                allow_agent=self.allow_agent, retry_policy=self.retry_policy,
+                proxy_host='127.0.0.1',
+                keepalive_seconds=self.keepalive_seconds,
+                _auth_thread_pool=False)
+        try:
+            addr_infos = self.resolver.resolve(host)
+        except sock_gaierror:
+            # Client raises UnknownHostException after its retries
+            addr_infos = None
+        if self.session_pool is not None:
+            client = self.session_pool.get(
+                host, user=_user, password=_password, port=_port,
+                pkey=_pkey, timeout=self.timeout,
+                allow_agent=self.allow_agent, retry_policy=self.retry_policy,
+                keepalive_seconds=self.keepalive_seconds,
+                _addr_infos=addr_infos)
+            # Leased from pool until discarded or this client is deleted
+            self._pooled_clients.add(client)
+            return client
+        return SSHClient(
+            host, user=_user, password=_password, port=_port,
+            pkey=_pkey, timeout=self.timeout,
+            allow_agent=self.allow_agent, retry_policy=self.retry_policy,
+            keepalive_seconds=self.keepalive_seconds,
+            _addr_infos=addr_infos)
+
+    def copy_file(self, local_file, remote_file, recurse=False, copy_args=None,
+                  concurrency=1, sync=False, progress=None):
         """Copy local file to remote file in parallel
 
         This function returns a list of greenlets which can be
@@ -407,11 +881,32 @@ class ParallelSSHClient(BaseParallelSSHClient):
         :param copy_args: (Optional) format local_file and remote_file strings
           with per-host arguments in ``copy_args``. ``copy_args`` length must
           equal length of host list -
-          :py:class:`pssh.exceptions.HostArgumentException` is raised otherwise
-        :type copy_args: tuple or list
+          :py:class:`pssh.exceptions.HostArgumentException` is
+          raised otherwise. Hosts and ``copy_args`` may be any iterable,
+          including generators, but are consumed in full as one greenlet
+          per host is returned - memory use grows with number of hosts.
+        :type copy_args: iterable
+        :param concurrency: (Optional) Number of files to copy concurrently
+          per host when copying a directory recursively, each over its own
+          SFTP session. Defaults to one file at a time.
+        :type concurrency: int
+        :param sync: (Optional) Skip remote files with the same size and
+          modification time as local files. Other files are copied to a
+          partial file with suffix
+          :py:data:`pssh.constants.SFTP_SYNC_PARTIAL_SUFFIX` that is renamed
+          to the remote file once copied and is resumed if copying is
+          interrupted. Modification times of remote files are set to those of
+          local files once copied.
+        :type sync: bool
+        :param progress: (Optional) Function to call with
+          ``(host, path, bytes_copied, total_bytes)`` as files are copied to
+          each host - see
+          :py:func:`pssh.clients.native.single.SSHClient.copy_file`
+        :type progress: function
 
         :rtype: list(:py:class:`gevent.Greenlet`) of greenlets for remote copy
-          commands
+          commands. Result of each greenlet is
+          :py:class:`pssh.output.TransferStats` for its host.
 
         :raises: :py:class:`ValueError` when a directory is supplied to
           local_file and recurse is not set
@@ -430,11 +925,115 @@ class ParallelSSHClient(BaseParallelSSHClient):
 
         """
         return BaseParallelSSHClient.copy_file(
-            self, local_file, remote_file, recurse=recurse, copy_args=copy_args)
+            self, local_file, remote_file, recurse=recurse, copy_args=copy_args,
+            concurrency=concurrency, sync=sync, progress=progress)
+
+    def distribute_file(self, local_file, remote_file, fanout=4,
+                        relay_cmd=RELAY_SCP_COMMAND):
+        """Copy local file to all hosts by uploading it to a set of seed hosts
+        which then copy it onward to other hosts.
+
+        Hosts are arranged in a tree in order of ``self.hosts``. The first
+        ``fanout`` hosts are seeds and have the file uploaded directly via
+        SFTP. Once a host has the file, it relays it to up to ``fanout`` other
+        hosts by running ``relay_cmd`` on it, so the client uploads only
+        ``fanout`` copies of the file regardless of number of hosts.
+
+        Hosts whose relay fails, or whose relay host did not receive the file,
+        have the file uploaded directly instead.
+
+        Relay hosts must be able to connect to the hosts they relay to, by
+        the same host names and ports as the client and without interactive
+        authentication - for example via the forwarded SSH agent of the
+        client. Remote directories in ``remote_file`` are created by the
+        client on each host.
+
+        This function returns a list of greenlets which can be
+        `join`-ed on to wait for completion. Result of each greenlet is the
+        host the file was relayed from, or ``None`` if uploaded directly.
+
+        :param local_file: Local filepath to copy to remote hosts
+        :type local_file: str
+        :param remote_file: Remote filepath on remote hosts to copy file to
+        :type remote_file: str
+        :param fanout: (Optional) Number of seed hosts and of hosts each host
+          relays the file to.
+        :type fanout: int
+        :param relay_cmd: (Optional) Command format string to run on relay
+          hosts with ``port``, ``source`` and ``destination`` keys. Defaults
+          to :py:data:`pssh.constants.RELAY_SCP_COMMAND`.
+        :type relay_cmd: str
+
+        :rtype: list(:py:class:`gevent.Greenlet`) of greenlets for remote copy
+          commands
+
+        :raises: :py:class:`ValueError` when ``local_file`` is a directory or
+          ``fanout`` is less than one.
+        :raises: :py:class:`pss.exceptions.SFTPError` on SFTP initialisation
+          errors
+        :raises: :py:class:`pssh.exceptions.SFTPIOError` on I/O errors writing
+          via SFTP
+        """
+        if os.path.isdir(local_file):
+            raise ValueError("Cannot distribute directory %s" % (local_file,))
+        if fanout < 1:
+            raise ValueError("Fanout must be at least one")
+        hosts = []
+        cmds = []
+        for i, host in enumerate(self.hosts):
+            parent = None if i < fanout else (i - fanout) // fanout
+            relay_host, relay = (None, None) if parent is None else \
+                (hosts[parent], cmds[parent])
+            cmds.append(self.pool.spawn(
+                self._distribute_file, host, relay_host, relay,
+                local_file, remote_file, relay_cmd))
+            hosts.append(host)
+        return cmds
+
+    def _distribute_file(self, host, relay_host, relay, local_file,
+                         remote_file, relay_cmd):
+        """Copy file to host via ``relay_host`` once its ``relay`` greenlet
+        has completed, directly if there is no relay host or relaying
+        failed."""
+        try:
+            self._make_ssh_client(host)
+            if relay_host is not None:
+                try:
+                    relay.get()
+                    self._relay_file(relay_host, host, remote_file,
+                                     relay_cmd)
+                except Exception as ex:
+                    logger.warning("Relaying file %s to host %s via %s failed "
+                                   "- %s - copying directly", remote_file,
+                                   host, relay_host, ex)
+                else:
+                    return relay_host
+            self.host_clients[host].copy_file(local_file, remote_file)
+        except Exception as ex:
+            ex.host = host
+            raise ex
+
+    def _relay_file(self, relay_host, host, remote_file, relay_cmd):
+        client = self.host_clients[host]
+        destination = client._remote_paths_split(remote_file)
+        if destination is not None:
+            client.mkdir(client._make_sftp(), destination)
+        _user, _port, _, _ = self._get_host_config_values(host)
+        cmd = relay_cmd % {
+            'port': _port if _port else 22,
+            'source': quote(remote_file),
+            'destination': quote('%s@%s:%s' % (
+                client.user, host, quote(remote_file)))}
+        output, exit_code = self.host_clients[relay_host]._run_for_output(cmd)
+        if exit_code != 0:
+            raise SCPError("Relay command exited with %s - %s",
+                           exit_code, output.decode('utf-8', 'replace'))
+        logger.info("Relayed file %s from host %s to host %s",
+                    remote_file, relay_host, host)
 
     def copy_remote_file(self, remote_file, local_file, recurse=False,
                          suffix_separator='_', copy_args=None,
-                         encoding='utf-8'):
+                         encoding='utf-8', sync=False, progress=None):
         """Copy remote file(s) in parallel as
         <local_file><suffix_separator><host>
 
@@ -472,13 +1071,30 @@ class ParallelSSHClient(BaseParallelSSHClient):
         :param copy_args: (Optional) format remote_file and local_file strings
           with per-host arguments in ``copy_args``.   ``copy_args`` length must
           equal length of host list -
-          :py:class:`pssh.exceptions.HostArgumentException` is raised otherwise
-        :type copy_args: tuple or list
+          :py:class:`pssh.exceptions.HostArgumentException` is
+          raised otherwise. Hosts and ``copy_args`` may be any iterable,
+          including generators, but are consumed in full as one greenlet
+          per host is returned - memory use grows with number of hosts.
+        :type copy_args: iterable
         :param encoding: Encoding to use for file paths.
         :type encoding: str
+        :param sync: (Optional) Skip local files with the same size and
+          modification time as remote files. Other files are copied to a
+          partial file with suffix
+          :py:data:`pssh.constants.SFTP_SYNC_PARTIAL_SUFFIX` that is renamed
+          to the local file once copied and is resumed if copying is
+          interrupted. Modification times of local files are set to those of
+          remote files once copied.
+        :type sync: bool
+        :param progress: (Optional) Function to call with
+          ``(host, path, bytes_copied, total_bytes)`` as files are copied from
+          each host - see
+          :py:func:`pssh.clients.native.single.SSHClient.copy_remote_file`
+        :type progress: function
 
         :rtype: list(:py:class:`gevent.Greenlet`) of greenlets for remote copy
-          commands
+          commands. Result of each greenlet is
+          :py:class:`pssh.output.TransferStats` for its host.
 
         :raises: :py:class:`ValueError` when a directory is supplied to
           local_file and recurse is not set
@@ -502,42 +1118,127 @@ class ParallelSSHClient(BaseParallelSSHClient):
         return BaseParallelSSHClient.copy_remote_file(
             self, remote_file, local_file, recurse=recurse,
             suffix_separator=suffix_separator, copy_args=copy_args,
-            encoding=encoding)
+            encoding=encoding, sync=sync, progress=progress)
+
+    def sync_dir(self, local_dir, remote_dir, checksum=False, concurrency=1,
+                 scp_min_size=None, encoding='utf-8'):
+        """Sync remote directory with local directory on all hosts in
+        parallel, copying only files that are missing or have changed on each
+        host.
+
+        The local directory is walked once for all hosts. With ``checksum``,
+        digests of local files are cached by the client and only re-calculated
+        for files whose size or modification time has changed since the last
+        sync.
+
+        See :py:func:`pssh.clients.native.single.SSHClient.sync_dir` for how
+        files are compared and copied.
+
+        This function returns a list of greenlets which can be
+        `join`-ed on to wait for completion. Result of each greenlet is the
+        list of paths relative to ``remote_dir`` of files copied to its host.
 
-    def _scp_send(self, host, local_file, remote_file, recurse=False):
+        :param local_dir: Local directory to sync from
+        :type local_dir: str
+        :param remote_dir: Remote directory to sync to
+        :type remote_dir: str
+        :param checksum: (Optional) Compare files by SHA256 digest instead of
+          modification time. Requires ``sha256sum`` on remote hosts.
+        :type checksum: bool
+        :param concurrency: (Optional) Number of files to copy concurrently
+          per host via SFTP, each over its own SFTP session.
+        :type concurrency: int
+        :param scp_min_size: (Optional) Copy files of at least this many bytes
+          via SCP instead of SFTP. Defaults to copying all files via SFTP.
+        :type scp_min_size: int
+        :param encoding: (Optional) Encoding of remote file paths.
+        :type encoding: str
+
+        :rtype: list(:py:class:`gevent.Greenlet`) of greenlets for remote sync
+          commands
+
+        :raises: :py:class:`ValueError` when ``local_dir`` is not a directory
+        :raises: :py:class:`OSError` on local OS errors walking ``local_dir``
+        """
+        if not os.path.isdir(local_dir):
+            raise ValueError("Local path %s is not a directory" % (local_dir,))
+        local_manifest = _local_manifest(
+            local_dir, checksum=checksum, cache=self._sync_cache)
+        return [self.pool.spawn(
+            self._sync_dir, host, local_dir, remote_dir, checksum=checksum,
+            concurrency=concurrency, scp_min_size=scp_min_size,
+            encoding=encoding, local_manifest=local_manifest)
+            for host in self.hosts]
+
+    def _sync_dir(self, host, local_dir, remote_dir, **kwargs):
+        """Make SSHClient if needed, sync directory"""
+        try:
+            self._make_ssh_client(host)
+            return self.host_clients[host].sync_dir(
+                local_dir, remote_dir, **kwargs)
+        except Exception as ex:
+            ex.host = host
+            raise ex
+
+    def _scp_send(self, host, local_file, remote_file, recurse=False,
+                  **kwargs):
         self._make_ssh_client(host)
         return self._handle_greenlet_exc(
             self.host_clients[host].scp_send, host,
-            local_file, remote_file, recurse=recurse)
+            local_file, remote_file, recurse=recurse, **kwargs)
 
-    def _scp_recv(self, host, remote_file, local_file, recurse=False):
+    def _scp_recv(self, host, remote_file, local_file, recurse=False,
+                  **kwargs):
         self._make_ssh_client(host)
         return self._handle_greenlet_exc(
             self.host_clients[host].scp_recv, host,
-            remote_file, local_file, recurse=recurse)
+            remote_file, local_file, recurse=recurse, **kwargs)
+
+    def scp_send(self, local_file, remote_file, recurse=False,
+                 block_size=SCP_BLOCK_SIZE, progress=None):
+        """Copy local file to remote file in parallel via SCP.
+
+        See :py:func:`pssh.clients.native.single.SSHClient.scp_send` for
+        ``block_size`` and ``progress`` parameters.
 
-    def scp_send(self, local_file, remote_file, recurse=False):
+        :rtype: list(:py:class:`gevent.Greenlet`) of greenlets for remote copy
+          commands. Result of each greenlet is
+          :py:class:`pssh.output.TransferStats` for its host.
+        """
         return [self.pool.spawn(self._scp_send, host, local_file,
-                                remote_file, recurse=recurse)
+                                remote_file, recurse=recurse,
+                                block_size=block_size, progress=progress)
                 for host in self.hosts]
 
-    def scp_recv(self, remote_file, local_file, recurse=False, copy_args=None):
-        copy_args = [{'local_file': '_'.join([local_file, host]),
-                      'remote_file': remote_file}
-                     for i, host in enumerate(self.hosts)] \
-                         if copy_args is None else copy_args
-        local_file = "%(local_file)s"
-        remote_file = "%(remote_file)s"
-        try:
+    def scp_recv(self, remote_file, local_file, recurse=False, copy_args=None,
+                 block_size=SCP_BLOCK_SIZE, preallocate=False, progress=None):
+        """Copy remote file(s) in parallel via SCP as
+        <local_file>_<host>, or as ``local_file`` formatted with per-host
+        arguments in ``copy_args``.
+
+        See :py:func:`pssh.clients.native.single.SSHClient.scp_recv` for
+        ``block_size``, ``preallocate`` and ``progress`` parameters.
+
+        Hosts and ``copy_args`` may be any iterable, including generators,
+        but are consumed in full as one greenlet per host is returned - memory
+        use grows with number of hosts.
+
+        :rtype: list(:py:class:`gevent.Greenlet`) of greenlets for remote copy
+          commands. Result of each greenlet is
+          :py:class:`pssh.output.TransferStats` for its host.
+        """
+        kwargs = dict(recurse=recurse, block_size=block_size,
+                      preallocate=preallocate, progress=progress)
+        if copy_args is None:
             return [self.pool.spawn(
-                self._scp_recv, host,
-                remote_file % copy_args[host_i],
-                local_file % copy_args[host_i], recurse=recurse)
-                    for host_i, host in enumerate(self.hosts)]
-        except IndexError:
-            raise HostArgumentException(
-                "Number of per-host copy arguments provided does not match "
-                "number of hosts")
+                self._scp_recv, host, remote_file,
+                '_'.join([local_file, host]), **kwargs)
+                for host in self.hosts]
+        return [self.pool.spawn(
+            self._scp_recv, host,
+            remote_file % copy_arg,
+            local_file % copy_arg, **kwargs)
+            for host, copy_arg in self._host_args(copy_args)]
 
     def _handle_greenlet_exc(self, func, host, *args, **kwargs):
         try:
@@ -546,3 +1247,15 @@ class ParallelSSHClient(BaseParallelSSHClient):
         except Exception as ex:
             ex.host = host
             raise ex
+
+
+def _keepalive_loop(client_ref, interval):
+    """Send keepalives for parallel client until it is garbage collected.
+    Only a weak reference to the client is kept in between passes."""
+    while True:
+        sleep(interval)
+        client = client_ref()
+        if client is None:
+            return
+        interval = client._send_keepalives()
+        del client
@@ -0,0 +1,163 @@
+# This file is part of parallel-ssh.
+
+# Copyright (C) 2014-2018 Panos Kittenis.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""Concurrent host name resolution with cache of resolved addresses"""
+
+import logging
+from collections import OrderedDict
+from socket import gaierror as sock_gaierror
+from time import time
+
+from gevent import socket, get_hub
+from gevent.pool import Pool
+try:
+    from gevent.resolver.ares import Resolver as AresResolver
+except ImportError:
+    # gevent < 1.3 or gevent built without c-ares
+    AresResolver = None
+
+from ...constants import DNS_CACHE_TTL, DNS_CACHE_MAX_SIZE, DNS_CONCURRENCY
+
+
+logger = logging.getLogger(__name__)
+
+
+class HostResolver(object):
+    """Resolves host names to addresses concurrently and caches resolved
+    addresses for ``ttl`` seconds.
+
+    Host names are resolved by gevent's configured resolver, which can be
+    set with the ``GEVENT_RESOLVER`` environment variable. With gevent's
+    default thread pool resolver, at most as many host names as the gevent
+    hub's thread pool size are resolved concurrently regardless of
+    ``concurrency``. ``use_ares`` resolves host names with gevent's c-ares
+    based resolver without blocking instead - c-ares only uses DNS and
+    ``/etc/hosts``, not other system name services like mDNS or SSSD.
+
+    Addresses are cached for a fixed ``ttl`` - TTLs of DNS records are not
+    known to the resolver and are not used. At most ``max_size`` host names
+    are cached, with the least recently resolved evicted first.
+
+    A resolver may be shared by any number of clients.
+    """
+
+    def __init__(self, ttl=DNS_CACHE_TTL, concurrency=DNS_CONCURRENCY,
+                 max_size=DNS_CACHE_MAX_SIZE, use_ares=False):
+        """
+        :param ttl: Number of seconds to cache resolved addresses for,
+          regardless of TTLs of DNS records. Defaults to
+          :py:class:`pssh.constants.DNS_CACHE_TTL`
+        :type ttl: float
+        :param concurrency: Maximum number of host names to resolve
+          concurrently. Defaults to
+          :py:class:`pssh.constants.DNS_CONCURRENCY`
+        :type concurrency: int
+        :param max_size: Maximum number of host names to cache addresses of.
+          Defaults to :py:class:`pssh.constants.DNS_CACHE_MAX_SIZE`
+        :type max_size: int
+        :param use_ares: (Optional) Resolve host names with gevent's c-ares
+          resolver instead of gevent's configured resolver.
+        :type use_ares: bool
+        :raises: :py:class:`ValueError` if ``use_ares`` is set and gevent
+          is built without c-ares.
+        """
+        if use_ares and AresResolver is None:
+            raise ValueError("gevent c-ares resolver is not available")
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.max_size = max_size
+        self.use_ares = use_ares
+        # Host -> (address info list, expiry time) in order of expiry
+        self._cache = OrderedDict()
+        self._ares = None
+
+    def get(self, host):
+        """Get cached addresses of host.
+
+        :returns: :py:func:`socket.getaddrinfo` address info list or ``None``
+          if host has no unexpired cached addresses.
+        """
+        entry = self._cache.get(host)
+        if entry is None:
+            return
+        if entry[1] < time():
+            del self._cache[host]
+            return
+        return entry[0]
+
+    def resolve(self, host):
+        """Resolve host, using cached addresses if available.
+
+        :returns: :py:func:`socket.getaddrinfo` address info list with port
+          set to ``0``.
+        :raises: :py:class:`socket.gaierror` on errors resolving host.
+        """
+        addr_infos = self.get(host)
+        if addr_infos is None:
+            addr_infos = self._getaddrinfo()(
+                host, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+            self._cache_put(host, addr_infos)
+        return addr_infos
+
+    def _cache_put(self, host, addr_infos):
+        now = time()
+        self._cache.pop(host, None)
+        self._cache[host] = (addr_infos, now + self.ttl)
+        # Entries are in order of expiry - expired entries and entries over
+        # max size are evicted from the front
+        while self._cache:
+            oldest = next(iter(self._cache))
+            if len(self._cache) <= self.max_size \
+               and self._cache[oldest][1] >= now:
+                return
+            del self._cache[oldest]
+
+    def _getaddrinfo(self):
+        if not self.use_ares:
+            return socket.getaddrinfo
+        hub = get_hub()
+        # c-ares resolvers are bound to the hub of the thread they are
+        # made in
+        if self._ares is None or self._ares.hub is not hub:
+            self._ares = AresResolver(hub=hub)
+        return self._ares.getaddrinfo
+
+    def _resolve(self, host):
+        try:
+            self.resolve(host)
+        except sock_gaierror as ex:
+            logger.debug("Could not resolve host %s - %s", host, ex)
+
+    def resolve_all(self, hosts):
+        """Resolve all hosts not already cached, at most ``concurrency``
+        at a time. Hosts that fail to resolve are not cached.
+
+        :param hosts: Hosts to resolve.
+        :type hosts: list(str)
+        """
+        pending = [host for host in OrderedDict.fromkeys(hosts)
+                   if self.get(host) is None]
+        if not pending:
+            return
+        pool = Pool(size=self.concurrency)
+        for host in pending:
+            pool.spawn(self._resolve, host)
+        pool.join()
+
+    def clear(self):
+        """Remove all cached addresses."""
+        self._cache.clear()
@@ -0,0 +1,229 @@
+# This file is part of parallel-ssh.
+
+# Copyright (C) 2014-2018 Panos Kittenis.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""Pool of connected and authenticated native clients that can be shared
+by any number of single and parallel clients in a process."""
+
+import logging
+from collections import OrderedDict, defaultdict
+from time import time
+
+from gevent import Timeout as GTimeout
+from gevent.lock import RLock
+
+from ...constants import SESSION_POOL_MAX_SESSIONS, \
+    SESSION_POOL_IDLE_TIMEOUT, SESSION_POOL_CHECK_TIMEOUT
+from .single import SSHClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class SessionPool(object):
+    """Pool of connected and authenticated :py:class:`SSHClient` objects,
+    keyed by host, port, user and authentication identity.
+
+    Clients retrieved from the pool with :py:func:`get` are shared - commands
+    from any number of callers run concurrently on separate channels of the
+    same SSH session, like SSH ``ControlMaster`` connections.
+
+    Each :py:func:`get` leases the client to its caller until the caller
+    calls :py:func:`release`. Leased clients are never disconnected by the
+    pool. Clients with no leases and no activity for ``idle_timeout``
+    seconds, and least recently used clients over ``max_sessions``, are
+    disconnected and removed from the pool. When only leased clients are
+    over ``max_sessions``, least recently used ones are removed from the pool
+    without being disconnected and are disconnected once released by all
+    their callers.
+    """
+
+    def __init__(self, max_sessions=SESSION_POOL_MAX_SESSIONS,
+                 idle_timeout=SESSION_POOL_IDLE_TIMEOUT):
+        """
+        :param max_sessions: Maximum number of clients to keep in pool.
+          Defaults to :py:class:`pssh.constants.SESSION_POOL_MAX_SESSIONS`
+        :type max_sessions: int
+        :param idle_timeout: Number of seconds of inactivity after which
+          clients with no leases are disconnected. Defaults to
+          :py:class:`pssh.constants.SESSION_POOL_IDLE_TIMEOUT`. ``None`` to
+          keep clients until evicted by ``max_sessions``.
+        :type idle_timeout: float
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        # Pool key -> client in order of use
+        self._clients = OrderedDict()
+        # Pooled client -> pool key
+        self._keys = {}
+        # Client -> number of leases, including clients removed from pool
+        # that are still leased
+        self._leases = defaultdict(int)
+        self._locks = defaultdict(RLock)
+
+    def __len__(self):
+        return len(self._clients)
+
+    def __contains__(self, client):
+        return client in self._keys
+
+    def _key(self, host, port=None, user=None, password=None, pkey=None):
+        return (host, port if port else 22, user, pkey, password)
+
+    def get(self, host, user=None, password=None, port=None, pkey=None,
+            **kwargs):
+        """Get connected and authenticated client for host from pool, making
+        a new client if the pool does not have a live client for host, port,
+        user and authentication identity.
+
+        Client is leased to caller until released with :py:func:`release`.
+
+        Parameters are as for :py:class:`SSHClient`. Keyword arguments other
+        than host, port, user, password and private key are only used for
+        making new clients.
+
+        :rtype: :py:class:`SSHClient`
+        """
+        key = self._key(host, port=port, user=user, password=password,
+                        pkey=pkey)
+        # Only one client per key is made, while clients for other keys
+        # connect concurrently
+        with self._locks[key]:
+            client = self._clients.get(key)
+            if client is not None and not self._alive(client):
+                logger.debug("Pooled client for host %s is not alive - "
+                             "reconnecting", host)
+                self._remove(key)
+                client = None
+            if client is None:
+                client = SSHClient(host, user=user, password=password,
+                                   port=port, pkey=pkey, **kwargs)
+                self._keys[client] = key
+            self._leases[client] += 1
+            self._touch(key, client)
+        self._evict()
+        return client
+
+    def release(self, client):
+        """Release lease of client retrieved with :py:func:`get`.
+
+        Clients removed from the pool while leased are disconnected once
+        released by all their callers.
+
+        :param client: Client to release.
+        :type client: :py:class:`SSHClient`
+        """
+        if self._leases.get(client, 0) < 1:
+            return
+        self._leases[client] -= 1
+        if self._leases[client] > 0:
+            return
+        del self._leases[client]
+        key = self._keys.get(client)
+        if key is None:
+            logger.debug("Disconnecting released client for host %s no "
+                         "longer in pool", client.host)
+            client.disconnect()
+            return
+        with self._locks[key]:
+            self._touch(key, client)
+        self._evict()
+
+    def _touch(self, key, client):
+        # Mark as most recently used
+        self._clients.pop(key, None)
+        self._clients[key] = client
+
+    def _alive(self, client):
+        if not client.is_alive():
+            return False
+        # Leased clients may have commands in progress - sessions of idle
+        # clients are checked with a round trip to the server by opening a
+        # channel, as writes to dropped connections can still succeed
+        if self._leases.get(client):
+            return True
+        try:
+            with GTimeout(SESSION_POOL_CHECK_TIMEOUT):
+                client.close_channel(client.open_session())
+        except (Exception, GTimeout) as ex:
+            logger.debug("Session of pooled client for host %s is not "
+                         "responding - %s", client.host, ex)
+            # Session may be left mid request - close socket so that
+            # disconnecting does not wait on it
+            client.sock.close()
+            return False
+        return True
+
+    def _evict(self):
+        if self.idle_timeout is not None:
+            idle_since = time() - self.idle_timeout
+            for key, client in list(self._clients.items()):
+                if self._leases.get(client) or client.last_activity is None \
+                   or client.last_activity >= idle_since:
+                    continue
+                self._evict_key(key, "Disconnecting idle pooled client for "
+                                "host %s")
+        if len(self._clients) <= self.max_sessions:
+            return
+        # Least recently used clients with no leases first
+        keys = sorted(self._clients, key=lambda key: bool(
+            self._leases.get(self._clients[key])))
+        for key in keys:
+            if len(self._clients) <= self.max_sessions:
+                return
+            self._evict_key(key, "Evicting least recently used pooled client "
+                            "for host %s")
+
+    def _evict_key(self, key, msg):
+        lock = self._locks[key]
+        # Clients being retrieved are not evicted
+        if not lock.acquire(blocking=False):
+            return
+        try:
+            logger.debug(msg, key[0])
+            self._remove(key)
+        finally:
+            lock.release()
+
+    def _remove(self, key):
+        """Remove client of key from pool, disconnecting it if not leased."""
+        client = self._clients.pop(key, None)
+        if client is None:
+            return
+        self._keys.pop(client, None)
+        if not self._leases.get(client):
+            client.disconnect()
+
+    def remove(self, client):
+        """Remove client from pool so that it is not retrieved again.
+
+        Client is disconnected if not leased, or otherwise once released by
+        all its callers.
+
+        :param client: Client to remove.
+        :type client: :py:class:`SSHClient`
+        """
+        key = self._keys.get(client)
+        if key is not None:
+            self._remove(key)
+
+    def close(self):
+        """Remove all clients from pool, disconnecting those not leased.
+        Leased clients are disconnected once released."""
+        for key in list(self._clients):
+            self._remove(key)
@@ -17,6 +17,7 @@
 
 import logging
 import os
+from time import time
 try:
     import pwd
 except ImportError:
@@ -24,8 +25,13 @@ except ImportError:
 else:
     WIN_PLATFORM = False
 from socket import gaierror as sock_gaierror, error as sock_error
+try:
+    from shlex import quote
+except ImportError:
+    from pipes import quote
 
-from gevent import sleep, socket, get_hub
+from gevent import socket, get_hub, spawn, killall
+from gevent.queue import Queue, Empty
 from gevent.hub import Hub
 from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
 from ssh2.exceptions import SFTPHandleError, SFTPProtocolError, \
@@ -34,14 +40,21 @@ from ssh2.session import Session
 from ssh2.sftp import LIBSSH2_FXF_READ, LIBSSH2_FXF_CREAT, LIBSSH2_FXF_WRITE, \
     LIBSSH2_FXF_TRUNC, LIBSSH2_SFTP_S_IRUSR, LIBSSH2_SFTP_S_IRGRP, \
     LIBSSH2_SFTP_S_IWUSR, LIBSSH2_SFTP_S_IXUSR, LIBSSH2_SFTP_S_IROTH, \
-    LIBSSH2_SFTP_S_IXGRP, LIBSSH2_SFTP_S_IXOTH
+    LIBSSH2_SFTP_S_IXGRP, LIBSSH2_SFTP_S_IXOTH, LIBSSH2_SFTP_ATTR_ACMODTIME
+from ssh2.sftp_handle import SFTPAttributes
 
 from ...exceptions import UnknownHostException, AuthenticationException, \
      ConnectionErrorException, SessionError, SFTPError, SFTPIOError, Timeout, \
      SCPError
-from ...constants import DEFAULT_RETRIES, RETRY_DELAY
-from ...native._ssh2 import wait_select, _read_output  # , sftp_get, sftp_put
-from .common import _validate_pkey_path
+from ...constants import DEFAULT_RETRIES, RETRY_DELAY, SFTP_BLOCK_SIZE, \
+    SFTP_READ_BUFFER_SIZE, SFTP_SYNC_VERIFY_SIZE, SFTP_SYNC_PARTIAL_SUFFIX, \
+    SCP_BLOCK_SIZE, CONNECTION_ATTEMPT_DELAY
+from ...native._ssh2 import wait_select, _read_output, sftp_put, sftp_get
+from ...output import TransferStats
+from ...retry import RetryPolicy
+from .common import _validate_pkey_path, _validate_output_mode, \
+    _local_manifest, _manifest_changed, _throttle_progress, \
+    _sort_addrs, _replace_file
 
 
 Hub.NOT_ERROR = (Exception,)
@@ -67,7 +80,9 @@ class SSHClient(object):
                  allow_agent=True, timeout=None,
                  forward_ssh_agent=True,
                  proxy_host=None,
-                 _auth_thread_pool=True):
+                 keepalive_seconds=None,
+                 retry_policy=None,
+                 _auth_thread_pool=True, _addr_infos=None):
         """:param host: Host name or IP to connect to.
         :type host: str
         :param user: User to connect as. Defaults to logged in user.
@@ -99,6 +114,17 @@ class SSHClient(object):
         :param proxy_host: Connection to host is via provided proxy host
           and client should use self.proxy_host for connection attempts.
         :type proxy_host: str
+        :param keepalive_seconds: (Optional) Interval of keepalive messages
+          sent by :py:func:`keepalive`. Keepalive is disabled by default -
+          :py:class:`pssh.constants.KEEPALIVE_INTERVAL` is a suitable
+          interval for enabling it.
+        :type keepalive_seconds: int
+        :param retry_policy: (Optional) Policy for number of connection
+          attempts and delay between them, for example with exponential
+          backoff. Defaults to a fixed delay of ``retry_delay`` between
+          ``num_retries`` attempts. Overrides ``num_retries`` and
+          ``retry_delay`` if set.
+        :type retry_policy: :py:class:`pssh.retry.RetryPolicy`
 
         :raises: :py:class:`pssh.exceptions.PKeyFileError` on errors finding
           provided private key.
@@ -111,14 +137,21 @@ class SSHClient(object):
             raise ValueError("Must provide user parameter on Windows")
         self.password = password
         self.port = port if port else 22
-        self.num_retries = num_retries
+        self.retry_policy = retry_policy if retry_policy is not None \
+            else RetryPolicy(num_retries=num_retries, retry_delay=retry_delay,
+                             backoff=1, max_delay=retry_delay, jitter=False)
+        self.num_retries = self.retry_policy.num_retries
         self.sock = None
         self.timeout = timeout
-        self.retry_delay = retry_delay
+        self.retry_delay = self.retry_policy.retry_delay
         self.allow_agent = allow_agent
         self.forward_ssh_agent = forward_ssh_agent
+        self.keepalive_seconds = keepalive_seconds
         self._forward_requested = False
         self.session = None
+        self.last_activity = None
+        # Addresses of host already resolved by parallel client
+        self._addr_infos = _addr_infos
         self._host = proxy_host if proxy_host else host
         self.pkey = _validate_pkey_path(pkey, self.host)
         self._connect(self._host, self.port)
@@ -147,11 +180,11 @@ class SSHClient(object):
         self.disconnect()
 
     def _connect_init_retry(self, retries):
-        retries += 1
         self.session = None
         if not self.sock.closed:
             self.sock.close()
-        sleep(self.retry_delay)
+        self.retry_policy.sleep(retries)
+        retries += 1
         self._connect(self._host, self.port, retries=retries)
         return self._init(retries=retries)
 
@@ -177,20 +210,26 @@ class SSHClient(object):
                 return self._connect_init_retry(retries)
             msg = "Authentication error while connecting to %s:%s - %s"
             raise AuthenticationException(msg, self.host, self.port, ex)
+        if self.keepalive_seconds:
+            self.session.keepalive_config(False, self.keepalive_seconds)
         self.session.set_blocking(0)
+        self.last_activity = time()
 
     def _connect(self, host, port, retries=1):
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        if self.timeout:
-            self.sock.settimeout(self.timeout)
         logger.debug("Connecting to %s:%s", host, port)
         try:
-            self.sock.connect((host, port))
+            if self._addr_infos is not None and host == self.host:
+                addrs = _sort_addrs(self._addr_infos, port=port)
+            else:
+                addrs = _sort_addrs(socket.getaddrinfo(
+                    host, port, socket.AF_UNSPEC, socket.SOCK_STREAM))
+            self.sock = self._connect_addrs(addrs)
         except sock_gaierror as ex:
             logger.error("Could not resolve host '%s' - retry %s/%s",
                          host, retries, self.num_retries)
+            self._addr_infos = None
             while retries < self.num_retries:
-                sleep(self.retry_delay)
+                self.retry_policy.sleep(retries)
                 return self._connect(host, port, retries=retries+1)
             raise UnknownHostException("Unknown host %s - %s - retry %s/%s",
                                        host, str(ex.args[1]), retries,
@@ -198,8 +237,10 @@ class SSHClient(object):
         except sock_error as ex:
             logger.error("Error connecting to host '%s:%s' - retry %s/%s",
                          host, port, retries, self.num_retries)
+            # Host is resolved again on retries
+            self._addr_infos = None
             while retries < self.num_retries:
-                sleep(self.retry_delay)
+                self.retry_policy.sleep(retries)
                 return self._connect(host, port, retries=retries+1)
             error_type = ex.args[1] if len(ex.args) > 1 else ex.args[0]
             raise ConnectionErrorException(
@@ -207,6 +248,64 @@ class SSHClient(object):
                 host, port, str(error_type), retries,
                 self.num_retries,)
 
+    def _connect_addr(self, family, sockaddr):
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        if self.timeout:
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(sockaddr)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    def _connect_addrs(self, addrs):
+        """Connect to first address to accept connection.
+
+        Connection attempts to each address are started
+        ``pssh.constants.CONNECTION_ATTEMPT_DELAY`` seconds apart, or as soon
+        as the previous attempt fails, and race each other as per RFC 8305.
+
+        :raises: :py:class:`socket.gaierror` if there are no addresses.
+        """
+        if not addrs:
+            raise sock_gaierror(socket.EAI_NONAME,
+                                "No addresses to connect to")
+        if len(addrs) == 1:
+            return self._connect_addr(*addrs[0])
+        results = Queue()
+        attempts = []
+        sock = None
+        failed = 0
+        try:
+            for family, sockaddr in addrs:
+                attempt = spawn(self._connect_addr, family, sockaddr)
+                attempt.link(results.put)
+                attempts.append(attempt)
+                try:
+                    done = results.get(timeout=CONNECTION_ATTEMPT_DELAY)
+                except Empty:
+                    continue
+                if done.successful():
+                    sock = done.value
+                    return sock
+                failed += 1
+            while True:
+                if failed == len(attempts):
+                    raise done.exception
+                done = results.get()
+                if done.successful():
+                    sock = done.value
+                    return sock
+                failed += 1
+        finally:
+            killall(attempts)
+            # Close sockets of other attempts that also succeeded
+            for attempt in attempts:
+                if attempt.successful() and attempt.value is not sock \
+                   and isinstance(attempt.value, socket.socket):
+                    attempt.value.close()
+
     def _pkey_auth(self):
         self.session.userauth_publickey_fromfile(
             self.user,
@@ -283,8 +382,39 @@ class SSHClient(object):
         if self.forward_ssh_agent and not self._forward_requested:
             self._eagain(chan.request_auth_agent)
             self._forward_requested = True
+        self.last_activity = time()
         return chan
 
+    def is_alive(self):
+        """Whether client has an initialised session with an open socket.
+
+        Sessions dropped by the server or network without the client
+        having tried to use them may still appear to be alive.
+
+        :rtype: bool
+        """
+        return self.session is not None and self.sock is not None \
+            and not self.sock.closed
+
+    def keepalive(self):
+        """Send keepalive message to server if one is due, as configured by
+        ``keepalive_seconds``.
+
+        :returns: Number of seconds until next keepalive is due.
+        :rtype: int
+
+        :raises: :py:class:`pssh.exceptions.SessionError` on errors sending
+          keepalive, for example the connection having been dropped.
+        """
+        if not self.keepalive_seconds:
+            return
+        try:
+            seconds = self._eagain(self.session.keepalive_send)
+        except Exception as ex:
+            raise SessionError(ex)
+        self.last_activity = time()
+        return seconds
+
     def execute(self, cmd, use_pty=False, channel=None):
         """Execute command on remote server.
 
@@ -303,21 +433,77 @@ class SSHClient(object):
         self._eagain(channel.execute, cmd)
         return channel
 
-    def read_stderr(self, channel, timeout=None):
+    def read_stderr(self, channel, timeout=None, chunks=False):
         """Read standard error buffer from channel.
 
         :param channel: Channel to read output from.
         :type channel: :py:class:`ssh2.channel.Channel`
+        :param chunks: Yield chunks of output as read instead of lines.
+        :type chunks: bool
         """
-        return _read_output(self.session, channel.read_stderr, timeout=timeout)
+        return _read_output(self.session,
+                            self._read_func(channel.read_stderr),
+                            timeout=timeout, chunks=chunks)
 
-    def read_output(self, channel, timeout=None):
+    def read_output(self, channel, timeout=None, chunks=False):
         """Read standard output buffer from channel.
 
         :param channel: Channel to read output from.
         :type channel: :py:class:`ssh2.channel.Channel`
+        :param chunks: Yield chunks of output as read instead of lines.
+        :type chunks: bool
+        """
+        return _read_output(self.session, self._read_func(channel.read),
+                            timeout=timeout, chunks=chunks)
+
+    def _read_func(self, read_func):
+        """Channel read function to read output with.
+
+        With keepalive enabled, read function is wrapped to update
+        ``last_activity`` on each read that does not block, so that
+        keepalives are not sent on sessions busy reading output. Read
+        functions are otherwise used as is."""
+        if not self.keepalive_seconds:
+            return read_func
+
+        def _read():
+            ret = read_func()
+            if ret[0] != LIBSSH2_ERROR_EAGAIN:
+                self.last_activity = time()
+            return ret
+        return _read
+
+    def get_output_generators(self, channel, timeout=None, encoding='utf-8',
+                              output_mode='lines'):
+        """Get standard output and standard error generators for channel.
+
+        :param channel: Channel to read output from.
+        :type channel: :py:class:`ssh2.channel.Channel`
+        :param timeout: (Optional) Timeout in seconds for reading output.
+        :type timeout: int
+        :param encoding: Encoding to decode output lines with when
+          ``output_mode`` is ``lines``.
+        :type encoding: str
+        :param output_mode: One of ``lines`` for decoded lines of output,
+          logged to ``host_logger``, ``bytes`` for undecoded lines of output or
+          ``chunks`` for undecoded chunks of output as they are read. Output is
+          not logged to ``host_logger`` in ``bytes`` or ``chunks`` modes.
+        :type output_mode: str
+
+        :rtype: tuple(stdout, stderr)
+        :raises: :py:class:`ValueError` on invalid ``output_mode``.
         """
-        return _read_output(self.session, channel.read, timeout=timeout)
+        if output_mode == 'lines':
+            return self.read_output_buffer(
+                self.read_output(channel, timeout=timeout),
+                encoding=encoding), \
+                self.read_output_buffer(
+                    self.read_stderr(channel, timeout=timeout),
+                    encoding=encoding, prefix='\t[err]')
+        _validate_output_mode(output_mode)
+        chunks = output_mode == 'chunks'
+        return self.read_output(channel, timeout=timeout, chunks=chunks), \
+            self.read_stderr(channel, timeout=timeout, chunks=chunks)
 
     def _select_timeout(self, func, timeout):
         ret = func()
@@ -326,6 +512,7 @@ class SSHClient(object):
             ret = func()
             if ret == LIBSSH2_ERROR_EAGAIN and timeout is not None:
                 raise Timeout
+        self.last_activity = time()
 
     def wait_finished(self, channel, timeout=None):
         """Wait for EOF from channel and close channel.
@@ -355,6 +542,7 @@ class SSHClient(object):
         while ret == LIBSSH2_ERROR_EAGAIN:
             wait_select(self.session)
             ret = func(*args, **kwargs)
+        self.last_activity = time()
         return ret
 
     def read_output_buffer(self, output_buffer, prefix=None,
@@ -373,16 +561,20 @@ class SSHClient(object):
         :type callback_args: tuple
         """
         prefix = '' if prefix is None else prefix
-        for line in output_buffer:
-            output = line.decode(encoding)
-            host_logger.info("[%s]%s\t%s", self.host, prefix, output)
-            yield output
+        if not host_logger.isEnabledFor(logging.INFO):
+            for line in output_buffer:
+                yield line.decode(encoding)
+        else:
+            for line in output_buffer:
+                output = line.decode(encoding)
+                host_logger.info("[%s]%s\t%s", self.host, prefix, output)
+                yield output
         if callback:
             callback(*callback_args)
 
     def run_command(self, command, sudo=False, user=None,
                     use_pty=False, shell=None,
-                    encoding='utf-8', timeout=None):
+                    encoding='utf-8', timeout=None, output_mode='lines'):
         """Run remote command.
 
         :param command: Command to run.
@@ -400,9 +592,17 @@ class SSHClient(object):
         :param encoding: Encoding to use for output. Must be valid
           `Python codec <https://docs.python.org/2.7/library/codecs.html>`_
         :type encoding: str
+        :param output_mode: (Optional) ``lines`` (default) for decoded lines
+          of output, ``bytes`` for undecoded lines or ``chunks`` for undecoded
+          chunks of output as they are read from the channel. Raw modes skip
+          decoding and ``host_logger`` logging and are suited to bulk or
+          binary output.
+        :type output_mode: str
 
         :rtype: (channel, host, stdout, stderr, stdin) tuple.
+        :raises: :py:class:`ValueError` on invalid ``output_mode``.
         """
+        _validate_output_mode(output_mode)
         # Fast path for no command substitution needed
         if not sudo and not user and not shell:
             _command = command
@@ -415,13 +615,10 @@ class SSHClient(object):
             _shell = shell if shell else '$SHELL -c'
             _command += "%s '%s'" % (_shell, command,)
         channel = self.execute(_command, use_pty=use_pty)
-        return channel, self.host, \
-            self.read_output_buffer(
-                self.read_output(channel, timeout=timeout),
-                encoding=encoding), \
-            self.read_output_buffer(
-                self.read_stderr(channel, timeout=timeout), encoding=encoding,
-                prefix='\t[err]'), channel
+        stdout, stderr = self.get_output_generators(
+            channel, timeout=timeout, encoding=encoding,
+            output_mode=output_mode)
+        return channel, self.host, stdout, stderr, channel
 
     def _make_sftp(self):
         """Make SFTP client from open transport"""
@@ -463,7 +660,8 @@ class SSHClient(object):
         logger.debug("Created remote directory %s", directory)
 
     def copy_file(self, local_file, remote_file, recurse=False,
-                  sftp=None, _dir=None):
+                  sftp=None, _dir=None, concurrency=1,
+                  block_size=SFTP_BLOCK_SIZE, sync=False, progress=None):
         """Copy local file to host via SFTP.
 
         :param local_file: Local filepath to copy to remote host
@@ -472,6 +670,30 @@ class SSHClient(object):
         :type remote_file: str
         :param recurse: Whether or not to descend into directories recursively.
         :type recurse: bool
+        :param concurrency: (Optional) Number of files to copy concurrently
+          when copying a directory recursively, each over its own SFTP session.
+          Defaults to one file at a time.
+        :type concurrency: int
+        :param block_size: (Optional) Size in bytes of blocks to read from
+          local files and write via SFTP. Defaults to
+          :py:data:`pssh.constants.SFTP_BLOCK_SIZE`.
+        :type block_size: int
+        :param sync: (Optional) Skip remote files with the same size and
+          modification time as local files. Other files are copied to a
+          partial file with suffix
+          :py:data:`pssh.constants.SFTP_SYNC_PARTIAL_SUFFIX` that is renamed
+          to the remote file once copied and is resumed if copying is
+          interrupted. Modification times of remote files are set to those of
+          local files once copied.
+        :type sync: bool
+        :param progress: (Optional) Function to call with
+          ``(host, path, bytes_copied, total_bytes)`` as files are copied, at
+          most once every :py:data:`pssh.constants.PROGRESS_INTERVAL`
+          seconds other than on completing a file. ``path`` is the path of
+          the file being copied from.
+        :type progress: function
+
+        :rtype: :py:class:`pssh.output.TransferStats` of files copied
 
         :raises: :py:class:`ValueError` when a directory is supplied to
           ``local_file`` and ``recurse`` is not set
@@ -482,43 +704,244 @@ class SSHClient(object):
         :raises: :py:class:`IOError` on local file IO errors
         :raises: :py:class:`OSError` on local OS errors like permission denied
         """
+        start = time()
+        stats = TransferStats(self.host)
+        progress = _throttle_progress(progress)
         sftp = self._make_sftp() if sftp is None else sftp
         if os.path.isdir(local_file) and recurse:
-            return self._copy_dir(local_file, remote_file, sftp)
+            self._copy_dir(local_file, remote_file, sftp,
+                           concurrency=concurrency, block_size=block_size,
+                           sync=sync, progress=progress, stats=stats)
         elif os.path.isdir(local_file) and not recurse:
             raise ValueError("Recurse must be true if local_file is a "
                              "directory.")
-        destination = self._remote_paths_split(remote_file)
-        if destination is not None:
+        else:
+            destination = self._remote_paths_split(remote_file)
+            if destination is not None:
+                try:
+                    self._eagain(sftp.stat, destination)
+                except (SFTPHandleError, SFTPProtocolError):
+                    self.mkdir(sftp, destination)
+            self._copy_files(sftp, [(local_file, remote_file)],
+                             block_size=block_size, sync=sync,
+                             progress=progress, stats=stats)
+        stats.duration = time() - start
+        return stats
+
+    def _sftp_open_write(self, sftp, remote_file, resume=False):
+        mode = LIBSSH2_SFTP_S_IRUSR | \
+            LIBSSH2_SFTP_S_IWUSR | \
+            LIBSSH2_SFTP_S_IRGRP | \
+            LIBSSH2_SFTP_S_IROTH
+        f_flags = LIBSSH2_FXF_CREAT | LIBSSH2_FXF_WRITE | LIBSSH2_FXF_READ \
+            if resume else \
+            LIBSSH2_FXF_CREAT | LIBSSH2_FXF_WRITE | LIBSSH2_FXF_TRUNC
+        return sftp.open(remote_file, f_flags, mode)
+
+    def _sync_up_to_date(self, src_size, src_mtime, dst_size, dst_mtime):
+        """Whether destination is up to date with source - sync transfers set
+        destination modification time once complete."""
+        return dst_size == src_size and int(dst_mtime) == int(src_mtime)
+
+    def _sync_offset(self, src_size, part_size):
+        """Offset to resume transfer of source file from given size of its
+        partial file.
+
+        Sync transfers write to a partial file with
+        :py:class:`pssh.constants.SFTP_SYNC_PARTIAL_SUFFIX` that is renamed to
+        the destination once complete, so only partial files are resumed -
+        never destination files of unknown origin."""
+        if part_size < src_size:
+            return part_size
+        return 0
+
+    def _sftp_rename_iter(self, sftp, source, dest):
+        """Rename remote file, replacing destination, without blocking."""
+        try:
+            rc = sftp.rename(source, dest)
+            while rc == LIBSSH2_ERROR_EAGAIN:
+                yield rc
+                rc = sftp.rename(source, dest)
+        except SFTPProtocolError:
+            # SFTP version 3 servers do not replace existing files on rename
+            rc = sftp.unlink(dest)
+            while rc == LIBSSH2_ERROR_EAGAIN:
+                yield rc
+                rc = sftp.unlink(dest)
+            rc = sftp.rename(source, dest)
+            while rc == LIBSSH2_ERROR_EAGAIN:
+                yield rc
+                rc = sftp.rename(source, dest)
+
+    def _sftp_put_iter(self, sftp, local_file, remote_file,
+                       block_size=SFTP_BLOCK_SIZE, sync=False, changed=False,
+                       progress=None, stats=None):
+        """Copy local file to remote file via SFTP without blocking.
+
+        Yields ``LIBSSH2_ERROR_EAGAIN`` whenever the session would block -
+        caller should wait on session socket before resuming.
+
+        Local file is read in blocks of ``block_size`` which libssh2 writes
+        as several outstanding SFTP write requests.
+
+        With ``sync``, remote files that are up to date are skipped and
+        others are copied to a partial file that is renamed to the remote file
+        once complete. Partial files left by interrupted copies are resumed.
+        With ``changed``, remote files are already known to differ from local
+        files and are copied even if their size and modification time match.
+
+        Bytes written and completed files are added to ``stats``."""
+        offset = 0
+        local_stat = os.stat(local_file)
+        write_file = remote_file
+        if sync and not changed:
+            try:
+                attrs = sftp.stat(remote_file)
+                while attrs == LIBSSH2_ERROR_EAGAIN:
+                    yield attrs
+                    attrs = sftp.stat(remote_file)
+            except (SFTPHandleError, SFTPProtocolError):
+                pass
+            else:
+                if self._sync_up_to_date(
+                        local_stat.st_size, local_stat.st_mtime,
+                        attrs.filesize, attrs.mtime):
+                    logger.info("Remote file %s:%s is up to date with local "
+                                "file %s", self.host, remote_file, local_file)
+                    return
+        if sync:
+            write_file = remote_file + SFTP_SYNC_PARTIAL_SUFFIX
             try:
-                self._eagain(sftp.stat, destination)
+                attrs = sftp.stat(write_file)
+                while attrs == LIBSSH2_ERROR_EAGAIN:
+                    yield attrs
+                    attrs = sftp.stat(write_file)
             except (SFTPHandleError, SFTPProtocolError):
-                self.mkdir(sftp, destination)
-        self.sftp_put(sftp, local_file, remote_file)
+                pass
+            else:
+                offset = self._sync_offset(local_stat.st_size, attrs.filesize)
+        try:
+            remote_fh = self._sftp_open_write(sftp, write_file, bool(offset))
+            while remote_fh == LIBSSH2_ERROR_EAGAIN:
+                yield remote_fh
+                remote_fh = self._sftp_open_write(
+                    sftp, write_file, bool(offset))
+        except Exception as ex:
+            raise SFTPError(ex)
+        try:
+            with open(local_file, 'rb') as local_fh:
+                if offset:
+                    # Resume only if data preceding offset matches, as
+                    # local file may have changed since partial copy
+                    verify_size = min(offset, SFTP_SYNC_VERIFY_SIZE)
+                    remote_fh.seek64(offset - verify_size)
+                    local_fh.seek(offset - verify_size)
+                    expected = local_fh.read(verify_size)
+                    data = b''
+                    while len(data) < verify_size:
+                        rc, _data = remote_fh.read(verify_size - len(data))
+                        if rc == LIBSSH2_ERROR_EAGAIN:
+                            yield rc
+                        elif rc <= 0:
+                            break
+                        else:
+                            data += _data
+                    if data != expected:
+                        logger.debug("Partial remote file %s:%s differs "
+                                     "from local file %s before offset %s - "
+                                     "copying whole file", self.host,
+                                     write_file, local_file, offset)
+                        offset = 0
+                    else:
+                        logger.debug("Resuming copy of local file %s to "
+                                     "remote destination %s:%s from offset "
+                                     "%s", local_file, self.host, write_file,
+                                     offset)
+                    remote_fh.seek64(offset)
+                    local_fh.seek(offset)
+                done = offset
+                data = local_fh.read(block_size)
+                while data:
+                    ret = remote_fh.write(data)
+                    # Tuple of (rc, bytes_written) on ssh2-python >= 0.27
+                    rc, written = ret if isinstance(ret, tuple) \
+                        else (ret, max(ret, 0))
+                    data = data[written:]
+                    done += written
+                    if stats is not None:
+                        stats.transferred += written
+                    if rc == LIBSSH2_ERROR_EAGAIN:
+                        yield rc
+                    elif not data:
+                        if progress is not None:
+                            progress(self.host, local_file, done,
+                                     local_stat.st_size)
+                        data = local_fh.read(block_size)
+            if sync:
+                attrs = SFTPAttributes()
+                attrs.flags = LIBSSH2_SFTP_ATTR_ACMODTIME
+                attrs.atime = int(local_stat.st_atime)
+                attrs.mtime = int(local_stat.st_mtime)
+                rc = remote_fh.fsetstat(attrs)
+                while rc == LIBSSH2_ERROR_EAGAIN:
+                    yield rc
+                    rc = remote_fh.fsetstat(attrs)
+        except SFTPProtocolError as ex:
+            msg = "Error writing to remote file %s - %s"
+            logger.error(msg, remote_file, ex)
+            self._eagain(remote_fh.close)
+            raise SFTPIOError(msg, remote_file, ex)
+        # Non-blocking close must be completed before the SFTP session can
+        # be used for further requests without stalling
+        rc = remote_fh.close()
+        while rc == LIBSSH2_ERROR_EAGAIN:
+            yield rc
+            rc = remote_fh.close()
+        if write_file != remote_file:
+            try:
+                for rc in self._sftp_rename_iter(
+                        sftp, write_file, remote_file):
+                    yield rc
+            except SFTPProtocolError as ex:
+                msg = "Error renaming partial remote file %s - %s"
+                logger.error(msg, write_file, ex)
+                raise SFTPIOError(msg, write_file, ex)
+        if stats is not None:
+            stats.files += 1
         logger.info("Copied local file %s to remote destination %s:%s",
                     local_file, self.host, remote_file)
 
-    def _sftp_put(self, remote_fh, local_file):
-        with open(local_file, 'rb') as local_fh:
-            for data in local_fh:
-                self._eagain(remote_fh.write, data)
+    def sftp_put(self, sftp, local_file, remote_file,
+                 block_size=SFTP_BLOCK_SIZE, progress=None):
+        """Copy local file to remote file via SFTP, reading local file in
+        blocks of ``block_size``.
 
-    def sftp_put(self, sftp, local_file, remote_file):
-        mode = LIBSSH2_SFTP_S_IRUSR | \
-               LIBSSH2_SFTP_S_IWUSR | \
-               LIBSSH2_SFTP_S_IRGRP | \
-               LIBSSH2_SFTP_S_IROTH
-        f_flags = LIBSSH2_FXF_CREAT | LIBSSH2_FXF_WRITE | LIBSSH2_FXF_TRUNC
-        with self._sftp_openfh(
-                sftp.open, remote_file, f_flags, mode) as remote_fh:
-            try:
-                self._sftp_put(remote_fh, local_file)
-                # THREAD_POOL.apply(
-                #     sftp_put, args=(self.session, remote_fh, local_file))
-            except SFTPProtocolError as ex:
-                msg = "Error writing to remote file %s - %s"
-                logger.error(msg, remote_file, ex)
-                raise SFTPIOError(msg, remote_file, ex)
+        ``progress``, if set, is called with
+        ``(host, local_file, bytes_copied, total_bytes)`` after each block is
+        written.
+
+        :rtype: int - number of bytes copied
+
+        :raises: :py:class:`pssh.exceptions.SFTPError` on errors opening remote
+          file
+        :raises: :py:class:`pssh.exceptions.SFTPIOError` on errors writing to
+          remote file
+        :raises: :py:class:`IOError` on local file IO errors
+        """
+        remote_fh = self._sftp_openfh(self._sftp_open_write, sftp, remote_file)
+        callback = None if progress is None else self._progress_callback(
+            progress, local_file, os.stat(local_file).st_size)
+        try:
+            return sftp_put(self.session, remote_fh, local_file,
+                            buffer_maxlen=block_size, progress=callback)
+        except SFTPProtocolError as ex:
+            msg = "Error writing to remote file %s - %s"
+            logger.error(msg, remote_file, ex)
+            raise SFTPIOError(msg, remote_file, ex)
+        finally:
+            # Non-blocking close must be completed before the SFTP session can
+            # be used for further requests without stalling
+            self._eagain(remote_fh.close)
 
     def mkdir(self, sftp, directory, _parent_path=None):
         """Make directory via SFTP channel.
@@ -554,18 +977,231 @@ class SSHClient(object):
                 _dir = ''.join(('/', _dir))
             return self.mkdir(sftp, sub_dirs, _parent_path=_dir)
 
-    def _copy_dir(self, local_dir, remote_dir, sftp):
-        """Call copy_file on every file in the specified directory, copying
-        them to the specified remote directory."""
-        file_list = os.listdir(local_dir)
-        for file_name in file_list:
-            local_path = os.path.join(local_dir, file_name)
-            remote_path = '/'.join([remote_dir, file_name])
-            self.copy_file(local_path, remote_path, recurse=True,
-                           sftp=sftp)
+    def _copy_dir(self, local_dir, remote_dir, sftp, concurrency=1,
+                  block_size=SFTP_BLOCK_SIZE, sync=False, progress=None,
+                  stats=None):
+        """Copy local directory tree to the specified remote directory.
+
+        Remote directory tree is created up front from a walk of the local
+        directory, after which files are copied with up to ``concurrency``
+        files in flight, each on its own SFTP session."""
+        remote_dirs, files = self._walk_local_dir(local_dir, remote_dir)
+        self.mkdir(sftp, remote_dir)
+        for directory in remote_dirs:
+            try:
+                self._eagain(sftp.stat, directory)
+            except (SFTPHandleError, SFTPProtocolError):
+                self._mkdir(sftp, directory)
+        files.reverse()
+        self._copy_files(sftp, files, concurrency=concurrency,
+                         block_size=block_size, sync=sync, progress=progress,
+                         stats=stats)
+
+    def _walk_local_dir(self, local_dir, remote_dir):
+        """Walk local directory and return remote directories in top-down order
+        and list of ``(local_path, remote_path)`` of files to copy."""
+        def _raise(ex):
+            raise ex
+        remote_dirs = []
+        files = []
+        for root, dir_names, file_names in os.walk(
+                local_dir, onerror=_raise, followlinks=True):
+            rel_root = os.path.relpath(root, local_dir)
+            remote_root = remote_dir if rel_root == os.curdir else \
+                '/'.join([remote_dir] + rel_root.split(os.path.sep))
+            remote_dirs.extend('/'.join([remote_root, dir_name])
+                               for dir_name in dir_names)
+            files.extend((os.path.join(root, file_name),
+                          '/'.join([remote_root, file_name]))
+                         for file_name in file_names)
+        return remote_dirs, files
+
+    def _copy_files(self, sftp, files, concurrency=1,
+                    block_size=SFTP_BLOCK_SIZE, sync=False, changed=False,
+                    progress=None, stats=None):
+        """Copy ``(local_path, remote_path)`` files popped from ``files``
+        with up to ``concurrency`` files in flight, each on its own SFTP
+        session. ``sftp`` is used for the first file in flight and further
+        SFTP sessions are made as needed and shut down once copying is done
+        or has failed.
+
+        All copies are driven from the calling greenlet and the session socket
+        is only waited on when no copy can make progress. Waiting on the same
+        session from multiple greenlets would stall them, as data read by one
+        greenlet's SFTP request may be for another's."""
+        free = [sftp]
+        copies = []
+        try:
+            free.extend(self._make_sftp() for _ in range(
+                min(concurrency, len(files)) - 1))
+            while files or copies:
+                while free and files:
+                    local_file, remote_file = files.pop()
+                    _sftp = free.pop()
+                    copies.append((_sftp, self._sftp_put_iter(
+                        _sftp, local_file, remote_file, block_size=block_size,
+                        sync=sync, changed=changed, progress=progress,
+                        stats=stats)))
+                blocked = True
+                for copy in copies[:]:
+                    try:
+                        next(copy[1])
+                    except StopIteration:
+                        copies.remove(copy)
+                        free.append(copy[0])
+                        blocked = False
+                if blocked:
+                    wait_select(self.session)
+                else:
+                    self.last_activity = time()
+        finally:
+            # Extra SFTP sessions are shut down when no longer referenced,
+            # including by frames of a raised exception's traceback
+            for _, steps in copies:
+                steps.close()
+            del copies[:], free[:]
+            _sftp = copy = None
+
+    def sync_dir(self, local_dir, remote_dir, checksum=False, concurrency=1,
+                 scp_min_size=None, block_size=SFTP_BLOCK_SIZE,
+                 encoding='utf-8', local_manifest=None):
+        """Sync remote directory with local directory, copying only files that
+        are missing or have changed.
+
+        A manifest of the remote directory is gathered by running ``find``,
+        and ``sha256sum`` with ``checksum``, on the remote host, and compared
+        to a manifest of the local directory. Files are changed if their size
+        differs, or their SHA256 digest with ``checksum``, or otherwise their
+        modification time. Remote files not in the local directory are not
+        removed.
+
+        Changed files are copied via SFTP with ``sync`` - see
+        :py:func:`SSHClient.copy_file` - or via SCP if at least
+        ``scp_min_size`` bytes in size. Modification times of copied remote
+        files are set to those of local files.
+
+        :param local_dir: Local directory to sync from
+        :type local_dir: str
+        :param remote_dir: Remote directory to sync to
+        :type remote_dir: str
+        :param checksum: (Optional) Compare files by SHA256 digest instead of
+          modification time. Requires ``sha256sum`` on the remote host.
+        :type checksum: bool
+        :param concurrency: (Optional) Number of files to copy concurrently
+          via SFTP, each over its own SFTP session.
+        :type concurrency: int
+        :param scp_min_size: (Optional) Copy files of at least this many bytes
+          via SCP instead of SFTP. Defaults to copying all files via SFTP -
+          unlike SFTP, SCP copies cannot be resumed.
+        :type scp_min_size: int
+        :param block_size: (Optional) Size in bytes of blocks to read from
+          local files and write via SFTP.
+        :type block_size: int
+        :param encoding: (Optional) Encoding of remote file paths.
+        :type encoding: str
+        :param local_manifest: (Optional) Manifest of local directory to use
+          instead of walking ``local_dir``.
+
+        :rtype: list(str) of paths relative to ``remote_dir`` of files copied
+
+        :raises: :py:class:`ValueError` when ``local_dir`` is not a directory
+        :raises: :py:class:`pss.exceptions.SFTPError` on SFTP initialisation
+          errors
+        :raises: :py:class:`pssh.exceptions.SFTPIOError` on I/O errors writing
+          via SFTP
+        :raises: :py:class:`pssh.exceptions.SCPError` on errors copying via SCP
+        :raises: :py:class:`OSError` on local OS errors like permission denied
+        """
+        if not os.path.isdir(local_dir):
+            raise ValueError("Local path %s is not a directory" % (local_dir,))
+        local_dirs, local_files = _local_manifest(
+            local_dir, checksum=checksum) if local_manifest is None \
+            else local_manifest
+        remote_dirs, remote_files = self._remote_manifest(
+            remote_dir, checksum=checksum, encoding=encoding)
+        changed = [path for path in sorted(local_files)
+                   if _manifest_changed(local_files[path],
+                                        remote_files.get(path))]
+        logger.debug("%s out of %s files changed on host %s for remote "
+                     "directory %s", len(changed), len(local_files),
+                     self.host, remote_dir)
+        sftp = self._make_sftp()
+        self.mkdir(sftp, remote_dir)
+        for directory in local_dirs:
+            if directory not in remote_dirs:
+                self._mkdir(sftp, '/'.join([remote_dir, directory]))
+        sftp_files = []
+        scp_files = []
+        for path in changed:
+            _files = scp_files if scp_min_size is not None and \
+                local_files[path][0] >= scp_min_size else sftp_files
+            _files.append((os.path.join(local_dir, *path.split('/')),
+                           '/'.join([remote_dir, path])))
+        if sftp_files:
+            sftp_files.reverse()
+            # Files are known to have changed from the manifests, which may
+            # compare digests of files with the same size and modification
+            # time
+            self._copy_files(sftp, sftp_files, concurrency=concurrency,
+                             block_size=block_size, sync=True, changed=True)
+        for local_file, remote_file in scp_files:
+            self._scp_send(local_file, remote_file)
+        logger.info("Synced local directory %s to remote destination %s:%s - "
+                    "copied %s files", local_dir, self.host, remote_dir,
+                    len(changed))
+        return changed
+
+    def _remote_manifest(self, remote_dir, checksum=False, encoding='utf-8'):
+        """Get ``(dirs, files)`` manifest of remote directory as per
+        :py:func:`pssh.clients.native.common._local_manifest`.
+
+        Remote directories that do not exist or cannot be listed have an
+        empty manifest."""
+        remote_dirs = set()
+        remote_files = {}
+        data, exit_code = self._run_for_output(
+            "find %s -mindepth 1 \\( -type d -o -type f \\) "
+            "-printf '%%y\\t%%s\\t%%T@\\t%%P\\0'" % (quote(remote_dir),))
+        if exit_code != 0:
+            logger.debug("Listing remote directory %s on host %s exited with "
+                         "%s", remote_dir, self.host, exit_code)
+        for entry in data.split(b'\0'):
+            if not entry:
+                continue
+            _type, size, mtime, path = entry.split(b'\t', 3)
+            path = path.decode(encoding)
+            if _type == b'd':
+                remote_dirs.add(path)
+            else:
+                remote_files[path] = (int(size), float(mtime), None)
+        if not checksum or not remote_files:
+            return remote_dirs, remote_files
+        data, exit_code = self._run_for_output(
+            "cd %s && find . -type f -exec sha256sum -z {} +" % (
+                quote(remote_dir),))
+        for entry in data.split(b'\0'):
+            # <digest>  ./<path>
+            digest, path = entry[:64], entry[66:].decode(encoding)
+            if path.startswith('./') and path[2:] in remote_files:
+                path = path[2:]
+                remote_files[path] = remote_files[path][:2] + (
+                    digest.decode('ascii'),)
+        return remote_dirs, remote_files
+
+    def _run_for_output(self, command):
+        """Run command and return its standard output and exit code."""
+        channel, _, stdout, stderr, _ = self.run_command(
+            command, output_mode='chunks')
+        data = b''.join(stdout)
+        for _ in stderr:
+            pass
+        self.wait_finished(channel)
+        return data, channel.get_exit_status()
 
     def copy_remote_file(self, remote_file, local_file, recurse=False,
-                         sftp=None, encoding='utf-8'):
+                         sftp=None, encoding='utf-8',
+                         block_size=SFTP_READ_BUFFER_SIZE, sync=False,
+                         progress=None):
         """Copy remote file to local host via SFTP.
 
         :param remote_file: Remote filepath to copy from
@@ -576,6 +1212,26 @@ class SSHClient(object):
         :type recurse: bool
         :param encoding: Encoding to use for file paths.
         :type encoding: str
+        :param block_size: (Optional) Size in bytes of buffer to read remote
+          files into via SFTP. Defaults to
+          :py:data:`pssh.constants.SFTP_READ_BUFFER_SIZE`.
+        :type block_size: int
+        :param sync: (Optional) Skip local files with the same size and
+          modification time as remote files. Other files are copied to a
+          partial file with suffix
+          :py:data:`pssh.constants.SFTP_SYNC_PARTIAL_SUFFIX` that is renamed
+          to the local file once copied and is resumed if copying is
+          interrupted. Modification times of local files are set to those of
+          remote files once copied.
+        :type sync: bool
+        :param progress: (Optional) Function to call with
+          ``(host, path, bytes_copied, total_bytes)`` as files are copied, at
+          most once every :py:data:`pssh.constants.PROGRESS_INTERVAL`
+          seconds other than on completing a file. ``path`` is the path of
+          the file being copied from.
+        :type progress: function
+
+        :rtype: :py:class:`pssh.output.TransferStats` of files copied
 
         :raises: :py:class:`ValueError` when a directory is supplied to
           ``local_file`` and ``recurse`` is not set
@@ -586,9 +1242,12 @@ class SSHClient(object):
         :raises: :py:class:`IOError` on local file IO errors
         :raises: :py:class:`OSError` on local OS errors like permission denied
         """
+        start = time()
+        stats = TransferStats(self.host)
+        progress = _throttle_progress(progress)
         sftp = self._make_sftp() if sftp is None else sftp
         try:
-            self._eagain(sftp.stat, remote_file)
+            attrs = self._eagain(sftp.stat, remote_file)
         except (SFTPHandleError, SFTPProtocolError):
             msg = "Remote file or directory %s does not exist"
             logger.error(msg, remote_file)
@@ -596,25 +1255,39 @@ class SSHClient(object):
         try:
             dir_h = self._sftp_openfh(sftp.opendir, remote_file)
         except SFTPError:
-            pass
-        else:
+            dir_h = None
+        if dir_h is not None:
             if not recurse:
                 raise ValueError("Recurse must be true if remote_file is a "
                                  "directory.")
             file_list = self._sftp_readdir(dir_h)
-            return self._copy_remote_dir(file_list, remote_file,
-                                         local_file, sftp,
-                                         encoding=encoding)
-        destination = os.path.join(os.path.sep, os.path.sep.join(
-            [_dir for _dir in local_file.split('/')
-             if _dir][:-1]))
-        self._make_local_dir(destination)
-        self.sftp_get(sftp, remote_file, local_file)
-        logger.info("Copied local file %s from remote destination %s:%s",
-                    local_file, self.host, remote_file)
+            self._copy_remote_dir(file_list, remote_file, local_file, sftp,
+                                  encoding=encoding, block_size=block_size,
+                                  sync=sync, progress=progress, stats=stats)
+        else:
+            destination = os.path.join(os.path.sep, os.path.sep.join(
+                [_dir for _dir in local_file.split('/')
+                 if _dir][:-1]))
+            self._make_local_dir(destination)
+            if sync:
+                transferred = self._sftp_sync_get(
+                    sftp, remote_file, local_file, attrs,
+                    block_size=block_size, progress=progress)
+            else:
+                transferred = self._sftp_get(
+                    sftp, remote_file, local_file, block_size=block_size,
+                    progress=progress, total=attrs.filesize)
+                logger.info("Copied local file %s from remote destination "
+                            "%s:%s", local_file, self.host, remote_file)
+            if transferred is not None:
+                stats.files += 1
+                stats.transferred += transferred
+        stats.duration = time() - start
+        return stats
 
     def scp_recv(self, remote_file, local_file, recurse=False, sftp=None,
-                 encoding='utf-8'):
+                 encoding='utf-8', block_size=SCP_BLOCK_SIZE,
+                 preallocate=False, progress=None):
         """Copy remote file to local host via SCP.
 
         Note - Remote directory listings are gather via SFTP when
@@ -631,6 +1304,21 @@ class SSHClient(object):
         :param encoding: Encoding to use for file paths when recursion is
           enabled.
         :type encoding: str
+        :param block_size: (Optional) Maximum size in bytes of blocks to read
+          from remote files. Defaults to
+          :py:data:`pssh.constants.SCP_BLOCK_SIZE`.
+        :type block_size: int
+        :param preallocate: (Optional) Allocate disk space for whole local
+          file before copying, where supported by the local OS.
+        :type preallocate: bool
+        :param progress: (Optional) Function to call with
+          ``(host, path, bytes_copied, total_bytes)`` as files are copied, at
+          most once every :py:data:`pssh.constants.PROGRESS_INTERVAL`
+          seconds other than on completing a file. ``path`` is the path of
+          the remote file being copied.
+        :type progress: function
+
+        :rtype: :py:class:`pssh.output.TransferStats` of files copied
 
         :raises: :py:class:`pssh.exceptions.SCPError` when a directory is
           supplied to ``local_file`` and ``recurse`` is not set.
@@ -638,6 +1326,9 @@ class SSHClient(object):
         :raises: :py:class:`IOError` on local file IO errors.
         :raises: :py:class:`OSError` on local OS errors like permission denied.
         """
+        start = time()
+        stats = TransferStats(self.host)
+        progress = _throttle_progress(progress)
         sftp = self._make_sftp() if (sftp is None and recurse) else sftp
         if recurse:
             try:
@@ -652,18 +1343,32 @@ class SSHClient(object):
                 pass
             else:
                 file_list = self._sftp_readdir(dir_h)
-                return self._scp_recv_dir(file_list, remote_file,
-                                          local_file, sftp,
-                                          encoding=encoding)
+                self._scp_recv_dir(file_list, remote_file, local_file, sftp,
+                                   encoding=encoding, stats=stats,
+                                   block_size=block_size,
+                                   preallocate=preallocate, progress=progress)
+                stats.duration = time() - start
+                return stats
         destination = os.path.join(os.path.sep, os.path.sep.join(
             [_dir for _dir in local_file.split('/')
              if _dir][:-1]))
         self._make_local_dir(destination)
-        self._scp_recv(remote_file, local_file)
+        stats.transferred = self._scp_recv(
+            remote_file, local_file, block_size=block_size,
+            preallocate=preallocate, progress=progress)
+        stats.files = 1
+        stats.duration = time() - start
         logger.info("SCP local file %s from remote destination %s:%s",
                     local_file, self.host, remote_file)
+        return stats
 
-    def _scp_recv(self, remote_file, local_file):
+    def _scp_recv(self, remote_file, local_file, block_size=SCP_BLOCK_SIZE,
+                  preallocate=False, progress=None):
+        """Copy remote file to local file via SCP, reading at most
+        ``block_size`` bytes at a time so that memory use does not depend on
+        file size.
+
+        :rtype: int - number of bytes copied"""
         try:
             (file_chan, fileinfo) = self._eagain(
                 self.session.scp_recv2, remote_file)
@@ -671,40 +1376,64 @@ class SSHClient(object):
             msg = "Error copying file %s from host %s - %s"
             logger.error(msg, remote_file, self.host, ex)
             raise SCPError(msg, remote_file, self.host, ex)
-        local_fh = open(local_file, 'wb')
-        try:
-            total = 0
-            size, data = file_chan.read(size=fileinfo.st_size)
-            while size == LIBSSH2_ERROR_EAGAIN:
-                wait_select(self.session)
-                size, data = file_chan.read(size=fileinfo.st_size)
-            total += size
-            local_fh.write(data)
-            while total < fileinfo.st_size:
-                size, data = file_chan.read(size=fileinfo.st_size - total)
-                while size == LIBSSH2_ERROR_EAGAIN:
+        file_size = fileinfo.st_size
+        total = 0
+        with open(local_file, 'wb') as local_fh:
+            if preallocate and file_size:
+                self._preallocate(local_fh, file_size)
+            while total < file_size:
+                try:
+                    rc, data = file_chan.read(
+                        size=min(block_size, file_size - total))
+                except Exception as ex:
+                    msg = "Error reading from remote file %s on host %s - %s"
+                    logger.error(msg, remote_file, self.host, ex)
+                    raise SCPError(msg, remote_file, self.host, ex)
+                if rc == LIBSSH2_ERROR_EAGAIN:
                     wait_select(self.session)
                     continue
-                total += size
+                elif rc <= 0:
+                    # EOF or error before all data was read
+                    break
                 local_fh.write(data)
-            if total != fileinfo.st_size:
-                msg = "Error copying data from remote file %s on host %s. " \
-                      "Copied %s out of %s total bytes"
-                raise SCPError(msg, remote_file, self.host, total,
-                               fileinfo.st_size)
-        finally:
-            local_fh.close()
+                total += rc
+                self.last_activity = time()
+                if progress is not None:
+                    progress(self.host, remote_file, total, file_size)
+        if total != file_size:
+            msg = "Error copying data from remote file %s on host %s. " \
+                  "Copied %s out of %s total bytes"
+            logger.error(msg, remote_file, self.host, total, file_size)
+            raise SCPError(msg, remote_file, self.host, total, file_size)
+        return total
+
+    def _preallocate(self, local_fh, size):
+        """Allocate ``size`` bytes of disk space for local file if supported
+        by the local OS."""
+        try:
+            posix_fallocate = os.posix_fallocate
+        except AttributeError:
+            return
+        try:
+            posix_fallocate(local_fh.fileno(), 0, size)
+        except OSError as ex:
+            logger.debug("Could not allocate %s bytes for local file %s - %s",
+                         size, local_fh.name, ex)
 
-    def _scp_send_dir(self, local_dir, remote_dir, sftp):
+    def _scp_send_dir(self, local_dir, remote_dir, sftp, stats=None,
+                      **kwargs):
         file_list = os.listdir(local_dir)
         for file_name in file_list:
             local_path = os.path.join(local_dir, file_name)
             remote_path = '/'.join([remote_dir, file_name])
-            self.scp_send(local_path, remote_path, recurse=True,
-                          sftp=sftp)
+            _stats = self.scp_send(local_path, remote_path, recurse=True,
+                                   sftp=sftp, **kwargs)
+            if stats is not None:
+                stats.files += _stats.files
+                stats.transferred += _stats.transferred
 
     def _scp_recv_dir(self, file_list, remote_dir, local_dir, sftp,
-                      encoding='utf-8'):
+                      encoding='utf-8', stats=None, **kwargs):
         for file_name in file_list:
             file_name = file_name.decode(encoding)
             if file_name in ('.', '..'):
@@ -713,10 +1442,14 @@ class SSHClient(object):
             local_path = os.path.join(local_dir, file_name)
             logger.debug("Attempting recursive copy from %s:%s to %s",
                          self.host, remote_path, local_path)
-            self.scp_recv(remote_path, local_path, sftp=sftp,
-                          recurse=True)
-
-    def scp_send(self, local_file, remote_file, recurse=False, sftp=None):
+            _stats = self.scp_recv(remote_path, local_path, sftp=sftp,
+                                   recurse=True, encoding=encoding, **kwargs)
+            if stats is not None:
+                stats.files += _stats.files
+                stats.transferred += _stats.transferred
+
+    def scp_send(self, local_file, remote_file, recurse=False, sftp=None,
+                 block_size=SCP_BLOCK_SIZE, progress=None):
         """Copy local file to host via SCP.
 
         Note - Directories are created via SFTP when ``recurse`` is enabled -
@@ -730,6 +1463,18 @@ class SSHClient(object):
         :type remote_file: str
         :param recurse: Whether or not to descend into directories recursively.
         :type recurse: bool
+        :param block_size: (Optional) Size in bytes of blocks to read from
+          local files and write via SCP. Defaults to
+          :py:data:`pssh.constants.SCP_BLOCK_SIZE`.
+        :type block_size: int
+        :param progress: (Optional) Function to call with
+          ``(host, path, bytes_copied, total_bytes)`` as files are copied, at
+          most once every :py:data:`pssh.constants.PROGRESS_INTERVAL`
+          seconds other than on completing a file. ``path`` is the path of
+          the local file being copied.
+        :type progress: function
+
+        :rtype: :py:class:`pssh.output.TransferStats` of files copied
 
         :raises: :py:class:`ValueError` when a directory is supplied to
           ``local_file`` and ``recurse`` is not set
@@ -737,45 +1482,93 @@ class SSHClient(object):
           errors
         :raises: :py:class:`pssh.exceptions.SFTPIOError` on I/O errors writing
           via SFTP
+        :raises: :py:class:`pssh.exceptions.SCPError` on errors copying file.
         :raises: :py:class:`IOError` on local file IO errors
         :raises: :py:class:`OSError` on local OS errors like permission denied
         """
+        start = time()
+        stats = TransferStats(self.host)
+        progress = _throttle_progress(progress)
         if os.path.isdir(local_file) and recurse:
             sftp = self._make_sftp() if sftp is None else sftp
-            return self._scp_send_dir(local_file, remote_file, sftp)
+            self._scp_send_dir(local_file, remote_file, sftp, stats=stats,
+                               block_size=block_size, progress=progress)
         elif os.path.isdir(local_file) and not recurse:
             raise ValueError("Recurse must be True if local_file is a "
                              "directory.")
-        destination = self._remote_paths_split(remote_file)
-        if destination is not None:
-            sftp = self._make_sftp() if sftp is None else sftp
-            try:
-                self._eagain(sftp.stat, destination)
-            except (SFTPHandleError, SFTPProtocolError):
-                self.mkdir(sftp, destination)
-        self._scp_send(local_file, remote_file)
-        logger.info("SCP local file %s to remote destination %s:%s",
-                    local_file, self.host, remote_file)
-
-    def _scp_send(self, local_file, remote_file):
+        else:
+            destination = self._remote_paths_split(remote_file)
+            if destination is not None:
+                sftp = self._make_sftp() if sftp is None else sftp
+                try:
+                    self._eagain(sftp.stat, destination)
+                except (SFTPHandleError, SFTPProtocolError):
+                    self.mkdir(sftp, destination)
+            stats.transferred = self._scp_send(
+                local_file, remote_file, block_size=block_size,
+                progress=progress)
+            stats.files = 1
+        stats.duration = time() - start
+        return stats
+
+    def _scp_send(self, local_file, remote_file, block_size=SCP_BLOCK_SIZE,
+                  progress=None):
+        """Copy local file to remote file via SCP in blocks of
+        ``block_size``, waiting on the session socket whenever a write would
+        block and resuming from the offset in the block reached by partial
+        writes.
+
+        :rtype: int - number of bytes copied"""
         fileinfo = os.stat(local_file)
         try:
             chan = self._eagain(
                 self.session.scp_send64,
-                remote_file, fileinfo.st_mode & 777, fileinfo.st_size,
+                remote_file, fileinfo.st_mode & 0o777, fileinfo.st_size,
                 fileinfo.st_mtime, fileinfo.st_atime)
         except Exception as ex:
             msg = "Error opening remote file %s for writing on host %s - %s"
             logger.error(msg, remote_file, self.host, ex)
             raise SCPError(msg, remote_file, self.host, ex)
+        total = 0
+        start = time()
         try:
             with open(local_file, 'rb') as local_fh:
-                for data in local_fh:
-                    chan.write(data)
+                data = local_fh.read(block_size)
+                while data:
+                    view = memoryview(data)
+                    offset = 0
+                    while offset < len(data):
+                        # Channel.write only accepts bytes - only data left
+                        # unwritten by a partial write is copied
+                        ret = chan.write(
+                            view[offset:].tobytes() if offset else data)
+                        # Tuple of (rc, bytes_written) on ssh2-python >= 0.27
+                        rc, written = ret if isinstance(ret, tuple) \
+                            else (ret, max(ret, 0))
+                        offset += written
+                        total += written
+                        if rc == LIBSSH2_ERROR_EAGAIN:
+                            wait_select(self.session)
+                    self.last_activity = time()
+                    if progress is not None:
+                        progress(self.host, local_file, total,
+                                 fileinfo.st_size)
+                    data = local_fh.read(block_size)
+            # Remote scp only completes writing the file once it has
+            # received EOF
+            self._eagain(chan.send_eof)
+            self._eagain(chan.wait_eof)
+            self._eagain(chan.wait_closed)
         except Exception as ex:
             msg = "Error writing to remote file %s on host %s - %s"
             logger.error(msg, remote_file, self.host, ex)
             raise SCPError(msg, remote_file, self.host, ex)
+        duration = time() - start
+        logger.info("SCP local file %s to remote destination %s:%s - %s bytes "
+                    "in %.3fs (%.2f MB/s)", local_file, self.host, remote_file,
+                    total, duration,
+                    total / duration / 1048576 if duration else 0.0)
+        return total
 
     def _sftp_readdir(self, dir_h):
         for size, buf, attrs in dir_h.readdir():
@@ -795,40 +1588,145 @@ class SSHClient(object):
                 raise SFTPError(ex)
         return fh
 
-    def _sftp_get(self, remote_fh, local_file):
-        with open(local_file, 'wb') as local_fh:
-            for size, data in remote_fh:
-                if size == LIBSSH2_ERROR_EAGAIN:
-                    wait_select(self.session)
-                    continue
-                local_fh.write(data)
+    def sftp_get(self, sftp, remote_file, local_file,
+                 block_size=SFTP_READ_BUFFER_SIZE, progress=None):
+        """Copy remote file to local file via SFTP, reading remote file into a
+        buffer of ``block_size`` bytes.
 
-    def sftp_get(self, sftp, remote_file, local_file):
-        with self._sftp_openfh(
-                sftp.open, remote_file,
-                LIBSSH2_FXF_READ, LIBSSH2_SFTP_S_IRUSR) as remote_fh:
-            try:
-                self._sftp_get(remote_fh, local_file)
-                # Running SFTP in a thread requires a new session
-                # as session handles or any handles created by a session
-                # cannot be used simultaneously in multiple threads.
-                # THREAD_POOL.apply(
-                #     sftp_get, args=(self.session, remote_fh, local_file))
-            except SFTPProtocolError as ex:
-                msg = "Error reading from remote file %s - %s"
-                logger.error(msg, remote_file, ex)
-                raise SFTPIOError(msg, remote_file, ex)
+        ``progress``, if set, is called with
+        ``(host, remote_file, bytes_copied, total_bytes)`` after each read.
+
+        :rtype: int - number of bytes copied
+
+        :raises: :py:class:`pssh.exceptions.SFTPError` on errors opening remote
+          file
+        :raises: :py:class:`pssh.exceptions.SFTPIOError` on errors reading from
+          remote file
+        :raises: :py:class:`IOError` on local file IO errors
+        """
+        return self._sftp_get(sftp, remote_file, local_file,
+                              block_size=block_size, progress=progress)
+
+    def _sftp_get(self, sftp, remote_file, local_file,
+                  block_size=SFTP_READ_BUFFER_SIZE, progress=None, total=None):
+        """Copy remote file to local file.
+
+        ``total`` is the remote file size reported to ``progress`` - remote
+        file is stat-ed for it if not set."""
+        remote_fh = self._sftp_openfh(
+            sftp.open, remote_file, LIBSSH2_FXF_READ, LIBSSH2_SFTP_S_IRUSR)
+        try:
+            if progress is not None and total is None:
+                total = self._eagain(remote_fh.fstat).filesize
+            return sftp_get(self.session, remote_fh, local_file,
+                            buffer_maxlen=block_size,
+                            progress=self._progress_callback(
+                                progress, remote_file, total))
+        except SFTPProtocolError as ex:
+            msg = "Error reading from remote file %s - %s"
+            logger.error(msg, remote_file, ex)
+            raise SFTPIOError(msg, remote_file, ex)
+        finally:
+            # Non-blocking close must be completed before the SFTP session can
+            # be used for further requests without stalling
+            self._eagain(remote_fh.close)
+
+    def _sftp_sync_get(self, sftp, remote_file, local_file, attrs,
+                       block_size=SFTP_READ_BUFFER_SIZE, progress=None):
+        """Sync local file with remote file with stat ``attrs``.
+
+        Local files that are up to date are skipped and others are copied to
+        a partial file that is renamed to the local file once complete.
+        Partial files left by interrupted copies are resumed.
+
+        :rtype: int - number of bytes copied, or ``None`` if local file was
+          up to date"""
+        offset = 0
+        if os.path.isfile(local_file):
+            local_stat = os.stat(local_file)
+            if self._sync_up_to_date(attrs.filesize, attrs.mtime,
+                                     local_stat.st_size,
+                                     local_stat.st_mtime):
+                logger.info("Local file %s is up to date with remote file "
+                            "%s:%s", local_file, self.host, remote_file)
+                return
+        part_file = local_file + SFTP_SYNC_PARTIAL_SUFFIX
+        if os.path.isfile(part_file):
+            offset = self._sync_offset(
+                attrs.filesize, os.stat(part_file).st_size)
+        remote_fh = self._sftp_openfh(
+            sftp.open, remote_file, LIBSSH2_FXF_READ, LIBSSH2_SFTP_S_IRUSR)
+        try:
+            # Remote file may have changed since partial copy
+            if offset and not self._sftp_verify(
+                    remote_fh, part_file, offset):
+                logger.debug("Partial local file %s differs from remote file "
+                             "%s:%s before offset %s - copying whole file",
+                             part_file, self.host, remote_file, offset)
+                offset = 0
+            elif offset:
+                logger.debug("Resuming copy of local file %s from remote "
+                             "destination %s:%s from offset %s", local_file,
+                             self.host, remote_file, offset)
+            remote_fh.seek64(offset)
+            transferred = sftp_get(
+                self.session, remote_fh, part_file,
+                buffer_maxlen=block_size, append=bool(offset),
+                progress=self._progress_callback(
+                    progress, remote_file, attrs.filesize, offset=offset))
+        except SFTPProtocolError as ex:
+            msg = "Error reading from remote file %s - %s"
+            logger.error(msg, remote_file, ex)
+            raise SFTPIOError(msg, remote_file, ex)
+        finally:
+            self._eagain(remote_fh.close)
+        os.utime(part_file, (attrs.atime, attrs.mtime))
+        _replace_file(part_file, local_file)
+        logger.info("Copied local file %s from remote destination %s:%s",
+                    local_file, self.host, remote_file)
+        return transferred
+
+    def _progress_callback(self, progress, path, total, offset=0):
+        """Make callback for native transfer functions, which report number
+        of bytes copied, from ``progress`` function."""
+        if progress is None:
+            return
+        return lambda done: progress(self.host, path, offset + done, total)
+
+    def _sftp_verify(self, remote_fh, local_file, offset):
+        """Compare data preceding ``offset`` in remote and local files."""
+        verify_size = min(offset, SFTP_SYNC_VERIFY_SIZE)
+        with open(local_file, 'rb') as local_fh:
+            local_fh.seek(offset - verify_size)
+            expected = local_fh.read(verify_size)
+        remote_fh.seek64(offset - verify_size)
+        data = b''
+        while len(data) < verify_size:
+            rc, _data = remote_fh.read(verify_size - len(data))
+            if rc == LIBSSH2_ERROR_EAGAIN:
+                wait_select(self.session)
+            elif rc <= 0:
+                break
+            else:
+                data += _data
+        return data == expected
 
     def _copy_remote_dir(self, file_list, remote_dir, local_dir, sftp,
-                         encoding='utf-8'):
+                         encoding='utf-8', block_size=SFTP_READ_BUFFER_SIZE,
+                         sync=False, progress=None, stats=None):
         for file_name in file_list:
             file_name = file_name.decode(encoding)
             if file_name in ('.', '..'):
                 continue
             remote_path = os.path.join(remote_dir, file_name)
             local_path = os.path.join(local_dir, file_name)
-            self.copy_remote_file(remote_path, local_path, sftp=sftp,
-                                  recurse=True)
+            _stats = self.copy_remote_file(
+                remote_path, local_path, sftp=sftp, recurse=True,
+                encoding=encoding, block_size=block_size, sync=sync,
+                progress=progress)
+            if stats is not None:
+                stats.files += _stats.files
+                stats.transferred += _stats.transferred
 
     def _make_local_dir(self, dirpath):
         if os.path.exists(dirpath):
@@ -16,9 +16,11 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 
 from threading import Thread, Event
+from collections import deque
 import logging
 
 from gevent import socket, spawn, joinall, get_hub, sleep
+from gevent.event import Event as GEvent, AsyncResult
 from gevent.select import select
 
 from ssh2.error_codes import LIBSSH2_ERROR_EAGAIN
@@ -30,6 +32,24 @@ from ...constants import DEFAULT_RETRIES, RETRY_DELAY
 logger = logging.getLogger(__name__)
 
 
+def _make_async_watcher(callback, ref=True):
+    """Start and return an async watcher on the current thread's hub that
+    runs ``callback`` in that hub when the watcher's ``send`` is called from
+    any thread.
+
+    Watchers with ``ref=False`` do not keep the hub's event loop alive on
+    their own."""
+    loop = get_hub().loop
+    try:
+        watcher = loop.async_()
+    except AttributeError:
+        # gevent < 1.3
+        watcher = getattr(loop, 'async')()
+    watcher.ref = ref
+    watcher.start(callback)
+    return watcher
+
+
 class Tunnel(Thread):
 
     """SSH proxy implementation with direct TCP/IP tunnels.
@@ -38,11 +58,21 @@ class Tunnel(Thread):
     direct tunnels to remote host:port destinations on local ports over
     the same SSH connection.
 
-    To use, append ``(host, port)`` tuples into ``Tunnel.in_q`` and read
-    listen port for tunnel connection from ``Tunnel.out_q``.
+    To use, call ``Tunnel.request_tunnel`` with ``host, port`` of tunnel
+    destination and get listen port for tunnel connection from the returned
+    async result.
+
+    Alternatively, append ``(host, port)`` tuples into ``Tunnel.in_q``, call
+    ``Tunnel.notify_in_q`` and read ``((host, port), listen_port)`` tuples for
+    each request from ``Tunnel.out_q``. Listen port is ``None`` if the tunnel
+    could not be started.
 
     ``Tunnel.tunnel_open`` is a *thread* event that will be set once tunnel is
-    ready."""
+    ready.
+
+    ``Tunnel.out_q_ready`` is a gevent event on the hub of the thread that
+    created the tunnel that is set whenever a listen port is added to
+    ``Tunnel.out_q``."""
 
     def __init__(self, host, in_q, out_q, user=None,
                  password=None, port=None, pkey=None,
@@ -55,7 +85,8 @@ class Tunnel(Thread):
         :type host: str
         :param in_q: Deque for requesting new tunnel to given ``((host, port))``
         :type in_q: :py:class:`collections.deque`
-        :param out_q: Deque for feeding back tunnel listening ports.
+        :param out_q: Deque for feeding back ``((host, port), listen_port)``
+          for requested tunnels.
         :type out_q: :py:class:`collections.deque`
         :param user: (Optional) User to login as. Defaults to logged in user
         :type user: str
@@ -98,6 +129,18 @@ class Tunnel(Thread):
         self.timeout = timeout
         self.exception = None
         self.tunnel_open = Event()
+        self.out_q_ready = GEvent()
+        self._port_waiters = {}
+        # (host, port) -> number of cancelled requests whose listen port
+        # is yet to be closed
+        self._cancelled = {}
+        # Listen port -> listening socket of tunnels not yet connected to
+        self._listen_sockets = {}
+        self._cancel_q = deque()
+        self._out_q_watcher = _make_async_watcher(
+            self._dispatch_out_q, ref=False)
+        self._in_q_ready = None
+        self._in_q_watcher = None
         self._tunnels = []
         self.channel_retries = channel_retries
 
@@ -195,6 +238,81 @@ class Tunnel(Thread):
         self.session = self.client.session
         self.tunnel_open.set()
 
+    def notify_in_q(self):
+        """Wake up tunnel thread to consume newly added requests from
+        ``Tunnel.in_q``. Safe to call from any thread."""
+        if self._in_q_watcher is not None:
+            self._in_q_watcher.send()
+
+    def cancel_request(self, host, port, result):
+        """Cancel tunnel request that is no longer waited on, for example
+        after timing out waiting on its listen port. Listen port opened for
+        the request, if any, is closed.
+
+        Must be called from the thread that created the tunnel.
+
+        :param result: Result of :py:func:`request_tunnel` to cancel.
+        :type result: :py:class:`gevent.event.AsyncResult`"""
+        key = (host, port)
+        waiters = self._port_waiters.get(key)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(result)
+        except ValueError:
+            return
+        if not waiters:
+            del self._port_waiters[key]
+        self._cancelled[key] = self._cancelled.get(key, 0) + 1
+
+    def _close_listen_port(self, listen_port):
+        """Close listening socket of tunnel with no requester in tunnel
+        thread. Safe to call from any thread."""
+        self._cancel_q.append(listen_port)
+        self.notify_in_q()
+
+    def request_tunnel(self, host, port):
+        """Request new tunnel to ``host:port``.
+
+        Must be called from the thread that created the tunnel.
+
+        :rtype: :py:class:`gevent.event.AsyncResult` with listen port of the
+          tunnel, or ``None`` if tunnel could not be started."""
+        result = AsyncResult()
+        self._port_waiters.setdefault((host, port), deque()).append(result)
+        self.in_q.append((host, port))
+        self.notify_in_q()
+        return result
+
+    def _dispatch_out_q(self):
+        self.out_q_ready.set()
+        for entry in list(self.out_q):
+            key, listen_port = entry
+            waiters = self._port_waiters.get(key)
+            if waiters:
+                self.out_q.remove(entry)
+                result = waiters.popleft()
+                if not waiters:
+                    del self._port_waiters[key]
+                result.set(listen_port)
+            elif self._cancelled.get(key):
+                # Request timed out - nothing will connect to tunnel
+                self.out_q.remove(entry)
+                self._cancelled[key] -= 1
+                if not self._cancelled[key]:
+                    del self._cancelled[key]
+                logger.debug("Request for tunnel to %s:%s was cancelled - "
+                             "closing listen port %s", key[0], key[1],
+                             listen_port)
+                if listen_port is not None:
+                    self._close_listen_port(listen_port)
+            # Entries not requested via request_tunnel are left in out_q
+            # for callers using the queue directly
+
+    def _put_listen_port(self, fw_host, fw_port, listen_port):
+        self.out_q.append(((fw_host, fw_port), listen_port))
+        self._out_q_watcher.send()
+
     def cleanup(self):
         for _sock in self._sockets:
             try:
@@ -205,11 +323,19 @@ class Tunnel(Thread):
             self.client.disconnect()
 
     def _consume_q(self):
+        self._in_q_ready = GEvent()
+        self._in_q_watcher = _make_async_watcher(self._in_q_ready.set)
         while True:
+            self._in_q_ready.clear()
+            while self._cancel_q:
+                listen_socket = self._listen_sockets.pop(
+                    self._cancel_q.popleft(), None)
+                if listen_socket is not None:
+                    listen_socket.close()
             try:
                 host, port = self.in_q.pop()
             except IndexError:
-                sleep(1)
+                self._in_q_ready.wait()
                 continue
             logger.debug("Got request for tunnel to %s:%s", host, port)
             tunnel = spawn(self._start_tunnel, host, port)
@@ -249,17 +375,23 @@ class Tunnel(Thread):
         except Exception as ex:
             logger.error("Error initialising tunnel listen socket - %s", ex)
             self.exception = ex
+            self._put_listen_port(fw_host, fw_port, None)
             return
         logger.debug("Tunnel listening on 127.0.0.1:%s on hub %s",
                      listen_port, get_hub().thread_ident)
-        self.out_q.append(listen_port)
+        self._listen_sockets[listen_port] = listen_socket
+        self._put_listen_port(fw_host, fw_port, listen_port)
         try:
             forward_sock, forward_addr = listen_socket.accept()
         except Exception as ex:
+            if self._listen_sockets.pop(listen_port, None) is None:
+                logger.debug("Tunnel listen port %s closed", listen_port)
+                return
             logger.error("Error accepting connection from client - %s", ex)
             self.exception = ex
             listen_socket.close()
             return
+        self._listen_sockets.pop(listen_port, None)
         forward_sock.settimeout(self.timeout)
         logger.debug("Client connected, forwarding %s:%s on"
                      " remote host to %s",
@@ -307,4 +439,6 @@ class Tunnel(Thread):
                          exc_info=1)
             self.exception = ex
         finally:
+            if self._in_q_watcher is not None:
+                self._in_q_watcher.stop()
             self.cleanup()
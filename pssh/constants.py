@@ -19,3 +19,64 @@
 
 DEFAULT_RETRIES = 3
 RETRY_DELAY = 5
+# Size of blocks read from local files for SFTP uploads. Writes of large
+# blocks are split by libssh2 into several outstanding SFTP write requests
+SFTP_BLOCK_SIZE = 256 * 1024
+
+# Size of buffer remote files are read into for SFTP downloads. libssh2 keeps
+# enough SFTP read requests outstanding to fill the buffer
+SFTP_READ_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Number of bytes preceding the resume offset of a partially transferred file
+# that are compared between source and destination before resuming a sync
+SFTP_SYNC_VERIFY_SIZE = 64 * 1024
+
+# Suffix of the temporary file a sync transfers into. It is renamed to the
+# destination once complete and is the only file a sync ever resumes
+SFTP_SYNC_PARTIAL_SUFFIX = '.part'
+
+# Command run on a host to copy a file it has received onward to another host
+# when distributing files. Keys are the destination host's SSH port, the
+# source path and the scp destination
+RELAY_SCP_COMMAND = "scp -B -q -P %(port)s %(source)s %(destination)s 2>&1"
+
+# Maximum size of blocks read from and written to SCP channels
+SCP_BLOCK_SIZE = 256 * 1024
+
+# Minimum number of seconds between calls to transfer progress functions for
+# the same transfer, other than for completed files
+PROGRESS_INTERVAL = 1.0
+
+# Maximum number of clients kept in a session pool and number of seconds
+# after which clients not used are disconnected
+SESSION_POOL_MAX_SESSIONS = 1024
+SESSION_POOL_IDLE_TIMEOUT = 300
+
+# Number of seconds to wait on servers of idle pooled clients to open a
+# channel when checking clients are alive before reuse
+SESSION_POOL_CHECK_TIMEOUT = 5
+
+# Suggested interval in seconds of keepalive messages sent on idle sessions
+# when enabled via keepalive_seconds - keepalive is disabled by default
+KEEPALIVE_INTERVAL = 60
+
+# Factor connection retry delay is multiplied by after each failed attempt
+# and maximum delay between attempts in seconds
+RETRY_BACKOFF = 2
+RETRY_MAX_DELAY = 60
+
+# Number of consecutive connection failures after which connections to a
+# host fail fast and number of seconds to fail fast for
+CIRCUIT_BREAKER_FAILURES = 3
+CIRCUIT_BREAKER_RESET_TIMEOUT = 60
+
+# Number of seconds to wait for a connection attempt to a host's address
+# before also trying its next address
+CONNECTION_ATTEMPT_DELAY = 0.25
+
+# Number of seconds resolved host addresses are cached for, maximum
+# number of host names cached and maximum number of host names resolved
+# concurrently
+DNS_CACHE_TTL = 300
+DNS_CACHE_MAX_SIZE = 10000
+DNS_CONCURRENCY = 100
@@ -1,13 +1,16 @@
-/* Generated by Cython 0.28.3 */
+/* Generated by Cython 0.29.37 */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
     #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_28_3"
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
 #define CYTHON_FUTURE_DIVISION 0
 #include <stddef.h>
 #ifndef offsetof
@@ -46,6 +49,7 @@
   #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
@@ -74,14 +78,26 @@
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_PYCALL
   #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
 #elif defined(PYSTON_VERSION)
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -115,10 +131,63 @@
   #define CYTHON_PEP489_MULTI_PHASE_INIT 0
   #undef CYTHON_USE_TP_FINALIZE
   #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -138,7 +207,7 @@
     #undef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 0
   #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
   #endif
   #ifndef CYTHON_USE_PYLIST_INTERNALS
     #define CYTHON_USE_PYLIST_INTERNALS 1
@@ -146,7 +215,7 @@
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -161,27 +230,47 @@
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
-  #ifndef CYTHON_FAST_THREAD_STATE
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
   #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
-    #define CYTHON_PEP489_MULTI_PHASE_INIT (0 && PY_VERSION_HEX >= 0x03050000)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
   #endif
   #ifndef CYTHON_USE_TP_FINALIZE
     #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
   #endif
+  #ifndef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
+  #endif
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
+    #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
 #if !defined(CYTHON_FAST_PYCCALL)
 #define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
   #undef SHIFT
   #undef BASE
   #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
 #endif
 #ifndef __has_attribute
   #define __has_attribute(x) 0
@@ -280,9 +369,6 @@
   #endif
 #endif
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -292,10 +378,79 @@
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
+#else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -308,6 +463,9 @@
 #ifndef Py_TPFLAGS_HAVE_FINALIZE
   #define Py_TPFLAGS_HAVE_FINALIZE 0
 #endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
 #if PY_VERSION_HEX <= 0x030700A3 || !defined(METH_FASTCALL)
   #ifndef METH_FASTCALL
      #define METH_FASTCALL 0x80
@@ -321,7 +479,7 @@
 #endif
 #if CYTHON_FAST_PYCCALL
 #define __Pyx_PyFastCFunction_Check(func)\
-    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)))))
+    ((PyCFunction_Check(func) && (METH_FASTCALL == (PyCFunction_GET_FLAGS(func) & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)))))
 #else
 #define __Pyx_PyFastCFunction_Check(func) 0
 #endif
@@ -330,6 +488,11 @@
   #define PyObject_Free(p)     PyMem_Free(p)
   #define PyObject_Realloc(p)  PyMem_Realloc(p)
 #endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030400A1
+  #define PyMem_RawMalloc(n)           PyMem_Malloc(n)
+  #define PyMem_RawRealloc(p, n)       PyMem_Realloc(p, n)
+  #define PyMem_RawFree(p)             PyMem_Free(p)
+#endif
 #if CYTHON_COMPILING_IN_PYSTON
   #define __Pyx_PyCode_HasFreeVars(co)  PyCode_HasFreeVars(co)
   #define __Pyx_PyFrame_SetLineNumber(frame, lineno) PyFrame_SetLineNumber(frame, lineno)
@@ -352,7 +515,7 @@
 typedef int Py_tss_t;
 static CYTHON_INLINE int PyThread_tss_create(Py_tss_t *key) {
   *key = PyThread_create_key();
-  return 0; // PyThread_create_key reports success always
+  return 0;
 }
 static CYTHON_INLINE Py_tss_t * PyThread_tss_alloc(void) {
   Py_tss_t *key = (Py_tss_t *)PyObject_Malloc(sizeof(Py_tss_t));
@@ -375,7 +538,7 @@ static CYTHON_INLINE int PyThread_tss_set(Py_tss_t *key, void *value) {
 static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   return PyThread_get_key_value(*key);
 }
-#endif // TSS (Thread Specific Storage) API
+#endif
 #if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
 #define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
 #else
@@ -395,8 +558,12 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
@@ -404,7 +571,15 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
   #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
   #define PyUnicode_1BYTE_KIND  1
@@ -437,8 +612,8 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Format)
   #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
 #endif
-#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
-#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None)) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#define __Pyx_PyString_FormatSafe(a, b)   ((unlikely((a) == Py_None || (PyString_Check(b) && !PyString_CheckExact(b)))) ? PyNumber_Remainder(a, b) : __Pyx_PyString_Format(a, b))
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyString_Format(a, b)  PyUnicode_Format(a, b)
 #else
@@ -453,8 +628,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define PyString_Type                PyUnicode_Type
   #define PyString_Check               PyUnicode_Check
   #define PyString_CheckExact          PyUnicode_CheckExact
+#ifndef PyObject_Unicode
   #define PyObject_Unicode             PyObject_Str
 #endif
+#endif
 #if PY_MAJOR_VERSION >= 3
   #define __Pyx_PyBaseString_Check(obj) PyUnicode_Check(obj)
   #define __Pyx_PyBaseString_CheckExact(obj) PyUnicode_CheckExact(obj)
@@ -465,6 +642,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
 #if CYTHON_ASSUME_SAFE_MACROS
   #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
 #else
@@ -498,13 +682,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : (Py_INCREF(func), func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
@@ -526,8 +710,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
     } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -545,11 +731,10 @@ static CYTHON_INLINE float __PYX_NAN() {
 #define __Pyx_truncl truncl
 #endif
 
-
+#define __PYX_MARK_ERR_POS(f_index, lineno) \
+    { __pyx_filename = __pyx_f[f_index]; (void)__pyx_filename; __pyx_lineno = lineno; (void)__pyx_lineno; __pyx_clineno = __LINE__; (void)__pyx_clineno; }
 #define __PYX_ERR(f_index, lineno, Ln_error) \
-{ \
-  __pyx_filename = __pyx_f[f_index]; __pyx_lineno = lineno; __pyx_clineno = __LINE__; goto Ln_error; \
-}
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
 
 #ifndef __PYX_EXTERN_C
   #ifdef __cplusplus
@@ -565,12 +750,13 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include <string.h>
 #include <stdlib.h>
 #include <stdio.h>
+#include <errno.h>
 #include <stddef.h>
 #include <time.h>
-#include <sys/types.h>
 #include <sys/stat.h>
 #include "libssh2.h"
 #include "libssh2_sftp.h"
+#include "ext/find_eol.h"
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -583,7 +769,8 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
                 const char is_unicode; const char is_str; const char intern; } __Pyx_StringTabEntry;
 
 #define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
-#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT (PY_MAJOR_VERSION >= 3 && __PYX_DEFAULT_STRING_ENCODING_IS_UTF8)
 #define __PYX_DEFAULT_STRING_ENCODING ""
 #define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
 #define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
@@ -599,6 +786,9 @@ typedef struct {PyObject **p; const char *s; const Py_ssize_t n; const char* enc
     (sizeof(type) == sizeof(Py_ssize_t) &&\
           (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
                                v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
 #if defined (__cplusplus) && __cplusplus >= 201103L
     #include <cstdlib>
     #define __Pyx_sst_abs(value) std::abs(value)
@@ -657,11 +847,13 @@ static CYTHON_INLINE size_t __Pyx_Py_UNICODE_strlen(const Py_UNICODE *u) {
 #define __Pyx_Owned_Py_None(b) __Pyx_NewRef(Py_None)
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
 static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
 static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
 #define __Pyx_PySequence_Tuple(obj)\
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
@@ -737,7 +929,7 @@ static int __Pyx_init_sys_getdefaultencoding_params(void) {
     if (!default_encoding) goto bad;
     default_encoding_c = PyBytes_AsString(default_encoding);
     if (!default_encoding_c) goto bad;
-    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c));
+    __PYX_DEFAULT_STRING_ENCODING = (char*) malloc(strlen(default_encoding_c) + 1);
     if (!__PYX_DEFAULT_STRING_ENCODING) goto bad;
     strcpy(__PYX_DEFAULT_STRING_ENCODING, default_encoding_c);
     Py_DECREF(default_encoding);
@@ -775,6 +967,8 @@ static const char *__pyx_filename;
 
 static const char *__pyx_f[] = {
   "pssh/native/_ssh2.pyx",
+  "stringsource",
+  "type.pxd",
   "session.pxd",
   "sftp.pxd",
   "sftp_handle.pxd",
@@ -794,14 +988,30 @@ static const char *__pyx_f[] = {
 
 /*--- Type declarations ---*/
 struct __pyx_obj_4ssh2_7session_Session;
+struct __pyx_obj_4ssh2_7session_MethodType;
+struct __pyx_obj_4ssh2_7session_FlagType;
 struct __pyx_obj_4ssh2_4sftp_SFTP;
 struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle;
 struct __pyx_obj_4ssh2_11sftp_handle_SFTPAttributes;
 struct __pyx_obj_4ssh2_11sftp_handle_SFTPStatVFS;
+struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer;
 struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output;
+struct __pyx_opt_args_4pssh_6native_5_ssh2_11_LineBuffer_pop;
+
+/* "pssh/native/_ssh2.pyx":73
+ *         return 0
+ * 
+ *     cdef bytes pop(self, bint strip=True):             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t size = _rstrip_size(self._buf, self._len) \
+ *             if strip else self._len
+ */
+struct __pyx_opt_args_4pssh_6native_5_ssh2_11_LineBuffer_pop {
+  int __pyx_n;
+  int strip;
+};
 
-/* "ssh2/session.pxd":19
- * cimport c_ssh2
+/* "ssh2/session.pxd":20
+ * from . cimport c_ssh2
  * 
  * cdef class Session:             # <<<<<<<<<<<<<<
  *     cdef c_ssh2.LIBSSH2_SESSION *_session
@@ -812,10 +1022,36 @@ struct __pyx_obj_4ssh2_7session_Session {
   LIBSSH2_SESSION *_session;
   int _sock;
   PyObject *sock;
+  PyObject *_kbd_callback;
+};
+
+
+/* "ssh2/session.pxd":27
+ * 
+ * 
+ * cdef class MethodType:             # <<<<<<<<<<<<<<
+ *     cdef int value
+ * 
+ */
+struct __pyx_obj_4ssh2_7session_MethodType {
+  PyObject_HEAD
+  int value;
+};
+
+
+/* "ssh2/session.pxd":31
+ * 
+ * 
+ * cdef class FlagType:             # <<<<<<<<<<<<<<
+ *     cdef int value
+ */
+struct __pyx_obj_4ssh2_7session_FlagType {
+  PyObject_HEAD
+  int value;
 };
 
 
-/* "sftp.pxd":26
+/* "sftp.pxd":27
  * 
  * 
  * cdef class SFTP:             # <<<<<<<<<<<<<<
@@ -829,7 +1065,7 @@ struct __pyx_obj_4ssh2_4sftp_SFTP {
 };
 
 
-/* "ssh2/sftp_handle.pxd":25
+/* "ssh2/sftp_handle.pxd":26
  * 
  * 
  * cdef class SFTPHandle:             # <<<<<<<<<<<<<<
@@ -840,11 +1076,11 @@ struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle {
   PyObject_HEAD
   LIBSSH2_SFTP_HANDLE *_handle;
   struct __pyx_obj_4ssh2_4sftp_SFTP *_sftp;
-  int closed;
+  int _closed;
 };
 
 
-/* "ssh2/sftp_handle.pxd":31
+/* "ssh2/sftp_handle.pxd":32
  * 
  * 
  * cdef class SFTPAttributes:             # <<<<<<<<<<<<<<
@@ -857,7 +1093,7 @@ struct __pyx_obj_4ssh2_11sftp_handle_SFTPAttributes {
 };
 
 
-/* "ssh2/sftp_handle.pxd":35
+/* "ssh2/sftp_handle.pxd":36
  * 
  * 
  * cdef class SFTPStatVFS:             # <<<<<<<<<<<<<<
@@ -871,29 +1107,61 @@ struct __pyx_obj_4ssh2_11sftp_handle_SFTPStatVFS {
 };
 
 
-/* "pssh/native/_ssh2.pyx":42
+/* "pssh/native/_ssh2.pyx":45
  * 
  * 
- * def _read_output(Session session, read_func, timeout=None):             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t _size
- *     cdef bytes _data
+ * cdef class _LineBuffer:             # <<<<<<<<<<<<<<
+ *     """Growable buffer for partial lines spanning more than one chunk"""
+ *     cdef char *_buf
+ */
+struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_4pssh_6native_5_ssh2__LineBuffer *__pyx_vtab;
+  char *_buf;
+  Py_ssize_t _len;
+  Py_ssize_t _size;
+};
+
+
+/* "pssh/native/_ssh2.pyx":94
+ * 
+ * 
+ * def _read_output(Session session, read_func, timeout=None, bint chunks=False):             # <<<<<<<<<<<<<<
+ *     """Read output from ``read_func`` until EOF and yield lines of output
+ *     with trailing whitespace stripped.
  */
 struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output {
   PyObject_HEAD
   PyObject *__pyx_v__data;
-  size_t __pyx_v__pos;
+  char const *__pyx_v__end;
+  char const *__pyx_v__pos;
   LIBSSH2_SESSION *__pyx_v__session;
   Py_ssize_t __pyx_v__size;
   int __pyx_v__sock;
-  Py_ssize_t __pyx_v_linesep;
+  int __pyx_v_chunks;
+  char const *__pyx_v_linesep;
   PyObject *__pyx_v_read_func;
-  PyObject *__pyx_v_remainder;
-  Py_ssize_t __pyx_v_remainder_len;
+  struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_remainder;
   struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session;
   PyObject *__pyx_v_timeout;
 };
 
 
+
+/* "pssh/native/_ssh2.pyx":45
+ * 
+ * 
+ * cdef class _LineBuffer:             # <<<<<<<<<<<<<<
+ *     """Growable buffer for partial lines spanning more than one chunk"""
+ *     cdef char *_buf
+ */
+
+struct __pyx_vtabstruct_4pssh_6native_5_ssh2__LineBuffer {
+  int (*append)(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *, char const *, Py_ssize_t);
+  PyObject *(*pop)(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *, struct __pyx_opt_args_4pssh_6native_5_ssh2_11_LineBuffer_pop *__pyx_optional_args);
+};
+static struct __pyx_vtabstruct_4pssh_6native_5_ssh2__LineBuffer *__pyx_vtabptr_4pssh_6native_5_ssh2__LineBuffer;
+
 /* --- Runtime support code (head) --- */
 /* Refnanny.proto */
 #ifndef CYTHON_REFNANNY
@@ -972,6 +1240,55 @@ static PyObject *__Pyx_GetBuiltinName(PyObject *name);
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kwdict, const char* function_name, int kw_allowed);
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyThreadStateGet.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
 /* RaiseDoubleKeywords.proto */
 static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
 
@@ -986,29 +1303,35 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
         __Pyx__ArgTypeTest(obj, type, name, exact))
 static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
 
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
-#else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
-#endif
-
 /* PyFunctionFastCall.proto */
 #if CYTHON_FAST_PYCALL
 #define __Pyx_PyFunction_FastCall(func, args, nargs)\
     __Pyx_PyFunction_FastCallDict((func), (args), (nargs), NULL)
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs);
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs);
 #else
 #define __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs) _PyFunction_FastCallDict(func, args, nargs, kwargs)
 #endif
+#define __Pyx_BUILD_ASSERT_EXPR(cond)\
+    (sizeof(char [1 - 2*!(cond)]) - 1)
+#ifndef Py_MEMBER_SIZE
+#define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
 #endif
-
-/* PyObjectCall.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
-#else
-#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#if CYTHON_FAST_PYCALL
+  static size_t __pyx_pyframe_localsplus_offset = 0;
+  #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+  #define __Pxy_PyFrame_Initialize_Offsets()\
+    ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
+     (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
+  #define __Pyx_PyFrame_GetLocalsplus(frame)\
+    (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
 #endif
 
 /* PyObjectCallMethO.proto */
@@ -1016,9 +1339,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
 #endif
 
-/* PyObjectCallOneArg.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
-
 /* PyObjectCallNoArg.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
@@ -1026,6 +1346,16 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
 #define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
 #endif
 
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
+/* PyObjectCallOneArg.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
 /* RaiseTooManyValuesToUnpack.proto */
 static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected);
 
@@ -1038,47 +1368,78 @@ static CYTHON_INLINE int __Pyx_IterFinish(void);
 /* UnpackItemEndCheck.proto */
 static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
 
-/* GetModuleGlobalName.proto */
-static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name);
-
-/* PyThreadStateGet.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
-#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
-#define __Pyx_PyErr_Occurred()  __pyx_tstate->curexc_type
+/* PyDictVersioning.proto */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __pyx_dict_cached_value;\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
 #else
-#define __Pyx_PyThreadState_declare
-#define __Pyx_PyThreadState_assign
-#define __Pyx_PyErr_Occurred()  PyErr_Occurred()
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
 #endif
 
-/* PyErrFetchRestore.proto */
-#if CYTHON_FAST_THREAD_STATE
-#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
-#if CYTHON_COMPILING_IN_CPYTHON
-#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
-#else
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#endif
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
 #else
-#define __Pyx_PyErr_Clear() PyErr_Clear()
-#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
-#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
-#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
-#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 #endif
 
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* decode_c_string_utf16.proto */
+static CYTHON_INLINE PyObject *__Pyx_PyUnicode_DecodeUTF16(const char *s, Py_ssize_t size, const char *errors) {
+    int byteorder = 0;
+    return PyUnicode_DecodeUTF16(s, size, errors, &byteorder);
+}
+static CYTHON_INLINE PyObject *__Pyx_PyUnicode_DecodeUTF16LE(const char *s, Py_ssize_t size, const char *errors) {
+    int byteorder = -1;
+    return PyUnicode_DecodeUTF16(s, size, errors, &byteorder);
+}
+static CYTHON_INLINE PyObject *__Pyx_PyUnicode_DecodeUTF16BE(const char *s, Py_ssize_t size, const char *errors) {
+    int byteorder = 1;
+    return PyUnicode_DecodeUTF16(s, size, errors, &byteorder);
+}
+
+/* decode_c_string.proto */
+static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
+         const char* cstring, Py_ssize_t start, Py_ssize_t stop,
+         const char* encoding, const char* errors,
+         PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors));
+
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
 
 /* GetException.proto */
 #if CYTHON_FAST_THREAD_STATE
@@ -1096,6 +1457,11 @@ static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject *
 static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
 #endif
 
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
 /* SaveResetException.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
@@ -1107,9 +1473,6 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
 #endif
 
-/* IncludeStringH.proto */
-#include <string.h>
-
 /* PyObject_GenericGetAttrNoDict.proto */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
@@ -1117,6 +1480,49 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj
 #define __Pyx_PyObject_GenericGetAttrNoDict PyObject_GenericGetAttr
 #endif
 
+/* PyObject_GenericGetAttr.proto */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GenericGetAttr PyObject_GenericGetAttr
+#endif
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable);
+
+/* PyErrExceptionMatches.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
+};
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
+#endif
+
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
@@ -1149,14 +1555,22 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
-/* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
 
 /* CIntFromPy.proto */
 static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
 
 /* CIntToPy.proto */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_PY_LONG_LONG(unsigned PY_LONG_LONG value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
 /* CIntFromPy.proto */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *);
@@ -1180,19 +1594,28 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 /* FetchCommonType.proto */
 static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type);
 
+/* PyObjectGetMethod.proto */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+
 /* PyObjectCallMethod1.proto */
 static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
-static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg);
 
 /* CoroutineBase.proto */
 typedef PyObject *(*__pyx_coroutine_body_t)(PyObject *, PyThreadState *, PyObject *);
+#if CYTHON_USE_EXC_INFO_STACK
+#define __Pyx_ExcInfoStruct  _PyErr_StackItem
+#else
 typedef struct {
-    PyObject_HEAD
-    __pyx_coroutine_body_t body;
-    PyObject *closure;
     PyObject *exc_type;
     PyObject *exc_value;
     PyObject *exc_traceback;
+} __Pyx_ExcInfoStruct;
+#endif
+typedef struct {
+    PyObject_HEAD
+    __pyx_coroutine_body_t body;
+    PyObject *closure;
+    __Pyx_ExcInfoStruct gi_exc_state;
     PyObject *gi_weakreflist;
     PyObject *classobj;
     PyObject *yieldfrom;
@@ -1200,6 +1623,7 @@ typedef struct {
     PyObject *gi_qualname;
     PyObject *gi_modulename;
     PyObject *gi_code;
+    PyObject *gi_frame;
     int resume_label;
     char is_running;
 } __pyx_CoroutineObject;
@@ -1209,18 +1633,24 @@ static __pyx_CoroutineObject *__Pyx__Coroutine_New(
 static __pyx_CoroutineObject *__Pyx__Coroutine_NewInit(
             __pyx_CoroutineObject *gen, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
             PyObject *name, PyObject *qualname, PyObject *module_name);
+static CYTHON_INLINE void __Pyx_Coroutine_ExceptionClear(__Pyx_ExcInfoStruct *self);
 static int __Pyx_Coroutine_clear(PyObject *self);
 static PyObject *__Pyx_Coroutine_Send(PyObject *self, PyObject *value);
 static PyObject *__Pyx_Coroutine_Close(PyObject *self);
 static PyObject *__Pyx_Coroutine_Throw(PyObject *gen, PyObject *args);
+#if CYTHON_USE_EXC_INFO_STACK
+#define __Pyx_Coroutine_SwapException(self)
+#define __Pyx_Coroutine_ResetAndClearException(self)  __Pyx_Coroutine_ExceptionClear(&(self)->gi_exc_state)
+#else
 #define __Pyx_Coroutine_SwapException(self) {\
-    __Pyx_ExceptionSwap(&(self)->exc_type, &(self)->exc_value, &(self)->exc_traceback);\
-    __Pyx_Coroutine_ResetFrameBackpointer(self);\
+    __Pyx_ExceptionSwap(&(self)->gi_exc_state.exc_type, &(self)->gi_exc_state.exc_value, &(self)->gi_exc_state.exc_traceback);\
+    __Pyx_Coroutine_ResetFrameBackpointer(&(self)->gi_exc_state);\
     }
 #define __Pyx_Coroutine_ResetAndClearException(self) {\
-    __Pyx_ExceptionReset((self)->exc_type, (self)->exc_value, (self)->exc_traceback);\
-    (self)->exc_type = (self)->exc_value = (self)->exc_traceback = NULL;\
+    __Pyx_ExceptionReset((self)->gi_exc_state.exc_type, (self)->gi_exc_state.exc_value, (self)->gi_exc_state.exc_traceback);\
+    (self)->gi_exc_state.exc_type = (self)->gi_exc_state.exc_value = (self)->gi_exc_state.exc_traceback = NULL;\
     }
+#endif
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyGen_FetchStopIterationValue(pvalue)\
     __Pyx_PyGen__FetchStopIterationValue(__pyx_tstate, pvalue)
@@ -1229,7 +1659,7 @@ static PyObject *__Pyx_Coroutine_Throw(PyObject *gen, PyObject *args);
     __Pyx_PyGen__FetchStopIterationValue(__Pyx_PyThreadState_Current, pvalue)
 #endif
 static int __Pyx_PyGen__FetchStopIterationValue(PyThreadState *tstate, PyObject **pvalue);
-static CYTHON_INLINE void __Pyx_Coroutine_ResetFrameBackpointer(__pyx_CoroutineObject *self);
+static CYTHON_INLINE void __Pyx_Coroutine_ResetFrameBackpointer(__Pyx_ExcInfoStruct *exc_state);
 
 /* PatchModuleWithCoroutine.proto */
 static PyObject* __Pyx_Coroutine_patch_module(PyObject* module, const char* py_code);
@@ -1249,27 +1679,14 @@ static int __pyx_Generator_init(void);
 /* CheckBinaryVersion.proto */
 static int __Pyx_check_binary_version(void);
 
-/* PyIdentifierFromString.proto */
-#if !defined(__Pyx_PyIdentifier_FromString)
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_PyIdentifier_FromString(s) PyString_FromString(s)
-#else
-  #define __Pyx_PyIdentifier_FromString(s) PyUnicode_FromString(s)
-#endif
-#endif
-
-/* ModuleImport.proto */
-static PyObject *__Pyx_ImportModule(const char *name);
-
-/* TypeImport.proto */
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, size_t size, int strict);
-
 /* FunctionImport.proto */
-static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
 
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
+static int __pyx_f_4pssh_6native_5_ssh2_11_LineBuffer_append(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self, char const *__pyx_v_data, Py_ssize_t __pyx_v_size); /* proto*/
+static PyObject *__pyx_f_4pssh_6native_5_ssh2_11_LineBuffer_pop(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self, struct __pyx_opt_args_4pssh_6native_5_ssh2_11_LineBuffer_pop *__pyx_optional_args); /* proto*/
 
 /* Module declarations from 'libc.string' */
 
@@ -1277,20 +1694,35 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
 /* Module declarations from 'libc.stdio' */
 
+/* Module declarations from 'libc.errno' */
+
+/* Module declarations from '__builtin__' */
+
+/* Module declarations from 'cpython.type' */
+static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
+
+/* Module declarations from 'cpython' */
+
+/* Module declarations from 'cpython.object' */
+
+/* Module declarations from 'cpython.bytes' */
+
 /* Module declarations from 'libc.stddef' */
 
 /* Module declarations from 'libc.time' */
 
-/* Module declarations from 'posix.types' */
-
 /* Module declarations from 'ssh2.c_stat' */
 
 /* Module declarations from 'ssh2.c_ssh2' */
 
 /* Module declarations from 'ssh2.c_sftp' */
 
+/* Module declarations from 'ssh2' */
+
 /* Module declarations from 'ssh2.session' */
 static PyTypeObject *__pyx_ptype_4ssh2_7session_Session = 0;
+static PyTypeObject *__pyx_ptype_4ssh2_7session_MethodType = 0;
+static PyTypeObject *__pyx_ptype_4ssh2_7session_FlagType = 0;
 
 /* Module declarations from 'ssh2.sftp' */
 static PyTypeObject *__pyx_ptype_4ssh2_4sftp_SFTP = 0;
@@ -1302,384 +1734,1039 @@ static PyTypeObject *__pyx_ptype_4ssh2_11sftp_handle_SFTPStatVFS = 0;
 
 /* Module declarations from 'ssh2.utils' */
 static PyObject *(*__pyx_f_4ssh2_5utils_to_bytes)(PyObject *); /*proto*/
+static int (*__pyx_f_4ssh2_5utils_handle_error_codes)(int, int __pyx_skip_dispatch); /*proto*/
 
 /* Module declarations from 'pssh.native._ssh2' */
+static PyTypeObject *__pyx_ptype_4pssh_6native_5_ssh2__LineBuffer = 0;
 static PyTypeObject *__pyx_ptype_4pssh_6native_5_ssh2___pyx_scope_struct___read_output = 0;
-static PyObject *__pyx_v_4pssh_6native_5_ssh2_LINESEP = 0;
+static Py_ssize_t __pyx_v_4pssh_6native_5_ssh2__MIN_BUFFER_SIZE;
+static CYTHON_INLINE Py_ssize_t __pyx_f_4pssh_6native_5_ssh2__rstrip_size(char const *, Py_ssize_t); /*proto*/
 static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int, LIBSSH2_SESSION *, PyObject *); /*proto*/
 #define __Pyx_MODULE_NAME "pssh.native._ssh2"
 extern int __pyx_module_is_main_pssh__native___ssh2;
 int __pyx_module_is_main_pssh__native___ssh2 = 0;
 
 /* Implementation of 'pssh.native._ssh2' */
-static PyObject *__pyx_builtin_OSError;
 static PyObject *__pyx_builtin_MemoryError;
+static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_IOError;
-static const char __pyx_k__2[] = "";
-static const char __pyx_k__5[] = "\n";
 static const char __pyx_k_rc[] = "rc";
+static const char __pyx_k_end[] = "_end";
 static const char __pyx_k_pos[] = "_pos";
 static const char __pyx_k_ptr[] = "ptr";
 static const char __pyx_k_args[] = "args";
 static const char __pyx_k_cbuf[] = "cbuf";
 static const char __pyx_k_data[] = "_data";
-static const char __pyx_k_find[] = "find";
 static const char __pyx_k_main[] = "__main__";
+static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_send[] = "send";
 static const char __pyx_k_size[] = "_size";
 static const char __pyx_k_sock[] = "_sock";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_close[] = "close";
+static const char __pyx_k_errno[] = "_errno";
 static const char __pyx_k_nread[] = "nread";
 static const char __pyx_k_throw[] = "throw";
+static const char __pyx_k_total[] = "total";
+static const char __pyx_k_append[] = "append";
+static const char __pyx_k_chunks[] = "chunks";
 static const char __pyx_k_handle[] = "handle";
 static const char __pyx_k_import[] = "__import__";
-static const char __pyx_k_rstrip[] = "rstrip";
+static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_select[] = "select";
 static const char __pyx_k_IOError[] = "IOError";
-static const char __pyx_k_OSError[] = "OSError";
 static const char __pyx_k_Timeout[] = "Timeout";
 static const char __pyx_k_linesep[] = "linesep";
 static const char __pyx_k_session[] = "session";
 static const char __pyx_k_timeout[] = "timeout";
+static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_handle_2[] = "_handle";
 static const char __pyx_k_local_fh[] = "local_fh";
+static const char __pyx_k_progress[] = "progress";
+static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_sftp_get[] = "sftp_get";
 static const char __pyx_k_sftp_put[] = "sftp_put";
+static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_read_func[] = "read_func";
+static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_remainder[] = "remainder";
 static const char __pyx_k_session_2[] = "_session";
+static const char __pyx_k_LineBuffer[] = "_LineBuffer";
 static const char __pyx_k_exceptions[] = "exceptions";
 static const char __pyx_k_local_file[] = "local_file";
+static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_read_output[] = "_read_output";
 static const char __pyx_k_wait_select[] = "wait_select";
 static const char __pyx_k_SessionError[] = "SessionError";
 static const char __pyx_k_b_local_file[] = "b_local_file";
+static const char __pyx_k_has_progress[] = "has_progress";
 static const char __pyx_k_local_file_2[] = "_local_file";
 static const char __pyx_k_buffer_maxlen[] = "buffer_maxlen";
 static const char __pyx_k_gevent_select[] = "gevent.select";
-static const char __pyx_k_remainder_len[] = "remainder_len";
-static const char __pyx_k_SFTPHandleError[] = "SFTPHandleError";
-static const char __pyx_k_ssh2_exceptions[] = "ssh2.exceptions";
+static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_pssh_native__ssh2[] = "pssh.native._ssh2";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_pssh_native__ssh2_pyx[] = "pssh/native/_ssh2.pyx";
+static const char __pyx_k_Error_reading_from_local_file_s[] = "Error reading from local file %s";
 static const char __pyx_k_Cython_functions_for_interfacing[] = "Cython functions for interfacing directly with ssh2-python's C-API";
+static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static PyObject *__pyx_kp_s_Error_reading_from_local_file_s;
 static PyObject *__pyx_n_s_IOError;
+static PyObject *__pyx_n_s_LineBuffer;
 static PyObject *__pyx_n_s_MemoryError;
-static PyObject *__pyx_n_s_OSError;
-static PyObject *__pyx_n_s_SFTPHandleError;
 static PyObject *__pyx_n_s_SessionError;
 static PyObject *__pyx_n_s_Timeout;
-static PyObject *__pyx_kp_b__2;
-static PyObject *__pyx_kp_b__5;
+static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_append;
 static PyObject *__pyx_n_s_args;
 static PyObject *__pyx_n_s_b_local_file;
 static PyObject *__pyx_n_s_buffer_maxlen;
 static PyObject *__pyx_n_s_cbuf;
+static PyObject *__pyx_n_s_chunks;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_close;
 static PyObject *__pyx_n_s_data;
+static PyObject *__pyx_n_s_end;
+static PyObject *__pyx_n_s_errno;
 static PyObject *__pyx_n_s_exceptions;
-static PyObject *__pyx_n_s_find;
+static PyObject *__pyx_n_s_getstate;
 static PyObject *__pyx_n_s_gevent_select;
 static PyObject *__pyx_n_s_handle;
 static PyObject *__pyx_n_s_handle_2;
+static PyObject *__pyx_n_s_has_progress;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_linesep;
 static PyObject *__pyx_n_s_local_fh;
 static PyObject *__pyx_n_s_local_file;
 static PyObject *__pyx_n_s_local_file_2;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
 static PyObject *__pyx_n_s_nread;
 static PyObject *__pyx_n_s_pos;
+static PyObject *__pyx_n_s_progress;
 static PyObject *__pyx_n_s_pssh_native__ssh2;
 static PyObject *__pyx_kp_s_pssh_native__ssh2_pyx;
 static PyObject *__pyx_n_s_ptr;
+static PyObject *__pyx_n_s_pyx_vtable;
 static PyObject *__pyx_n_s_rc;
 static PyObject *__pyx_n_s_read_func;
 static PyObject *__pyx_n_s_read_output;
+static PyObject *__pyx_n_s_reduce;
+static PyObject *__pyx_n_s_reduce_cython;
+static PyObject *__pyx_n_s_reduce_ex;
 static PyObject *__pyx_n_s_remainder;
-static PyObject *__pyx_n_s_remainder_len;
-static PyObject *__pyx_n_s_rstrip;
 static PyObject *__pyx_n_s_select;
 static PyObject *__pyx_n_s_send;
 static PyObject *__pyx_n_s_session;
 static PyObject *__pyx_n_s_session_2;
+static PyObject *__pyx_n_s_setstate;
+static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_s_sftp_get;
 static PyObject *__pyx_n_s_sftp_put;
 static PyObject *__pyx_n_s_size;
 static PyObject *__pyx_n_s_sock;
-static PyObject *__pyx_n_s_ssh2_exceptions;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_throw;
 static PyObject *__pyx_n_s_timeout;
+static PyObject *__pyx_n_s_total;
 static PyObject *__pyx_n_s_wait_select;
-static PyObject *__pyx_pf_4pssh_6native_5_ssh2__read_output(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, PyObject *__pyx_v_read_func, PyObject *__pyx_v_timeout); /* proto */
-static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle, PyObject *__pyx_v_local_file, size_t __pyx_v_buffer_maxlen); /* proto */
-static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle, PyObject *__pyx_v_local_file, size_t __pyx_v_buffer_maxlen); /* proto */
+static int __pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer___cinit__(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self); /* proto */
+static void __pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_2__dealloc__(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_4__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_6__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2__read_output(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, PyObject *__pyx_v_read_func, PyObject *__pyx_v_timeout, int __pyx_v_chunks); /* proto */
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle, PyObject *__pyx_v_local_file, size_t __pyx_v_buffer_maxlen, PyObject *__pyx_v_progress); /* proto */
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle, PyObject *__pyx_v_local_file, size_t __pyx_v_buffer_maxlen, int __pyx_v_append, PyObject *__pyx_v_progress); /* proto */
 static PyObject *__pyx_pf_4pssh_6native_5_ssh2_7wait_select(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, PyObject *__pyx_v_timeout); /* proto */
+static PyObject *__pyx_tp_new_4pssh_6native_5_ssh2__LineBuffer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_4pssh_6native_5_ssh2___pyx_scope_struct___read_output(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
-static size_t __pyx_k__3;
 static size_t __pyx_k__4;
-static PyObject *__pyx_codeobj_;
+static size_t __pyx_k__5;
+static PyObject *__pyx_tuple_;
+static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__6;
 static PyObject *__pyx_tuple__7;
 static PyObject *__pyx_tuple__9;
 static PyObject *__pyx_tuple__11;
+static PyObject *__pyx_codeobj__3;
 static PyObject *__pyx_codeobj__8;
 static PyObject *__pyx_codeobj__10;
 static PyObject *__pyx_codeobj__12;
 /* Late includes */
-static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-/* "pssh/native/_ssh2.pyx":42
- * 
- * 
- * def _read_output(Session session, read_func, timeout=None):             # <<<<<<<<<<<<<<
+/* "pssh/native/_ssh2.pyx":51
  *     cdef Py_ssize_t _size
- *     cdef bytes _data
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self._buf = NULL
+ *         self._len = 0
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_4pssh_6native_5_ssh2_1_read_output(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_4pssh_6native_5_ssh2__read_output[] = "_read_output(Session session, read_func, timeout=None)";
-static PyMethodDef __pyx_mdef_4pssh_6native_5_ssh2_1_read_output = {"_read_output", (PyCFunction)__pyx_pw_4pssh_6native_5_ssh2_1_read_output, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4pssh_6native_5_ssh2__read_output};
-static PyObject *__pyx_pw_4pssh_6native_5_ssh2_1_read_output(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session = 0;
-  PyObject *__pyx_v_read_func = 0;
-  PyObject *__pyx_v_timeout = 0;
-  PyObject *__pyx_r = 0;
+static int __pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("_read_output (wrapper)", 0);
-  {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_session,&__pyx_n_s_read_func,&__pyx_n_s_timeout,0};
-    PyObject* values[3] = {0,0,0};
-    values[2] = ((PyObject *)Py_None);
-    if (unlikely(__pyx_kwds)) {
-      Py_ssize_t kw_args;
-      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
-      switch (pos_args) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = PyDict_Size(__pyx_kwds);
-      switch (pos_args) {
-        case  0:
-        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_session)) != 0)) kw_args--;
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_read_func)) != 0)) kw_args--;
-        else {
-          __Pyx_RaiseArgtupleInvalid("_read_output", 0, 2, 3, 1); __PYX_ERR(0, 42, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_timeout);
-          if (value) { values[2] = value; kw_args--; }
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_read_output") < 0)) __PYX_ERR(0, 42, __pyx_L3_error)
-      }
-    } else {
-      switch (PyTuple_GET_SIZE(__pyx_args)) {
-        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-        break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-    }
-    __pyx_v_session = ((struct __pyx_obj_4ssh2_7session_Session *)values[0]);
-    __pyx_v_read_func = values[1];
-    __pyx_v_timeout = values[2];
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("_read_output", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 42, __pyx_L3_error)
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("pssh.native._ssh2._read_output", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_session), __pyx_ptype_4ssh2_7session_Session, 1, "session", 0))) __PYX_ERR(0, 42, __pyx_L1_error)
-  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2__read_output(__pyx_self, __pyx_v_session, __pyx_v_read_func, __pyx_v_timeout);
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  if (unlikely(PyTuple_GET_SIZE(__pyx_args) > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, PyTuple_GET_SIZE(__pyx_args)); return -1;}
+  if (unlikely(__pyx_kwds) && unlikely(PyDict_Size(__pyx_kwds) > 0) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
+  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer___cinit__(((struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *)__pyx_v_self));
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  __pyx_L0:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4pssh_6native_5_ssh2__read_output(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, PyObject *__pyx_v_read_func, PyObject *__pyx_v_timeout) {
-  struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *__pyx_cur_scope;
-  PyObject *__pyx_r = NULL;
+static int __pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer___cinit__(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self) {
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("_read_output", 0);
-  __pyx_cur_scope = (struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *)__pyx_tp_new_4pssh_6native_5_ssh2___pyx_scope_struct___read_output(__pyx_ptype_4pssh_6native_5_ssh2___pyx_scope_struct___read_output, __pyx_empty_tuple, NULL);
-  if (unlikely(!__pyx_cur_scope)) {
-    __pyx_cur_scope = ((struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *)Py_None);
-    __Pyx_INCREF(Py_None);
-    __PYX_ERR(0, 42, __pyx_L1_error)
-  } else {
-    __Pyx_GOTREF(__pyx_cur_scope);
-  }
-  __pyx_cur_scope->__pyx_v_session = __pyx_v_session;
-  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_session);
-  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_session);
-  __pyx_cur_scope->__pyx_v_read_func = __pyx_v_read_func;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_read_func);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_read_func);
-  __pyx_cur_scope->__pyx_v_timeout = __pyx_v_timeout;
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_timeout);
-  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_timeout);
-  {
-    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_4pssh_6native_5_ssh2_2generator, __pyx_codeobj_, (PyObject *) __pyx_cur_scope, __pyx_n_s_read_output, __pyx_n_s_read_output, __pyx_n_s_pssh_native__ssh2); if (unlikely(!gen)) __PYX_ERR(0, 42, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_cur_scope);
-    __Pyx_RefNannyFinishContext();
-    return (PyObject *) gen;
-  }
+  __Pyx_RefNannySetupContext("__cinit__", 0);
+
+  /* "pssh/native/_ssh2.pyx":52
+ * 
+ *     def __cinit__(self):
+ *         self._buf = NULL             # <<<<<<<<<<<<<<
+ *         self._len = 0
+ *         self._size = 0
+ */
+  __pyx_v_self->_buf = NULL;
+
+  /* "pssh/native/_ssh2.pyx":53
+ *     def __cinit__(self):
+ *         self._buf = NULL
+ *         self._len = 0             # <<<<<<<<<<<<<<
+ *         self._size = 0
+ * 
+ */
+  __pyx_v_self->_len = 0;
+
+  /* "pssh/native/_ssh2.pyx":54
+ *         self._buf = NULL
+ *         self._len = 0
+ *         self._size = 0             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  __pyx_v_self->_size = 0;
+
+  /* "pssh/native/_ssh2.pyx":51
+ *     cdef Py_ssize_t _size
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         self._buf = NULL
+ *         self._len = 0
+ */
 
   /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("pssh.native._ssh2._read_output", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
-  __Pyx_XGIVEREF(__pyx_r);
+  __pyx_r = 0;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
-{
-  struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *__pyx_cur_scope = ((struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *)__pyx_generator->closure);
-  PyObject *__pyx_r = NULL;
-  LIBSSH2_SESSION *__pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *(*__pyx_t_7)(PyObject *);
-  Py_ssize_t __pyx_t_8;
-  int __pyx_t_9;
-  int __pyx_t_10;
-  int __pyx_t_11;
-  PyObject *__pyx_t_12 = NULL;
+/* "pssh/native/_ssh2.pyx":56
+ *         self._size = 0
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self._buf)
+ * 
+ */
+
+/* Python wrapper */
+static void __pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_3__dealloc__(PyObject *__pyx_v_self) {
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("_read_output", 0);
-  switch (__pyx_generator->resume_label) {
-    case 0: goto __pyx_L3_first_run;
-    case 1: goto __pyx_L22_resume_from_yield;
-    case 2: goto __pyx_L23_resume_from_yield;
-    case 3: goto __pyx_L27_resume_from_yield;
-    default: /* CPython raises the right error here */
-    __Pyx_RefNannyFinishContext();
-    return NULL;
-  }
-  __pyx_L3_first_run:;
-  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_2__dealloc__(((struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *)__pyx_v_self));
 
-  /* "pssh/native/_ssh2.pyx":45
- *     cdef Py_ssize_t _size
- *     cdef bytes _data
- *     cdef bytes remainder = b""             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t remainder_len = 0
- *     cdef LIBSSH2_SESSION *_session = session._session
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_2__dealloc__(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__", 0);
+
+  /* "pssh/native/_ssh2.pyx":57
+ * 
+ *     def __dealloc__(self):
+ *         free(self._buf)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int append(self, const char *data, Py_ssize_t size) except -1:
  */
-  __Pyx_INCREF(__pyx_kp_b__2);
-  __Pyx_GIVEREF(__pyx_kp_b__2);
-  __pyx_cur_scope->__pyx_v_remainder = __pyx_kp_b__2;
+  free(__pyx_v_self->_buf);
 
-  /* "pssh/native/_ssh2.pyx":46
- *     cdef bytes _data
- *     cdef bytes remainder = b""
- *     cdef Py_ssize_t remainder_len = 0             # <<<<<<<<<<<<<<
- *     cdef LIBSSH2_SESSION *_session = session._session
- *     cdef int _sock = session._sock
+  /* "pssh/native/_ssh2.pyx":56
+ *         self._size = 0
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self._buf)
+ * 
  */
-  __pyx_cur_scope->__pyx_v_remainder_len = 0;
 
-  /* "pssh/native/_ssh2.pyx":47
- *     cdef bytes remainder = b""
- *     cdef Py_ssize_t remainder_len = 0
- *     cdef LIBSSH2_SESSION *_session = session._session             # <<<<<<<<<<<<<<
- *     cdef int _sock = session._sock
- *     cdef size_t _pos = 0
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "pssh/native/_ssh2.pyx":59
+ *         free(self._buf)
+ * 
+ *     cdef int append(self, const char *data, Py_ssize_t size) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t new_size
+ *         cdef char *new_buf
  */
-  __pyx_t_1 = __pyx_cur_scope->__pyx_v_session->_session;
-  __pyx_cur_scope->__pyx_v__session = __pyx_t_1;
 
-  /* "pssh/native/_ssh2.pyx":48
- *     cdef Py_ssize_t remainder_len = 0
- *     cdef LIBSSH2_SESSION *_session = session._session
- *     cdef int _sock = session._sock             # <<<<<<<<<<<<<<
- *     cdef size_t _pos = 0
- *     cdef Py_ssize_t linesep
+static int __pyx_f_4pssh_6native_5_ssh2_11_LineBuffer_append(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self, char const *__pyx_v_data, Py_ssize_t __pyx_v_size) {
+  Py_ssize_t __pyx_v_new_size;
+  char *__pyx_v_new_buf;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("append", 0);
+
+  /* "pssh/native/_ssh2.pyx":62
+ *         cdef Py_ssize_t new_size
+ *         cdef char *new_buf
+ *         if self._len + size > self._size:             # <<<<<<<<<<<<<<
+ *             new_size = max(self._size * 2, self._len + size, _MIN_BUFFER_SIZE)
+ *             new_buf = <char *>realloc(self._buf, new_size)
+ */
+  __pyx_t_1 = (((__pyx_v_self->_len + __pyx_v_size) > __pyx_v_self->_size) != 0);
+  if (__pyx_t_1) {
+
+    /* "pssh/native/_ssh2.pyx":63
+ *         cdef char *new_buf
+ *         if self._len + size > self._size:
+ *             new_size = max(self._size * 2, self._len + size, _MIN_BUFFER_SIZE)             # <<<<<<<<<<<<<<
+ *             new_buf = <char *>realloc(self._buf, new_size)
+ *             if new_buf is NULL:
+ */
+    __pyx_t_2 = (__pyx_v_self->_len + __pyx_v_size);
+    __pyx_t_3 = __pyx_v_4pssh_6native_5_ssh2__MIN_BUFFER_SIZE;
+    __pyx_t_4 = (__pyx_v_self->_size * 2);
+    if (((__pyx_t_2 > __pyx_t_4) != 0)) {
+      __pyx_t_5 = __pyx_t_2;
+    } else {
+      __pyx_t_5 = __pyx_t_4;
+    }
+    __pyx_t_4 = __pyx_t_5;
+    if (((__pyx_t_3 > __pyx_t_4) != 0)) {
+      __pyx_t_5 = __pyx_t_3;
+    } else {
+      __pyx_t_5 = __pyx_t_4;
+    }
+    __pyx_v_new_size = __pyx_t_5;
+
+    /* "pssh/native/_ssh2.pyx":64
+ *         if self._len + size > self._size:
+ *             new_size = max(self._size * 2, self._len + size, _MIN_BUFFER_SIZE)
+ *             new_buf = <char *>realloc(self._buf, new_size)             # <<<<<<<<<<<<<<
+ *             if new_buf is NULL:
+ *                 raise MemoryError
  */
-  __pyx_t_2 = __pyx_cur_scope->__pyx_v_session->_sock;
-  __pyx_cur_scope->__pyx_v__sock = __pyx_t_2;
+    __pyx_v_new_buf = ((char *)realloc(__pyx_v_self->_buf, __pyx_v_new_size));
 
-  /* "pssh/native/_ssh2.pyx":49
- *     cdef LIBSSH2_SESSION *_session = session._session
- *     cdef int _sock = session._sock
- *     cdef size_t _pos = 0             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t linesep
- *     _size, _data = read_func()
+    /* "pssh/native/_ssh2.pyx":65
+ *             new_size = max(self._size * 2, self._len + size, _MIN_BUFFER_SIZE)
+ *             new_buf = <char *>realloc(self._buf, new_size)
+ *             if new_buf is NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError
+ *             self._buf = new_buf
  */
-  __pyx_cur_scope->__pyx_v__pos = 0;
+    __pyx_t_1 = ((__pyx_v_new_buf == NULL) != 0);
+    if (unlikely(__pyx_t_1)) {
 
-  /* "pssh/native/_ssh2.pyx":51
- *     cdef size_t _pos = 0
- *     cdef Py_ssize_t linesep
- *     _size, _data = read_func()             # <<<<<<<<<<<<<<
- *     while _size == LIBSSH2_ERROR_EAGAIN or _size > 0:
- *         if _size == LIBSSH2_ERROR_EAGAIN:
+      /* "pssh/native/_ssh2.pyx":66
+ *             new_buf = <char *>realloc(self._buf, new_size)
+ *             if new_buf is NULL:
+ *                 raise MemoryError             # <<<<<<<<<<<<<<
+ *             self._buf = new_buf
+ *             self._size = new_size
+ */
+      PyErr_NoMemory(); __PYX_ERR(0, 66, __pyx_L1_error)
+
+      /* "pssh/native/_ssh2.pyx":65
+ *             new_size = max(self._size * 2, self._len + size, _MIN_BUFFER_SIZE)
+ *             new_buf = <char *>realloc(self._buf, new_size)
+ *             if new_buf is NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError
+ *             self._buf = new_buf
  */
-  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_read_func);
-  __pyx_t_4 = __pyx_cur_scope->__pyx_v_read_func; __pyx_t_5 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_4, function);
     }
+
+    /* "pssh/native/_ssh2.pyx":67
+ *             if new_buf is NULL:
+ *                 raise MemoryError
+ *             self._buf = new_buf             # <<<<<<<<<<<<<<
+ *             self._size = new_size
+ *         memcpy(self._buf + self._len, data, size)
+ */
+    __pyx_v_self->_buf = __pyx_v_new_buf;
+
+    /* "pssh/native/_ssh2.pyx":68
+ *                 raise MemoryError
+ *             self._buf = new_buf
+ *             self._size = new_size             # <<<<<<<<<<<<<<
+ *         memcpy(self._buf + self._len, data, size)
+ *         self._len += size
+ */
+    __pyx_v_self->_size = __pyx_v_new_size;
+
+    /* "pssh/native/_ssh2.pyx":62
+ *         cdef Py_ssize_t new_size
+ *         cdef char *new_buf
+ *         if self._len + size > self._size:             # <<<<<<<<<<<<<<
+ *             new_size = max(self._size * 2, self._len + size, _MIN_BUFFER_SIZE)
+ *             new_buf = <char *>realloc(self._buf, new_size)
+ */
   }
-  if (__pyx_t_5) {
-    __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 51, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  } else {
-    __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 51, __pyx_L1_error)
-  }
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if ((likely(PyTuple_CheckExact(__pyx_t_3))) || (PyList_CheckExact(__pyx_t_3))) {
-    PyObject* sequence = __pyx_t_3;
-    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-    if (unlikely(size != 2)) {
-      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
-      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-      __PYX_ERR(0, 51, __pyx_L1_error)
-    }
-    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    if (likely(PyTuple_CheckExact(sequence))) {
-      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0); 
+
+  /* "pssh/native/_ssh2.pyx":69
+ *             self._buf = new_buf
+ *             self._size = new_size
+ *         memcpy(self._buf + self._len, data, size)             # <<<<<<<<<<<<<<
+ *         self._len += size
+ *         return 0
+ */
+  (void)(memcpy((__pyx_v_self->_buf + __pyx_v_self->_len), __pyx_v_data, __pyx_v_size));
+
+  /* "pssh/native/_ssh2.pyx":70
+ *             self._size = new_size
+ *         memcpy(self._buf + self._len, data, size)
+ *         self._len += size             # <<<<<<<<<<<<<<
+ *         return 0
+ * 
+ */
+  __pyx_v_self->_len = (__pyx_v_self->_len + __pyx_v_size);
+
+  /* "pssh/native/_ssh2.pyx":71
+ *         memcpy(self._buf + self._len, data, size)
+ *         self._len += size
+ *         return 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bytes pop(self, bint strip=True):
+ */
+  __pyx_r = 0;
+  goto __pyx_L0;
+
+  /* "pssh/native/_ssh2.pyx":59
+ *         free(self._buf)
+ * 
+ *     cdef int append(self, const char *data, Py_ssize_t size) except -1:             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t new_size
+ *         cdef char *new_buf
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("pssh.native._ssh2._LineBuffer.append", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pssh/native/_ssh2.pyx":73
+ *         return 0
+ * 
+ *     cdef bytes pop(self, bint strip=True):             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t size = _rstrip_size(self._buf, self._len) \
+ *             if strip else self._len
+ */
+
+static PyObject *__pyx_f_4pssh_6native_5_ssh2_11_LineBuffer_pop(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self, struct __pyx_opt_args_4pssh_6native_5_ssh2_11_LineBuffer_pop *__pyx_optional_args) {
+  int __pyx_v_strip = ((int)1);
+  Py_ssize_t __pyx_v_size;
+  PyObject *__pyx_v_line = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pop", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_strip = __pyx_optional_args->strip;
+    }
+  }
+
+  /* "pssh/native/_ssh2.pyx":75
+ *     cdef bytes pop(self, bint strip=True):
+ *         cdef Py_ssize_t size = _rstrip_size(self._buf, self._len) \
+ *             if strip else self._len             # <<<<<<<<<<<<<<
+ *         cdef bytes line = PyBytes_FromStringAndSize(self._buf, size)
+ *         self._len = 0
+ */
+  if ((__pyx_v_strip != 0)) {
+
+    /* "pssh/native/_ssh2.pyx":74
+ * 
+ *     cdef bytes pop(self, bint strip=True):
+ *         cdef Py_ssize_t size = _rstrip_size(self._buf, self._len) \             # <<<<<<<<<<<<<<
+ *             if strip else self._len
+ *         cdef bytes line = PyBytes_FromStringAndSize(self._buf, size)
+ */
+    __pyx_t_1 = __pyx_f_4pssh_6native_5_ssh2__rstrip_size(__pyx_v_self->_buf, __pyx_v_self->_len);
+  } else {
+
+    /* "pssh/native/_ssh2.pyx":75
+ *     cdef bytes pop(self, bint strip=True):
+ *         cdef Py_ssize_t size = _rstrip_size(self._buf, self._len) \
+ *             if strip else self._len             # <<<<<<<<<<<<<<
+ *         cdef bytes line = PyBytes_FromStringAndSize(self._buf, size)
+ *         self._len = 0
+ */
+    __pyx_t_1 = __pyx_v_self->_len;
+  }
+  __pyx_v_size = __pyx_t_1;
+
+  /* "pssh/native/_ssh2.pyx":76
+ *         cdef Py_ssize_t size = _rstrip_size(self._buf, self._len) \
+ *             if strip else self._len
+ *         cdef bytes line = PyBytes_FromStringAndSize(self._buf, size)             # <<<<<<<<<<<<<<
+ *         self._len = 0
+ *         return line
+ */
+  __pyx_t_2 = PyBytes_FromStringAndSize(__pyx_v_self->_buf, __pyx_v_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_v_line = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "pssh/native/_ssh2.pyx":77
+ *             if strip else self._len
+ *         cdef bytes line = PyBytes_FromStringAndSize(self._buf, size)
+ *         self._len = 0             # <<<<<<<<<<<<<<
+ *         return line
+ * 
+ */
+  __pyx_v_self->_len = 0;
+
+  /* "pssh/native/_ssh2.pyx":78
+ *         cdef bytes line = PyBytes_FromStringAndSize(self._buf, size)
+ *         self._len = 0
+ *         return line             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_line);
+  __pyx_r = __pyx_v_line;
+  goto __pyx_L0;
+
+  /* "pssh/native/_ssh2.pyx":73
+ *         return 0
+ * 
+ *     cdef bytes pop(self, bint strip=True):             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t size = _rstrip_size(self._buf, self._len) \
+ *             if strip else self._len
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("pssh.native._ssh2._LineBuffer.pop", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_line);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_4pssh_6native_5_ssh2_11_LineBuffer_4__reduce_cython__[] = "_LineBuffer.__reduce_cython__(self)";
+static PyObject *__pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_5__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_4__reduce_cython__(((struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_4__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("pssh.native._ssh2._LineBuffer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_4pssh_6native_5_ssh2_11_LineBuffer_6__setstate_cython__[] = "_LineBuffer.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_7__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_6__setstate_cython__(((struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2_11_LineBuffer_6__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("pssh.native._ssh2._LineBuffer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pssh/native/_ssh2.pyx":81
+ * 
+ * 
+ * cdef inline Py_ssize_t _rstrip_size(const char *data, Py_ssize_t size) nogil:             # <<<<<<<<<<<<<<
+ *     """Size of data without trailing whitespace, as per ``bytes.rstrip``"""
+ *     cdef char c
+ */
+
+static CYTHON_INLINE Py_ssize_t __pyx_f_4pssh_6native_5_ssh2__rstrip_size(char const *__pyx_v_data, Py_ssize_t __pyx_v_size) {
+  char __pyx_v_c;
+  Py_ssize_t __pyx_r;
+  int __pyx_t_1;
+
+  /* "pssh/native/_ssh2.pyx":84
+ *     """Size of data without trailing whitespace, as per ``bytes.rstrip``"""
+ *     cdef char c
+ *     while size > 0:             # <<<<<<<<<<<<<<
+ *         c = data[size - 1]
+ *         if c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' \
+ */
+  while (1) {
+    __pyx_t_1 = ((__pyx_v_size > 0) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "pssh/native/_ssh2.pyx":85
+ *     cdef char c
+ *     while size > 0:
+ *         c = data[size - 1]             # <<<<<<<<<<<<<<
+ *         if c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' \
+ *            or c == b'\x0b' or c == b'\x0c':
+ */
+    __pyx_v_c = (__pyx_v_data[(__pyx_v_size - 1)]);
+
+    /* "pssh/native/_ssh2.pyx":86
+ *     while size > 0:
+ *         c = data[size - 1]
+ *         if c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' \             # <<<<<<<<<<<<<<
+ *            or c == b'\x0b' or c == b'\x0c':
+ *             size -= 1
+ */
+    switch (__pyx_v_c) {
+      case ' ':
+      case '\t':
+      case '\n':
+      case '\r':
+      case '\x0B':
+
+      /* "pssh/native/_ssh2.pyx":87
+ *         c = data[size - 1]
+ *         if c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' \
+ *            or c == b'\x0b' or c == b'\x0c':             # <<<<<<<<<<<<<<
+ *             size -= 1
+ *         else:
+ */
+      case '\x0C':
+
+      /* "pssh/native/_ssh2.pyx":88
+ *         if c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' \
+ *            or c == b'\x0b' or c == b'\x0c':
+ *             size -= 1             # <<<<<<<<<<<<<<
+ *         else:
+ *             break
+ */
+      __pyx_v_size = (__pyx_v_size - 1);
+
+      /* "pssh/native/_ssh2.pyx":86
+ *     while size > 0:
+ *         c = data[size - 1]
+ *         if c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' \             # <<<<<<<<<<<<<<
+ *            or c == b'\x0b' or c == b'\x0c':
+ *             size -= 1
+ */
+      break;
+      default:
+
+      /* "pssh/native/_ssh2.pyx":90
+ *             size -= 1
+ *         else:
+ *             break             # <<<<<<<<<<<<<<
+ *     return size
+ * 
+ */
+      goto __pyx_L4_break;
+      break;
+    }
+  }
+  __pyx_L4_break:;
+
+  /* "pssh/native/_ssh2.pyx":91
+ *         else:
+ *             break
+ *     return size             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = __pyx_v_size;
+  goto __pyx_L0;
+
+  /* "pssh/native/_ssh2.pyx":81
+ * 
+ * 
+ * cdef inline Py_ssize_t _rstrip_size(const char *data, Py_ssize_t size) nogil:             # <<<<<<<<<<<<<<
+ *     """Size of data without trailing whitespace, as per ``bytes.rstrip``"""
+ *     cdef char c
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
+
+/* "pssh/native/_ssh2.pyx":94
+ * 
+ * 
+ * def _read_output(Session session, read_func, timeout=None, bint chunks=False):             # <<<<<<<<<<<<<<
+ *     """Read output from ``read_func`` until EOF and yield lines of output
+ *     with trailing whitespace stripped.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_4pssh_6native_5_ssh2_1_read_output(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_4pssh_6native_5_ssh2__read_output[] = "_read_output(Session session, read_func, timeout=None, bool chunks=False)\nRead output from ``read_func`` until EOF and yield lines of output\n    with trailing whitespace stripped.\n\n    Each chunk of data read is scanned for line separators once, partial\n    lines are kept in a native buffer until their line separator is read.\n\n    :param chunks: Yield chunks of data as they are read instead of lines.\n    :type chunks: bool";
+static PyMethodDef __pyx_mdef_4pssh_6native_5_ssh2_1_read_output = {"_read_output", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4pssh_6native_5_ssh2_1_read_output, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4pssh_6native_5_ssh2__read_output};
+static PyObject *__pyx_pw_4pssh_6native_5_ssh2_1_read_output(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session = 0;
+  PyObject *__pyx_v_read_func = 0;
+  PyObject *__pyx_v_timeout = 0;
+  int __pyx_v_chunks;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_read_output (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_session,&__pyx_n_s_read_func,&__pyx_n_s_timeout,&__pyx_n_s_chunks,0};
+    PyObject* values[4] = {0,0,0,0};
+    values[2] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_session)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_read_func)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("_read_output", 0, 2, 4, 1); __PYX_ERR(0, 94, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_timeout);
+          if (value) { values[2] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_chunks);
+          if (value) { values[3] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "_read_output") < 0)) __PYX_ERR(0, 94, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_session = ((struct __pyx_obj_4ssh2_7session_Session *)values[0]);
+    __pyx_v_read_func = values[1];
+    __pyx_v_timeout = values[2];
+    if (values[3]) {
+      __pyx_v_chunks = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_chunks == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 94, __pyx_L3_error)
+    } else {
+      __pyx_v_chunks = ((int)0);
+    }
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_read_output", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 94, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pssh.native._ssh2._read_output", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_session), __pyx_ptype_4ssh2_7session_Session, 1, "session", 0))) __PYX_ERR(0, 94, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2__read_output(__pyx_self, __pyx_v_session, __pyx_v_read_func, __pyx_v_timeout, __pyx_v_chunks);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2__read_output(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, PyObject *__pyx_v_read_func, PyObject *__pyx_v_timeout, int __pyx_v_chunks) {
+  struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *__pyx_cur_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_read_output", 0);
+  __pyx_cur_scope = (struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *)__pyx_tp_new_4pssh_6native_5_ssh2___pyx_scope_struct___read_output(__pyx_ptype_4pssh_6native_5_ssh2___pyx_scope_struct___read_output, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 94, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF(__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_v_session = __pyx_v_session;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_session);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_session);
+  __pyx_cur_scope->__pyx_v_read_func = __pyx_v_read_func;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_read_func);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_read_func);
+  __pyx_cur_scope->__pyx_v_timeout = __pyx_v_timeout;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_timeout);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_v_timeout);
+  __pyx_cur_scope->__pyx_v_chunks = __pyx_v_chunks;
+  {
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_4pssh_6native_5_ssh2_2generator, __pyx_codeobj__3, (PyObject *) __pyx_cur_scope, __pyx_n_s_read_output, __pyx_n_s_read_output, __pyx_n_s_pssh_native__ssh2); if (unlikely(!gen)) __PYX_ERR(0, 94, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
+  }
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("pssh.native._ssh2._read_output", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_DECREF(((PyObject *)__pyx_cur_scope));
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *__pyx_cur_scope = ((struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *)__pyx_generator->closure);
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  LIBSSH2_SESSION *__pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *(*__pyx_t_7)(PyObject *);
+  Py_ssize_t __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_t_11;
+  char const *__pyx_t_12;
+  struct __pyx_opt_args_4pssh_6native_5_ssh2_11_LineBuffer_pop __pyx_t_13;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_read_output", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    case 1: goto __pyx_L19_resume_from_yield;
+    case 2: goto __pyx_L26_resume_from_yield;
+    case 3: goto __pyx_L27_resume_from_yield;
+    case 4: goto __pyx_L31_resume_from_yield;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
+  }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 94, __pyx_L1_error)
+
+  /* "pssh/native/_ssh2.pyx":105
+ *     cdef Py_ssize_t _size
+ *     cdef bytes _data
+ *     cdef _LineBuffer remainder = _LineBuffer()             # <<<<<<<<<<<<<<
+ *     cdef LIBSSH2_SESSION *_session = session._session
+ *     cdef int _sock = session._sock
+ */
+  __pyx_t_1 = __Pyx_PyObject_CallNoArg(((PyObject *)__pyx_ptype_4pssh_6native_5_ssh2__LineBuffer)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __pyx_cur_scope->__pyx_v_remainder = ((struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "pssh/native/_ssh2.pyx":106
+ *     cdef bytes _data
+ *     cdef _LineBuffer remainder = _LineBuffer()
+ *     cdef LIBSSH2_SESSION *_session = session._session             # <<<<<<<<<<<<<<
+ *     cdef int _sock = session._sock
+ *     cdef const char *_pos
+ */
+  __pyx_t_2 = __pyx_cur_scope->__pyx_v_session->_session;
+  __pyx_cur_scope->__pyx_v__session = __pyx_t_2;
+
+  /* "pssh/native/_ssh2.pyx":107
+ *     cdef _LineBuffer remainder = _LineBuffer()
+ *     cdef LIBSSH2_SESSION *_session = session._session
+ *     cdef int _sock = session._sock             # <<<<<<<<<<<<<<
+ *     cdef const char *_pos
+ *     cdef const char *_end
+ */
+  __pyx_t_3 = __pyx_cur_scope->__pyx_v_session->_sock;
+  __pyx_cur_scope->__pyx_v__sock = __pyx_t_3;
+
+  /* "pssh/native/_ssh2.pyx":111
+ *     cdef const char *_end
+ *     cdef const char *linesep
+ *     _size, _data = read_func()             # <<<<<<<<<<<<<<
+ *     while _size == LIBSSH2_ERROR_EAGAIN or _size > 0:
+ *         if _size == LIBSSH2_ERROR_EAGAIN:
+ */
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_v_read_func);
+  __pyx_t_4 = __pyx_cur_scope->__pyx_v_read_func; __pyx_t_5 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 111, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+    PyObject* sequence = __pyx_t_1;
+    Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+    if (unlikely(size != 2)) {
+      if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+      else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+      __PYX_ERR(0, 111, __pyx_L1_error)
+    }
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    if (likely(PyTuple_CheckExact(sequence))) {
+      __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0); 
       __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
     } else {
       __pyx_t_4 = PyList_GET_ITEM(sequence, 0); 
@@ -1688,23 +2775,23 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
     __Pyx_INCREF(__pyx_t_4);
     __Pyx_INCREF(__pyx_t_5);
     #else
-    __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 111, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 111, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     #endif
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   } else {
     Py_ssize_t index = -1;
-    __pyx_t_6 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 51, __pyx_L1_error)
+    __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 111, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_7 = Py_TYPE(__pyx_t_6)->tp_iternext;
     index = 0; __pyx_t_4 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L4_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_4);
     index = 1; __pyx_t_5 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_5)) goto __pyx_L4_unpacking_failed;
     __Pyx_GOTREF(__pyx_t_5);
-    if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 51, __pyx_L1_error)
+    if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 111, __pyx_L1_error)
     __pyx_t_7 = NULL;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     goto __pyx_L5_unpacking_done;
@@ -1712,19 +2799,19 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __pyx_t_7 = NULL;
     if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-    __PYX_ERR(0, 51, __pyx_L1_error)
+    __PYX_ERR(0, 111, __pyx_L1_error)
     __pyx_L5_unpacking_done:;
   }
-  __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_t_4); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 51, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_t_4); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(PyBytes_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 51, __pyx_L1_error)
+  if (!(likely(PyBytes_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 111, __pyx_L1_error)
   __pyx_cur_scope->__pyx_v__size = __pyx_t_8;
   __Pyx_GIVEREF(__pyx_t_5);
   __pyx_cur_scope->__pyx_v__data = ((PyObject*)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "pssh/native/_ssh2.pyx":52
- *     cdef Py_ssize_t linesep
+  /* "pssh/native/_ssh2.pyx":112
+ *     cdef const char *linesep
  *     _size, _data = read_func()
  *     while _size == LIBSSH2_ERROR_EAGAIN or _size > 0:             # <<<<<<<<<<<<<<
  *         if _size == LIBSSH2_ERROR_EAGAIN:
@@ -1742,7 +2829,7 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
     __pyx_L8_bool_binop_done:;
     if (!__pyx_t_9) break;
 
-    /* "pssh/native/_ssh2.pyx":53
+    /* "pssh/native/_ssh2.pyx":113
  *     _size, _data = read_func()
  *     while _size == LIBSSH2_ERROR_EAGAIN or _size > 0:
  *         if _size == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
@@ -1752,16 +2839,16 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
     __pyx_t_9 = ((__pyx_cur_scope->__pyx_v__size == LIBSSH2_ERROR_EAGAIN) != 0);
     if (__pyx_t_9) {
 
-      /* "pssh/native/_ssh2.pyx":54
+      /* "pssh/native/_ssh2.pyx":114
  *     while _size == LIBSSH2_ERROR_EAGAIN or _size > 0:
  *         if _size == LIBSSH2_ERROR_EAGAIN:
  *             _wait_select(_sock, _session, timeout)             # <<<<<<<<<<<<<<
  *             _size, _data = read_func()
  *             if timeout is not None and _size == LIBSSH2_ERROR_EAGAIN:
  */
-      __pyx_t_2 = __pyx_f_4pssh_6native_5_ssh2__wait_select(__pyx_cur_scope->__pyx_v__sock, __pyx_cur_scope->__pyx_v__session, __pyx_cur_scope->__pyx_v_timeout); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 54, __pyx_L1_error)
+      __pyx_t_3 = __pyx_f_4pssh_6native_5_ssh2__wait_select(__pyx_cur_scope->__pyx_v__sock, __pyx_cur_scope->__pyx_v__session, __pyx_cur_scope->__pyx_v_timeout); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 114, __pyx_L1_error)
 
-      /* "pssh/native/_ssh2.pyx":55
+      /* "pssh/native/_ssh2.pyx":115
  *         if _size == LIBSSH2_ERROR_EAGAIN:
  *             _wait_select(_sock, _session, timeout)
  *             _size, _data = read_func()             # <<<<<<<<<<<<<<
@@ -1779,21 +2866,18 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
           __Pyx_DECREF_SET(__pyx_t_5, function);
         }
       }
-      if (__pyx_t_4) {
-        __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      } else {
-        __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
-      }
-      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 115, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if ((likely(PyTuple_CheckExact(__pyx_t_3))) || (PyList_CheckExact(__pyx_t_3))) {
-        PyObject* sequence = __pyx_t_3;
+      if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+        PyObject* sequence = __pyx_t_1;
         Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
         if (unlikely(size != 2)) {
           if (size > 2) __Pyx_RaiseTooManyValuesError(2);
           else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-          __PYX_ERR(0, 55, __pyx_L1_error)
+          __PYX_ERR(0, 115, __pyx_L1_error)
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
         if (likely(PyTuple_CheckExact(sequence))) {
@@ -1806,23 +2890,23 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
         __Pyx_INCREF(__pyx_t_5);
         __Pyx_INCREF(__pyx_t_4);
         #else
-        __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 55, __pyx_L1_error)
+        __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 115, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
-        __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 55, __pyx_L1_error)
+        __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 115, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       } else {
         Py_ssize_t index = -1;
-        __pyx_t_6 = PyObject_GetIter(__pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 55, __pyx_L1_error)
+        __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 115, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         __pyx_t_7 = Py_TYPE(__pyx_t_6)->tp_iternext;
         index = 0; __pyx_t_5 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_5)) goto __pyx_L11_unpacking_failed;
         __Pyx_GOTREF(__pyx_t_5);
         index = 1; __pyx_t_4 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L11_unpacking_failed;
         __Pyx_GOTREF(__pyx_t_4);
-        if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 55, __pyx_L1_error)
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 115, __pyx_L1_error)
         __pyx_t_7 = NULL;
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         goto __pyx_L12_unpacking_done;
@@ -1830,19 +2914,19 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         __pyx_t_7 = NULL;
         if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-        __PYX_ERR(0, 55, __pyx_L1_error)
+        __PYX_ERR(0, 115, __pyx_L1_error)
         __pyx_L12_unpacking_done:;
       }
-      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_t_5); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 55, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_t_5); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 115, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 55, __pyx_L1_error)
+      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 115, __pyx_L1_error)
       __pyx_cur_scope->__pyx_v__size = __pyx_t_8;
       __Pyx_GOTREF(__pyx_cur_scope->__pyx_v__data);
       __Pyx_DECREF_SET(__pyx_cur_scope->__pyx_v__data, ((PyObject*)__pyx_t_4));
       __Pyx_GIVEREF(__pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "pssh/native/_ssh2.pyx":56
+      /* "pssh/native/_ssh2.pyx":116
  *             _wait_select(_sock, _session, timeout)
  *             _size, _data = read_func()
  *             if timeout is not None and _size == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
@@ -1861,20 +2945,20 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
       __pyx_L14_bool_binop_done:;
       if (unlikely(__pyx_t_9)) {
 
-        /* "pssh/native/_ssh2.pyx":57
+        /* "pssh/native/_ssh2.pyx":117
  *             _size, _data = read_func()
  *             if timeout is not None and _size == LIBSSH2_ERROR_EAGAIN:
  *                 raise Timeout             # <<<<<<<<<<<<<<
  *         while _size > 0:
- *             while _pos < _size:
+ *             if chunks:
  */
-        __pyx_t_3 = __Pyx_GetModuleGlobalName(__pyx_n_s_Timeout); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 57, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __PYX_ERR(0, 57, __pyx_L1_error)
+        __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_Timeout); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 117, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __PYX_ERR(0, 117, __pyx_L1_error)
 
-        /* "pssh/native/_ssh2.pyx":56
+        /* "pssh/native/_ssh2.pyx":116
  *             _wait_select(_sock, _session, timeout)
  *             _size, _data = read_func()
  *             if timeout is not None and _size == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
@@ -1883,7 +2967,7 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
  */
       }
 
-      /* "pssh/native/_ssh2.pyx":53
+      /* "pssh/native/_ssh2.pyx":113
  *     _size, _data = read_func()
  *     while _size == LIBSSH2_ERROR_EAGAIN or _size > 0:
  *         if _size == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
@@ -1892,492 +2976,523 @@ static PyObject *__pyx_gb_4pssh_6native_5_ssh2_2generator(__pyx_CoroutineObject
  */
     }
 
-    /* "pssh/native/_ssh2.pyx":58
+    /* "pssh/native/_ssh2.pyx":118
  *             if timeout is not None and _size == LIBSSH2_ERROR_EAGAIN:
  *                 raise Timeout
  *         while _size > 0:             # <<<<<<<<<<<<<<
- *             while _pos < _size:
- *                 linesep = _data[:_size].find(LINESEP, _pos)
+ *             if chunks:
+ *                 yield _data if len(_data) == _size else _data[:_size]
  */
     while (1) {
       __pyx_t_9 = ((__pyx_cur_scope->__pyx_v__size > 0) != 0);
       if (!__pyx_t_9) break;
 
-      /* "pssh/native/_ssh2.pyx":59
+      /* "pssh/native/_ssh2.pyx":119
+ *                 raise Timeout
+ *         while _size > 0:
+ *             if chunks:             # <<<<<<<<<<<<<<
+ *                 yield _data if len(_data) == _size else _data[:_size]
+ *                 _size, _data = read_func()
+ */
+      __pyx_t_9 = (__pyx_cur_scope->__pyx_v_chunks != 0);
+      if (__pyx_t_9) {
+
+        /* "pssh/native/_ssh2.pyx":120
+ *         while _size > 0:
+ *             if chunks:
+ *                 yield _data if len(_data) == _size else _data[:_size]             # <<<<<<<<<<<<<<
+ *                 _size, _data = read_func()
+ *                 continue
+ */
+        if (unlikely(__pyx_cur_scope->__pyx_v__data == Py_None)) {
+          PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+          __PYX_ERR(0, 120, __pyx_L1_error)
+        }
+        __pyx_t_8 = PyBytes_GET_SIZE(__pyx_cur_scope->__pyx_v__data); if (unlikely(__pyx_t_8 == ((Py_ssize_t)-1))) __PYX_ERR(0, 120, __pyx_L1_error)
+        if (((__pyx_t_8 == __pyx_cur_scope->__pyx_v__size) != 0)) {
+          __Pyx_INCREF(__pyx_cur_scope->__pyx_v__data);
+          __pyx_t_1 = __pyx_cur_scope->__pyx_v__data;
+        } else {
+          if (unlikely(__pyx_cur_scope->__pyx_v__data == Py_None)) {
+            PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+            __PYX_ERR(0, 120, __pyx_L1_error)
+          }
+          __pyx_t_4 = PySequence_GetSlice(__pyx_cur_scope->__pyx_v__data, 0, __pyx_cur_scope->__pyx_v__size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 120, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_1 = __pyx_t_4;
+          __pyx_t_4 = 0;
+        }
+        __pyx_r = __pyx_t_1;
+        __pyx_t_1 = 0;
+        __Pyx_XGIVEREF(__pyx_r);
+        __Pyx_RefNannyFinishContext();
+        __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+        /* return from generator, yielding value */
+        __pyx_generator->resume_label = 1;
+        return __pyx_r;
+        __pyx_L19_resume_from_yield:;
+        if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 120, __pyx_L1_error)
+
+        /* "pssh/native/_ssh2.pyx":121
+ *             if chunks:
+ *                 yield _data if len(_data) == _size else _data[:_size]
+ *                 _size, _data = read_func()             # <<<<<<<<<<<<<<
+ *                 continue
+ *             _pos = _data
+ */
+        __Pyx_INCREF(__pyx_cur_scope->__pyx_v_read_func);
+        __pyx_t_4 = __pyx_cur_scope->__pyx_v_read_func; __pyx_t_5 = NULL;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+          }
+        }
+        __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5) : __Pyx_PyObject_CallNoArg(__pyx_t_4);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+          PyObject* sequence = __pyx_t_1;
+          Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+          if (unlikely(size != 2)) {
+            if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+            else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+            __PYX_ERR(0, 121, __pyx_L1_error)
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          if (likely(PyTuple_CheckExact(sequence))) {
+            __pyx_t_4 = PyTuple_GET_ITEM(sequence, 0); 
+            __pyx_t_5 = PyTuple_GET_ITEM(sequence, 1); 
+          } else {
+            __pyx_t_4 = PyList_GET_ITEM(sequence, 0); 
+            __pyx_t_5 = PyList_GET_ITEM(sequence, 1); 
+          }
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_5);
+          #else
+          __pyx_t_4 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 121, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_5 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 121, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        } else {
+          Py_ssize_t index = -1;
+          __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 121, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __pyx_t_7 = Py_TYPE(__pyx_t_6)->tp_iternext;
+          index = 0; __pyx_t_4 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L20_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_4);
+          index = 1; __pyx_t_5 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_5)) goto __pyx_L20_unpacking_failed;
+          __Pyx_GOTREF(__pyx_t_5);
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 121, __pyx_L1_error)
+          __pyx_t_7 = NULL;
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          goto __pyx_L21_unpacking_done;
+          __pyx_L20_unpacking_failed:;
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+          __pyx_t_7 = NULL;
+          if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+          __PYX_ERR(0, 121, __pyx_L1_error)
+          __pyx_L21_unpacking_done:;
+        }
+        __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_t_4); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 121, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (!(likely(PyBytes_CheckExact(__pyx_t_5))||((__pyx_t_5) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_5)->tp_name), 0))) __PYX_ERR(0, 121, __pyx_L1_error)
+        __pyx_cur_scope->__pyx_v__size = __pyx_t_8;
+        __Pyx_GOTREF(__pyx_cur_scope->__pyx_v__data);
+        __Pyx_DECREF_SET(__pyx_cur_scope->__pyx_v__data, ((PyObject*)__pyx_t_5));
+        __Pyx_GIVEREF(__pyx_t_5);
+        __pyx_t_5 = 0;
+
+        /* "pssh/native/_ssh2.pyx":122
+ *                 yield _data if len(_data) == _size else _data[:_size]
+ *                 _size, _data = read_func()
+ *                 continue             # <<<<<<<<<<<<<<
+ *             _pos = _data
+ *             _end = _pos + _size
+ */
+        goto __pyx_L16_continue;
+
+        /* "pssh/native/_ssh2.pyx":119
  *                 raise Timeout
  *         while _size > 0:
- *             while _pos < _size:             # <<<<<<<<<<<<<<
- *                 linesep = _data[:_size].find(LINESEP, _pos)
- *                 if linesep >= 0:
+ *             if chunks:             # <<<<<<<<<<<<<<
+ *                 yield _data if len(_data) == _size else _data[:_size]
+ *                 _size, _data = read_func()
+ */
+      }
+
+      /* "pssh/native/_ssh2.pyx":123
+ *                 _size, _data = read_func()
+ *                 continue
+ *             _pos = _data             # <<<<<<<<<<<<<<
+ *             _end = _pos + _size
+ *             while _pos < _end:
+ */
+      if (unlikely(__pyx_cur_scope->__pyx_v__data == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
+        __PYX_ERR(0, 123, __pyx_L1_error)
+      }
+      __pyx_t_12 = __Pyx_PyBytes_AsString(__pyx_cur_scope->__pyx_v__data); if (unlikely((!__pyx_t_12) && PyErr_Occurred())) __PYX_ERR(0, 123, __pyx_L1_error)
+      __pyx_cur_scope->__pyx_v__pos = __pyx_t_12;
+
+      /* "pssh/native/_ssh2.pyx":124
+ *                 continue
+ *             _pos = _data
+ *             _end = _pos + _size             # <<<<<<<<<<<<<<
+ *             while _pos < _end:
+ *                 linesep = <const char *>memchr(_pos, b'\n', _end - _pos)
+ */
+      __pyx_cur_scope->__pyx_v__end = (__pyx_cur_scope->__pyx_v__pos + __pyx_cur_scope->__pyx_v__size);
+
+      /* "pssh/native/_ssh2.pyx":125
+ *             _pos = _data
+ *             _end = _pos + _size
+ *             while _pos < _end:             # <<<<<<<<<<<<<<
+ *                 linesep = <const char *>memchr(_pos, b'\n', _end - _pos)
+ *                 if linesep is NULL:
  */
       while (1) {
-        __pyx_t_9 = ((__pyx_cur_scope->__pyx_v__pos < __pyx_cur_scope->__pyx_v__size) != 0);
+        __pyx_t_9 = ((__pyx_cur_scope->__pyx_v__pos < __pyx_cur_scope->__pyx_v__end) != 0);
         if (!__pyx_t_9) break;
 
-        /* "pssh/native/_ssh2.pyx":60
- *         while _size > 0:
- *             while _pos < _size:
- *                 linesep = _data[:_size].find(LINESEP, _pos)             # <<<<<<<<<<<<<<
- *                 if linesep >= 0:
- *                     if remainder_len > 0:
+        /* "pssh/native/_ssh2.pyx":126
+ *             _end = _pos + _size
+ *             while _pos < _end:
+ *                 linesep = <const char *>memchr(_pos, b'\n', _end - _pos)             # <<<<<<<<<<<<<<
+ *                 if linesep is NULL:
+ *                     remainder.append(_pos, _end - _pos)
+ */
+        __pyx_cur_scope->__pyx_v_linesep = ((char const *)memchr(__pyx_cur_scope->__pyx_v__pos, '\n', (__pyx_cur_scope->__pyx_v__end - __pyx_cur_scope->__pyx_v__pos)));
+
+        /* "pssh/native/_ssh2.pyx":127
+ *             while _pos < _end:
+ *                 linesep = <const char *>memchr(_pos, b'\n', _end - _pos)
+ *                 if linesep is NULL:             # <<<<<<<<<<<<<<
+ *                     remainder.append(_pos, _end - _pos)
+ *                     break
  */
-        if (unlikely(__pyx_cur_scope->__pyx_v__data == Py_None)) {
-          PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-          __PYX_ERR(0, 60, __pyx_L1_error)
-        }
-        __pyx_t_4 = PySequence_GetSlice(__pyx_cur_scope->__pyx_v__data, 0, __pyx_cur_scope->__pyx_v__size); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_find); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 60, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_5);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __pyx_t_4 = __Pyx_PyInt_FromSize_t(__pyx_cur_scope->__pyx_v__pos); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_6 = NULL;
-        __pyx_t_2 = 0;
-        if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-          __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-          if (likely(__pyx_t_6)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-            __Pyx_INCREF(__pyx_t_6);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_5, function);
-            __pyx_t_2 = 1;
-          }
-        }
-        #if CYTHON_FAST_PYCALL
-        if (PyFunction_Check(__pyx_t_5)) {
-          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_4pssh_6native_5_ssh2_LINESEP, __pyx_t_4};
-          __pyx_t_3 = __Pyx_PyFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_2, 2+__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        } else
-        #endif
-        #if CYTHON_FAST_PYCCALL
-        if (__Pyx_PyFastCFunction_Check(__pyx_t_5)) {
-          PyObject *__pyx_temp[3] = {__pyx_t_6, __pyx_v_4pssh_6native_5_ssh2_LINESEP, __pyx_t_4};
-          __pyx_t_3 = __Pyx_PyCFunction_FastCall(__pyx_t_5, __pyx_temp+1-__pyx_t_2, 2+__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
-          __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        } else
-        #endif
-        {
-          __pyx_t_12 = PyTuple_New(2+__pyx_t_2); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 60, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_12);
-          if (__pyx_t_6) {
-            __Pyx_GIVEREF(__pyx_t_6); PyTuple_SET_ITEM(__pyx_t_12, 0, __pyx_t_6); __pyx_t_6 = NULL;
-          }
-          __Pyx_INCREF(__pyx_v_4pssh_6native_5_ssh2_LINESEP);
-          __Pyx_GIVEREF(__pyx_v_4pssh_6native_5_ssh2_LINESEP);
-          PyTuple_SET_ITEM(__pyx_t_12, 0+__pyx_t_2, __pyx_v_4pssh_6native_5_ssh2_LINESEP);
-          __Pyx_GIVEREF(__pyx_t_4);
-          PyTuple_SET_ITEM(__pyx_t_12, 1+__pyx_t_2, __pyx_t_4);
-          __pyx_t_4 = 0;
-          __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_5, __pyx_t_12, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-        }
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_t_3); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 60, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __pyx_cur_scope->__pyx_v_linesep = __pyx_t_8;
-
-        /* "pssh/native/_ssh2.pyx":61
- *             while _pos < _size:
- *                 linesep = _data[:_size].find(LINESEP, _pos)
- *                 if linesep >= 0:             # <<<<<<<<<<<<<<
- *                     if remainder_len > 0:
- *                         yield remainder + _data[_pos:linesep].rstrip()
- */
-        __pyx_t_9 = ((__pyx_cur_scope->__pyx_v_linesep >= 0) != 0);
+        __pyx_t_9 = ((__pyx_cur_scope->__pyx_v_linesep == NULL) != 0);
         if (__pyx_t_9) {
 
-          /* "pssh/native/_ssh2.pyx":62
- *                 linesep = _data[:_size].find(LINESEP, _pos)
- *                 if linesep >= 0:
- *                     if remainder_len > 0:             # <<<<<<<<<<<<<<
- *                         yield remainder + _data[_pos:linesep].rstrip()
- *                         remainder = b""
- */
-          __pyx_t_9 = ((__pyx_cur_scope->__pyx_v_remainder_len > 0) != 0);
-          if (__pyx_t_9) {
-
-            /* "pssh/native/_ssh2.pyx":63
- *                 if linesep >= 0:
- *                     if remainder_len > 0:
- *                         yield remainder + _data[_pos:linesep].rstrip()             # <<<<<<<<<<<<<<
- *                         remainder = b""
- *                         remainder_len = 0
- */
-            if (unlikely(__pyx_cur_scope->__pyx_v__data == Py_None)) {
-              PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-              __PYX_ERR(0, 63, __pyx_L1_error)
-            }
-            __pyx_t_5 = PySequence_GetSlice(__pyx_cur_scope->__pyx_v__data, __pyx_cur_scope->__pyx_v__pos, __pyx_cur_scope->__pyx_v_linesep); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 63, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_5);
-            __pyx_t_12 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_rstrip); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 63, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_12);
-            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            __pyx_t_5 = NULL;
-            if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_12))) {
-              __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_12);
-              if (likely(__pyx_t_5)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_12);
-                __Pyx_INCREF(__pyx_t_5);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_12, function);
-              }
-            }
-            if (__pyx_t_5) {
-              __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_t_12, __pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 63, __pyx_L1_error)
-              __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            } else {
-              __pyx_t_3 = __Pyx_PyObject_CallNoArg(__pyx_t_12); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 63, __pyx_L1_error)
-            }
-            __Pyx_GOTREF(__pyx_t_3);
-            __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-            __pyx_t_12 = PyNumber_Add(__pyx_cur_scope->__pyx_v_remainder, __pyx_t_3); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 63, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_12);
-            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __pyx_r = __pyx_t_12;
-            __pyx_t_12 = 0;
-            __Pyx_XGIVEREF(__pyx_r);
-            __Pyx_RefNannyFinishContext();
-            __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-            /* return from generator, yielding value */
-            __pyx_generator->resume_label = 1;
-            return __pyx_r;
-            __pyx_L22_resume_from_yield:;
-            if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 63, __pyx_L1_error)
-
-            /* "pssh/native/_ssh2.pyx":64
- *                     if remainder_len > 0:
- *                         yield remainder + _data[_pos:linesep].rstrip()
- *                         remainder = b""             # <<<<<<<<<<<<<<
- *                         remainder_len = 0
- *                     else:
+          /* "pssh/native/_ssh2.pyx":128
+ *                 linesep = <const char *>memchr(_pos, b'\n', _end - _pos)
+ *                 if linesep is NULL:
+ *                     remainder.append(_pos, _end - _pos)             # <<<<<<<<<<<<<<
+ *                     break
+ *                 if remainder._len > 0:
  */
-            __Pyx_INCREF(__pyx_kp_b__2);
-            __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_remainder);
-            __Pyx_DECREF_SET(__pyx_cur_scope->__pyx_v_remainder, __pyx_kp_b__2);
-            __Pyx_GIVEREF(__pyx_kp_b__2);
+          __pyx_t_3 = ((struct __pyx_vtabstruct_4pssh_6native_5_ssh2__LineBuffer *)__pyx_cur_scope->__pyx_v_remainder->__pyx_vtab)->append(__pyx_cur_scope->__pyx_v_remainder, __pyx_cur_scope->__pyx_v__pos, (__pyx_cur_scope->__pyx_v__end - __pyx_cur_scope->__pyx_v__pos)); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 128, __pyx_L1_error)
 
-            /* "pssh/native/_ssh2.pyx":65
- *                         yield remainder + _data[_pos:linesep].rstrip()
- *                         remainder = b""
- *                         remainder_len = 0             # <<<<<<<<<<<<<<
- *                     else:
- *                         yield _data[_pos:linesep].rstrip()
+          /* "pssh/native/_ssh2.pyx":129
+ *                 if linesep is NULL:
+ *                     remainder.append(_pos, _end - _pos)
+ *                     break             # <<<<<<<<<<<<<<
+ *                 if remainder._len > 0:
+ *                     remainder.append(_pos, linesep - _pos)
  */
-            __pyx_cur_scope->__pyx_v_remainder_len = 0;
+          goto __pyx_L23_break;
 
-            /* "pssh/native/_ssh2.pyx":62
- *                 linesep = _data[:_size].find(LINESEP, _pos)
- *                 if linesep >= 0:
- *                     if remainder_len > 0:             # <<<<<<<<<<<<<<
- *                         yield remainder + _data[_pos:linesep].rstrip()
- *                         remainder = b""
+          /* "pssh/native/_ssh2.pyx":127
+ *             while _pos < _end:
+ *                 linesep = <const char *>memchr(_pos, b'\n', _end - _pos)
+ *                 if linesep is NULL:             # <<<<<<<<<<<<<<
+ *                     remainder.append(_pos, _end - _pos)
+ *                     break
  */
-            goto __pyx_L21;
-          }
+        }
 
-          /* "pssh/native/_ssh2.pyx":67
- *                         remainder_len = 0
- *                     else:
- *                         yield _data[_pos:linesep].rstrip()             # <<<<<<<<<<<<<<
- *                     _pos = linesep + 1
- *                 else:
+        /* "pssh/native/_ssh2.pyx":130
+ *                     remainder.append(_pos, _end - _pos)
+ *                     break
+ *                 if remainder._len > 0:             # <<<<<<<<<<<<<<
+ *                     remainder.append(_pos, linesep - _pos)
+ *                     yield remainder.pop()
  */
-          /*else*/ {
-            if (unlikely(__pyx_cur_scope->__pyx_v__data == Py_None)) {
-              PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-              __PYX_ERR(0, 67, __pyx_L1_error)
-            }
-            __pyx_t_3 = PySequence_GetSlice(__pyx_cur_scope->__pyx_v__data, __pyx_cur_scope->__pyx_v__pos, __pyx_cur_scope->__pyx_v_linesep); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_3);
-            __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_rstrip); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 67, __pyx_L1_error)
-            __Pyx_GOTREF(__pyx_t_5);
-            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            __pyx_t_3 = NULL;
-            if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
-              __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_5);
-              if (likely(__pyx_t_3)) {
-                PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-                __Pyx_INCREF(__pyx_t_3);
-                __Pyx_INCREF(function);
-                __Pyx_DECREF_SET(__pyx_t_5, function);
-              }
-            }
-            if (__pyx_t_3) {
-              __pyx_t_12 = __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 67, __pyx_L1_error)
-              __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-            } else {
-              __pyx_t_12 = __Pyx_PyObject_CallNoArg(__pyx_t_5); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 67, __pyx_L1_error)
-            }
-            __Pyx_GOTREF(__pyx_t_12);
-            __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-            __pyx_r = __pyx_t_12;
-            __pyx_t_12 = 0;
-            __Pyx_XGIVEREF(__pyx_r);
-            __Pyx_RefNannyFinishContext();
-            __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
-            /* return from generator, yielding value */
-            __pyx_generator->resume_label = 2;
-            return __pyx_r;
-            __pyx_L23_resume_from_yield:;
-            if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 67, __pyx_L1_error)
-          }
-          __pyx_L21:;
+        __pyx_t_9 = ((__pyx_cur_scope->__pyx_v_remainder->_len > 0) != 0);
+        if (__pyx_t_9) {
 
-          /* "pssh/native/_ssh2.pyx":68
- *                     else:
- *                         yield _data[_pos:linesep].rstrip()
- *                     _pos = linesep + 1             # <<<<<<<<<<<<<<
+          /* "pssh/native/_ssh2.pyx":131
+ *                     break
+ *                 if remainder._len > 0:
+ *                     remainder.append(_pos, linesep - _pos)             # <<<<<<<<<<<<<<
+ *                     yield remainder.pop()
  *                 else:
- *                     remainder += _data[_pos:]
  */
-          __pyx_cur_scope->__pyx_v__pos = (__pyx_cur_scope->__pyx_v_linesep + 1);
+          __pyx_t_3 = ((struct __pyx_vtabstruct_4pssh_6native_5_ssh2__LineBuffer *)__pyx_cur_scope->__pyx_v_remainder->__pyx_vtab)->append(__pyx_cur_scope->__pyx_v_remainder, __pyx_cur_scope->__pyx_v__pos, (__pyx_cur_scope->__pyx_v_linesep - __pyx_cur_scope->__pyx_v__pos)); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 131, __pyx_L1_error)
 
-          /* "pssh/native/_ssh2.pyx":61
- *             while _pos < _size:
- *                 linesep = _data[:_size].find(LINESEP, _pos)
- *                 if linesep >= 0:             # <<<<<<<<<<<<<<
- *                     if remainder_len > 0:
- *                         yield remainder + _data[_pos:linesep].rstrip()
+          /* "pssh/native/_ssh2.pyx":132
+ *                 if remainder._len > 0:
+ *                     remainder.append(_pos, linesep - _pos)
+ *                     yield remainder.pop()             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     yield PyBytes_FromStringAndSize(
+ */
+          __pyx_t_1 = ((struct __pyx_vtabstruct_4pssh_6native_5_ssh2__LineBuffer *)__pyx_cur_scope->__pyx_v_remainder->__pyx_vtab)->pop(__pyx_cur_scope->__pyx_v_remainder, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_r = __pyx_t_1;
+          __pyx_t_1 = 0;
+          __Pyx_XGIVEREF(__pyx_r);
+          __Pyx_RefNannyFinishContext();
+          __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+          /* return from generator, yielding value */
+          __pyx_generator->resume_label = 2;
+          return __pyx_r;
+          __pyx_L26_resume_from_yield:;
+          if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 132, __pyx_L1_error)
+
+          /* "pssh/native/_ssh2.pyx":130
+ *                     remainder.append(_pos, _end - _pos)
+ *                     break
+ *                 if remainder._len > 0:             # <<<<<<<<<<<<<<
+ *                     remainder.append(_pos, linesep - _pos)
+ *                     yield remainder.pop()
  */
-          goto __pyx_L20;
+          goto __pyx_L25;
         }
 
-        /* "pssh/native/_ssh2.pyx":70
- *                     _pos = linesep + 1
+        /* "pssh/native/_ssh2.pyx":134
+ *                     yield remainder.pop()
  *                 else:
- *                     remainder += _data[_pos:]             # <<<<<<<<<<<<<<
- *                     remainder_len = len(remainder)
- *                     break
+ *                     yield PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
+ *                         _pos, _rstrip_size(_pos, linesep - _pos))
+ *                 _pos = linesep + 1
  */
         /*else*/ {
-          if (unlikely(__pyx_cur_scope->__pyx_v__data == Py_None)) {
-            PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-            __PYX_ERR(0, 70, __pyx_L1_error)
-          }
-          __pyx_t_12 = PySequence_GetSlice(__pyx_cur_scope->__pyx_v__data, __pyx_cur_scope->__pyx_v__pos, PY_SSIZE_T_MAX); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 70, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_12);
-          __pyx_t_5 = PyNumber_InPlaceAdd(__pyx_cur_scope->__pyx_v_remainder, __pyx_t_12); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 70, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-          __Pyx_GOTREF(__pyx_cur_scope->__pyx_v_remainder);
-          __Pyx_DECREF_SET(__pyx_cur_scope->__pyx_v_remainder, ((PyObject*)__pyx_t_5));
-          __Pyx_GIVEREF(__pyx_t_5);
-          __pyx_t_5 = 0;
 
-          /* "pssh/native/_ssh2.pyx":71
+          /* "pssh/native/_ssh2.pyx":135
  *                 else:
- *                     remainder += _data[_pos:]
- *                     remainder_len = len(remainder)             # <<<<<<<<<<<<<<
- *                     break
+ *                     yield PyBytes_FromStringAndSize(
+ *                         _pos, _rstrip_size(_pos, linesep - _pos))             # <<<<<<<<<<<<<<
+ *                 _pos = linesep + 1
  *             _size, _data = read_func()
  */
-          __pyx_t_8 = PyBytes_GET_SIZE(__pyx_cur_scope->__pyx_v_remainder); if (unlikely(__pyx_t_8 == ((Py_ssize_t)-1))) __PYX_ERR(0, 71, __pyx_L1_error)
-          __pyx_cur_scope->__pyx_v_remainder_len = __pyx_t_8;
+          __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_cur_scope->__pyx_v__pos, __pyx_f_4pssh_6native_5_ssh2__rstrip_size(__pyx_cur_scope->__pyx_v__pos, (__pyx_cur_scope->__pyx_v_linesep - __pyx_cur_scope->__pyx_v__pos))); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
+          __pyx_r = __pyx_t_1;
+          __pyx_t_1 = 0;
+          __Pyx_XGIVEREF(__pyx_r);
+          __Pyx_RefNannyFinishContext();
+          __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+          /* return from generator, yielding value */
+          __pyx_generator->resume_label = 3;
+          return __pyx_r;
+          __pyx_L27_resume_from_yield:;
+          if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 134, __pyx_L1_error)
+        }
+        __pyx_L25:;
 
-          /* "pssh/native/_ssh2.pyx":72
- *                     remainder += _data[_pos:]
- *                     remainder_len = len(remainder)
- *                     break             # <<<<<<<<<<<<<<
+        /* "pssh/native/_ssh2.pyx":136
+ *                     yield PyBytes_FromStringAndSize(
+ *                         _pos, _rstrip_size(_pos, linesep - _pos))
+ *                 _pos = linesep + 1             # <<<<<<<<<<<<<<
  *             _size, _data = read_func()
- *             _pos = 0
+ *     if remainder._len > 0:
  */
-          goto __pyx_L19_break;
-        }
-        __pyx_L20:;
+        __pyx_cur_scope->__pyx_v__pos = (__pyx_cur_scope->__pyx_v_linesep + 1);
       }
-      __pyx_L19_break:;
+      __pyx_L23_break:;
 
-      /* "pssh/native/_ssh2.pyx":73
- *                     remainder_len = len(remainder)
- *                     break
+      /* "pssh/native/_ssh2.pyx":137
+ *                         _pos, _rstrip_size(_pos, linesep - _pos))
+ *                 _pos = linesep + 1
  *             _size, _data = read_func()             # <<<<<<<<<<<<<<
- *             _pos = 0
- *     if remainder_len > 0:
+ *     if remainder._len > 0:
+ *         # Finished reading without finding ending linesep
  */
       __Pyx_INCREF(__pyx_cur_scope->__pyx_v_read_func);
-      __pyx_t_12 = __pyx_cur_scope->__pyx_v_read_func; __pyx_t_3 = NULL;
-      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_12))) {
-        __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_12);
-        if (likely(__pyx_t_3)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_12);
-          __Pyx_INCREF(__pyx_t_3);
+      __pyx_t_5 = __pyx_cur_scope->__pyx_v_read_func; __pyx_t_4 = NULL;
+      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_5);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
+          __Pyx_INCREF(__pyx_t_4);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_12, function);
+          __Pyx_DECREF_SET(__pyx_t_5, function);
         }
       }
-      if (__pyx_t_3) {
-        __pyx_t_5 = __Pyx_PyObject_CallOneArg(__pyx_t_12, __pyx_t_3); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 73, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      } else {
-        __pyx_t_5 = __Pyx_PyObject_CallNoArg(__pyx_t_12); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 73, __pyx_L1_error)
-      }
-      __Pyx_GOTREF(__pyx_t_5);
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-        PyObject* sequence = __pyx_t_5;
+      __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+        PyObject* sequence = __pyx_t_1;
         Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
         if (unlikely(size != 2)) {
           if (size > 2) __Pyx_RaiseTooManyValuesError(2);
           else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-          __PYX_ERR(0, 73, __pyx_L1_error)
+          __PYX_ERR(0, 137, __pyx_L1_error)
         }
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
         if (likely(PyTuple_CheckExact(sequence))) {
-          __pyx_t_12 = PyTuple_GET_ITEM(sequence, 0); 
-          __pyx_t_3 = PyTuple_GET_ITEM(sequence, 1); 
+          __pyx_t_5 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_4 = PyTuple_GET_ITEM(sequence, 1); 
         } else {
-          __pyx_t_12 = PyList_GET_ITEM(sequence, 0); 
-          __pyx_t_3 = PyList_GET_ITEM(sequence, 1); 
+          __pyx_t_5 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_4 = PyList_GET_ITEM(sequence, 1); 
         }
-        __Pyx_INCREF(__pyx_t_12);
-        __Pyx_INCREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(__pyx_t_4);
         #else
-        __pyx_t_12 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 73, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_12);
-        __pyx_t_3 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 73, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_5 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_5);
+        __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
         #endif
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
       } else {
         Py_ssize_t index = -1;
-        __pyx_t_4 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 73, __pyx_L1_error)
+        __pyx_t_6 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 137, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __pyx_t_7 = Py_TYPE(__pyx_t_6)->tp_iternext;
+        index = 0; __pyx_t_5 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_5)) goto __pyx_L28_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_5);
+        index = 1; __pyx_t_4 = __pyx_t_7(__pyx_t_6); if (unlikely(!__pyx_t_4)) goto __pyx_L28_unpacking_failed;
         __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_t_7 = Py_TYPE(__pyx_t_4)->tp_iternext;
-        index = 0; __pyx_t_12 = __pyx_t_7(__pyx_t_4); if (unlikely(!__pyx_t_12)) goto __pyx_L24_unpacking_failed;
-        __Pyx_GOTREF(__pyx_t_12);
-        index = 1; __pyx_t_3 = __pyx_t_7(__pyx_t_4); if (unlikely(!__pyx_t_3)) goto __pyx_L24_unpacking_failed;
-        __Pyx_GOTREF(__pyx_t_3);
-        if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_4), 2) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_7(__pyx_t_6), 2) < 0) __PYX_ERR(0, 137, __pyx_L1_error)
         __pyx_t_7 = NULL;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        goto __pyx_L25_unpacking_done;
-        __pyx_L24_unpacking_failed:;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        goto __pyx_L29_unpacking_done;
+        __pyx_L28_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         __pyx_t_7 = NULL;
         if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-        __PYX_ERR(0, 73, __pyx_L1_error)
-        __pyx_L25_unpacking_done:;
+        __PYX_ERR(0, 137, __pyx_L1_error)
+        __pyx_L29_unpacking_done:;
       }
-      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_t_12); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 73, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-      if (!(likely(PyBytes_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_3)->tp_name), 0))) __PYX_ERR(0, 73, __pyx_L1_error)
+      __pyx_t_8 = __Pyx_PyIndex_AsSsize_t(__pyx_t_5); if (unlikely((__pyx_t_8 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 137, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (!(likely(PyBytes_CheckExact(__pyx_t_4))||((__pyx_t_4) == Py_None)||((void)PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "bytes", Py_TYPE(__pyx_t_4)->tp_name), 0))) __PYX_ERR(0, 137, __pyx_L1_error)
       __pyx_cur_scope->__pyx_v__size = __pyx_t_8;
       __Pyx_GOTREF(__pyx_cur_scope->__pyx_v__data);
-      __Pyx_DECREF_SET(__pyx_cur_scope->__pyx_v__data, ((PyObject*)__pyx_t_3));
-      __Pyx_GIVEREF(__pyx_t_3);
-      __pyx_t_3 = 0;
-
-      /* "pssh/native/_ssh2.pyx":74
- *                     break
- *             _size, _data = read_func()
- *             _pos = 0             # <<<<<<<<<<<<<<
- *     if remainder_len > 0:
- *         # Finished reading without finding ending linesep
- */
-      __pyx_cur_scope->__pyx_v__pos = 0;
+      __Pyx_DECREF_SET(__pyx_cur_scope->__pyx_v__data, ((PyObject*)__pyx_t_4));
+      __Pyx_GIVEREF(__pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_L16_continue:;
     }
   }
 
-  /* "pssh/native/_ssh2.pyx":75
+  /* "pssh/native/_ssh2.pyx":138
+ *                 _pos = linesep + 1
  *             _size, _data = read_func()
- *             _pos = 0
- *     if remainder_len > 0:             # <<<<<<<<<<<<<<
+ *     if remainder._len > 0:             # <<<<<<<<<<<<<<
  *         # Finished reading without finding ending linesep
- *         yield remainder
+ *         yield remainder.pop(strip=False)
  */
-  __pyx_t_9 = ((__pyx_cur_scope->__pyx_v_remainder_len > 0) != 0);
+  __pyx_t_9 = ((__pyx_cur_scope->__pyx_v_remainder->_len > 0) != 0);
   if (__pyx_t_9) {
 
-    /* "pssh/native/_ssh2.pyx":77
- *     if remainder_len > 0:
+    /* "pssh/native/_ssh2.pyx":140
+ *     if remainder._len > 0:
  *         # Finished reading without finding ending linesep
- *         yield remainder             # <<<<<<<<<<<<<<
+ *         yield remainder.pop(strip=False)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-    __Pyx_INCREF(__pyx_cur_scope->__pyx_v_remainder);
-    __pyx_r = __pyx_cur_scope->__pyx_v_remainder;
+    __pyx_t_13.__pyx_n = 1;
+    __pyx_t_13.strip = 0;
+    __pyx_t_1 = ((struct __pyx_vtabstruct_4pssh_6native_5_ssh2__LineBuffer *)__pyx_cur_scope->__pyx_v_remainder->__pyx_vtab)->pop(__pyx_cur_scope->__pyx_v_remainder, &__pyx_t_13); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
     __Pyx_XGIVEREF(__pyx_r);
     __Pyx_RefNannyFinishContext();
     __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
     /* return from generator, yielding value */
-    __pyx_generator->resume_label = 3;
+    __pyx_generator->resume_label = 4;
     return __pyx_r;
-    __pyx_L27_resume_from_yield:;
-    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __pyx_L31_resume_from_yield:;
+    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 140, __pyx_L1_error)
 
-    /* "pssh/native/_ssh2.pyx":75
+    /* "pssh/native/_ssh2.pyx":138
+ *                 _pos = linesep + 1
  *             _size, _data = read_func()
- *             _pos = 0
- *     if remainder_len > 0:             # <<<<<<<<<<<<<<
+ *     if remainder._len > 0:             # <<<<<<<<<<<<<<
  *         # Finished reading without finding ending linesep
- *         yield remainder
+ *         yield remainder.pop(strip=False)
  */
   }
   CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
-  /* "pssh/native/_ssh2.pyx":42
+  /* "pssh/native/_ssh2.pyx":94
  * 
  * 
- * def _read_output(Session session, read_func, timeout=None):             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t _size
- *     cdef bytes _data
+ * def _read_output(Session session, read_func, timeout=None, bint chunks=False):             # <<<<<<<<<<<<<<
+ *     """Read output from ``read_func`` until EOF and yield lines of output
+ *     with trailing whitespace stripped.
  */
 
   /* function exit code */
   PyErr_SetNone(PyExc_StopIteration);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_12);
   __Pyx_AddTraceback("_read_output", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_L0:;
   __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  #if !CYTHON_USE_EXC_INFO_STACK
   __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
   __pyx_generator->resume_label = -1;
   __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "pssh/native/_ssh2.pyx":80
+/* "pssh/native/_ssh2.pyx":143
  * 
  * 
  * def sftp_put(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from SFTP and writing to local file"""
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              progress=None):
  */
 
 /* Python wrapper */
 static PyObject *__pyx_pw_4pssh_6native_5_ssh2_4sftp_put(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_4pssh_6native_5_ssh2_3sftp_put[] = "sftp_put(Session session, SFTPHandle handle, local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT)\nNative function for reading from SFTP and writing to local file";
-static PyMethodDef __pyx_mdef_4pssh_6native_5_ssh2_4sftp_put = {"sftp_put", (PyCFunction)__pyx_pw_4pssh_6native_5_ssh2_4sftp_put, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4pssh_6native_5_ssh2_3sftp_put};
+static char __pyx_doc_4pssh_6native_5_ssh2_3sftp_put[] = "sftp_put(Session session, SFTPHandle handle, local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT, progress=None)\nNative function for reading from local file and writing to SFTP.\n\n    Local file is read in blocks of ``buffer_maxlen`` bytes. Each block is\n    written by libssh2 as several outstanding SFTP write requests.\n\n    ``progress``, if set, is called with total number of bytes written after\n    each block is written.\n\n    :rtype: int - total number of bytes written";
+static PyMethodDef __pyx_mdef_4pssh_6native_5_ssh2_4sftp_put = {"sftp_put", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4pssh_6native_5_ssh2_4sftp_put, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4pssh_6native_5_ssh2_3sftp_put};
 static PyObject *__pyx_pw_4pssh_6native_5_ssh2_4sftp_put(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session = 0;
   struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle = 0;
   PyObject *__pyx_v_local_file = 0;
   size_t __pyx_v_buffer_maxlen;
+  PyObject *__pyx_v_progress = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("sftp_put (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_session,&__pyx_n_s_handle,&__pyx_n_s_local_file,&__pyx_n_s_buffer_maxlen,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_session,&__pyx_n_s_handle,&__pyx_n_s_local_file,&__pyx_n_s_buffer_maxlen,&__pyx_n_s_progress,0};
+    PyObject* values[5] = {0,0,0,0,0};
+
+    /* "pssh/native/_ssh2.pyx":145
+ * def sftp_put(Session session, SFTPHandle handle,
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              progress=None):             # <<<<<<<<<<<<<<
+ *     """Native function for reading from local file and writing to SFTP.
+ * 
+ */
+    values[4] = ((PyObject *)Py_None);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -2398,13 +3513,13 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_4sftp_put(PyObject *__pyx_self, P
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_handle)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("sftp_put", 0, 3, 4, 1); __PYX_ERR(0, 80, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("sftp_put", 0, 3, 5, 1); __PYX_ERR(0, 143, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_local_file)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("sftp_put", 0, 3, 4, 2); __PYX_ERR(0, 80, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("sftp_put", 0, 3, 5, 2); __PYX_ERR(0, 143, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
@@ -2412,12 +3527,20 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_4sftp_put(PyObject *__pyx_self, P
           PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_buffer_maxlen);
           if (value) { values[3] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_progress);
+          if (value) { values[4] = value; kw_args--; }
+        }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sftp_put") < 0)) __PYX_ERR(0, 80, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sftp_put") < 0)) __PYX_ERR(0, 143, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -2431,22 +3554,31 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_4sftp_put(PyObject *__pyx_self, P
     __pyx_v_handle = ((struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *)values[1]);
     __pyx_v_local_file = values[2];
     if (values[3]) {
-      __pyx_v_buffer_maxlen = __Pyx_PyInt_As_size_t(values[3]); if (unlikely((__pyx_v_buffer_maxlen == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 81, __pyx_L3_error)
+      __pyx_v_buffer_maxlen = __Pyx_PyInt_As_size_t(values[3]); if (unlikely((__pyx_v_buffer_maxlen == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 144, __pyx_L3_error)
     } else {
-      __pyx_v_buffer_maxlen = __pyx_k__3;
+      __pyx_v_buffer_maxlen = __pyx_k__4;
     }
+    __pyx_v_progress = values[4];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("sftp_put", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 80, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("sftp_put", 0, 3, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 143, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("pssh.native._ssh2.sftp_put", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_session), __pyx_ptype_4ssh2_7session_Session, 1, "session", 0))) __PYX_ERR(0, 80, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_handle), __pyx_ptype_4ssh2_11sftp_handle_SFTPHandle, 1, "handle", 0))) __PYX_ERR(0, 80, __pyx_L1_error)
-  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2_3sftp_put(__pyx_self, __pyx_v_session, __pyx_v_handle, __pyx_v_local_file, __pyx_v_buffer_maxlen);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_session), __pyx_ptype_4ssh2_7session_Session, 1, "session", 0))) __PYX_ERR(0, 143, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_handle), __pyx_ptype_4ssh2_11sftp_handle_SFTPHandle, 1, "handle", 0))) __PYX_ERR(0, 143, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2_3sftp_put(__pyx_self, __pyx_v_session, __pyx_v_handle, __pyx_v_local_file, __pyx_v_buffer_maxlen, __pyx_v_progress);
+
+  /* "pssh/native/_ssh2.pyx":143
+ * 
+ * 
+ * def sftp_put(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              progress=None):
+ */
 
   /* function exit code */
   goto __pyx_L0;
@@ -2457,12 +3589,15 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_4sftp_put(PyObject *__pyx_self, P
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle, PyObject *__pyx_v_local_file, size_t __pyx_v_buffer_maxlen) {
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle, PyObject *__pyx_v_local_file, size_t __pyx_v_buffer_maxlen, PyObject *__pyx_v_progress) {
   PyObject *__pyx_v_b_local_file = 0;
   char *__pyx_v__local_file;
   FILE *__pyx_v_local_fh;
-  int __pyx_v_rc;
-  int __pyx_v_nread;
+  Py_ssize_t __pyx_v_rc;
+  size_t __pyx_v_nread;
+  unsigned PY_LONG_LONG __pyx_v_total;
+  int __pyx_v_has_progress;
+  int __pyx_v__errno;
   char *__pyx_v_cbuf;
   char *__pyx_v_ptr;
   LIBSSH2_SFTP_HANDLE *__pyx_v__handle;
@@ -2472,82 +3607,103 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   char *__pyx_t_2;
-  LIBSSH2_SFTP_HANDLE *__pyx_t_3;
-  LIBSSH2_SESSION *__pyx_t_4;
-  int __pyx_t_5;
+  int __pyx_t_3;
+  LIBSSH2_SFTP_HANDLE *__pyx_t_4;
+  LIBSSH2_SESSION *__pyx_t_5;
   int __pyx_t_6;
-  int __pyx_t_7;
+  PyObject *__pyx_t_7 = NULL;
   PyObject *__pyx_t_8 = NULL;
-  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_9;
   PyObject *__pyx_t_10 = NULL;
-  PyObject *__pyx_t_11 = NULL;
-  int __pyx_t_12;
-  char const *__pyx_t_13;
+  int __pyx_t_11;
+  char const *__pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
   PyObject *__pyx_t_14 = NULL;
   PyObject *__pyx_t_15 = NULL;
   PyObject *__pyx_t_16 = NULL;
   PyObject *__pyx_t_17 = NULL;
   PyObject *__pyx_t_18 = NULL;
-  PyObject *__pyx_t_19 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("sftp_put", 0);
 
-  /* "pssh/native/_ssh2.pyx":83
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from SFTP and writing to local file"""
+  /* "pssh/native/_ssh2.pyx":155
+ * 
+ *     :rtype: int - total number of bytes written"""
  *     cdef bytes b_local_file = to_bytes(local_file)             # <<<<<<<<<<<<<<
  *     cdef char *_local_file = b_local_file
  *     cdef FILE *local_fh
  */
-  __pyx_t_1 = __pyx_f_4ssh2_5utils_to_bytes(__pyx_v_local_file); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4ssh2_5utils_to_bytes(__pyx_v_local_file); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_b_local_file = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "pssh/native/_ssh2.pyx":84
- *     """Native function for reading from SFTP and writing to local file"""
+  /* "pssh/native/_ssh2.pyx":156
+ *     :rtype: int - total number of bytes written"""
  *     cdef bytes b_local_file = to_bytes(local_file)
  *     cdef char *_local_file = b_local_file             # <<<<<<<<<<<<<<
  *     cdef FILE *local_fh
- *     cdef int rc
+ *     cdef ssize_t rc
  */
   if (unlikely(__pyx_v_b_local_file == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
-    __PYX_ERR(0, 84, __pyx_L1_error)
+    __PYX_ERR(0, 156, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyBytes_AsWritableString(__pyx_v_b_local_file); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 84, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBytes_AsWritableString(__pyx_v_b_local_file); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 156, __pyx_L1_error)
   __pyx_v__local_file = __pyx_t_2;
 
-  /* "pssh/native/_ssh2.pyx":90
+  /* "pssh/native/_ssh2.pyx":160
+ *     cdef ssize_t rc
+ *     cdef size_t nread
+ *     cdef unsigned long long total = 0             # <<<<<<<<<<<<<<
+ *     cdef bint has_progress = progress is not None
+ *     cdef int _errno
+ */
+  __pyx_v_total = 0;
+
+  /* "pssh/native/_ssh2.pyx":161
+ *     cdef size_t nread
+ *     cdef unsigned long long total = 0
+ *     cdef bint has_progress = progress is not None             # <<<<<<<<<<<<<<
+ *     cdef int _errno
+ *     cdef char *cbuf
+ */
+  __pyx_t_3 = (__pyx_v_progress != Py_None);
+  __pyx_v_has_progress = __pyx_t_3;
+
+  /* "pssh/native/_ssh2.pyx":165
  *     cdef char *cbuf
  *     cdef char *ptr
  *     cdef LIBSSH2_SFTP_HANDLE *_handle = handle._handle             # <<<<<<<<<<<<<<
  *     cdef LIBSSH2_SESSION *_session = session._session
  *     cdef int _sock = session._sock
  */
-  __pyx_t_3 = __pyx_v_handle->_handle;
-  __pyx_v__handle = __pyx_t_3;
+  __pyx_t_4 = __pyx_v_handle->_handle;
+  __pyx_v__handle = __pyx_t_4;
 
-  /* "pssh/native/_ssh2.pyx":91
+  /* "pssh/native/_ssh2.pyx":166
  *     cdef char *ptr
  *     cdef LIBSSH2_SFTP_HANDLE *_handle = handle._handle
  *     cdef LIBSSH2_SESSION *_session = session._session             # <<<<<<<<<<<<<<
  *     cdef int _sock = session._sock
  * 
  */
-  __pyx_t_4 = __pyx_v_session->_session;
-  __pyx_v__session = __pyx_t_4;
+  __pyx_t_5 = __pyx_v_session->_session;
+  __pyx_v__session = __pyx_t_5;
 
-  /* "pssh/native/_ssh2.pyx":92
+  /* "pssh/native/_ssh2.pyx":167
  *     cdef LIBSSH2_SFTP_HANDLE *_handle = handle._handle
  *     cdef LIBSSH2_SESSION *_session = session._session
  *     cdef int _sock = session._sock             # <<<<<<<<<<<<<<
  * 
  *     with nogil:
  */
-  __pyx_t_5 = __pyx_v_session->_sock;
-  __pyx_v__sock = __pyx_t_5;
+  __pyx_t_6 = __pyx_v_session->_sock;
+  __pyx_v__sock = __pyx_t_6;
 
-  /* "pssh/native/_ssh2.pyx":94
+  /* "pssh/native/_ssh2.pyx":169
  *     cdef int _sock = session._sock
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
@@ -2562,30 +3718,39 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
       #endif
       /*try:*/ {
 
-        /* "pssh/native/_ssh2.pyx":95
+        /* "pssh/native/_ssh2.pyx":170
  * 
  *     with nogil:
  *         local_fh = fopen(_local_file, 'rb')             # <<<<<<<<<<<<<<
  *         if local_fh is NULL:
- *             with gil:
+ *             _errno = errno
  */
         __pyx_v_local_fh = fopen(__pyx_v__local_file, ((char const *)"rb"));
 
-        /* "pssh/native/_ssh2.pyx":96
+        /* "pssh/native/_ssh2.pyx":171
  *     with nogil:
  *         local_fh = fopen(_local_file, 'rb')
  *         if local_fh is NULL:             # <<<<<<<<<<<<<<
+ *             _errno = errno
  *             with gil:
- *                 raise OSError
  */
-        __pyx_t_6 = ((__pyx_v_local_fh == NULL) != 0);
-        if (__pyx_t_6) {
+        __pyx_t_3 = ((__pyx_v_local_fh == NULL) != 0);
+        if (__pyx_t_3) {
 
-          /* "pssh/native/_ssh2.pyx":97
+          /* "pssh/native/_ssh2.pyx":172
  *         local_fh = fopen(_local_file, 'rb')
  *         if local_fh is NULL:
+ *             _errno = errno             # <<<<<<<<<<<<<<
+ *             with gil:
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
+ */
+          __pyx_v__errno = errno;
+
+          /* "pssh/native/_ssh2.pyx":173
+ *         if local_fh is NULL:
+ *             _errno = errno
  *             with gil:             # <<<<<<<<<<<<<<
- *                 raise OSError
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  */
           {
@@ -2594,22 +3759,43 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
               #endif
               /*try:*/ {
 
-                /* "pssh/native/_ssh2.pyx":98
- *         if local_fh is NULL:
+                /* "pssh/native/_ssh2.pyx":174
+ *             _errno = errno
  *             with gil:
- *                 raise OSError             # <<<<<<<<<<<<<<
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)             # <<<<<<<<<<<<<<
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  *         if cbuf is NULL:
  */
-                __Pyx_Raise(__pyx_builtin_OSError, 0, 0, 0);
-                __PYX_ERR(0, 98, __pyx_L8_error)
+                __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v__errno); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 174, __pyx_L8_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __pyx_t_2 = strerror(__pyx_v__errno);
+                __pyx_t_7 = __Pyx_decode_c_string(__pyx_t_2, 0, strlen(__pyx_t_2), NULL, NULL, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 174, __pyx_L8_error)
+                __Pyx_GOTREF(__pyx_t_7);
+                __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 174, __pyx_L8_error)
+                __Pyx_GOTREF(__pyx_t_8);
+                __Pyx_GIVEREF(__pyx_t_1);
+                PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_1);
+                __Pyx_INCREF(__pyx_t_7);
+                __Pyx_GIVEREF(__pyx_t_7);
+                PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_7);
+                __Pyx_INCREF(__pyx_v_local_file);
+                __Pyx_GIVEREF(__pyx_v_local_file);
+                PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_v_local_file);
+                __pyx_t_1 = 0;
+                __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                __pyx_t_7 = __Pyx_PyObject_Call(__pyx_builtin_IOError, __pyx_t_8, NULL); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 174, __pyx_L8_error)
+                __Pyx_GOTREF(__pyx_t_7);
+                __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+                __Pyx_Raise(__pyx_t_7, 0, 0, 0);
+                __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                __PYX_ERR(0, 174, __pyx_L8_error)
               }
 
-              /* "pssh/native/_ssh2.pyx":97
- *         local_fh = fopen(_local_file, 'rb')
+              /* "pssh/native/_ssh2.pyx":173
  *         if local_fh is NULL:
+ *             _errno = errno
  *             with gil:             # <<<<<<<<<<<<<<
- *                 raise OSError
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  */
               /*finally:*/ {
@@ -2622,37 +3808,46 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
               }
           }
 
-          /* "pssh/native/_ssh2.pyx":96
+          /* "pssh/native/_ssh2.pyx":171
  *     with nogil:
  *         local_fh = fopen(_local_file, 'rb')
  *         if local_fh is NULL:             # <<<<<<<<<<<<<<
+ *             _errno = errno
  *             with gil:
- *                 raise OSError
  */
         }
 
-        /* "pssh/native/_ssh2.pyx":99
+        /* "pssh/native/_ssh2.pyx":175
  *             with gil:
- *                 raise OSError
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)             # <<<<<<<<<<<<<<
  *         if cbuf is NULL:
- *             with gil:
+ *             fclose(local_fh)
  */
         __pyx_v_cbuf = ((char *)malloc(((sizeof(char)) * __pyx_v_buffer_maxlen)));
 
-        /* "pssh/native/_ssh2.pyx":100
- *                 raise OSError
+        /* "pssh/native/_ssh2.pyx":176
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  *         if cbuf is NULL:             # <<<<<<<<<<<<<<
+ *             fclose(local_fh)
  *             with gil:
- *                 raise MemoryError
  */
-        __pyx_t_6 = ((__pyx_v_cbuf == NULL) != 0);
-        if (__pyx_t_6) {
+        __pyx_t_3 = ((__pyx_v_cbuf == NULL) != 0);
+        if (__pyx_t_3) {
 
-          /* "pssh/native/_ssh2.pyx":101
+          /* "pssh/native/_ssh2.pyx":177
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  *         if cbuf is NULL:
+ *             fclose(local_fh)             # <<<<<<<<<<<<<<
+ *             with gil:
+ *                 raise MemoryError
+ */
+          (void)(fclose(__pyx_v_local_fh));
+
+          /* "pssh/native/_ssh2.pyx":178
+ *         if cbuf is NULL:
+ *             fclose(local_fh)
  *             with gil:             # <<<<<<<<<<<<<<
  *                 raise MemoryError
  *         try:
@@ -2663,19 +3858,19 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
               #endif
               /*try:*/ {
 
-                /* "pssh/native/_ssh2.pyx":102
- *         if cbuf is NULL:
+                /* "pssh/native/_ssh2.pyx":179
+ *             fclose(local_fh)
  *             with gil:
  *                 raise MemoryError             # <<<<<<<<<<<<<<
  *         try:
  *             nread = fread(cbuf, 1, buffer_maxlen, local_fh)
  */
-                PyErr_NoMemory(); __PYX_ERR(0, 102, __pyx_L12_error)
+                PyErr_NoMemory(); __PYX_ERR(0, 179, __pyx_L12_error)
               }
 
-              /* "pssh/native/_ssh2.pyx":101
- *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
+              /* "pssh/native/_ssh2.pyx":178
  *         if cbuf is NULL:
+ *             fclose(local_fh)
  *             with gil:             # <<<<<<<<<<<<<<
  *                 raise MemoryError
  *         try:
@@ -2690,106 +3885,46 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
               }
           }
 
-          /* "pssh/native/_ssh2.pyx":100
- *                 raise OSError
+          /* "pssh/native/_ssh2.pyx":176
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  *         if cbuf is NULL:             # <<<<<<<<<<<<<<
+ *             fclose(local_fh)
  *             with gil:
- *                 raise MemoryError
  */
         }
 
-        /* "pssh/native/_ssh2.pyx":103
+        /* "pssh/native/_ssh2.pyx":180
  *             with gil:
  *                 raise MemoryError
  *         try:             # <<<<<<<<<<<<<<
  *             nread = fread(cbuf, 1, buffer_maxlen, local_fh)
- *             if nread < 0:
+ *             while nread > 0:
  */
         /*try:*/ {
 
-          /* "pssh/native/_ssh2.pyx":104
+          /* "pssh/native/_ssh2.pyx":181
  *                 raise MemoryError
  *         try:
  *             nread = fread(cbuf, 1, buffer_maxlen, local_fh)             # <<<<<<<<<<<<<<
- *             if nread < 0:
- *                 with gil:
- */
-          __pyx_v_nread = fread(__pyx_v_cbuf, 1, __pyx_v_buffer_maxlen, __pyx_v_local_fh);
-
-          /* "pssh/native/_ssh2.pyx":105
- *         try:
- *             nread = fread(cbuf, 1, buffer_maxlen, local_fh)
- *             if nread < 0:             # <<<<<<<<<<<<<<
- *                 with gil:
- *                     raise IOError
- */
-          __pyx_t_6 = ((__pyx_v_nread < 0) != 0);
-          if (__pyx_t_6) {
-
-            /* "pssh/native/_ssh2.pyx":106
- *             nread = fread(cbuf, 1, buffer_maxlen, local_fh)
- *             if nread < 0:
- *                 with gil:             # <<<<<<<<<<<<<<
- *                     raise IOError
- *             while nread > 0:
- */
-            {
-                #ifdef WITH_THREAD
-                PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
-                #endif
-                /*try:*/ {
-
-                  /* "pssh/native/_ssh2.pyx":107
- *             if nread < 0:
- *                 with gil:
- *                     raise IOError             # <<<<<<<<<<<<<<
  *             while nread > 0:
  *                 ptr = cbuf
  */
-                  __Pyx_Raise(__pyx_builtin_IOError, 0, 0, 0);
-                  __PYX_ERR(0, 107, __pyx_L19_error)
-                }
-
-                /* "pssh/native/_ssh2.pyx":106
- *             nread = fread(cbuf, 1, buffer_maxlen, local_fh)
- *             if nread < 0:
- *                 with gil:             # <<<<<<<<<<<<<<
- *                     raise IOError
- *             while nread > 0:
- */
-                /*finally:*/ {
-                  __pyx_L19_error: {
-                    #ifdef WITH_THREAD
-                    __Pyx_PyGILState_Release(__pyx_gilstate_save);
-                    #endif
-                    goto __pyx_L15_error;
-                  }
-                }
-            }
+          __pyx_v_nread = fread(__pyx_v_cbuf, 1, __pyx_v_buffer_maxlen, __pyx_v_local_fh);
 
-            /* "pssh/native/_ssh2.pyx":105
+          /* "pssh/native/_ssh2.pyx":182
  *         try:
  *             nread = fread(cbuf, 1, buffer_maxlen, local_fh)
- *             if nread < 0:             # <<<<<<<<<<<<<<
- *                 with gil:
- *                     raise IOError
- */
-          }
-
-          /* "pssh/native/_ssh2.pyx":108
- *                 with gil:
- *                     raise IOError
  *             while nread > 0:             # <<<<<<<<<<<<<<
  *                 ptr = cbuf
  *                 rc = libssh2_sftp_write(_handle, ptr, nread)
  */
           while (1) {
-            __pyx_t_6 = ((__pyx_v_nread > 0) != 0);
-            if (!__pyx_t_6) break;
+            __pyx_t_3 = ((__pyx_v_nread > 0) != 0);
+            if (!__pyx_t_3) break;
 
-            /* "pssh/native/_ssh2.pyx":109
- *                     raise IOError
+            /* "pssh/native/_ssh2.pyx":183
+ *             nread = fread(cbuf, 1, buffer_maxlen, local_fh)
  *             while nread > 0:
  *                 ptr = cbuf             # <<<<<<<<<<<<<<
  *                 rc = libssh2_sftp_write(_handle, ptr, nread)
@@ -2797,7 +3932,7 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
  */
             __pyx_v_ptr = __pyx_v_cbuf;
 
-            /* "pssh/native/_ssh2.pyx":110
+            /* "pssh/native/_ssh2.pyx":184
  *             while nread > 0:
  *                 ptr = cbuf
  *                 rc = libssh2_sftp_write(_handle, ptr, nread)             # <<<<<<<<<<<<<<
@@ -2806,7 +3941,7 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
  */
             __pyx_v_rc = libssh2_sftp_write(__pyx_v__handle, __pyx_v_ptr, __pyx_v_nread);
 
-            /* "pssh/native/_ssh2.pyx":111
+            /* "pssh/native/_ssh2.pyx":185
  *                 ptr = cbuf
  *                 rc = libssh2_sftp_write(_handle, ptr, nread)
  *                 while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
@@ -2814,28 +3949,28 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
  *                         with gil:
  */
             while (1) {
-              __pyx_t_7 = ((__pyx_v_rc > 0) != 0);
-              if (!__pyx_t_7) {
+              __pyx_t_9 = ((__pyx_v_rc > 0) != 0);
+              if (!__pyx_t_9) {
               } else {
-                __pyx_t_6 = __pyx_t_7;
-                goto __pyx_L25_bool_binop_done;
+                __pyx_t_3 = __pyx_t_9;
+                goto __pyx_L21_bool_binop_done;
               }
-              __pyx_t_7 = ((__pyx_v_rc == LIBSSH2_ERROR_EAGAIN) != 0);
-              __pyx_t_6 = __pyx_t_7;
-              __pyx_L25_bool_binop_done:;
-              if (!__pyx_t_6) break;
+              __pyx_t_9 = ((__pyx_v_rc == LIBSSH2_ERROR_EAGAIN) != 0);
+              __pyx_t_3 = __pyx_t_9;
+              __pyx_L21_bool_binop_done:;
+              if (!__pyx_t_3) break;
 
-              /* "pssh/native/_ssh2.pyx":112
+              /* "pssh/native/_ssh2.pyx":186
  *                 rc = libssh2_sftp_write(_handle, ptr, nread)
  *                 while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:
  *                     if rc == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
  *                         with gil:
  *                             _wait_select(_sock, _session, None)
  */
-              __pyx_t_6 = ((__pyx_v_rc == LIBSSH2_ERROR_EAGAIN) != 0);
-              if (__pyx_t_6) {
+              __pyx_t_3 = ((__pyx_v_rc == LIBSSH2_ERROR_EAGAIN) != 0);
+              if (__pyx_t_3) {
 
-                /* "pssh/native/_ssh2.pyx":113
+                /* "pssh/native/_ssh2.pyx":187
  *                 while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:
  *                     if rc == LIBSSH2_ERROR_EAGAIN:
  *                         with gil:             # <<<<<<<<<<<<<<
@@ -2848,17 +3983,17 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
                     #endif
                     /*try:*/ {
 
-                      /* "pssh/native/_ssh2.pyx":114
+                      /* "pssh/native/_ssh2.pyx":188
  *                     if rc == LIBSSH2_ERROR_EAGAIN:
  *                         with gil:
  *                             _wait_select(_sock, _session, None)             # <<<<<<<<<<<<<<
  *                     else:
  *                         ptr += rc
  */
-                      __pyx_t_5 = __pyx_f_4pssh_6native_5_ssh2__wait_select(__pyx_v__sock, __pyx_v__session, Py_None); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 114, __pyx_L31_error)
+                      __pyx_t_6 = __pyx_f_4pssh_6native_5_ssh2__wait_select(__pyx_v__sock, __pyx_v__session, Py_None); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 188, __pyx_L27_error)
                     }
 
-                    /* "pssh/native/_ssh2.pyx":113
+                    /* "pssh/native/_ssh2.pyx":187
  *                 while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:
  *                     if rc == LIBSSH2_ERROR_EAGAIN:
  *                         with gil:             # <<<<<<<<<<<<<<
@@ -2870,52 +4005,61 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
                         #ifdef WITH_THREAD
                         __Pyx_PyGILState_Release(__pyx_gilstate_save);
                         #endif
-                        goto __pyx_L32;
+                        goto __pyx_L28;
                       }
-                      __pyx_L31_error: {
+                      __pyx_L27_error: {
                         #ifdef WITH_THREAD
                         __Pyx_PyGILState_Release(__pyx_gilstate_save);
                         #endif
                         goto __pyx_L15_error;
                       }
-                      __pyx_L32:;
+                      __pyx_L28:;
                     }
                 }
 
-                /* "pssh/native/_ssh2.pyx":112
+                /* "pssh/native/_ssh2.pyx":186
  *                 rc = libssh2_sftp_write(_handle, ptr, nread)
  *                 while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:
  *                     if rc == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
  *                         with gil:
  *                             _wait_select(_sock, _session, None)
  */
-                goto __pyx_L27;
+                goto __pyx_L23;
               }
 
-              /* "pssh/native/_ssh2.pyx":116
+              /* "pssh/native/_ssh2.pyx":190
  *                             _wait_select(_sock, _session, None)
  *                     else:
  *                         ptr += rc             # <<<<<<<<<<<<<<
  *                         nread -= rc
- *                     rc = libssh2_sftp_write(_handle, ptr, nread)
+ *                         total += rc
  */
               /*else*/ {
                 __pyx_v_ptr = (__pyx_v_ptr + __pyx_v_rc);
 
-                /* "pssh/native/_ssh2.pyx":117
+                /* "pssh/native/_ssh2.pyx":191
  *                     else:
  *                         ptr += rc
  *                         nread -= rc             # <<<<<<<<<<<<<<
+ *                         total += rc
  *                     rc = libssh2_sftp_write(_handle, ptr, nread)
- *                 if rc < 0:
  */
                 __pyx_v_nread = (__pyx_v_nread - __pyx_v_rc);
-              }
-              __pyx_L27:;
 
-              /* "pssh/native/_ssh2.pyx":118
+                /* "pssh/native/_ssh2.pyx":192
  *                         ptr += rc
  *                         nread -= rc
+ *                         total += rc             # <<<<<<<<<<<<<<
+ *                     rc = libssh2_sftp_write(_handle, ptr, nread)
+ *                 if rc < 0:
+ */
+                __pyx_v_total = (__pyx_v_total + __pyx_v_rc);
+              }
+              __pyx_L23:;
+
+              /* "pssh/native/_ssh2.pyx":193
+ *                         nread -= rc
+ *                         total += rc
  *                     rc = libssh2_sftp_write(_handle, ptr, nread)             # <<<<<<<<<<<<<<
  *                 if rc < 0:
  *                     with gil:
@@ -2923,21 +4067,87 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
               __pyx_v_rc = libssh2_sftp_write(__pyx_v__handle, __pyx_v_ptr, __pyx_v_nread);
             }
 
-            /* "pssh/native/_ssh2.pyx":119
- *                         nread -= rc
+            /* "pssh/native/_ssh2.pyx":194
+ *                         total += rc
+ *                     rc = libssh2_sftp_write(_handle, ptr, nread)
+ *                 if rc < 0:             # <<<<<<<<<<<<<<
+ *                     with gil:
+ *                         handle_error_codes(rc)
+ */
+            __pyx_t_3 = ((__pyx_v_rc < 0) != 0);
+            if (__pyx_t_3) {
+
+              /* "pssh/native/_ssh2.pyx":195
+ *                     rc = libssh2_sftp_write(_handle, ptr, nread)
+ *                 if rc < 0:
+ *                     with gil:             # <<<<<<<<<<<<<<
+ *                         handle_error_codes(rc)
+ *                 if has_progress:
+ */
+              {
+                  #ifdef WITH_THREAD
+                  PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+                  #endif
+                  /*try:*/ {
+
+                    /* "pssh/native/_ssh2.pyx":196
+ *                 if rc < 0:
+ *                     with gil:
+ *                         handle_error_codes(rc)             # <<<<<<<<<<<<<<
+ *                 if has_progress:
+ *                     with gil:
+ */
+                    __pyx_t_6 = __pyx_f_4ssh2_5utils_handle_error_codes(__pyx_v_rc, 0); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 196, __pyx_L33_error)
+                  }
+
+                  /* "pssh/native/_ssh2.pyx":195
+ *                     rc = libssh2_sftp_write(_handle, ptr, nread)
+ *                 if rc < 0:
+ *                     with gil:             # <<<<<<<<<<<<<<
+ *                         handle_error_codes(rc)
+ *                 if has_progress:
+ */
+                  /*finally:*/ {
+                    /*normal exit:*/{
+                      #ifdef WITH_THREAD
+                      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                      #endif
+                      goto __pyx_L34;
+                    }
+                    __pyx_L33_error: {
+                      #ifdef WITH_THREAD
+                      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                      #endif
+                      goto __pyx_L15_error;
+                    }
+                    __pyx_L34:;
+                  }
+              }
+
+              /* "pssh/native/_ssh2.pyx":194
+ *                         total += rc
  *                     rc = libssh2_sftp_write(_handle, ptr, nread)
  *                 if rc < 0:             # <<<<<<<<<<<<<<
  *                     with gil:
- *                         raise SFTPHandleError(rc)
+ *                         handle_error_codes(rc)
+ */
+            }
+
+            /* "pssh/native/_ssh2.pyx":197
+ *                     with gil:
+ *                         handle_error_codes(rc)
+ *                 if has_progress:             # <<<<<<<<<<<<<<
+ *                     with gil:
+ *                         progress(total)
  */
-            __pyx_t_6 = ((__pyx_v_rc < 0) != 0);
-            if (__pyx_t_6) {
+            __pyx_t_3 = (__pyx_v_has_progress != 0);
+            if (__pyx_t_3) {
 
-              /* "pssh/native/_ssh2.pyx":120
- *                     rc = libssh2_sftp_write(_handle, ptr, nread)
- *                 if rc < 0:
+              /* "pssh/native/_ssh2.pyx":198
+ *                         handle_error_codes(rc)
+ *                 if has_progress:
  *                     with gil:             # <<<<<<<<<<<<<<
- *                         raise SFTPHandleError(rc)
+ *                         progress(total)
  *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
  */
               {
@@ -2946,121 +4156,175 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
                   #endif
                   /*try:*/ {
 
-                    /* "pssh/native/_ssh2.pyx":121
- *                 if rc < 0:
+                    /* "pssh/native/_ssh2.pyx":199
+ *                 if has_progress:
  *                     with gil:
- *                         raise SFTPHandleError(rc)             # <<<<<<<<<<<<<<
+ *                         progress(total)             # <<<<<<<<<<<<<<
  *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
- *         finally:
+ *             if ferror(local_fh):
  */
-                    __pyx_t_8 = __Pyx_GetModuleGlobalName(__pyx_n_s_SFTPHandleError); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 121, __pyx_L37_error)
+                    __pyx_t_8 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_total); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 199, __pyx_L39_error)
                     __Pyx_GOTREF(__pyx_t_8);
-                    __pyx_t_9 = __Pyx_PyInt_From_int(__pyx_v_rc); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 121, __pyx_L37_error)
-                    __Pyx_GOTREF(__pyx_t_9);
-                    __pyx_t_10 = NULL;
-                    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_8))) {
-                      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_8);
+                    __Pyx_INCREF(__pyx_v_progress);
+                    __pyx_t_1 = __pyx_v_progress; __pyx_t_10 = NULL;
+                    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_1))) {
+                      __pyx_t_10 = PyMethod_GET_SELF(__pyx_t_1);
                       if (likely(__pyx_t_10)) {
-                        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+                        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_1);
                         __Pyx_INCREF(__pyx_t_10);
                         __Pyx_INCREF(function);
-                        __Pyx_DECREF_SET(__pyx_t_8, function);
-                      }
-                    }
-                    if (!__pyx_t_10) {
-                      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L37_error)
-                      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-                      __Pyx_GOTREF(__pyx_t_1);
-                    } else {
-                      #if CYTHON_FAST_PYCALL
-                      if (PyFunction_Check(__pyx_t_8)) {
-                        PyObject *__pyx_temp[2] = {__pyx_t_10, __pyx_t_9};
-                        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L37_error)
-                        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-                        __Pyx_GOTREF(__pyx_t_1);
-                        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-                      } else
-                      #endif
-                      #if CYTHON_FAST_PYCCALL
-                      if (__Pyx_PyFastCFunction_Check(__pyx_t_8)) {
-                        PyObject *__pyx_temp[2] = {__pyx_t_10, __pyx_t_9};
-                        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_8, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L37_error)
-                        __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-                        __Pyx_GOTREF(__pyx_t_1);
-                        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-                      } else
-                      #endif
-                      {
-                        __pyx_t_11 = PyTuple_New(1+1); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 121, __pyx_L37_error)
-                        __Pyx_GOTREF(__pyx_t_11);
-                        __Pyx_GIVEREF(__pyx_t_10); PyTuple_SET_ITEM(__pyx_t_11, 0, __pyx_t_10); __pyx_t_10 = NULL;
-                        __Pyx_GIVEREF(__pyx_t_9);
-                        PyTuple_SET_ITEM(__pyx_t_11, 0+1, __pyx_t_9);
-                        __pyx_t_9 = 0;
-                        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_11, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 121, __pyx_L37_error)
-                        __Pyx_GOTREF(__pyx_t_1);
-                        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+                        __Pyx_DECREF_SET(__pyx_t_1, function);
                       }
                     }
+                    __pyx_t_7 = (__pyx_t_10) ? __Pyx_PyObject_Call2Args(__pyx_t_1, __pyx_t_10, __pyx_t_8) : __Pyx_PyObject_CallOneArg(__pyx_t_1, __pyx_t_8);
+                    __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
                     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-                    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+                    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 199, __pyx_L39_error)
+                    __Pyx_GOTREF(__pyx_t_7);
                     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-                    __PYX_ERR(0, 121, __pyx_L37_error)
+                    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
                   }
 
-                  /* "pssh/native/_ssh2.pyx":120
- *                     rc = libssh2_sftp_write(_handle, ptr, nread)
- *                 if rc < 0:
+                  /* "pssh/native/_ssh2.pyx":198
+ *                         handle_error_codes(rc)
+ *                 if has_progress:
  *                     with gil:             # <<<<<<<<<<<<<<
- *                         raise SFTPHandleError(rc)
+ *                         progress(total)
  *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
  */
                   /*finally:*/ {
-                    __pyx_L37_error: {
+                    /*normal exit:*/{
+                      #ifdef WITH_THREAD
+                      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                      #endif
+                      goto __pyx_L40;
+                    }
+                    __pyx_L39_error: {
                       #ifdef WITH_THREAD
                       __Pyx_PyGILState_Release(__pyx_gilstate_save);
                       #endif
                       goto __pyx_L15_error;
                     }
+                    __pyx_L40:;
                   }
               }
 
-              /* "pssh/native/_ssh2.pyx":119
- *                         nread -= rc
- *                     rc = libssh2_sftp_write(_handle, ptr, nread)
- *                 if rc < 0:             # <<<<<<<<<<<<<<
+              /* "pssh/native/_ssh2.pyx":197
+ *                     with gil:
+ *                         handle_error_codes(rc)
+ *                 if has_progress:             # <<<<<<<<<<<<<<
  *                     with gil:
- *                         raise SFTPHandleError(rc)
+ *                         progress(total)
  */
             }
 
-            /* "pssh/native/_ssh2.pyx":122
+            /* "pssh/native/_ssh2.pyx":200
  *                     with gil:
- *                         raise SFTPHandleError(rc)
+ *                         progress(total)
  *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)             # <<<<<<<<<<<<<<
+ *             if ferror(local_fh):
+ *                 with gil:
+ */
+            __pyx_v_nread = fread(__pyx_v_cbuf, 1, __pyx_v_buffer_maxlen, __pyx_v_local_fh);
+          }
+
+          /* "pssh/native/_ssh2.pyx":201
+ *                         progress(total)
+ *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
+ *             if ferror(local_fh):             # <<<<<<<<<<<<<<
+ *                 with gil:
+ *                     raise IOError("Error reading from local file %s" % (
+ */
+          __pyx_t_3 = (ferror(__pyx_v_local_fh) != 0);
+          if (__pyx_t_3) {
+
+            /* "pssh/native/_ssh2.pyx":202
+ *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
+ *             if ferror(local_fh):
+ *                 with gil:             # <<<<<<<<<<<<<<
+ *                     raise IOError("Error reading from local file %s" % (
+ *                         local_file,))
+ */
+            {
+                #ifdef WITH_THREAD
+                PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+                #endif
+                /*try:*/ {
+
+                  /* "pssh/native/_ssh2.pyx":204
+ *                 with gil:
+ *                     raise IOError("Error reading from local file %s" % (
+ *                         local_file,))             # <<<<<<<<<<<<<<
  *         finally:
  *             free(cbuf)
  */
-            __pyx_v_nread = fread(__pyx_v_cbuf, 1, __pyx_v_buffer_maxlen, __pyx_v_local_fh);
+                  __pyx_t_7 = PyTuple_New(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 204, __pyx_L43_error)
+                  __Pyx_GOTREF(__pyx_t_7);
+                  __Pyx_INCREF(__pyx_v_local_file);
+                  __Pyx_GIVEREF(__pyx_v_local_file);
+                  PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_v_local_file);
+
+                  /* "pssh/native/_ssh2.pyx":203
+ *             if ferror(local_fh):
+ *                 with gil:
+ *                     raise IOError("Error reading from local file %s" % (             # <<<<<<<<<<<<<<
+ *                         local_file,))
+ *         finally:
+ */
+                  __pyx_t_1 = __Pyx_PyString_Format(__pyx_kp_s_Error_reading_from_local_file_s, __pyx_t_7); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 203, __pyx_L43_error)
+                  __Pyx_GOTREF(__pyx_t_1);
+                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                  __pyx_t_7 = __Pyx_PyObject_CallOneArg(__pyx_builtin_IOError, __pyx_t_1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 203, __pyx_L43_error)
+                  __Pyx_GOTREF(__pyx_t_7);
+                  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                  __Pyx_Raise(__pyx_t_7, 0, 0, 0);
+                  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+                  __PYX_ERR(0, 203, __pyx_L43_error)
+                }
+
+                /* "pssh/native/_ssh2.pyx":202
+ *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
+ *             if ferror(local_fh):
+ *                 with gil:             # <<<<<<<<<<<<<<
+ *                     raise IOError("Error reading from local file %s" % (
+ *                         local_file,))
+ */
+                /*finally:*/ {
+                  __pyx_L43_error: {
+                    #ifdef WITH_THREAD
+                    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                    #endif
+                    goto __pyx_L15_error;
+                  }
+                }
+            }
+
+            /* "pssh/native/_ssh2.pyx":201
+ *                         progress(total)
+ *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
+ *             if ferror(local_fh):             # <<<<<<<<<<<<<<
+ *                 with gil:
+ *                     raise IOError("Error reading from local file %s" % (
+ */
           }
         }
 
-        /* "pssh/native/_ssh2.pyx":124
- *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
+        /* "pssh/native/_ssh2.pyx":206
+ *                         local_file,))
  *         finally:
  *             free(cbuf)             # <<<<<<<<<<<<<<
  *             fclose(local_fh)
- * 
+ *     return total
  */
         /*finally:*/ {
           /*normal exit:*/{
             free(__pyx_v_cbuf);
 
-            /* "pssh/native/_ssh2.pyx":125
+            /* "pssh/native/_ssh2.pyx":207
  *         finally:
  *             free(cbuf)
  *             fclose(local_fh)             # <<<<<<<<<<<<<<
- * 
+ *     return total
  * 
  */
             (void)(fclose(__pyx_v_local_fh));
@@ -3076,40 +4340,39 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
             __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
             #endif
             __Pyx_PyThreadState_assign
-            __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
+            __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0;
+            __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
             __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-            __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-            __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+            __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
             __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
-            __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_17, &__pyx_t_18, &__pyx_t_19);
-            if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16) < 0)) __Pyx_ErrFetch(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16);
+            if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_16, &__pyx_t_17, &__pyx_t_18);
+            if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15) < 0)) __Pyx_ErrFetch(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
+            __Pyx_XGOTREF(__pyx_t_13);
             __Pyx_XGOTREF(__pyx_t_14);
             __Pyx_XGOTREF(__pyx_t_15);
             __Pyx_XGOTREF(__pyx_t_16);
             __Pyx_XGOTREF(__pyx_t_17);
             __Pyx_XGOTREF(__pyx_t_18);
-            __Pyx_XGOTREF(__pyx_t_19);
-            __pyx_t_5 = __pyx_lineno; __pyx_t_12 = __pyx_clineno; __pyx_t_13 = __pyx_filename;
+            __pyx_t_6 = __pyx_lineno; __pyx_t_11 = __pyx_clineno; __pyx_t_12 = __pyx_filename;
             #ifdef WITH_THREAD
             __Pyx_PyGILState_Release(__pyx_gilstate_save);
             #endif
             {
 
-              /* "pssh/native/_ssh2.pyx":124
- *                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
+              /* "pssh/native/_ssh2.pyx":206
+ *                         local_file,))
  *         finally:
  *             free(cbuf)             # <<<<<<<<<<<<<<
  *             fclose(local_fh)
- * 
+ *     return total
  */
               free(__pyx_v_cbuf);
 
-              /* "pssh/native/_ssh2.pyx":125
+              /* "pssh/native/_ssh2.pyx":207
  *         finally:
  *             free(cbuf)
  *             fclose(local_fh)             # <<<<<<<<<<<<<<
- * 
+ *     return total
  * 
  */
               (void)(fclose(__pyx_v_local_fh));
@@ -3118,27 +4381,27 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
             __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
             #endif
             if (PY_MAJOR_VERSION >= 3) {
+              __Pyx_XGIVEREF(__pyx_t_16);
               __Pyx_XGIVEREF(__pyx_t_17);
               __Pyx_XGIVEREF(__pyx_t_18);
-              __Pyx_XGIVEREF(__pyx_t_19);
-              __Pyx_ExceptionReset(__pyx_t_17, __pyx_t_18, __pyx_t_19);
+              __Pyx_ExceptionReset(__pyx_t_16, __pyx_t_17, __pyx_t_18);
             }
+            __Pyx_XGIVEREF(__pyx_t_13);
             __Pyx_XGIVEREF(__pyx_t_14);
             __Pyx_XGIVEREF(__pyx_t_15);
-            __Pyx_XGIVEREF(__pyx_t_16);
-            __Pyx_ErrRestore(__pyx_t_14, __pyx_t_15, __pyx_t_16);
+            __Pyx_ErrRestore(__pyx_t_13, __pyx_t_14, __pyx_t_15);
             #ifdef WITH_THREAD
             __Pyx_PyGILState_Release(__pyx_gilstate_save);
             #endif
-            __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
-            __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_12; __pyx_filename = __pyx_t_13;
+            __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0;
+            __pyx_lineno = __pyx_t_6; __pyx_clineno = __pyx_t_11; __pyx_filename = __pyx_t_12;
             goto __pyx_L4_error;
           }
           __pyx_L16:;
         }
       }
 
-      /* "pssh/native/_ssh2.pyx":94
+      /* "pssh/native/_ssh2.pyx":169
  *     cdef int _sock = session._sock
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
@@ -3164,23 +4427,34 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
       }
   }
 
-  /* "pssh/native/_ssh2.pyx":80
+  /* "pssh/native/_ssh2.pyx":208
+ *             free(cbuf)
+ *             fclose(local_fh)
+ *     return total             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_7 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_total); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 208, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_r = __pyx_t_7;
+  __pyx_t_7 = 0;
+  goto __pyx_L0;
+
+  /* "pssh/native/_ssh2.pyx":143
  * 
  * 
  * def sftp_put(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from SFTP and writing to local file"""
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              progress=None):
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_7);
   __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_XDECREF(__pyx_t_9);
   __Pyx_XDECREF(__pyx_t_10);
-  __Pyx_XDECREF(__pyx_t_11);
   __Pyx_AddTraceback("pssh.native._ssh2.sftp_put", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -3190,33 +4464,51 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_3sftp_put(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "pssh/native/_ssh2.pyx":128
+/* "pssh/native/_ssh2.pyx":211
  * 
  * 
  * def sftp_get(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from local file and writing to SFTP"""
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              bint append=False, progress=None):
  */
 
 /* Python wrapper */
 static PyObject *__pyx_pw_4pssh_6native_5_ssh2_6sftp_get(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_4pssh_6native_5_ssh2_5sftp_get[] = "sftp_get(Session session, SFTPHandle handle, local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT)\nNative function for reading from local file and writing to SFTP";
-static PyMethodDef __pyx_mdef_4pssh_6native_5_ssh2_6sftp_get = {"sftp_get", (PyCFunction)__pyx_pw_4pssh_6native_5_ssh2_6sftp_get, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4pssh_6native_5_ssh2_5sftp_get};
+static char __pyx_doc_4pssh_6native_5_ssh2_5sftp_get[] = "sftp_get(Session session, SFTPHandle handle, local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT, bool append=False, progress=None)\nNative function for reading from SFTP and writing to local file.\n\n    Remote file is read into a single buffer of ``buffer_maxlen`` bytes,\n    with libssh2 keeping several SFTP read requests outstanding to fill it.\n    No Python objects are created for data read.\n\n    Data is appended to local file if ``append`` is set, otherwise local file\n    is truncated.\n\n    ``progress``, if set, is called with total number of bytes read after\n    each read.\n\n    Waits cooperatively on session socket whenever reading would block.\n\n    :rtype: int - total number of bytes read";
+static PyMethodDef __pyx_mdef_4pssh_6native_5_ssh2_6sftp_get = {"sftp_get", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4pssh_6native_5_ssh2_6sftp_get, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4pssh_6native_5_ssh2_5sftp_get};
 static PyObject *__pyx_pw_4pssh_6native_5_ssh2_6sftp_get(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session = 0;
   struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle = 0;
   PyObject *__pyx_v_local_file = 0;
   size_t __pyx_v_buffer_maxlen;
+  int __pyx_v_append;
+  PyObject *__pyx_v_progress = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("sftp_get (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_session,&__pyx_n_s_handle,&__pyx_n_s_local_file,&__pyx_n_s_buffer_maxlen,0};
-    PyObject* values[4] = {0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_session,&__pyx_n_s_handle,&__pyx_n_s_local_file,&__pyx_n_s_buffer_maxlen,&__pyx_n_s_append,&__pyx_n_s_progress,0};
+    PyObject* values[6] = {0,0,0,0,0,0};
+
+    /* "pssh/native/_ssh2.pyx":213
+ * def sftp_get(Session session, SFTPHandle handle,
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              bint append=False, progress=None):             # <<<<<<<<<<<<<<
+ *     """Native function for reading from SFTP and writing to local file.
+ * 
+ */
+    values[5] = ((PyObject *)Py_None);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -3237,13 +4529,13 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_6sftp_get(PyObject *__pyx_self, P
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_handle)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("sftp_get", 0, 3, 4, 1); __PYX_ERR(0, 128, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("sftp_get", 0, 3, 6, 1); __PYX_ERR(0, 211, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_local_file)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("sftp_get", 0, 3, 4, 2); __PYX_ERR(0, 128, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("sftp_get", 0, 3, 6, 2); __PYX_ERR(0, 211, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
@@ -3251,12 +4543,28 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_6sftp_get(PyObject *__pyx_self, P
           PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_buffer_maxlen);
           if (value) { values[3] = value; kw_args--; }
         }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_append);
+          if (value) { values[4] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_progress);
+          if (value) { values[5] = value; kw_args--; }
+        }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sftp_get") < 0)) __PYX_ERR(0, 128, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "sftp_get") < 0)) __PYX_ERR(0, 211, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
         case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
         CYTHON_FALLTHROUGH;
         case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
@@ -3270,22 +4578,36 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_6sftp_get(PyObject *__pyx_self, P
     __pyx_v_handle = ((struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *)values[1]);
     __pyx_v_local_file = values[2];
     if (values[3]) {
-      __pyx_v_buffer_maxlen = __Pyx_PyInt_As_size_t(values[3]); if (unlikely((__pyx_v_buffer_maxlen == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 129, __pyx_L3_error)
+      __pyx_v_buffer_maxlen = __Pyx_PyInt_As_size_t(values[3]); if (unlikely((__pyx_v_buffer_maxlen == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 212, __pyx_L3_error)
     } else {
-      __pyx_v_buffer_maxlen = __pyx_k__4;
+      __pyx_v_buffer_maxlen = __pyx_k__5;
+    }
+    if (values[4]) {
+      __pyx_v_append = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_append == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 213, __pyx_L3_error)
+    } else {
+      __pyx_v_append = ((int)0);
     }
+    __pyx_v_progress = values[5];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("sftp_get", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 128, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("sftp_get", 0, 3, 6, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 211, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("pssh.native._ssh2.sftp_get", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_session), __pyx_ptype_4ssh2_7session_Session, 1, "session", 0))) __PYX_ERR(0, 128, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_handle), __pyx_ptype_4ssh2_11sftp_handle_SFTPHandle, 1, "handle", 0))) __PYX_ERR(0, 128, __pyx_L1_error)
-  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2_5sftp_get(__pyx_self, __pyx_v_session, __pyx_v_handle, __pyx_v_local_file, __pyx_v_buffer_maxlen);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_session), __pyx_ptype_4ssh2_7session_Session, 1, "session", 0))) __PYX_ERR(0, 211, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_handle), __pyx_ptype_4ssh2_11sftp_handle_SFTPHandle, 1, "handle", 0))) __PYX_ERR(0, 211, __pyx_L1_error)
+  __pyx_r = __pyx_pf_4pssh_6native_5_ssh2_5sftp_get(__pyx_self, __pyx_v_session, __pyx_v_handle, __pyx_v_local_file, __pyx_v_buffer_maxlen, __pyx_v_append, __pyx_v_progress);
+
+  /* "pssh/native/_ssh2.pyx":211
+ * 
+ * 
+ * def sftp_get(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              bint append=False, progress=None):
+ */
 
   /* function exit code */
   goto __pyx_L0;
@@ -3296,11 +4618,14 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_6sftp_get(PyObject *__pyx_self, P
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle, PyObject *__pyx_v_local_file, size_t __pyx_v_buffer_maxlen) {
+static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject *__pyx_self, struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session, struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle *__pyx_v_handle, PyObject *__pyx_v_local_file, size_t __pyx_v_buffer_maxlen, int __pyx_v_append, PyObject *__pyx_v_progress) {
   PyObject *__pyx_v_b_local_file = 0;
   char *__pyx_v__local_file;
   FILE *__pyx_v_local_fh;
-  int __pyx_v_rc;
+  Py_ssize_t __pyx_v_rc;
+  unsigned PY_LONG_LONG __pyx_v_total;
+  int __pyx_v_has_progress;
+  int __pyx_v__errno;
   char *__pyx_v_cbuf;
   LIBSSH2_SFTP_HANDLE *__pyx_v__handle;
   LIBSSH2_SESSION *__pyx_v__session;
@@ -3309,86 +4634,108 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   char *__pyx_t_2;
-  LIBSSH2_SFTP_HANDLE *__pyx_t_3;
-  LIBSSH2_SESSION *__pyx_t_4;
-  int __pyx_t_5;
+  int __pyx_t_3;
+  LIBSSH2_SFTP_HANDLE *__pyx_t_4;
+  LIBSSH2_SESSION *__pyx_t_5;
   int __pyx_t_6;
-  int __pyx_t_7;
-  int __pyx_t_8;
-  char const *__pyx_t_9;
-  PyObject *__pyx_t_10 = NULL;
+  char const *__pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_t_10;
   PyObject *__pyx_t_11 = NULL;
-  PyObject *__pyx_t_12 = NULL;
-  PyObject *__pyx_t_13 = NULL;
+  int __pyx_t_12;
+  char const *__pyx_t_13;
   PyObject *__pyx_t_14 = NULL;
   PyObject *__pyx_t_15 = NULL;
   PyObject *__pyx_t_16 = NULL;
   PyObject *__pyx_t_17 = NULL;
   PyObject *__pyx_t_18 = NULL;
   PyObject *__pyx_t_19 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("sftp_get", 0);
 
-  /* "pssh/native/_ssh2.pyx":131
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from local file and writing to SFTP"""
+  /* "pssh/native/_ssh2.pyx":229
+ * 
+ *     :rtype: int - total number of bytes read"""
  *     cdef bytes b_local_file = to_bytes(local_file)             # <<<<<<<<<<<<<<
  *     cdef char *_local_file = b_local_file
  *     cdef FILE *local_fh
  */
-  __pyx_t_1 = __pyx_f_4ssh2_5utils_to_bytes(__pyx_v_local_file); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_4ssh2_5utils_to_bytes(__pyx_v_local_file); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_b_local_file = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "pssh/native/_ssh2.pyx":132
- *     """Native function for reading from local file and writing to SFTP"""
+  /* "pssh/native/_ssh2.pyx":230
+ *     :rtype: int - total number of bytes read"""
  *     cdef bytes b_local_file = to_bytes(local_file)
  *     cdef char *_local_file = b_local_file             # <<<<<<<<<<<<<<
  *     cdef FILE *local_fh
- *     cdef int rc
+ *     cdef ssize_t rc
  */
   if (unlikely(__pyx_v_b_local_file == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "expected bytes, NoneType found");
-    __PYX_ERR(0, 132, __pyx_L1_error)
+    __PYX_ERR(0, 230, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyBytes_AsWritableString(__pyx_v_b_local_file); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 132, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBytes_AsWritableString(__pyx_v_b_local_file); if (unlikely((!__pyx_t_2) && PyErr_Occurred())) __PYX_ERR(0, 230, __pyx_L1_error)
   __pyx_v__local_file = __pyx_t_2;
 
-  /* "pssh/native/_ssh2.pyx":136
- *     cdef int rc
+  /* "pssh/native/_ssh2.pyx":233
+ *     cdef FILE *local_fh
+ *     cdef ssize_t rc
+ *     cdef unsigned long long total = 0             # <<<<<<<<<<<<<<
+ *     cdef bint has_progress = progress is not None
+ *     cdef int _errno
+ */
+  __pyx_v_total = 0;
+
+  /* "pssh/native/_ssh2.pyx":234
+ *     cdef ssize_t rc
+ *     cdef unsigned long long total = 0
+ *     cdef bint has_progress = progress is not None             # <<<<<<<<<<<<<<
+ *     cdef int _errno
+ *     cdef char *cbuf
+ */
+  __pyx_t_3 = (__pyx_v_progress != Py_None);
+  __pyx_v_has_progress = __pyx_t_3;
+
+  /* "pssh/native/_ssh2.pyx":237
+ *     cdef int _errno
  *     cdef char *cbuf
  *     cdef LIBSSH2_SFTP_HANDLE *_handle = handle._handle             # <<<<<<<<<<<<<<
  *     cdef LIBSSH2_SESSION *_session = session._session
  *     cdef int _sock = session._sock
  */
-  __pyx_t_3 = __pyx_v_handle->_handle;
-  __pyx_v__handle = __pyx_t_3;
+  __pyx_t_4 = __pyx_v_handle->_handle;
+  __pyx_v__handle = __pyx_t_4;
 
-  /* "pssh/native/_ssh2.pyx":137
+  /* "pssh/native/_ssh2.pyx":238
  *     cdef char *cbuf
  *     cdef LIBSSH2_SFTP_HANDLE *_handle = handle._handle
  *     cdef LIBSSH2_SESSION *_session = session._session             # <<<<<<<<<<<<<<
  *     cdef int _sock = session._sock
  * 
  */
-  __pyx_t_4 = __pyx_v_session->_session;
-  __pyx_v__session = __pyx_t_4;
+  __pyx_t_5 = __pyx_v_session->_session;
+  __pyx_v__session = __pyx_t_5;
 
-  /* "pssh/native/_ssh2.pyx":138
+  /* "pssh/native/_ssh2.pyx":239
  *     cdef LIBSSH2_SFTP_HANDLE *_handle = handle._handle
  *     cdef LIBSSH2_SESSION *_session = session._session
  *     cdef int _sock = session._sock             # <<<<<<<<<<<<<<
  * 
  *     with nogil:
  */
-  __pyx_t_5 = __pyx_v_session->_sock;
-  __pyx_v__sock = __pyx_t_5;
+  __pyx_t_6 = __pyx_v_session->_sock;
+  __pyx_v__sock = __pyx_t_6;
 
-  /* "pssh/native/_ssh2.pyx":140
+  /* "pssh/native/_ssh2.pyx":241
  *     cdef int _sock = session._sock
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         local_fh = fopen(_local_file, 'wb')
+ *         local_fh = fopen(_local_file, 'ab' if append else 'wb')
  *         if local_fh is NULL:
  */
   {
@@ -3399,30 +4746,44 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
       #endif
       /*try:*/ {
 
-        /* "pssh/native/_ssh2.pyx":141
+        /* "pssh/native/_ssh2.pyx":242
  * 
  *     with nogil:
- *         local_fh = fopen(_local_file, 'wb')             # <<<<<<<<<<<<<<
+ *         local_fh = fopen(_local_file, 'ab' if append else 'wb')             # <<<<<<<<<<<<<<
  *         if local_fh is NULL:
- *             with gil:
+ *             _errno = errno
  */
-        __pyx_v_local_fh = fopen(__pyx_v__local_file, ((char const *)"wb"));
+        if ((__pyx_v_append != 0)) {
+          __pyx_t_7 = ((char const *)"ab");
+        } else {
+          __pyx_t_7 = ((char const *)"wb");
+        }
+        __pyx_v_local_fh = fopen(__pyx_v__local_file, __pyx_t_7);
 
-        /* "pssh/native/_ssh2.pyx":142
+        /* "pssh/native/_ssh2.pyx":243
  *     with nogil:
- *         local_fh = fopen(_local_file, 'wb')
+ *         local_fh = fopen(_local_file, 'ab' if append else 'wb')
  *         if local_fh is NULL:             # <<<<<<<<<<<<<<
+ *             _errno = errno
+ *             with gil:
+ */
+        __pyx_t_3 = ((__pyx_v_local_fh == NULL) != 0);
+        if (__pyx_t_3) {
+
+          /* "pssh/native/_ssh2.pyx":244
+ *         local_fh = fopen(_local_file, 'ab' if append else 'wb')
+ *         if local_fh is NULL:
+ *             _errno = errno             # <<<<<<<<<<<<<<
  *             with gil:
- *                 raise OSError
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  */
-        __pyx_t_6 = ((__pyx_v_local_fh == NULL) != 0);
-        if (__pyx_t_6) {
+          __pyx_v__errno = errno;
 
-          /* "pssh/native/_ssh2.pyx":143
- *         local_fh = fopen(_local_file, 'wb')
+          /* "pssh/native/_ssh2.pyx":245
  *         if local_fh is NULL:
+ *             _errno = errno
  *             with gil:             # <<<<<<<<<<<<<<
- *                 raise OSError
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  */
           {
@@ -3431,22 +4792,43 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
               #endif
               /*try:*/ {
 
-                /* "pssh/native/_ssh2.pyx":144
- *         if local_fh is NULL:
+                /* "pssh/native/_ssh2.pyx":246
+ *             _errno = errno
  *             with gil:
- *                 raise OSError             # <<<<<<<<<<<<<<
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)             # <<<<<<<<<<<<<<
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  *         if cbuf is NULL:
  */
-                __Pyx_Raise(__pyx_builtin_OSError, 0, 0, 0);
-                __PYX_ERR(0, 144, __pyx_L8_error)
+                __pyx_t_1 = __Pyx_PyInt_From_int(__pyx_v__errno); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 246, __pyx_L8_error)
+                __Pyx_GOTREF(__pyx_t_1);
+                __pyx_t_2 = strerror(__pyx_v__errno);
+                __pyx_t_8 = __Pyx_decode_c_string(__pyx_t_2, 0, strlen(__pyx_t_2), NULL, NULL, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 246, __pyx_L8_error)
+                __Pyx_GOTREF(__pyx_t_8);
+                __pyx_t_9 = PyTuple_New(3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 246, __pyx_L8_error)
+                __Pyx_GOTREF(__pyx_t_9);
+                __Pyx_GIVEREF(__pyx_t_1);
+                PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_1);
+                __Pyx_INCREF(__pyx_t_8);
+                __Pyx_GIVEREF(__pyx_t_8);
+                PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_8);
+                __Pyx_INCREF(__pyx_v_local_file);
+                __Pyx_GIVEREF(__pyx_v_local_file);
+                PyTuple_SET_ITEM(__pyx_t_9, 2, __pyx_v_local_file);
+                __pyx_t_1 = 0;
+                __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+                __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_IOError, __pyx_t_9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 246, __pyx_L8_error)
+                __Pyx_GOTREF(__pyx_t_8);
+                __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+                __Pyx_Raise(__pyx_t_8, 0, 0, 0);
+                __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+                __PYX_ERR(0, 246, __pyx_L8_error)
               }
 
-              /* "pssh/native/_ssh2.pyx":143
- *         local_fh = fopen(_local_file, 'wb')
+              /* "pssh/native/_ssh2.pyx":245
  *         if local_fh is NULL:
+ *             _errno = errno
  *             with gil:             # <<<<<<<<<<<<<<
- *                 raise OSError
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  */
               /*finally:*/ {
@@ -3459,37 +4841,46 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
               }
           }
 
-          /* "pssh/native/_ssh2.pyx":142
+          /* "pssh/native/_ssh2.pyx":243
  *     with nogil:
- *         local_fh = fopen(_local_file, 'wb')
+ *         local_fh = fopen(_local_file, 'ab' if append else 'wb')
  *         if local_fh is NULL:             # <<<<<<<<<<<<<<
+ *             _errno = errno
  *             with gil:
- *                 raise OSError
  */
         }
 
-        /* "pssh/native/_ssh2.pyx":145
+        /* "pssh/native/_ssh2.pyx":247
  *             with gil:
- *                 raise OSError
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)             # <<<<<<<<<<<<<<
  *         if cbuf is NULL:
- *             with gil:
+ *             fclose(local_fh)
  */
         __pyx_v_cbuf = ((char *)malloc(((sizeof(char)) * __pyx_v_buffer_maxlen)));
 
-        /* "pssh/native/_ssh2.pyx":146
- *                 raise OSError
+        /* "pssh/native/_ssh2.pyx":248
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  *         if cbuf is NULL:             # <<<<<<<<<<<<<<
+ *             fclose(local_fh)
  *             with gil:
- *                 raise MemoryError
  */
-        __pyx_t_6 = ((__pyx_v_cbuf == NULL) != 0);
-        if (__pyx_t_6) {
+        __pyx_t_3 = ((__pyx_v_cbuf == NULL) != 0);
+        if (__pyx_t_3) {
 
-          /* "pssh/native/_ssh2.pyx":147
+          /* "pssh/native/_ssh2.pyx":249
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  *         if cbuf is NULL:
+ *             fclose(local_fh)             # <<<<<<<<<<<<<<
+ *             with gil:
+ *                 raise MemoryError
+ */
+          (void)(fclose(__pyx_v_local_fh));
+
+          /* "pssh/native/_ssh2.pyx":250
+ *         if cbuf is NULL:
+ *             fclose(local_fh)
  *             with gil:             # <<<<<<<<<<<<<<
  *                 raise MemoryError
  *         try:
@@ -3500,19 +4891,19 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
               #endif
               /*try:*/ {
 
-                /* "pssh/native/_ssh2.pyx":148
- *         if cbuf is NULL:
+                /* "pssh/native/_ssh2.pyx":251
+ *             fclose(local_fh)
  *             with gil:
  *                 raise MemoryError             # <<<<<<<<<<<<<<
  *         try:
  *             rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
  */
-                PyErr_NoMemory(); __PYX_ERR(0, 148, __pyx_L12_error)
+                PyErr_NoMemory(); __PYX_ERR(0, 251, __pyx_L12_error)
               }
 
-              /* "pssh/native/_ssh2.pyx":147
- *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
+              /* "pssh/native/_ssh2.pyx":250
  *         if cbuf is NULL:
+ *             fclose(local_fh)
  *             with gil:             # <<<<<<<<<<<<<<
  *                 raise MemoryError
  *         try:
@@ -3527,16 +4918,16 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
               }
           }
 
-          /* "pssh/native/_ssh2.pyx":146
- *                 raise OSError
+          /* "pssh/native/_ssh2.pyx":248
+ *                 raise IOError(_errno, strerror(_errno).decode(), local_file)
  *         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
  *         if cbuf is NULL:             # <<<<<<<<<<<<<<
+ *             fclose(local_fh)
  *             with gil:
- *                 raise MemoryError
  */
         }
 
-        /* "pssh/native/_ssh2.pyx":149
+        /* "pssh/native/_ssh2.pyx":252
  *             with gil:
  *                 raise MemoryError
  *         try:             # <<<<<<<<<<<<<<
@@ -3545,7 +4936,7 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
  */
         /*try:*/ {
 
-          /* "pssh/native/_ssh2.pyx":150
+          /* "pssh/native/_ssh2.pyx":253
  *                 raise MemoryError
  *         try:
  *             rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)             # <<<<<<<<<<<<<<
@@ -3554,7 +4945,7 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
  */
           __pyx_v_rc = libssh2_sftp_read(__pyx_v__handle, __pyx_v_cbuf, __pyx_v_buffer_maxlen);
 
-          /* "pssh/native/_ssh2.pyx":151
+          /* "pssh/native/_ssh2.pyx":254
  *         try:
  *             rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
  *             while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
@@ -3562,33 +4953,33 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
  *                     with gil:
  */
           while (1) {
-            __pyx_t_7 = ((__pyx_v_rc > 0) != 0);
-            if (!__pyx_t_7) {
+            __pyx_t_10 = ((__pyx_v_rc > 0) != 0);
+            if (!__pyx_t_10) {
             } else {
-              __pyx_t_6 = __pyx_t_7;
+              __pyx_t_3 = __pyx_t_10;
               goto __pyx_L19_bool_binop_done;
             }
-            __pyx_t_7 = ((__pyx_v_rc == LIBSSH2_ERROR_EAGAIN) != 0);
-            __pyx_t_6 = __pyx_t_7;
+            __pyx_t_10 = ((__pyx_v_rc == LIBSSH2_ERROR_EAGAIN) != 0);
+            __pyx_t_3 = __pyx_t_10;
             __pyx_L19_bool_binop_done:;
-            if (!__pyx_t_6) break;
+            if (!__pyx_t_3) break;
 
-            /* "pssh/native/_ssh2.pyx":152
+            /* "pssh/native/_ssh2.pyx":255
  *             rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
  *             while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:
  *                 if rc == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
  *                     with gil:
  *                         _wait_select(_sock, _session, None)
  */
-            __pyx_t_6 = ((__pyx_v_rc == LIBSSH2_ERROR_EAGAIN) != 0);
-            if (__pyx_t_6) {
+            __pyx_t_3 = ((__pyx_v_rc == LIBSSH2_ERROR_EAGAIN) != 0);
+            if (__pyx_t_3) {
 
-              /* "pssh/native/_ssh2.pyx":153
+              /* "pssh/native/_ssh2.pyx":256
  *             while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:
  *                 if rc == LIBSSH2_ERROR_EAGAIN:
  *                     with gil:             # <<<<<<<<<<<<<<
  *                         _wait_select(_sock, _session, None)
- *                 elif fwrite(cbuf, 1, rc, local_fh) < 0:
+ *                 elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:
  */
               {
                   #ifdef WITH_THREAD
@@ -3596,22 +4987,22 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
                   #endif
                   /*try:*/ {
 
-                    /* "pssh/native/_ssh2.pyx":154
+                    /* "pssh/native/_ssh2.pyx":257
  *                 if rc == LIBSSH2_ERROR_EAGAIN:
  *                     with gil:
  *                         _wait_select(_sock, _session, None)             # <<<<<<<<<<<<<<
- *                 elif fwrite(cbuf, 1, rc, local_fh) < 0:
- *                     with gil:
+ *                 elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:
+ *                     _errno = errno
  */
-                    __pyx_t_5 = __pyx_f_4pssh_6native_5_ssh2__wait_select(__pyx_v__sock, __pyx_v__session, Py_None); if (unlikely(__pyx_t_5 == ((int)-1))) __PYX_ERR(0, 154, __pyx_L25_error)
+                    __pyx_t_6 = __pyx_f_4pssh_6native_5_ssh2__wait_select(__pyx_v__sock, __pyx_v__session, Py_None); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 257, __pyx_L25_error)
                   }
 
-                  /* "pssh/native/_ssh2.pyx":153
+                  /* "pssh/native/_ssh2.pyx":256
  *             while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:
  *                 if rc == LIBSSH2_ERROR_EAGAIN:
  *                     with gil:             # <<<<<<<<<<<<<<
  *                         _wait_select(_sock, _session, None)
- *                 elif fwrite(cbuf, 1, rc, local_fh) < 0:
+ *                 elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:
  */
                   /*finally:*/ {
                     /*normal exit:*/{
@@ -3630,7 +5021,7 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
                   }
               }
 
-              /* "pssh/native/_ssh2.pyx":152
+              /* "pssh/native/_ssh2.pyx":255
  *             rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
  *             while rc > 0 or rc == LIBSSH2_ERROR_EAGAIN:
  *                 if rc == LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
@@ -3640,22 +5031,31 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
               goto __pyx_L21;
             }
 
-            /* "pssh/native/_ssh2.pyx":155
+            /* "pssh/native/_ssh2.pyx":258
  *                     with gil:
  *                         _wait_select(_sock, _session, None)
- *                 elif fwrite(cbuf, 1, rc, local_fh) < 0:             # <<<<<<<<<<<<<<
+ *                 elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:             # <<<<<<<<<<<<<<
+ *                     _errno = errno
  *                     with gil:
- *                         raise IOError
  */
-            __pyx_t_6 = ((fwrite(__pyx_v_cbuf, 1, __pyx_v_rc, __pyx_v_local_fh) < 0) != 0);
-            if (__pyx_t_6) {
+            __pyx_t_3 = ((fwrite(__pyx_v_cbuf, 1, __pyx_v_rc, __pyx_v_local_fh) != ((size_t)__pyx_v_rc)) != 0);
+            if (__pyx_t_3) {
 
-              /* "pssh/native/_ssh2.pyx":156
+              /* "pssh/native/_ssh2.pyx":259
  *                         _wait_select(_sock, _session, None)
- *                 elif fwrite(cbuf, 1, rc, local_fh) < 0:
+ *                 elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:
+ *                     _errno = errno             # <<<<<<<<<<<<<<
+ *                     with gil:
+ *                         raise IOError(_errno, strerror(_errno).decode(),
+ */
+              __pyx_v__errno = errno;
+
+              /* "pssh/native/_ssh2.pyx":260
+ *                 elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:
+ *                     _errno = errno
  *                     with gil:             # <<<<<<<<<<<<<<
- *                         raise IOError
- *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+ *                         raise IOError(_errno, strerror(_errno).decode(),
+ *                                       local_file)
  */
               {
                   #ifdef WITH_THREAD
@@ -3663,72 +5063,271 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
                   #endif
                   /*try:*/ {
 
-                    /* "pssh/native/_ssh2.pyx":157
- *                 elif fwrite(cbuf, 1, rc, local_fh) < 0:
- *                     with gil:
- *                         raise IOError             # <<<<<<<<<<<<<<
+                    /* "pssh/native/_ssh2.pyx":261
+ *                     _errno = errno
+ *                     with gil:
+ *                         raise IOError(_errno, strerror(_errno).decode(),             # <<<<<<<<<<<<<<
+ *                                       local_file)
+ *                 else:
+ */
+                    __pyx_t_8 = __Pyx_PyInt_From_int(__pyx_v__errno); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 261, __pyx_L30_error)
+                    __Pyx_GOTREF(__pyx_t_8);
+                    __pyx_t_2 = strerror(__pyx_v__errno);
+                    __pyx_t_9 = __Pyx_decode_c_string(__pyx_t_2, 0, strlen(__pyx_t_2), NULL, NULL, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 261, __pyx_L30_error)
+                    __Pyx_GOTREF(__pyx_t_9);
+
+                    /* "pssh/native/_ssh2.pyx":262
+ *                     with gil:
+ *                         raise IOError(_errno, strerror(_errno).decode(),
+ *                                       local_file)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     total += rc
+ */
+                    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L30_error)
+                    __Pyx_GOTREF(__pyx_t_1);
+                    __Pyx_GIVEREF(__pyx_t_8);
+                    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_8);
+                    __Pyx_INCREF(__pyx_t_9);
+                    __Pyx_GIVEREF(__pyx_t_9);
+                    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_9);
+                    __Pyx_INCREF(__pyx_v_local_file);
+                    __Pyx_GIVEREF(__pyx_v_local_file);
+                    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_v_local_file);
+                    __pyx_t_8 = 0;
+                    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+
+                    /* "pssh/native/_ssh2.pyx":261
+ *                     _errno = errno
+ *                     with gil:
+ *                         raise IOError(_errno, strerror(_errno).decode(),             # <<<<<<<<<<<<<<
+ *                                       local_file)
+ *                 else:
+ */
+                    __pyx_t_9 = __Pyx_PyObject_Call(__pyx_builtin_IOError, __pyx_t_1, NULL); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 261, __pyx_L30_error)
+                    __Pyx_GOTREF(__pyx_t_9);
+                    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                    __Pyx_Raise(__pyx_t_9, 0, 0, 0);
+                    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+                    __PYX_ERR(0, 261, __pyx_L30_error)
+                  }
+
+                  /* "pssh/native/_ssh2.pyx":260
+ *                 elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:
+ *                     _errno = errno
+ *                     with gil:             # <<<<<<<<<<<<<<
+ *                         raise IOError(_errno, strerror(_errno).decode(),
+ *                                       local_file)
+ */
+                  /*finally:*/ {
+                    __pyx_L30_error: {
+                      #ifdef WITH_THREAD
+                      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                      #endif
+                      goto __pyx_L15_error;
+                    }
+                  }
+              }
+
+              /* "pssh/native/_ssh2.pyx":258
+ *                     with gil:
+ *                         _wait_select(_sock, _session, None)
+ *                 elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:             # <<<<<<<<<<<<<<
+ *                     _errno = errno
+ *                     with gil:
+ */
+            }
+
+            /* "pssh/native/_ssh2.pyx":264
+ *                                       local_file)
+ *                 else:
+ *                     total += rc             # <<<<<<<<<<<<<<
+ *                     if has_progress:
+ *                         with gil:
+ */
+            /*else*/ {
+              __pyx_v_total = (__pyx_v_total + __pyx_v_rc);
+
+              /* "pssh/native/_ssh2.pyx":265
+ *                 else:
+ *                     total += rc
+ *                     if has_progress:             # <<<<<<<<<<<<<<
+ *                         with gil:
+ *                             progress(total)
+ */
+              __pyx_t_3 = (__pyx_v_has_progress != 0);
+              if (__pyx_t_3) {
+
+                /* "pssh/native/_ssh2.pyx":266
+ *                     total += rc
+ *                     if has_progress:
+ *                         with gil:             # <<<<<<<<<<<<<<
+ *                             progress(total)
+ *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+ */
+                {
+                    #ifdef WITH_THREAD
+                    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+                    #endif
+                    /*try:*/ {
+
+                      /* "pssh/native/_ssh2.pyx":267
+ *                     if has_progress:
+ *                         with gil:
+ *                             progress(total)             # <<<<<<<<<<<<<<
+ *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+ *             if rc < 0:
+ */
+                      __pyx_t_1 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_total); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L36_error)
+                      __Pyx_GOTREF(__pyx_t_1);
+                      __Pyx_INCREF(__pyx_v_progress);
+                      __pyx_t_8 = __pyx_v_progress; __pyx_t_11 = NULL;
+                      if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_8))) {
+                        __pyx_t_11 = PyMethod_GET_SELF(__pyx_t_8);
+                        if (likely(__pyx_t_11)) {
+                          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_8);
+                          __Pyx_INCREF(__pyx_t_11);
+                          __Pyx_INCREF(function);
+                          __Pyx_DECREF_SET(__pyx_t_8, function);
+                        }
+                      }
+                      __pyx_t_9 = (__pyx_t_11) ? __Pyx_PyObject_Call2Args(__pyx_t_8, __pyx_t_11, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_8, __pyx_t_1);
+                      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+                      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+                      if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 267, __pyx_L36_error)
+                      __Pyx_GOTREF(__pyx_t_9);
+                      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+                      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+                    }
+
+                    /* "pssh/native/_ssh2.pyx":266
+ *                     total += rc
+ *                     if has_progress:
+ *                         with gil:             # <<<<<<<<<<<<<<
+ *                             progress(total)
+ *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+ */
+                    /*finally:*/ {
+                      /*normal exit:*/{
+                        #ifdef WITH_THREAD
+                        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                        #endif
+                        goto __pyx_L37;
+                      }
+                      __pyx_L36_error: {
+                        #ifdef WITH_THREAD
+                        __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                        #endif
+                        goto __pyx_L15_error;
+                      }
+                      __pyx_L37:;
+                    }
+                }
+
+                /* "pssh/native/_ssh2.pyx":265
+ *                 else:
+ *                     total += rc
+ *                     if has_progress:             # <<<<<<<<<<<<<<
+ *                         with gil:
+ *                             progress(total)
+ */
+              }
+            }
+            __pyx_L21:;
+
+            /* "pssh/native/_ssh2.pyx":268
+ *                         with gil:
+ *                             progress(total)
+ *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)             # <<<<<<<<<<<<<<
+ *             if rc < 0:
+ *                 with gil:
+ */
+            __pyx_v_rc = libssh2_sftp_read(__pyx_v__handle, __pyx_v_cbuf, __pyx_v_buffer_maxlen);
+          }
+
+          /* "pssh/native/_ssh2.pyx":269
+ *                             progress(total)
+ *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+ *             if rc < 0:             # <<<<<<<<<<<<<<
+ *                 with gil:
+ *                     handle_error_codes(rc)
+ */
+          __pyx_t_3 = ((__pyx_v_rc < 0) != 0);
+          if (__pyx_t_3) {
+
+            /* "pssh/native/_ssh2.pyx":270
  *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+ *             if rc < 0:
+ *                 with gil:             # <<<<<<<<<<<<<<
+ *                     handle_error_codes(rc)
  *         finally:
  */
-                    __Pyx_Raise(__pyx_builtin_IOError, 0, 0, 0);
-                    __PYX_ERR(0, 157, __pyx_L30_error)
-                  }
+            {
+                #ifdef WITH_THREAD
+                PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+                #endif
+                /*try:*/ {
 
-                  /* "pssh/native/_ssh2.pyx":156
- *                         _wait_select(_sock, _session, None)
- *                 elif fwrite(cbuf, 1, rc, local_fh) < 0:
- *                     with gil:             # <<<<<<<<<<<<<<
- *                         raise IOError
- *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+                  /* "pssh/native/_ssh2.pyx":271
+ *             if rc < 0:
+ *                 with gil:
+ *                     handle_error_codes(rc)             # <<<<<<<<<<<<<<
+ *         finally:
+ *             free(cbuf)
  */
-                  /*finally:*/ {
-                    __pyx_L30_error: {
-                      #ifdef WITH_THREAD
-                      __Pyx_PyGILState_Release(__pyx_gilstate_save);
-                      #endif
-                      goto __pyx_L15_error;
-                    }
-                  }
-              }
+                  __pyx_t_6 = __pyx_f_4ssh2_5utils_handle_error_codes(__pyx_v_rc, 0); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 271, __pyx_L40_error)
+                }
 
-              /* "pssh/native/_ssh2.pyx":155
- *                     with gil:
- *                         _wait_select(_sock, _session, None)
- *                 elif fwrite(cbuf, 1, rc, local_fh) < 0:             # <<<<<<<<<<<<<<
- *                     with gil:
- *                         raise IOError
+                /* "pssh/native/_ssh2.pyx":270
+ *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+ *             if rc < 0:
+ *                 with gil:             # <<<<<<<<<<<<<<
+ *                     handle_error_codes(rc)
+ *         finally:
  */
+                /*finally:*/ {
+                  /*normal exit:*/{
+                    #ifdef WITH_THREAD
+                    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                    #endif
+                    goto __pyx_L41;
+                  }
+                  __pyx_L40_error: {
+                    #ifdef WITH_THREAD
+                    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+                    #endif
+                    goto __pyx_L15_error;
+                  }
+                  __pyx_L41:;
+                }
             }
-            __pyx_L21:;
 
-            /* "pssh/native/_ssh2.pyx":158
- *                     with gil:
- *                         raise IOError
- *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)             # <<<<<<<<<<<<<<
- *         finally:
- *             free(cbuf)
+            /* "pssh/native/_ssh2.pyx":269
+ *                             progress(total)
+ *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+ *             if rc < 0:             # <<<<<<<<<<<<<<
+ *                 with gil:
+ *                     handle_error_codes(rc)
  */
-            __pyx_v_rc = libssh2_sftp_read(__pyx_v__handle, __pyx_v_cbuf, __pyx_v_buffer_maxlen);
           }
         }
 
-        /* "pssh/native/_ssh2.pyx":160
- *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+        /* "pssh/native/_ssh2.pyx":273
+ *                     handle_error_codes(rc)
  *         finally:
  *             free(cbuf)             # <<<<<<<<<<<<<<
  *             fclose(local_fh)
- *     if rc < 0 and rc != LIBSSH2_ERROR_EAGAIN:
+ *     return total
  */
         /*finally:*/ {
           /*normal exit:*/{
             free(__pyx_v_cbuf);
 
-            /* "pssh/native/_ssh2.pyx":161
+            /* "pssh/native/_ssh2.pyx":274
  *         finally:
  *             free(cbuf)
  *             fclose(local_fh)             # <<<<<<<<<<<<<<
- *     if rc < 0 and rc != LIBSSH2_ERROR_EAGAIN:
- *         raise SFTPHandleError(rc)
+ *     return total
+ * 
  */
             (void)(fclose(__pyx_v_local_fh));
             goto __pyx_L16;
@@ -3743,37 +5342,40 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
             __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
             #endif
             __Pyx_PyThreadState_assign
-            __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0;
+            __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
             __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-            if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
-            if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12) < 0)) __Pyx_ErrFetch(&__pyx_t_10, &__pyx_t_11, &__pyx_t_12);
-            __Pyx_XGOTREF(__pyx_t_10);
-            __Pyx_XGOTREF(__pyx_t_11);
-            __Pyx_XGOTREF(__pyx_t_12);
-            __Pyx_XGOTREF(__pyx_t_13);
+            __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+            __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+            __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+            if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_17, &__pyx_t_18, &__pyx_t_19);
+            if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16) < 0)) __Pyx_ErrFetch(&__pyx_t_14, &__pyx_t_15, &__pyx_t_16);
             __Pyx_XGOTREF(__pyx_t_14);
             __Pyx_XGOTREF(__pyx_t_15);
-            __pyx_t_5 = __pyx_lineno; __pyx_t_8 = __pyx_clineno; __pyx_t_9 = __pyx_filename;
+            __Pyx_XGOTREF(__pyx_t_16);
+            __Pyx_XGOTREF(__pyx_t_17);
+            __Pyx_XGOTREF(__pyx_t_18);
+            __Pyx_XGOTREF(__pyx_t_19);
+            __pyx_t_6 = __pyx_lineno; __pyx_t_12 = __pyx_clineno; __pyx_t_13 = __pyx_filename;
             #ifdef WITH_THREAD
             __Pyx_PyGILState_Release(__pyx_gilstate_save);
             #endif
             {
 
-              /* "pssh/native/_ssh2.pyx":160
- *                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+              /* "pssh/native/_ssh2.pyx":273
+ *                     handle_error_codes(rc)
  *         finally:
  *             free(cbuf)             # <<<<<<<<<<<<<<
  *             fclose(local_fh)
- *     if rc < 0 and rc != LIBSSH2_ERROR_EAGAIN:
+ *     return total
  */
               free(__pyx_v_cbuf);
 
-              /* "pssh/native/_ssh2.pyx":161
+              /* "pssh/native/_ssh2.pyx":274
  *         finally:
  *             free(cbuf)
  *             fclose(local_fh)             # <<<<<<<<<<<<<<
- *     if rc < 0 and rc != LIBSSH2_ERROR_EAGAIN:
- *         raise SFTPHandleError(rc)
+ *     return total
+ * 
  */
               (void)(fclose(__pyx_v_local_fh));
             }
@@ -3781,31 +5383,31 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
             __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
             #endif
             if (PY_MAJOR_VERSION >= 3) {
-              __Pyx_XGIVEREF(__pyx_t_13);
-              __Pyx_XGIVEREF(__pyx_t_14);
-              __Pyx_XGIVEREF(__pyx_t_15);
-              __Pyx_ExceptionReset(__pyx_t_13, __pyx_t_14, __pyx_t_15);
+              __Pyx_XGIVEREF(__pyx_t_17);
+              __Pyx_XGIVEREF(__pyx_t_18);
+              __Pyx_XGIVEREF(__pyx_t_19);
+              __Pyx_ExceptionReset(__pyx_t_17, __pyx_t_18, __pyx_t_19);
             }
-            __Pyx_XGIVEREF(__pyx_t_10);
-            __Pyx_XGIVEREF(__pyx_t_11);
-            __Pyx_XGIVEREF(__pyx_t_12);
-            __Pyx_ErrRestore(__pyx_t_10, __pyx_t_11, __pyx_t_12);
+            __Pyx_XGIVEREF(__pyx_t_14);
+            __Pyx_XGIVEREF(__pyx_t_15);
+            __Pyx_XGIVEREF(__pyx_t_16);
+            __Pyx_ErrRestore(__pyx_t_14, __pyx_t_15, __pyx_t_16);
             #ifdef WITH_THREAD
             __Pyx_PyGILState_Release(__pyx_gilstate_save);
             #endif
-            __pyx_t_10 = 0; __pyx_t_11 = 0; __pyx_t_12 = 0; __pyx_t_13 = 0; __pyx_t_14 = 0; __pyx_t_15 = 0;
-            __pyx_lineno = __pyx_t_5; __pyx_clineno = __pyx_t_8; __pyx_filename = __pyx_t_9;
+            __pyx_t_14 = 0; __pyx_t_15 = 0; __pyx_t_16 = 0; __pyx_t_17 = 0; __pyx_t_18 = 0; __pyx_t_19 = 0;
+            __pyx_lineno = __pyx_t_6; __pyx_clineno = __pyx_t_12; __pyx_filename = __pyx_t_13;
             goto __pyx_L4_error;
           }
           __pyx_L16:;
         }
       }
 
-      /* "pssh/native/_ssh2.pyx":140
+      /* "pssh/native/_ssh2.pyx":241
  *     cdef int _sock = session._sock
  * 
  *     with nogil:             # <<<<<<<<<<<<<<
- *         local_fh = fopen(_local_file, 'wb')
+ *         local_fh = fopen(_local_file, 'ab' if append else 'wb')
  *         if local_fh is NULL:
  */
       /*finally:*/ {
@@ -3827,111 +5429,34 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
       }
   }
 
-  /* "pssh/native/_ssh2.pyx":162
+  /* "pssh/native/_ssh2.pyx":275
  *             free(cbuf)
  *             fclose(local_fh)
- *     if rc < 0 and rc != LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
- *         raise SFTPHandleError(rc)
+ *     return total             # <<<<<<<<<<<<<<
  * 
- */
-  __pyx_t_7 = ((__pyx_v_rc < 0) != 0);
-  if (__pyx_t_7) {
-  } else {
-    __pyx_t_6 = __pyx_t_7;
-    goto __pyx_L35_bool_binop_done;
-  }
-  __pyx_t_7 = ((__pyx_v_rc != LIBSSH2_ERROR_EAGAIN) != 0);
-  __pyx_t_6 = __pyx_t_7;
-  __pyx_L35_bool_binop_done:;
-  if (unlikely(__pyx_t_6)) {
-
-    /* "pssh/native/_ssh2.pyx":163
- *             fclose(local_fh)
- *     if rc < 0 and rc != LIBSSH2_ERROR_EAGAIN:
- *         raise SFTPHandleError(rc)             # <<<<<<<<<<<<<<
- * 
- * 
- */
-    __pyx_t_16 = __Pyx_GetModuleGlobalName(__pyx_n_s_SFTPHandleError); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 163, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_16);
-    __pyx_t_17 = __Pyx_PyInt_From_int(__pyx_v_rc); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 163, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_17);
-    __pyx_t_18 = NULL;
-    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_16))) {
-      __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_16);
-      if (likely(__pyx_t_18)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_16);
-        __Pyx_INCREF(__pyx_t_18);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_16, function);
-      }
-    }
-    if (!__pyx_t_18) {
-      __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_t_16, __pyx_t_17); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-      __Pyx_GOTREF(__pyx_t_1);
-    } else {
-      #if CYTHON_FAST_PYCALL
-      if (PyFunction_Check(__pyx_t_16)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_18, __pyx_t_17};
-        __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_16, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-      } else
-      #endif
-      #if CYTHON_FAST_PYCCALL
-      if (__Pyx_PyFastCFunction_Check(__pyx_t_16)) {
-        PyObject *__pyx_temp[2] = {__pyx_t_18, __pyx_t_17};
-        __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_16, __pyx_temp+1-1, 1+1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
-        __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-      } else
-      #endif
-      {
-        __pyx_t_19 = PyTuple_New(1+1); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 163, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_19);
-        __Pyx_GIVEREF(__pyx_t_18); PyTuple_SET_ITEM(__pyx_t_19, 0, __pyx_t_18); __pyx_t_18 = NULL;
-        __Pyx_GIVEREF(__pyx_t_17);
-        PyTuple_SET_ITEM(__pyx_t_19, 0+1, __pyx_t_17);
-        __pyx_t_17 = 0;
-        __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_16, __pyx_t_19, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 163, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
-      }
-    }
-    __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 163, __pyx_L1_error)
-
-    /* "pssh/native/_ssh2.pyx":162
- *             free(cbuf)
- *             fclose(local_fh)
- *     if rc < 0 and rc != LIBSSH2_ERROR_EAGAIN:             # <<<<<<<<<<<<<<
- *         raise SFTPHandleError(rc)
  * 
  */
-  }
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_9 = __Pyx_PyInt_From_unsigned_PY_LONG_LONG(__pyx_v_total); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 275, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_r = __pyx_t_9;
+  __pyx_t_9 = 0;
+  goto __pyx_L0;
 
-  /* "pssh/native/_ssh2.pyx":128
+  /* "pssh/native/_ssh2.pyx":211
  * 
  * 
  * def sftp_get(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from local file and writing to SFTP"""
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              bint append=False, progress=None):
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_16);
-  __Pyx_XDECREF(__pyx_t_17);
-  __Pyx_XDECREF(__pyx_t_18);
-  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_11);
   __Pyx_AddTraceback("pssh.native._ssh2.sftp_get", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -3941,7 +5466,7 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_5sftp_get(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "pssh/native/_ssh2.pyx":166
+/* "pssh/native/_ssh2.pyx":278
  * 
  * 
  * cdef int _wait_select(int _socket, LIBSSH2_SESSION *_session,             # <<<<<<<<<<<<<<
@@ -3960,9 +5485,12 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_wait_select", 0);
 
-  /* "pssh/native/_ssh2.pyx":168
+  /* "pssh/native/_ssh2.pyx":280
  * cdef int _wait_select(int _socket, LIBSSH2_SESSION *_session,
  *                       timeout) except -1:
  *     cdef int directions = libssh2_session_block_directions(             # <<<<<<<<<<<<<<
@@ -3971,7 +5499,7 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
  */
   __pyx_v_directions = libssh2_session_block_directions(__pyx_v__session);
 
-  /* "pssh/native/_ssh2.pyx":171
+  /* "pssh/native/_ssh2.pyx":283
  *         _session)
  *     cdef tuple readfds, writefds
  *     if directions == 0:             # <<<<<<<<<<<<<<
@@ -3981,7 +5509,7 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
   __pyx_t_1 = ((__pyx_v_directions == 0) != 0);
   if (__pyx_t_1) {
 
-    /* "pssh/native/_ssh2.pyx":172
+    /* "pssh/native/_ssh2.pyx":284
  *     cdef tuple readfds, writefds
  *     if directions == 0:
  *         return 0             # <<<<<<<<<<<<<<
@@ -3991,7 +5519,7 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
     __pyx_r = 0;
     goto __pyx_L0;
 
-    /* "pssh/native/_ssh2.pyx":171
+    /* "pssh/native/_ssh2.pyx":283
  *         _session)
  *     cdef tuple readfds, writefds
  *     if directions == 0:             # <<<<<<<<<<<<<<
@@ -4000,7 +5528,7 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
  */
   }
 
-  /* "pssh/native/_ssh2.pyx":174
+  /* "pssh/native/_ssh2.pyx":286
  *         return 0
  *     readfds = (_socket,) \
  *         if (directions & LIBSSH2_SESSION_BLOCK_INBOUND) else ()             # <<<<<<<<<<<<<<
@@ -4009,16 +5537,16 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
  */
   if (((__pyx_v_directions & LIBSSH2_SESSION_BLOCK_INBOUND) != 0)) {
 
-    /* "pssh/native/_ssh2.pyx":173
+    /* "pssh/native/_ssh2.pyx":285
  *     if directions == 0:
  *         return 0
  *     readfds = (_socket,) \             # <<<<<<<<<<<<<<
  *         if (directions & LIBSSH2_SESSION_BLOCK_INBOUND) else ()
  *     writefds = (_socket,) \
  */
-    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v__socket); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 173, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v__socket); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 285, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 173, __pyx_L1_error)
+    __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 285, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_GIVEREF(__pyx_t_3);
     PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_t_3);
@@ -4027,7 +5555,7 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
     __pyx_t_4 = 0;
   } else {
 
-    /* "pssh/native/_ssh2.pyx":174
+    /* "pssh/native/_ssh2.pyx":286
  *         return 0
  *     readfds = (_socket,) \
  *         if (directions & LIBSSH2_SESSION_BLOCK_INBOUND) else ()             # <<<<<<<<<<<<<<
@@ -4040,7 +5568,7 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
   __pyx_v_readfds = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "pssh/native/_ssh2.pyx":176
+  /* "pssh/native/_ssh2.pyx":288
  *         if (directions & LIBSSH2_SESSION_BLOCK_INBOUND) else ()
  *     writefds = (_socket,) \
  *         if (directions & LIBSSH2_SESSION_BLOCK_OUTBOUND) else ()             # <<<<<<<<<<<<<<
@@ -4049,16 +5577,16 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
  */
   if (((__pyx_v_directions & LIBSSH2_SESSION_BLOCK_OUTBOUND) != 0)) {
 
-    /* "pssh/native/_ssh2.pyx":175
+    /* "pssh/native/_ssh2.pyx":287
  *     readfds = (_socket,) \
  *         if (directions & LIBSSH2_SESSION_BLOCK_INBOUND) else ()
  *     writefds = (_socket,) \             # <<<<<<<<<<<<<<
  *         if (directions & LIBSSH2_SESSION_BLOCK_OUTBOUND) else ()
  *     select(readfds, writefds, (), timeout=timeout)
  */
-    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v__socket); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 175, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v__socket); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 287, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
+    __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 287, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_GIVEREF(__pyx_t_4);
     PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
@@ -4067,7 +5595,7 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
     __pyx_t_3 = 0;
   } else {
 
-    /* "pssh/native/_ssh2.pyx":176
+    /* "pssh/native/_ssh2.pyx":288
  *         if (directions & LIBSSH2_SESSION_BLOCK_INBOUND) else ()
  *     writefds = (_socket,) \
  *         if (directions & LIBSSH2_SESSION_BLOCK_OUTBOUND) else ()             # <<<<<<<<<<<<<<
@@ -4080,16 +5608,16 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
   __pyx_v_writefds = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "pssh/native/_ssh2.pyx":177
+  /* "pssh/native/_ssh2.pyx":289
  *     writefds = (_socket,) \
  *         if (directions & LIBSSH2_SESSION_BLOCK_OUTBOUND) else ()
  *     select(readfds, writefds, (), timeout=timeout)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_GetModuleGlobalName(__pyx_n_s_select); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_select); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 289, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 289, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(__pyx_v_readfds);
   __Pyx_GIVEREF(__pyx_v_readfds);
@@ -4100,17 +5628,17 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
   __Pyx_INCREF(__pyx_empty_tuple);
   __Pyx_GIVEREF(__pyx_empty_tuple);
   PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_empty_tuple);
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 289, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_timeout, __pyx_v_timeout) < 0) __PYX_ERR(0, 177, __pyx_L1_error)
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 177, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_timeout, __pyx_v_timeout) < 0) __PYX_ERR(0, 289, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 289, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "pssh/native/_ssh2.pyx":166
+  /* "pssh/native/_ssh2.pyx":278
  * 
  * 
  * cdef int _wait_select(int _socket, LIBSSH2_SESSION *_session,             # <<<<<<<<<<<<<<
@@ -4135,7 +5663,7 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
   return __pyx_r;
 }
 
-/* "pssh/native/_ssh2.pyx":180
+/* "pssh/native/_ssh2.pyx":292
  * 
  * 
  * def wait_select(Session session, timeout=None):             # <<<<<<<<<<<<<<
@@ -4146,10 +5674,13 @@ static int __pyx_f_4pssh_6native_5_ssh2__wait_select(int __pyx_v__socket, LIBSSH
 /* Python wrapper */
 static PyObject *__pyx_pw_4pssh_6native_5_ssh2_8wait_select(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
 static char __pyx_doc_4pssh_6native_5_ssh2_7wait_select[] = "wait_select(Session session, timeout=None)";
-static PyMethodDef __pyx_mdef_4pssh_6native_5_ssh2_8wait_select = {"wait_select", (PyCFunction)__pyx_pw_4pssh_6native_5_ssh2_8wait_select, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4pssh_6native_5_ssh2_7wait_select};
+static PyMethodDef __pyx_mdef_4pssh_6native_5_ssh2_8wait_select = {"wait_select", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_4pssh_6native_5_ssh2_8wait_select, METH_VARARGS|METH_KEYWORDS, __pyx_doc_4pssh_6native_5_ssh2_7wait_select};
 static PyObject *__pyx_pw_4pssh_6native_5_ssh2_8wait_select(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   struct __pyx_obj_4ssh2_7session_Session *__pyx_v_session = 0;
   PyObject *__pyx_v_timeout = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("wait_select (wrapper)", 0);
@@ -4181,7 +5712,7 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_8wait_select(PyObject *__pyx_self
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "wait_select") < 0)) __PYX_ERR(0, 180, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "wait_select") < 0)) __PYX_ERR(0, 292, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -4197,13 +5728,13 @@ static PyObject *__pyx_pw_4pssh_6native_5_ssh2_8wait_select(PyObject *__pyx_self
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("wait_select", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 180, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("wait_select", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 292, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("pssh.native._ssh2.wait_select", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_session), __pyx_ptype_4ssh2_7session_Session, 1, "session", 0))) __PYX_ERR(0, 180, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_session), __pyx_ptype_4ssh2_7session_Session, 1, "session", 0))) __PYX_ERR(0, 292, __pyx_L1_error)
   __pyx_r = __pyx_pf_4pssh_6native_5_ssh2_7wait_select(__pyx_self, __pyx_v_session, __pyx_v_timeout);
 
   /* function exit code */
@@ -4222,9 +5753,12 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_7wait_select(CYTHON_UNUSED PyObje
   __Pyx_RefNannyDeclarations
   LIBSSH2_SESSION *__pyx_t_1;
   int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("wait_select", 0);
 
-  /* "pssh/native/_ssh2.pyx":181
+  /* "pssh/native/_ssh2.pyx":293
  * 
  * def wait_select(Session session, timeout=None):
  *     cdef LIBSSH2_SESSION *_session = session._session             # <<<<<<<<<<<<<<
@@ -4234,7 +5768,7 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_7wait_select(CYTHON_UNUSED PyObje
   __pyx_t_1 = __pyx_v_session->_session;
   __pyx_v__session = __pyx_t_1;
 
-  /* "pssh/native/_ssh2.pyx":182
+  /* "pssh/native/_ssh2.pyx":294
  * def wait_select(Session session, timeout=None):
  *     cdef LIBSSH2_SESSION *_session = session._session
  *     cdef int _sock = session._sock             # <<<<<<<<<<<<<<
@@ -4243,14 +5777,14 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_7wait_select(CYTHON_UNUSED PyObje
   __pyx_t_2 = __pyx_v_session->_sock;
   __pyx_v__sock = __pyx_t_2;
 
-  /* "pssh/native/_ssh2.pyx":183
+  /* "pssh/native/_ssh2.pyx":295
  *     cdef LIBSSH2_SESSION *_session = session._session
  *     cdef int _sock = session._sock
  *     _wait_select(_sock, _session, timeout)             # <<<<<<<<<<<<<<
  */
-  __pyx_t_2 = __pyx_f_4pssh_6native_5_ssh2__wait_select(__pyx_v__sock, __pyx_v__session, __pyx_v_timeout); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 183, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_4pssh_6native_5_ssh2__wait_select(__pyx_v__sock, __pyx_v__session, __pyx_v_timeout); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 295, __pyx_L1_error)
 
-  /* "pssh/native/_ssh2.pyx":180
+  /* "pssh/native/_ssh2.pyx":292
  * 
  * 
  * def wait_select(Session session, timeout=None):             # <<<<<<<<<<<<<<
@@ -4269,6 +5803,120 @@ static PyObject *__pyx_pf_4pssh_6native_5_ssh2_7wait_select(CYTHON_UNUSED PyObje
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+static struct __pyx_vtabstruct_4pssh_6native_5_ssh2__LineBuffer __pyx_vtable_4pssh_6native_5_ssh2__LineBuffer;
+
+static PyObject *__pyx_tp_new_4pssh_6native_5_ssh2__LineBuffer(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *)o);
+  p->__pyx_vtab = __pyx_vtabptr_4pssh_6native_5_ssh2__LineBuffer;
+  if (unlikely(__pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_4pssh_6native_5_ssh2__LineBuffer(PyObject *o) {
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && (!PyType_IS_GC(Py_TYPE(o)) || !__Pyx_PyObject_GC_IsFinalized(o))) {
+    if (PyObject_CallFinalizerFromDealloc(o)) return;
+  }
+  #endif
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  (*Py_TYPE(o)->tp_free)(o);
+}
+
+static PyMethodDef __pyx_methods_4pssh_6native_5_ssh2__LineBuffer[] = {
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_5__reduce_cython__, METH_NOARGS, __pyx_doc_4pssh_6native_5_ssh2_11_LineBuffer_4__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_4pssh_6native_5_ssh2_11_LineBuffer_7__setstate_cython__, METH_O, __pyx_doc_4pssh_6native_5_ssh2_11_LineBuffer_6__setstate_cython__},
+  {0, 0, 0, 0}
+};
+
+static PyTypeObject __pyx_type_4pssh_6native_5_ssh2__LineBuffer = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "pssh.native._ssh2._LineBuffer", /*tp_name*/
+  sizeof(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_4pssh_6native_5_ssh2__LineBuffer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+  "Growable buffer for partial lines spanning more than one chunk", /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_4pssh_6native_5_ssh2__LineBuffer, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  0, /*tp_dictoffset*/
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_4pssh_6native_5_ssh2__LineBuffer, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  0, /*tp_finalize*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
 
 static struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output *__pyx_freelist_4pssh_6native_5_ssh2___pyx_scope_struct___read_output[8];
 static int __pyx_freecount_4pssh_6native_5_ssh2___pyx_scope_struct___read_output = 0;
@@ -4308,6 +5956,9 @@ static int __pyx_tp_traverse_4pssh_6native_5_ssh2___pyx_scope_struct___read_outp
   if (p->__pyx_v_read_func) {
     e = (*v)(p->__pyx_v_read_func, a); if (e) return e;
   }
+  if (p->__pyx_v_remainder) {
+    e = (*v)(((PyObject *)p->__pyx_v_remainder), a); if (e) return e;
+  }
   if (p->__pyx_v_session) {
     e = (*v)(((PyObject *)p->__pyx_v_session), a); if (e) return e;
   }
@@ -4323,7 +5974,12 @@ static PyTypeObject __pyx_type_4pssh_6native_5_ssh2___pyx_scope_struct___read_ou
   sizeof(struct __pyx_obj_4pssh_6native_5_ssh2___pyx_scope_struct___read_output), /*tp_basicsize*/
   0, /*tp_itemsize*/
   __pyx_tp_dealloc_4pssh_6native_5_ssh2___pyx_scope_struct___read_output, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
   0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   #if PY_MAJOR_VERSION < 3
@@ -4373,6 +6029,15 @@ static PyTypeObject __pyx_type_4pssh_6native_5_ssh2___pyx_scope_struct___read_ou
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+  0, /*tp_print*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
 static PyMethodDef __pyx_methods[] = {
@@ -4410,120 +6075,159 @@ static struct PyModuleDef __pyx_moduledef = {
     NULL /* m_free */
 };
 #endif
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
 
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
+  {&__pyx_kp_s_Error_reading_from_local_file_s, __pyx_k_Error_reading_from_local_file_s, sizeof(__pyx_k_Error_reading_from_local_file_s), 0, 0, 1, 0},
   {&__pyx_n_s_IOError, __pyx_k_IOError, sizeof(__pyx_k_IOError), 0, 0, 1, 1},
+  {&__pyx_n_s_LineBuffer, __pyx_k_LineBuffer, sizeof(__pyx_k_LineBuffer), 0, 0, 1, 1},
   {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
-  {&__pyx_n_s_OSError, __pyx_k_OSError, sizeof(__pyx_k_OSError), 0, 0, 1, 1},
-  {&__pyx_n_s_SFTPHandleError, __pyx_k_SFTPHandleError, sizeof(__pyx_k_SFTPHandleError), 0, 0, 1, 1},
   {&__pyx_n_s_SessionError, __pyx_k_SessionError, sizeof(__pyx_k_SessionError), 0, 0, 1, 1},
   {&__pyx_n_s_Timeout, __pyx_k_Timeout, sizeof(__pyx_k_Timeout), 0, 0, 1, 1},
-  {&__pyx_kp_b__2, __pyx_k__2, sizeof(__pyx_k__2), 0, 0, 0, 0},
-  {&__pyx_kp_b__5, __pyx_k__5, sizeof(__pyx_k__5), 0, 0, 0, 0},
+  {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_append, __pyx_k_append, sizeof(__pyx_k_append), 0, 0, 1, 1},
   {&__pyx_n_s_args, __pyx_k_args, sizeof(__pyx_k_args), 0, 0, 1, 1},
   {&__pyx_n_s_b_local_file, __pyx_k_b_local_file, sizeof(__pyx_k_b_local_file), 0, 0, 1, 1},
   {&__pyx_n_s_buffer_maxlen, __pyx_k_buffer_maxlen, sizeof(__pyx_k_buffer_maxlen), 0, 0, 1, 1},
   {&__pyx_n_s_cbuf, __pyx_k_cbuf, sizeof(__pyx_k_cbuf), 0, 0, 1, 1},
+  {&__pyx_n_s_chunks, __pyx_k_chunks, sizeof(__pyx_k_chunks), 0, 0, 1, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
   {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+  {&__pyx_n_s_end, __pyx_k_end, sizeof(__pyx_k_end), 0, 0, 1, 1},
+  {&__pyx_n_s_errno, __pyx_k_errno, sizeof(__pyx_k_errno), 0, 0, 1, 1},
   {&__pyx_n_s_exceptions, __pyx_k_exceptions, sizeof(__pyx_k_exceptions), 0, 0, 1, 1},
-  {&__pyx_n_s_find, __pyx_k_find, sizeof(__pyx_k_find), 0, 0, 1, 1},
+  {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
   {&__pyx_n_s_gevent_select, __pyx_k_gevent_select, sizeof(__pyx_k_gevent_select), 0, 0, 1, 1},
   {&__pyx_n_s_handle, __pyx_k_handle, sizeof(__pyx_k_handle), 0, 0, 1, 1},
   {&__pyx_n_s_handle_2, __pyx_k_handle_2, sizeof(__pyx_k_handle_2), 0, 0, 1, 1},
+  {&__pyx_n_s_has_progress, __pyx_k_has_progress, sizeof(__pyx_k_has_progress), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_linesep, __pyx_k_linesep, sizeof(__pyx_k_linesep), 0, 0, 1, 1},
   {&__pyx_n_s_local_fh, __pyx_k_local_fh, sizeof(__pyx_k_local_fh), 0, 0, 1, 1},
   {&__pyx_n_s_local_file, __pyx_k_local_file, sizeof(__pyx_k_local_file), 0, 0, 1, 1},
   {&__pyx_n_s_local_file_2, __pyx_k_local_file_2, sizeof(__pyx_k_local_file_2), 0, 0, 1, 1},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
   {&__pyx_n_s_nread, __pyx_k_nread, sizeof(__pyx_k_nread), 0, 0, 1, 1},
   {&__pyx_n_s_pos, __pyx_k_pos, sizeof(__pyx_k_pos), 0, 0, 1, 1},
+  {&__pyx_n_s_progress, __pyx_k_progress, sizeof(__pyx_k_progress), 0, 0, 1, 1},
   {&__pyx_n_s_pssh_native__ssh2, __pyx_k_pssh_native__ssh2, sizeof(__pyx_k_pssh_native__ssh2), 0, 0, 1, 1},
   {&__pyx_kp_s_pssh_native__ssh2_pyx, __pyx_k_pssh_native__ssh2_pyx, sizeof(__pyx_k_pssh_native__ssh2_pyx), 0, 0, 1, 0},
   {&__pyx_n_s_ptr, __pyx_k_ptr, sizeof(__pyx_k_ptr), 0, 0, 1, 1},
+  {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
   {&__pyx_n_s_rc, __pyx_k_rc, sizeof(__pyx_k_rc), 0, 0, 1, 1},
   {&__pyx_n_s_read_func, __pyx_k_read_func, sizeof(__pyx_k_read_func), 0, 0, 1, 1},
   {&__pyx_n_s_read_output, __pyx_k_read_output, sizeof(__pyx_k_read_output), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+  {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
   {&__pyx_n_s_remainder, __pyx_k_remainder, sizeof(__pyx_k_remainder), 0, 0, 1, 1},
-  {&__pyx_n_s_remainder_len, __pyx_k_remainder_len, sizeof(__pyx_k_remainder_len), 0, 0, 1, 1},
-  {&__pyx_n_s_rstrip, __pyx_k_rstrip, sizeof(__pyx_k_rstrip), 0, 0, 1, 1},
   {&__pyx_n_s_select, __pyx_k_select, sizeof(__pyx_k_select), 0, 0, 1, 1},
   {&__pyx_n_s_send, __pyx_k_send, sizeof(__pyx_k_send), 0, 0, 1, 1},
   {&__pyx_n_s_session, __pyx_k_session, sizeof(__pyx_k_session), 0, 0, 1, 1},
   {&__pyx_n_s_session_2, __pyx_k_session_2, sizeof(__pyx_k_session_2), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+  {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
   {&__pyx_n_s_sftp_get, __pyx_k_sftp_get, sizeof(__pyx_k_sftp_get), 0, 0, 1, 1},
   {&__pyx_n_s_sftp_put, __pyx_k_sftp_put, sizeof(__pyx_k_sftp_put), 0, 0, 1, 1},
   {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
   {&__pyx_n_s_sock, __pyx_k_sock, sizeof(__pyx_k_sock), 0, 0, 1, 1},
-  {&__pyx_n_s_ssh2_exceptions, __pyx_k_ssh2_exceptions, sizeof(__pyx_k_ssh2_exceptions), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_throw, __pyx_k_throw, sizeof(__pyx_k_throw), 0, 0, 1, 1},
   {&__pyx_n_s_timeout, __pyx_k_timeout, sizeof(__pyx_k_timeout), 0, 0, 1, 1},
+  {&__pyx_n_s_total, __pyx_k_total, sizeof(__pyx_k_total), 0, 0, 1, 1},
   {&__pyx_n_s_wait_select, __pyx_k_wait_select, sizeof(__pyx_k_wait_select), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_OSError = __Pyx_GetBuiltinName(__pyx_n_s_OSError); if (!__pyx_builtin_OSError) __PYX_ERR(0, 98, __pyx_L1_error)
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 102, __pyx_L1_error)
-  __pyx_builtin_IOError = __Pyx_GetBuiltinName(__pyx_n_s_IOError); if (!__pyx_builtin_IOError) __PYX_ERR(0, 107, __pyx_L1_error)
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 66, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_builtin_IOError = __Pyx_GetBuiltinName(__pyx_n_s_IOError); if (!__pyx_builtin_IOError) __PYX_ERR(0, 174, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
 }
 
-static int __Pyx_InitCachedConstants(void) {
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "pssh/native/_ssh2.pyx":42
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple_)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
+  /* "pssh/native/_ssh2.pyx":94
  * 
  * 
- * def _read_output(Session session, read_func, timeout=None):             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t _size
- *     cdef bytes _data
+ * def _read_output(Session session, read_func, timeout=None, bint chunks=False):             # <<<<<<<<<<<<<<
+ *     """Read output from ``read_func`` until EOF and yield lines of output
+ *     with trailing whitespace stripped.
  */
-  __pyx_tuple__6 = PyTuple_Pack(11, __pyx_n_s_session, __pyx_n_s_read_func, __pyx_n_s_timeout, __pyx_n_s_size, __pyx_n_s_data, __pyx_n_s_remainder, __pyx_n_s_remainder_len, __pyx_n_s_session_2, __pyx_n_s_sock, __pyx_n_s_pos, __pyx_n_s_linesep); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(12, __pyx_n_s_session, __pyx_n_s_read_func, __pyx_n_s_timeout, __pyx_n_s_chunks, __pyx_n_s_size, __pyx_n_s_data, __pyx_n_s_remainder, __pyx_n_s_session_2, __pyx_n_s_sock, __pyx_n_s_pos, __pyx_n_s_end, __pyx_n_s_linesep); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 94, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
-  __pyx_codeobj_ = (PyObject*)__Pyx_PyCode_New(3, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pssh_native__ssh2_pyx, __pyx_n_s_read_output, 42, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj_)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_codeobj__3 = (PyObject*)__Pyx_PyCode_New(4, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__6, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pssh_native__ssh2_pyx, __pyx_n_s_read_output, 94, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__3)) __PYX_ERR(0, 94, __pyx_L1_error)
 
-  /* "pssh/native/_ssh2.pyx":80
+  /* "pssh/native/_ssh2.pyx":143
  * 
  * 
  * def sftp_put(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from SFTP and writing to local file"""
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              progress=None):
  */
-  __pyx_tuple__7 = PyTuple_Pack(14, __pyx_n_s_session, __pyx_n_s_handle, __pyx_n_s_local_file, __pyx_n_s_buffer_maxlen, __pyx_n_s_b_local_file, __pyx_n_s_local_file_2, __pyx_n_s_local_fh, __pyx_n_s_rc, __pyx_n_s_nread, __pyx_n_s_cbuf, __pyx_n_s_ptr, __pyx_n_s_handle_2, __pyx_n_s_session_2, __pyx_n_s_sock); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_tuple__7 = PyTuple_Pack(18, __pyx_n_s_session, __pyx_n_s_handle, __pyx_n_s_local_file, __pyx_n_s_buffer_maxlen, __pyx_n_s_progress, __pyx_n_s_b_local_file, __pyx_n_s_local_file_2, __pyx_n_s_local_fh, __pyx_n_s_rc, __pyx_n_s_nread, __pyx_n_s_total, __pyx_n_s_has_progress, __pyx_n_s_errno, __pyx_n_s_cbuf, __pyx_n_s_ptr, __pyx_n_s_handle_2, __pyx_n_s_session_2, __pyx_n_s_sock); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 143, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__7);
   __Pyx_GIVEREF(__pyx_tuple__7);
-  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(4, 0, 14, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pssh_native__ssh2_pyx, __pyx_n_s_sftp_put, 80, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 80, __pyx_L1_error)
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(5, 0, 18, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pssh_native__ssh2_pyx, __pyx_n_s_sftp_put, 143, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) __PYX_ERR(0, 143, __pyx_L1_error)
 
-  /* "pssh/native/_ssh2.pyx":128
+  /* "pssh/native/_ssh2.pyx":211
  * 
  * 
  * def sftp_get(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from local file and writing to SFTP"""
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              bint append=False, progress=None):
  */
-  __pyx_tuple__9 = PyTuple_Pack(12, __pyx_n_s_session, __pyx_n_s_handle, __pyx_n_s_local_file, __pyx_n_s_buffer_maxlen, __pyx_n_s_b_local_file, __pyx_n_s_local_file_2, __pyx_n_s_local_fh, __pyx_n_s_rc, __pyx_n_s_cbuf, __pyx_n_s_handle_2, __pyx_n_s_session_2, __pyx_n_s_sock); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_tuple__9 = PyTuple_Pack(17, __pyx_n_s_session, __pyx_n_s_handle, __pyx_n_s_local_file, __pyx_n_s_buffer_maxlen, __pyx_n_s_append, __pyx_n_s_progress, __pyx_n_s_b_local_file, __pyx_n_s_local_file_2, __pyx_n_s_local_fh, __pyx_n_s_rc, __pyx_n_s_total, __pyx_n_s_has_progress, __pyx_n_s_errno, __pyx_n_s_cbuf, __pyx_n_s_handle_2, __pyx_n_s_session_2, __pyx_n_s_sock); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 211, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
-  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(4, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pssh_native__ssh2_pyx, __pyx_n_s_sftp_get, 128, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(6, 0, 17, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pssh_native__ssh2_pyx, __pyx_n_s_sftp_get, 211, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) __PYX_ERR(0, 211, __pyx_L1_error)
 
-  /* "pssh/native/_ssh2.pyx":180
+  /* "pssh/native/_ssh2.pyx":292
  * 
  * 
  * def wait_select(Session session, timeout=None):             # <<<<<<<<<<<<<<
  *     cdef LIBSSH2_SESSION *_session = session._session
  *     cdef int _sock = session._sock
  */
-  __pyx_tuple__11 = PyTuple_Pack(4, __pyx_n_s_session, __pyx_n_s_timeout, __pyx_n_s_session_2, __pyx_n_s_sock); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __pyx_tuple__11 = PyTuple_Pack(4, __pyx_n_s_session, __pyx_n_s_timeout, __pyx_n_s_session_2, __pyx_n_s_sock); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 292, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__11);
   __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pssh_native__ssh2_pyx, __pyx_n_s_wait_select, 180, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_pssh_native__ssh2_pyx, __pyx_n_s_wait_select, 292, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 292, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -4531,26 +6235,25 @@ static int __Pyx_InitCachedConstants(void) {
   return -1;
 }
 
-static int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
 }
 
-static int __Pyx_modinit_global_init_code(void); /*proto*/
-static int __Pyx_modinit_variable_export_code(void); /*proto*/
-static int __Pyx_modinit_function_export_code(void); /*proto*/
-static int __Pyx_modinit_type_init_code(void); /*proto*/
-static int __Pyx_modinit_type_import_code(void); /*proto*/
-static int __Pyx_modinit_variable_import_code(void); /*proto*/
-static int __Pyx_modinit_function_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
 
 static int __Pyx_modinit_global_init_code(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
   /*--- Global init code ---*/
-  __pyx_v_4pssh_6native_5_ssh2_LINESEP = ((PyObject*)Py_None); Py_INCREF(Py_None);
   __Pyx_RefNannyFinishContext();
   return 0;
 }
@@ -4573,10 +6276,29 @@ static int __Pyx_modinit_function_export_code(void) {
 
 static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
-  if (PyType_Ready(&__pyx_type_4pssh_6native_5_ssh2___pyx_scope_struct___read_output) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_vtabptr_4pssh_6native_5_ssh2__LineBuffer = &__pyx_vtable_4pssh_6native_5_ssh2__LineBuffer;
+  __pyx_vtable_4pssh_6native_5_ssh2__LineBuffer.append = (int (*)(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *, char const *, Py_ssize_t))__pyx_f_4pssh_6native_5_ssh2_11_LineBuffer_append;
+  __pyx_vtable_4pssh_6native_5_ssh2__LineBuffer.pop = (PyObject *(*)(struct __pyx_obj_4pssh_6native_5_ssh2__LineBuffer *, struct __pyx_opt_args_4pssh_6native_5_ssh2_11_LineBuffer_pop *__pyx_optional_args))__pyx_f_4pssh_6native_5_ssh2_11_LineBuffer_pop;
+  if (PyType_Ready(&__pyx_type_4pssh_6native_5_ssh2__LineBuffer) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
+  __pyx_type_4pssh_6native_5_ssh2__LineBuffer.tp_print = 0;
+  #endif
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_4pssh_6native_5_ssh2__LineBuffer.tp_dictoffset && __pyx_type_4pssh_6native_5_ssh2__LineBuffer.tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_type_4pssh_6native_5_ssh2__LineBuffer.tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  if (__Pyx_SetVtable(__pyx_type_4pssh_6native_5_ssh2__LineBuffer.tp_dict, __pyx_vtabptr_4pssh_6native_5_ssh2__LineBuffer) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_LineBuffer, (PyObject *)&__pyx_type_4pssh_6native_5_ssh2__LineBuffer) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_4pssh_6native_5_ssh2__LineBuffer) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
+  __pyx_ptype_4pssh_6native_5_ssh2__LineBuffer = &__pyx_type_4pssh_6native_5_ssh2__LineBuffer;
+  if (PyType_Ready(&__pyx_type_4pssh_6native_5_ssh2___pyx_scope_struct___read_output) < 0) __PYX_ERR(0, 94, __pyx_L1_error)
+  #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_4pssh_6native_5_ssh2___pyx_scope_struct___read_output.tp_print = 0;
+  #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_4pssh_6native_5_ssh2___pyx_scope_struct___read_output.tp_dictoffset && __pyx_type_4pssh_6native_5_ssh2___pyx_scope_struct___read_output.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_4pssh_6native_5_ssh2___pyx_scope_struct___read_output.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
   }
@@ -4590,16 +6312,42 @@ static int __Pyx_modinit_type_init_code(void) {
 
 static int __Pyx_modinit_type_import_code(void) {
   __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
   /*--- Type import code ---*/
-  __pyx_ptype_4ssh2_7session_Session = __Pyx_ImportType("ssh2.session", "Session", sizeof(struct __pyx_obj_4ssh2_7session_Session), 1); if (unlikely(!__pyx_ptype_4ssh2_7session_Session)) __PYX_ERR(1, 19, __pyx_L1_error)
-  __pyx_ptype_4ssh2_4sftp_SFTP = __Pyx_ImportType("ssh2.sftp", "SFTP", sizeof(struct __pyx_obj_4ssh2_4sftp_SFTP), 1); if (unlikely(!__pyx_ptype_4ssh2_4sftp_SFTP)) __PYX_ERR(2, 26, __pyx_L1_error)
-  __pyx_ptype_4ssh2_11sftp_handle_SFTPHandle = __Pyx_ImportType("ssh2.sftp_handle", "SFTPHandle", sizeof(struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle), 1); if (unlikely(!__pyx_ptype_4ssh2_11sftp_handle_SFTPHandle)) __PYX_ERR(3, 25, __pyx_L1_error)
-  __pyx_ptype_4ssh2_11sftp_handle_SFTPAttributes = __Pyx_ImportType("ssh2.sftp_handle", "SFTPAttributes", sizeof(struct __pyx_obj_4ssh2_11sftp_handle_SFTPAttributes), 1); if (unlikely(!__pyx_ptype_4ssh2_11sftp_handle_SFTPAttributes)) __PYX_ERR(3, 31, __pyx_L1_error)
-  __pyx_ptype_4ssh2_11sftp_handle_SFTPStatVFS = __Pyx_ImportType("ssh2.sftp_handle", "SFTPStatVFS", sizeof(struct __pyx_obj_4ssh2_11sftp_handle_SFTPStatVFS), 1); if (unlikely(!__pyx_ptype_4ssh2_11sftp_handle_SFTPStatVFS)) __PYX_ERR(3, 35, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("ssh2.session"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 20, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_4ssh2_7session_Session = __Pyx_ImportType_0_29_37(__pyx_t_1, "ssh2.session", "Session", sizeof(struct __pyx_obj_4ssh2_7session_Session), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4ssh2_7session_Session),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4ssh2_7session_Session) __PYX_ERR(3, 20, __pyx_L1_error)
+  __pyx_ptype_4ssh2_7session_MethodType = __Pyx_ImportType_0_29_37(__pyx_t_1, "ssh2.session", "MethodType", sizeof(struct __pyx_obj_4ssh2_7session_MethodType), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4ssh2_7session_MethodType),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4ssh2_7session_MethodType) __PYX_ERR(3, 27, __pyx_L1_error)
+  __pyx_ptype_4ssh2_7session_FlagType = __Pyx_ImportType_0_29_37(__pyx_t_1, "ssh2.session", "FlagType", sizeof(struct __pyx_obj_4ssh2_7session_FlagType), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4ssh2_7session_FlagType),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4ssh2_7session_FlagType) __PYX_ERR(3, 31, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("ssh2.sftp"); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_4ssh2_4sftp_SFTP = __Pyx_ImportType_0_29_37(__pyx_t_1, "ssh2.sftp", "SFTP", sizeof(struct __pyx_obj_4ssh2_4sftp_SFTP), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4ssh2_4sftp_SFTP),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4ssh2_4sftp_SFTP) __PYX_ERR(4, 27, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("ssh2.sftp_handle"); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 26, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_4ssh2_11sftp_handle_SFTPHandle = __Pyx_ImportType_0_29_37(__pyx_t_1, "ssh2.sftp_handle", "SFTPHandle", sizeof(struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4ssh2_11sftp_handle_SFTPHandle),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4ssh2_11sftp_handle_SFTPHandle) __PYX_ERR(5, 26, __pyx_L1_error)
+  __pyx_ptype_4ssh2_11sftp_handle_SFTPAttributes = __Pyx_ImportType_0_29_37(__pyx_t_1, "ssh2.sftp_handle", "SFTPAttributes", sizeof(struct __pyx_obj_4ssh2_11sftp_handle_SFTPAttributes), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4ssh2_11sftp_handle_SFTPAttributes),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4ssh2_11sftp_handle_SFTPAttributes) __PYX_ERR(5, 32, __pyx_L1_error)
+  __pyx_ptype_4ssh2_11sftp_handle_SFTPStatVFS = __Pyx_ImportType_0_29_37(__pyx_t_1, "ssh2.sftp_handle", "SFTPStatVFS", sizeof(struct __pyx_obj_4ssh2_11sftp_handle_SFTPStatVFS), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(struct __pyx_obj_4ssh2_11sftp_handle_SFTPStatVFS),__Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_4ssh2_11sftp_handle_SFTPStatVFS) __PYX_ERR(5, 36, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_RefNannyFinishContext();
   return -1;
 }
@@ -4615,11 +6363,16 @@ static int __Pyx_modinit_variable_import_code(void) {
 static int __Pyx_modinit_function_import_code(void) {
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
   /*--- Function import code ---*/
-  __pyx_t_1 = __Pyx_ImportModule("ssh2.utils"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (__Pyx_ImportFunction(__pyx_t_1, "to_bytes", (void (**)(void))&__pyx_f_4ssh2_5utils_to_bytes, "PyObject *(PyObject *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("ssh2.utils"); if (!__pyx_t_1) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "to_bytes", (void (**)(void))&__pyx_f_4ssh2_5utils_to_bytes, "PyObject *(PyObject *)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_ImportFunction_0_29_37(__pyx_t_1, "handle_error_codes", (void (**)(void))&__pyx_f_4ssh2_5utils_handle_error_codes, "int (int, int __pyx_skip_dispatch)") < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -4629,26 +6382,19 @@ static int __Pyx_modinit_function_import_code(void) {
 }
 
 
-#if PY_MAJOR_VERSION < 3
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC void
-#else
+#ifndef CYTHON_NO_PYINIT_EXPORT
 #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#endif
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
 #else
-#ifdef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC PyObject *
-#else
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#endif
+#define __Pyx_PyMODINIT_FUNC void
 #endif
-#ifndef CYTHON_SMALL_CODE
-#if defined(__clang__)
-    #define CYTHON_SMALL_CODE
-#elif defined(__GNUC__) && (!(defined(__cplusplus)) || (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ > 4)))
-    #define CYTHON_SMALL_CODE __attribute__((optimize("Os")))
 #else
-    #define CYTHON_SMALL_CODE
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
 #endif
 #endif
 
@@ -4663,11 +6409,36 @@ __Pyx_PyMODINIT_FUNC PyInit__ssh2(void)
 {
   return PyModuleDef_Init(&__pyx_moduledef);
 }
-static int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name) {
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none) {
     PyObject *value = PyObject_GetAttrString(spec, from_name);
     int result = 0;
     if (likely(value)) {
-        result = PyDict_SetItemString(moddict, to_name, value);
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
         Py_DECREF(value);
     } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Clear();
@@ -4676,8 +6447,10 @@ static int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const ch
     }
     return result;
 }
-static PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *def) {
     PyObject *module = NULL, *moddict, *modname;
+    if (__Pyx_check_single_interpreter())
+        return NULL;
     if (__pyx_m)
         return __Pyx_NewRef(__pyx_m);
     modname = PyObject_GetAttrString(spec, "name");
@@ -4687,10 +6460,10 @@ static PyObject* __pyx_pymod_create(PyObject *spec, CYTHON_UNUSED PyModuleDef *d
     if (unlikely(!module)) goto bad;
     moddict = PyModule_GetDict(module);
     if (unlikely(!moddict)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__") < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__") < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
     return module;
 bad:
     Py_XDECREF(module);
@@ -4698,15 +6471,22 @@ bad:
 }
 
 
-static int __pyx_pymod_exec__ssh2(PyObject *__pyx_pyinit_module)
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__ssh2(PyObject *__pyx_pyinit_module)
 #endif
 #endif
 {
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannyDeclarations
   #if CYTHON_PEP489_MULTI_PHASE_INIT
-  if (__pyx_m && __pyx_m == __pyx_pyinit_module) return 0;
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_ssh2' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
   #elif PY_MAJOR_VERSION >= 3
   if (__pyx_m) return __Pyx_NewRef(__pyx_m);
   #endif
@@ -4721,6 +6501,9 @@ if (!__Pyx_RefNanny) {
 #endif
   __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__ssh2(void)", 0);
   if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
   __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
@@ -4744,11 +6527,9 @@ if (!__Pyx_RefNanny) {
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
   PyEval_InitThreads();
   #endif
-  #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __pyx_m = __pyx_pyinit_module;
@@ -4764,18 +6545,17 @@ if (!__Pyx_RefNanny) {
   __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_d);
   __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #if CYTHON_COMPILING_IN_PYPY
   Py_INCREF(__pyx_b);
-  #endif
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_cython_runtime);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Initialize various global constants etc. ---*/
   if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
   if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   if (__pyx_module_is_main_pssh__native___ssh2) {
-    if (PyObject_SetAttrString(__pyx_m, "__name__", __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   }
   #if PY_MAJOR_VERSION >= 3
   {
@@ -4793,172 +6573,148 @@ if (!__Pyx_RefNanny) {
   (void)__Pyx_modinit_global_init_code();
   (void)__Pyx_modinit_variable_export_code();
   (void)__Pyx_modinit_function_export_code();
-  if (unlikely(__Pyx_modinit_type_init_code() != 0)) goto __pyx_L1_error;
-  if (unlikely(__Pyx_modinit_type_import_code() != 0)) goto __pyx_L1_error;
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
   (void)__Pyx_modinit_variable_import_code();
-  if (unlikely(__Pyx_modinit_function_import_code() != 0)) goto __pyx_L1_error;
+  if (unlikely(__Pyx_modinit_function_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Execution code ---*/
   #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
   if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
-  /* "pssh/native/_ssh2.pyx":23
- * from libc.stdio cimport fopen, fclose, fwrite, fread, FILE
+  /* "pssh/native/_ssh2.pyx":27
+ * from cpython.bytes cimport PyBytes_FromStringAndSize
  * 
  * from gevent.select import select             # <<<<<<<<<<<<<<
  * 
  * from ssh2.c_ssh2 cimport LIBSSH2_CHANNEL, LIBSSH2_SESSION_BLOCK_INBOUND, \
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_select);
   __Pyx_GIVEREF(__pyx_n_s_select);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_select);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_gevent_select, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_select); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_select, __pyx_t_1) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-  /* "pssh/native/_ssh2.pyx":33
- * from ssh2.session cimport Session
- * from ssh2.sftp_handle cimport SFTPHandle
- * from ssh2.exceptions import SFTPHandleError             # <<<<<<<<<<<<<<
- * from ssh2.utils cimport to_bytes
- * 
- */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 33, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_n_s_SFTPHandleError);
-  __Pyx_GIVEREF(__pyx_n_s_SFTPHandleError);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_SFTPHandleError);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_ssh2_exceptions, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 33, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_SFTPHandleError); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 33, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_gevent_select, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 27, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_SFTPHandleError, __pyx_t_2) < 0) __PYX_ERR(0, 33, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_select); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_select, __pyx_t_1) < 0) __PYX_ERR(0, 27, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "pssh/native/_ssh2.pyx":36
- * from ssh2.utils cimport to_bytes
+  /* "pssh/native/_ssh2.pyx":39
+ * from ssh2.utils cimport to_bytes, handle_error_codes
  * 
  * from ..exceptions import SessionError, Timeout             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(__pyx_n_s_SessionError);
   __Pyx_GIVEREF(__pyx_n_s_SessionError);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_SessionError);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_SessionError);
   __Pyx_INCREF(__pyx_n_s_Timeout);
   __Pyx_GIVEREF(__pyx_n_s_Timeout);
-  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_Timeout);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_exceptions, __pyx_t_1, 2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 36, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_SessionError); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_SessionError, __pyx_t_1) < 0) __PYX_ERR(0, 36, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_Timeout); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L1_error)
+  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_Timeout);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_exceptions, __pyx_t_2, 2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Timeout, __pyx_t_1) < 0) __PYX_ERR(0, 36, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_SessionError); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_SessionError, __pyx_t_2) < 0) __PYX_ERR(0, 39, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_Timeout); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 39, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Timeout, __pyx_t_2) < 0) __PYX_ERR(0, 39, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pssh/native/_ssh2.pyx":39
+  /* "pssh/native/_ssh2.pyx":42
  * 
  * 
- * cdef bytes LINESEP = b'\n'             # <<<<<<<<<<<<<<
+ * cdef Py_ssize_t _MIN_BUFFER_SIZE = 1024             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __Pyx_INCREF(__pyx_kp_b__5);
-  __Pyx_XGOTREF(__pyx_v_4pssh_6native_5_ssh2_LINESEP);
-  __Pyx_DECREF_SET(__pyx_v_4pssh_6native_5_ssh2_LINESEP, __pyx_kp_b__5);
-  __Pyx_GIVEREF(__pyx_kp_b__5);
+  __pyx_v_4pssh_6native_5_ssh2__MIN_BUFFER_SIZE = 0x400;
 
-  /* "pssh/native/_ssh2.pyx":42
+  /* "pssh/native/_ssh2.pyx":94
  * 
  * 
- * def _read_output(Session session, read_func, timeout=None):             # <<<<<<<<<<<<<<
- *     cdef Py_ssize_t _size
- *     cdef bytes _data
+ * def _read_output(Session session, read_func, timeout=None, bint chunks=False):             # <<<<<<<<<<<<<<
+ *     """Read output from ``read_func`` until EOF and yield lines of output
+ *     with trailing whitespace stripped.
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_4pssh_6native_5_ssh2_1_read_output, NULL, __pyx_n_s_pssh_native__ssh2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_read_output, __pyx_t_2) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4pssh_6native_5_ssh2_1_read_output, NULL, __pyx_n_s_pssh_native__ssh2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_read_output, __pyx_t_1) < 0) __PYX_ERR(0, 94, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pssh/native/_ssh2.pyx":81
+  /* "pssh/native/_ssh2.pyx":144
  * 
  * def sftp_put(Session session, SFTPHandle handle,
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):             # <<<<<<<<<<<<<<
- *     """Native function for reading from SFTP and writing to local file"""
- *     cdef bytes b_local_file = to_bytes(local_file)
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,             # <<<<<<<<<<<<<<
+ *              progress=None):
+ *     """Native function for reading from local file and writing to SFTP.
  */
-  __pyx_k__3 = LIBSSH2_CHANNEL_WINDOW_DEFAULT;
+  __pyx_k__4 = LIBSSH2_CHANNEL_WINDOW_DEFAULT;
 
-  /* "pssh/native/_ssh2.pyx":80
+  /* "pssh/native/_ssh2.pyx":143
  * 
  * 
  * def sftp_put(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from SFTP and writing to local file"""
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              progress=None):
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_4pssh_6native_5_ssh2_4sftp_put, NULL, __pyx_n_s_pssh_native__ssh2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 80, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sftp_put, __pyx_t_2) < 0) __PYX_ERR(0, 80, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4pssh_6native_5_ssh2_4sftp_put, NULL, __pyx_n_s_pssh_native__ssh2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 143, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sftp_put, __pyx_t_1) < 0) __PYX_ERR(0, 143, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pssh/native/_ssh2.pyx":129
+  /* "pssh/native/_ssh2.pyx":212
  * 
  * def sftp_get(Session session, SFTPHandle handle,
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):             # <<<<<<<<<<<<<<
- *     """Native function for reading from local file and writing to SFTP"""
- *     cdef bytes b_local_file = to_bytes(local_file)
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,             # <<<<<<<<<<<<<<
+ *              bint append=False, progress=None):
+ *     """Native function for reading from SFTP and writing to local file.
  */
-  __pyx_k__4 = LIBSSH2_CHANNEL_WINDOW_DEFAULT;
+  __pyx_k__5 = LIBSSH2_CHANNEL_WINDOW_DEFAULT;
 
-  /* "pssh/native/_ssh2.pyx":128
+  /* "pssh/native/_ssh2.pyx":211
  * 
  * 
  * def sftp_get(Session session, SFTPHandle handle,             # <<<<<<<<<<<<<<
- *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
- *     """Native function for reading from local file and writing to SFTP"""
+ *              local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+ *              bint append=False, progress=None):
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_4pssh_6native_5_ssh2_6sftp_get, NULL, __pyx_n_s_pssh_native__ssh2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 128, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sftp_get, __pyx_t_2) < 0) __PYX_ERR(0, 128, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4pssh_6native_5_ssh2_6sftp_get, NULL, __pyx_n_s_pssh_native__ssh2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sftp_get, __pyx_t_1) < 0) __PYX_ERR(0, 211, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pssh/native/_ssh2.pyx":180
+  /* "pssh/native/_ssh2.pyx":292
  * 
  * 
  * def wait_select(Session session, timeout=None):             # <<<<<<<<<<<<<<
  *     cdef LIBSSH2_SESSION *_session = session._session
  *     cdef int _sock = session._sock
  */
-  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_4pssh_6native_5_ssh2_8wait_select, NULL, __pyx_n_s_pssh_native__ssh2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 180, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_wait_select, __pyx_t_2) < 0) __PYX_ERR(0, 180, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_4pssh_6native_5_ssh2_8wait_select, NULL, __pyx_n_s_pssh_native__ssh2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_wait_select, __pyx_t_1) < 0) __PYX_ERR(0, 292, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "pssh/native/_ssh2.pyx":1
  * # This file is part of parallel-ssh.             # <<<<<<<<<<<<<<
  * 
  * # Copyright (C) 2014-2018 Panos Kittenis.
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /*--- Wrapped vars code ---*/
 
@@ -4968,9 +6724,9 @@ if (!__Pyx_RefNanny) {
   __Pyx_XDECREF(__pyx_t_2);
   if (__pyx_m) {
     if (__pyx_d) {
-      __Pyx_AddTraceback("init pssh.native._ssh2", 0, __pyx_lineno, __pyx_filename);
+      __Pyx_AddTraceback("init pssh.native._ssh2", __pyx_clineno, __pyx_lineno, __pyx_filename);
     }
-    Py_DECREF(__pyx_m); __pyx_m = 0;
+    Py_CLEAR(__pyx_m);
   } else if (!PyErr_Occurred()) {
     PyErr_SetString(PyExc_ImportError, "init pssh.native._ssh2");
   }
@@ -4991,9 +6747,9 @@ if (!__Pyx_RefNanny) {
 static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
     PyObject *m = NULL, *p = NULL;
     void *r = NULL;
-    m = PyImport_ImportModule((char *)modname);
+    m = PyImport_ImportModule(modname);
     if (!m) goto end;
-    p = PyObject_GetAttrString(m, (char *)"RefNannyAPI");
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
     if (!p) goto end;
     r = PyLong_AsVoidPtr(p);
 end:
@@ -5051,11 +6807,254 @@ static void __Pyx_RaiseArgtupleInvalid(
     if (exact) {
         more_or_less = "exactly";
     }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kwdict,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kwdict, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    while (PyDict_Next(kwdict, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if ((!kw_allowed) && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+    #if PY_MAJOR_VERSION < 3
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+}
+#endif
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
+                        CYTHON_UNUSED PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrRestore(type, value, tb);
+    return;
+raise_error:
+    Py_XDECREF(value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+    return;
+}
+#else
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
 }
+#endif
 
 /* RaiseDoubleKeywords */
 static void __Pyx_RaiseDoubleKeywordsError(
@@ -5093,7 +7092,7 @@ static int __Pyx_ParseOptionalKeywords(
         }
         name = first_kw_arg;
         #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_CheckExact(key)) || likely(PyString_Check(key))) {
+        if (likely(PyString_Check(key))) {
             while (*name) {
                 if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
                         && _PyString_Eq(**name, key)) {
@@ -5120,7 +7119,7 @@ static int __Pyx_ParseOptionalKeywords(
             while (*name) {
                 int cmp = (**name == key) ? 0 :
                 #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (PyUnicode_GET_SIZE(**name) != PyUnicode_GET_SIZE(key)) ? 1 :
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                 #endif
                     PyUnicode_Compare(**name, key);
                 if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -5136,7 +7135,7 @@ static int __Pyx_ParseOptionalKeywords(
                 while (argname != first_kw_arg) {
                     int cmp = (**argname == key) ? 0 :
                     #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (PyUnicode_GET_SIZE(**argname) != PyUnicode_GET_SIZE(key)) ? 1 :
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
                     #endif
                         PyUnicode_Compare(**argname, key);
                     if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
@@ -5194,32 +7193,8 @@ static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *nam
     return 0;
 }
 
-/* PyCFunctionFastCall */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    int flags = PyCFunction_GET_FLAGS(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)meth)) (self, args, nargs, NULL);
-    } else {
-        return (*((__Pyx_PyCFunctionFast)meth)) (self, args, nargs);
-    }
-}
-#endif
-
 /* PyFunctionFastCall */
 #if CYTHON_FAST_PYCALL
-#include "frameobject.h"
 static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
                                                PyObject *globals) {
     PyFrameObject *f;
@@ -5237,7 +7212,7 @@ static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args
     if (f == NULL) {
         return NULL;
     }
-    fastlocals = f->f_localsplus;
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
     for (i = 0; i < na; i++) {
         Py_INCREF(*args);
         fastlocals[i] = *args++;
@@ -5249,7 +7224,7 @@ static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args
     return result;
 }
 #if 1 || PY_VERSION_HEX < 0x030600B1
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, int nargs, PyObject *kwargs) {
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
     PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
     PyObject *globals = PyFunction_GET_GLOBALS(func);
     PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
@@ -5320,12 +7295,12 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
     }
 #if PY_MAJOR_VERSION >= 3
     result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, nargs,
+                               args, (int)nargs,
                                k, (int)nk,
                                d, (int)nd, kwdefs, closure);
 #else
     result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, nargs,
+                               args, (int)nargs,
                                k, (int)nk,
                                d, (int)nd, closure);
 #endif
@@ -5337,26 +7312,6 @@ done:
 #endif
 #endif
 
-/* PyObjectCall */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    result = (*call)(func, arg, kw);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
 /* PyObjectCallMethO */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
@@ -5377,6 +7332,51 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 }
 #endif
 
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
 /* PyObjectCallOneArg */
 #if CYTHON_COMPILING_IN_CPYTHON
 static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
@@ -5399,7 +7399,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
         if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
             return __Pyx_PyObject_CallMethO(func, arg);
 #if CYTHON_FAST_PYCCALL
-        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
             return __Pyx_PyCFunction_FastCall(func, &arg, 1);
 #endif
         }
@@ -5417,42 +7417,21 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 }
 #endif
 
-/* PyObjectCallNoArg */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, NULL, 0);
-    }
-#endif
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || __Pyx_TypeCheck(func, __pyx_CyFunctionType))) {
-#else
-    if (likely(PyCFunction_Check(func))) {
-#endif
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
-            return __Pyx_PyObject_CallMethO(func, NULL);
-        }
-    }
-    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
-}
-#endif
-
 /* RaiseTooManyValuesToUnpack */
-  static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
+static CYTHON_INLINE void __Pyx_RaiseTooManyValuesError(Py_ssize_t expected) {
     PyErr_Format(PyExc_ValueError,
                  "too many values to unpack (expected %" CYTHON_FORMAT_SSIZE_T "d)", expected);
 }
 
 /* RaiseNeedMoreValuesToUnpack */
-  static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
+static CYTHON_INLINE void __Pyx_RaiseNeedMoreValuesError(Py_ssize_t index) {
     PyErr_Format(PyExc_ValueError,
                  "need more than %" CYTHON_FORMAT_SSIZE_T "d value%.1s to unpack",
                  index, (index == 1) ? "" : "s");
 }
 
 /* IterFinish */
-  static CYTHON_INLINE int __Pyx_IterFinish(void) {
+static CYTHON_INLINE int __Pyx_IterFinish(void) {
 #if CYTHON_FAST_THREAD_STATE
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
     PyObject* exc_type = tstate->curexc_type;
@@ -5487,233 +7466,145 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
 }
 
 /* UnpackItemEndCheck */
-  static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
+static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected) {
     if (unlikely(retval)) {
         Py_DECREF(retval);
         __Pyx_RaiseTooManyValuesError(expected);
         return -1;
-    } else {
-        return __Pyx_IterFinish();
     }
-    return 0;
+    return __Pyx_IterFinish();
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
 }
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
 
 /* GetModuleGlobalName */
-  static CYTHON_INLINE PyObject *__Pyx_GetModuleGlobalName(PyObject *name) {
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
     PyObject *result;
 #if !CYTHON_AVOID_BORROWED_REFS
 #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1
     result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
     if (likely(result)) {
-        Py_INCREF(result);
+        return __Pyx_NewRef(result);
     } else if (unlikely(PyErr_Occurred())) {
-        result = NULL;
-    } else {
+        return NULL;
+    }
 #else
     result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
     if (likely(result)) {
-        Py_INCREF(result);
-    } else {
+        return __Pyx_NewRef(result);
+    }
 #endif
 #else
     result = PyObject_GetItem(__pyx_d, name);
-    if (!result) {
-        PyErr_Clear();
-#endif
-        result = __Pyx_GetBuiltinName(name);
-    }
-    return result;
-}
-
-/* PyErrFetchRestore */
-      #if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-#endif
-
-/* RaiseException */
-      #if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
-                        CYTHON_UNUSED PyObject *cause) {
-    __Pyx_PyThreadState_declare
-    Py_XINCREF(type);
-    if (!value || value == Py_None)
-        value = NULL;
-    else
-        Py_INCREF(value);
-    if (!tb || tb == Py_None)
-        tb = NULL;
-    else {
-        Py_INCREF(tb);
-        if (!PyTraceBack_Check(tb)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: arg 3 must be a traceback or None");
-            goto raise_error;
-        }
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
     }
-    if (PyType_Check(type)) {
-#if CYTHON_COMPILING_IN_PYPY
-        if (!value) {
-            Py_INCREF(Py_None);
-            value = Py_None;
-        }
+    PyErr_Clear();
 #endif
-        PyErr_NormalizeException(&type, &value, &tb);
-    } else {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(type);
-        Py_INCREF(type);
-        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: exception class must be a subclass of BaseException");
-            goto raise_error;
-        }
-    }
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
+    return __Pyx_GetBuiltinName(name);
 }
-#else
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    PyObject* owned_instance = NULL;
-    if (tb == Py_None) {
-        tb = 0;
-    } else if (tb && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto bad;
-    }
-    if (value == Py_None)
-        value = 0;
-    if (PyExceptionInstance_Check(type)) {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto bad;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(value);
-    } else if (PyExceptionClass_Check(type)) {
-        PyObject *instance_class = NULL;
-        if (value && PyExceptionInstance_Check(value)) {
-            instance_class = (PyObject*) Py_TYPE(value);
-            if (instance_class != type) {
-                int is_subclass = PyObject_IsSubclass(instance_class, type);
-                if (!is_subclass) {
-                    instance_class = NULL;
-                } else if (unlikely(is_subclass == -1)) {
-                    goto bad;
-                } else {
-                    type = instance_class;
-                }
-            }
+
+/* decode_c_string */
+static CYTHON_INLINE PyObject* __Pyx_decode_c_string(
+         const char* cstring, Py_ssize_t start, Py_ssize_t stop,
+         const char* encoding, const char* errors,
+         PyObject* (*decode_func)(const char *s, Py_ssize_t size, const char *errors)) {
+    Py_ssize_t length;
+    if (unlikely((start < 0) | (stop < 0))) {
+        size_t slen = strlen(cstring);
+        if (unlikely(slen > (size_t) PY_SSIZE_T_MAX)) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "c-string too long to convert to Python");
+            return NULL;
         }
-        if (!instance_class) {
-            PyObject *args;
-            if (!value)
-                args = PyTuple_New(0);
-            else if (PyTuple_Check(value)) {
-                Py_INCREF(value);
-                args = value;
-            } else
-                args = PyTuple_Pack(1, value);
-            if (!args)
-                goto bad;
-            owned_instance = PyObject_Call(type, args, NULL);
-            Py_DECREF(args);
-            if (!owned_instance)
-                goto bad;
-            value = owned_instance;
-            if (!PyExceptionInstance_Check(value)) {
-                PyErr_Format(PyExc_TypeError,
-                             "calling %R should have returned an instance of "
-                             "BaseException, not %R",
-                             type, Py_TYPE(value));
-                goto bad;
-            }
+        length = (Py_ssize_t) slen;
+        if (start < 0) {
+            start += length;
+            if (start < 0)
+                start = 0;
         }
+        if (stop < 0)
+            stop += length;
+    }
+    if (unlikely(stop <= start))
+        return __Pyx_NewRef(__pyx_empty_unicode);
+    length = stop - start;
+    cstring += start;
+    if (decode_func) {
+        return decode_func(cstring, length, errors);
     } else {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: exception class must be a subclass of BaseException");
-        goto bad;
+        return PyUnicode_Decode(cstring, length, encoding, errors);
     }
-    if (cause) {
-        PyObject *fixed_cause;
-        if (cause == Py_None) {
-            fixed_cause = NULL;
-        } else if (PyExceptionClass_Check(cause)) {
-            fixed_cause = PyObject_CallObject(cause, NULL);
-            if (fixed_cause == NULL)
-                goto bad;
-        } else if (PyExceptionInstance_Check(cause)) {
-            fixed_cause = cause;
-            Py_INCREF(fixed_cause);
-        } else {
-            PyErr_SetString(PyExc_TypeError,
-                            "exception causes must derive from "
-                            "BaseException");
-            goto bad;
-        }
-        PyException_SetCause(value, fixed_cause);
+}
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
     }
-    PyErr_SetObject(type, value);
-    if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
-        PyThreadState *tstate = __Pyx_PyThreadState_Current;
-        PyObject* tmp_tb = tstate->curexc_traceback;
-        if (tb != tmp_tb) {
-            Py_INCREF(tb);
-            tstate->curexc_traceback = tb;
-            Py_XDECREF(tmp_tb);
-        }
-#endif
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
     }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
 }
-#endif
 
 /* GetException */
-      #if CYTHON_FAST_THREAD_STATE
-static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
 #else
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
 #endif
+{
     PyObject *local_type, *local_value, *local_tb;
 #if CYTHON_FAST_THREAD_STATE
     PyObject *tmp_type, *tmp_value, *tmp_tb;
@@ -5746,13 +7637,16 @@ static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
     *value = local_value;
     *tb = local_tb;
 #if CYTHON_FAST_THREAD_STATE
-    #if PY_VERSION_HEX >= 0x030700A2
-    tmp_type = tstate->exc_state.exc_type;
-    tmp_value = tstate->exc_state.exc_value;
-    tmp_tb = tstate->exc_state.exc_traceback;
-    tstate->exc_state.exc_type = local_type;
-    tstate->exc_state.exc_value = local_value;
-    tstate->exc_state.exc_traceback = local_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+    }
     #else
     tmp_type = tstate->exc_type;
     tmp_value = tstate->exc_value;
@@ -5779,16 +7673,17 @@ bad:
 }
 
 /* SwapException */
-        #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
-    #if PY_VERSION_HEX >= 0x030700A2
-    tmp_type = tstate->exc_state.exc_type;
-    tmp_value = tstate->exc_state.exc_value;
-    tmp_tb = tstate->exc_state.exc_traceback;
-    tstate->exc_state.exc_type = *type;
-    tstate->exc_state.exc_value = *value;
-    tstate->exc_state.exc_traceback = *tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
     #else
     tmp_type = tstate->exc_type;
     tmp_value = tstate->exc_value;
@@ -5812,13 +7707,29 @@ static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value,
 }
 #endif
 
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_type == NULL || exc_info->exc_type == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
 /* SaveResetException */
-        #if CYTHON_FAST_THREAD_STATE
+#if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-    #if PY_VERSION_HEX >= 0x030700A2
-    *type = tstate->exc_state.exc_type;
-    *value = tstate->exc_state.exc_value;
-    *tb = tstate->exc_state.exc_traceback;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
     #else
     *type = tstate->exc_type;
     *value = tstate->exc_value;
@@ -5830,13 +7741,14 @@ static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject *
 }
 static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
     PyObject *tmp_type, *tmp_value, *tmp_tb;
-    #if PY_VERSION_HEX >= 0x030700A2
-    tmp_type = tstate->exc_state.exc_type;
-    tmp_value = tstate->exc_state.exc_value;
-    tmp_tb = tstate->exc_state.exc_traceback;
-    tstate->exc_state.exc_type = type;
-    tstate->exc_state.exc_value = value;
-    tstate->exc_state.exc_traceback = tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
     #else
     tmp_type = tstate->exc_type;
     tmp_value = tstate->exc_value;
@@ -5852,7 +7764,7 @@ static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject
 #endif
 
 /* PyObject_GenericGetAttrNoDict */
-        #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
     PyErr_Format(PyExc_AttributeError,
 #if PY_MAJOR_VERSION >= 3
@@ -5891,8 +7803,266 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj
 }
 #endif
 
+/* PyObject_GenericGetAttr */
+#if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
+static PyObject* __Pyx_PyObject_GenericGetAttr(PyObject* obj, PyObject* attr_name) {
+    if (unlikely(Py_TYPE(obj)->tp_dictoffset)) {
+        return PyObject_GenericGetAttr(obj, attr_name);
+    }
+    return __Pyx_PyObject_GenericGetAttrNoDict(obj, attr_name);
+}
+#endif
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyObject *dict, void *vtable) {
+#if PY_VERSION_HEX >= 0x02070000
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+#else
+    PyObject *ob = PyCObject_FromVoidPtr(vtable, 0);
+#endif
+    if (!ob)
+        goto bad;
+    if (PyDict_SetItem(dict, __pyx_n_s_pyx_vtable, ob) < 0)
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    PyObject *exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+    if (unlikely(PyTuple_Check(err)))
+        return __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    return __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStr(meth, __pyx_n_s_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_n_s_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_n_s_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_n_s_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_n_s_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = PyDict_SetItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = PyDict_DelItem(((PyTypeObject*)type_obj)->tp_dict, __pyx_n_s_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred())
+        PyErr_Format(PyExc_RuntimeError, "Unable to initialize pickling for %s", ((PyTypeObject*)type_obj)->tp_name);
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
+{
+    PyObject *result = 0;
+    char warning[200];
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#ifdef Py_LIMITED_API
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#ifndef Py_LIMITED_API
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
+        PyOS_snprintf(warning, sizeof(warning),
+            "%s.%s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize);
+        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
 /* Import */
-        static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
+static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
     PyObject *empty_list = 0;
     PyObject *module = 0;
     PyObject *global_dict = 0;
@@ -5921,7 +8091,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj
     {
         #if PY_MAJOR_VERSION >= 3
         if (level == -1) {
-            if (strchr(__Pyx_MODULE_NAME, '.')) {
+            if ((1) && (strchr(__Pyx_MODULE_NAME, '.'))) {
                 module = PyImport_ImportModuleLevelObject(
                     name, global_dict, empty_dict, list, 1);
                 if (!module) {
@@ -5939,7 +8109,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj
             if (!py_level)
                 goto bad;
             module = PyObject_CallFunctionObjArgs(py_import,
-                name, global_dict, empty_dict, list, py_level, NULL);
+                name, global_dict, empty_dict, list, py_level, (PyObject *)NULL);
             Py_DECREF(py_level);
             #else
             module = PyImport_ImportModuleLevelObject(
@@ -5957,7 +8127,7 @@ bad:
 }
 
 /* ImportFrom */
-        static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
     PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
     if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
         PyErr_Format(PyExc_ImportError,
@@ -5971,7 +8141,7 @@ bad:
 }
 
 /* CLineInTraceback */
-        #ifndef CYTHON_CLINE_IN_TRACEBACK
+#ifndef CYTHON_CLINE_IN_TRACEBACK
 static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
@@ -5985,7 +8155,9 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #if CYTHON_COMPILING_IN_CPYTHON
     cython_runtime_dict = _PyObject_GetDictPtr(__pyx_cython_runtime);
     if (likely(cython_runtime_dict)) {
-      use_cline = __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback);
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, *cython_runtime_dict,
+            __Pyx_PyDict_GetItemStr(*cython_runtime_dict, __pyx_n_s_cline_in_traceback))
     } else
 #endif
     {
@@ -6000,9 +8172,9 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
     }
     if (!use_cline) {
         c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
-    else if (PyObject_Not(use_cline) != 0) {
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
     }
     __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
@@ -6011,7 +8183,7 @@ static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_li
 #endif
 
 /* CodeObjectCache */
-        static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
     int start = 0, mid = 0, end = count - 1;
     if (end >= 0 && code_line > entries[end].code_line) {
         return count;
@@ -6074,7 +8246,7 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
     if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
         int new_max = __pyx_code_cache.max_count + 64;
         entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, (size_t)new_max*sizeof(__Pyx_CodeObjectCacheEntry));
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
         if (unlikely(!entries)) {
             return;
         }
@@ -6091,36 +8263,43 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 }
 
 /* AddTraceback */
-        #include "compile.h"
+#include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -6139,11 +8318,16 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -6151,14 +8335,24 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
@@ -6176,61 +8370,37 @@ bad:
 }
 
 /* CIntFromPyVerify */
-        #define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
 #define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
     __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
-    }
-
-/* CIntToPy */
-        static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-    const int neg_one = (int) -1, const_zero = (int) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(int) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
-                                     little, !is_unsigned);
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
     }
-}
 
 /* CIntFromPy */
-        static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -6281,7 +8451,7 @@ bad:
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6418,8 +8588,91 @@ raise_neg_overflow:
 }
 
 /* CIntToPy */
-        static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_PY_LONG_LONG(unsigned PY_LONG_LONG value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG) -1, const_zero = (unsigned PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned PY_LONG_LONG) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned PY_LONG_LONG) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned PY_LONG_LONG) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned PY_LONG_LONG) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned PY_LONG_LONG),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
@@ -6449,8 +8702,15 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-        static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -6501,7 +8761,7 @@ raise_neg_overflow:
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6638,8 +8898,15 @@ raise_neg_overflow:
 }
 
 /* CIntFromPy */
-        static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
     const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -6690,7 +8957,7 @@ raise_neg_overflow:
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6827,7 +9094,7 @@ raise_neg_overflow:
 }
 
 /* FastTypeChecks */
-        #if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON
 static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
     while (a) {
         a = a->tp_base;
@@ -6882,14 +9149,42 @@ static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err,
     return res;
 }
 #endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
 static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
     if (likely(err == exc_type)) return 1;
     if (likely(PyExceptionClass_Check(err))) {
-        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
     }
     return PyErr_GivenExceptionMatches(err, exc_type);
 }
 static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
     if (likely(err == exc_type1 || err == exc_type2)) return 1;
     if (likely(PyExceptionClass_Check(err))) {
         return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
@@ -6899,7 +9194,7 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #endif
 
 /* FetchCommonType */
-        static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
+static PyTypeObject* __Pyx_FetchCommonType(PyTypeObject* type) {
     PyObject* fake_module;
     PyTypeObject* cached_type = NULL;
     fake_module = PyImport_AddModule((char*) "_cython_" CYTHON_ABI);
@@ -6937,60 +9232,129 @@ bad:
     goto done;
 }
 
-/* PyObjectCallMethod1 */
-        static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
-    PyObject *result = NULL;
-#if CYTHON_UNPACK_METHODS
-    if (likely(PyMethod_Check(method))) {
-        PyObject *self = PyMethod_GET_SELF(method);
-        if (likely(self)) {
-            PyObject *args;
-            PyObject *function = PyMethod_GET_FUNCTION(method);
-            #if CYTHON_FAST_PYCALL
-            if (PyFunction_Check(function)) {
-                PyObject *args[2] = {self, arg};
-                result = __Pyx_PyFunction_FastCall(function, args, 2);
-                goto done;
-            }
-            #endif
-            #if CYTHON_FAST_PYCCALL
-            if (__Pyx_PyFastCFunction_Check(function)) {
-                PyObject *args[2] = {self, arg};
-                result = __Pyx_PyCFunction_FastCall(function, args, 2);
-                goto done;
+/* PyObjectGetMethod */
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if PY_MAJOR_VERSION >= 3
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || (Py_TYPE(descr) == &PyMethodDescr_Type)))
+        #endif
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
             }
-            #endif
-            args = PyTuple_New(2);
-            if (unlikely(!args)) goto done;
-            Py_INCREF(self);
-            PyTuple_SET_ITEM(args, 0, self);
-            Py_INCREF(arg);
-            PyTuple_SET_ITEM(args, 1, arg);
-            Py_INCREF(function);
-            result = __Pyx_PyObject_Call(function, args, NULL);
-            Py_DECREF(args);
-            Py_DECREF(function);
-            return result;
         }
     }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (descr != NULL) {
+        *method = descr;
+        return 0;
+    }
+    PyErr_Format(PyExc_AttributeError,
+#if PY_MAJOR_VERSION >= 3
+                 "'%.50s' object has no attribute '%U'",
+                 tp->tp_name, name);
+#else
+                 "'%.50s' object has no attribute '%.400s'",
+                 tp->tp_name, PyString_AS_STRING(name));
+#endif
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
 #endif
-    result = __Pyx_PyObject_CallOneArg(method, arg);
-    goto done;
-done:
+    *method = attr;
+    return 0;
+}
+
+/* PyObjectCallMethod1 */
+static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
+    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
+    Py_DECREF(method);
     return result;
 }
 static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
-    PyObject *method, *result;
-    method = __Pyx_PyObject_GetAttrStr(obj, method_name);
+    PyObject *method = NULL, *result;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_Call2Args(method, obj, arg);
+        Py_DECREF(method);
+        return result;
+    }
     if (unlikely(!method)) return NULL;
-    result = __Pyx__PyObject_CallMethod1(method, arg);
-    Py_DECREF(method);
-    return result;
+    return __Pyx__PyObject_CallMethod1(method, arg);
 }
 
 /* CoroutineBase */
-        #include <structmember.h>
+#include <structmember.h>
 #include <frameobject.h>
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 #define __Pyx_Coroutine_Undelegate(gen) Py_CLEAR((gen)->yieldfrom)
 static int __Pyx_PyGen__FetchStopIterationValue(CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject **pvalue) {
     PyObject *et, *ev, *tb;
@@ -7072,21 +9436,22 @@ static int __Pyx_PyGen__FetchStopIterationValue(CYTHON_UNUSED PyThreadState *__p
     return 0;
 }
 static CYTHON_INLINE
-void __Pyx_Coroutine_ExceptionClear(__pyx_CoroutineObject *self) {
-    PyObject *exc_type = self->exc_type;
-    PyObject *exc_value = self->exc_value;
-    PyObject *exc_traceback = self->exc_traceback;
-    self->exc_type = NULL;
-    self->exc_value = NULL;
-    self->exc_traceback = NULL;
-    Py_XDECREF(exc_type);
-    Py_XDECREF(exc_value);
-    Py_XDECREF(exc_traceback);
+void __Pyx_Coroutine_ExceptionClear(__Pyx_ExcInfoStruct *exc_state) {
+    PyObject *t, *v, *tb;
+    t = exc_state->exc_type;
+    v = exc_state->exc_value;
+    tb = exc_state->exc_traceback;
+    exc_state->exc_type = NULL;
+    exc_state->exc_value = NULL;
+    exc_state->exc_traceback = NULL;
+    Py_XDECREF(t);
+    Py_XDECREF(v);
+    Py_XDECREF(tb);
 }
 #define __Pyx_Coroutine_AlreadyRunningError(gen)  (__Pyx__Coroutine_AlreadyRunningError(gen), (PyObject*)NULL)
 static void __Pyx__Coroutine_AlreadyRunningError(CYTHON_UNUSED __pyx_CoroutineObject *gen) {
     const char *msg;
-    if (0) {
+    if ((0)) {
     #ifdef __Pyx_Coroutine_USED
     } else if (__Pyx_Coroutine_Check((PyObject*)gen)) {
         msg = "coroutine already executing";
@@ -7103,7 +9468,7 @@ static void __Pyx__Coroutine_AlreadyRunningError(CYTHON_UNUSED __pyx_CoroutineOb
 #define __Pyx_Coroutine_NotStartedError(gen)  (__Pyx__Coroutine_NotStartedError(gen), (PyObject*)NULL)
 static void __Pyx__Coroutine_NotStartedError(CYTHON_UNUSED PyObject *gen) {
     const char *msg;
-    if (0) {
+    if ((0)) {
     #ifdef __Pyx_Coroutine_USED
     } else if (__Pyx_Coroutine_Check(gen)) {
         msg = "can't send non-None value to a just-started coroutine";
@@ -7137,6 +9502,7 @@ static
 PyObject *__Pyx_Coroutine_SendEx(__pyx_CoroutineObject *self, PyObject *value, int closing) {
     __Pyx_PyThreadState_declare
     PyThreadState *tstate;
+    __Pyx_ExcInfoStruct *exc_state;
     PyObject *retval;
     assert(!self->is_running);
     if (unlikely(self->resume_label == 0)) {
@@ -7153,33 +9519,51 @@ PyObject *__Pyx_Coroutine_SendEx(__pyx_CoroutineObject *self, PyObject *value, i
 #else
     tstate = __Pyx_PyThreadState_Current;
 #endif
-    if (self->exc_type) {
-#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_PYSTON
-#else
-        if (self->exc_traceback) {
-            PyTracebackObject *tb = (PyTracebackObject *) self->exc_traceback;
+    exc_state = &self->gi_exc_state;
+    if (exc_state->exc_type) {
+        #if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_PYSTON
+        #else
+        if (exc_state->exc_traceback) {
+            PyTracebackObject *tb = (PyTracebackObject *) exc_state->exc_traceback;
             PyFrameObject *f = tb->tb_frame;
-            Py_XINCREF(tstate->frame);
             assert(f->f_back == NULL);
+            #if PY_VERSION_HEX >= 0x030B00A1
+            f->f_back = PyThreadState_GetFrame(tstate);
+            #else
+            Py_XINCREF(tstate->frame);
             f->f_back = tstate->frame;
+            #endif
         }
-#endif
-        __Pyx_ExceptionSwap(&self->exc_type, &self->exc_value,
-                            &self->exc_traceback);
+        #endif
+    }
+#if CYTHON_USE_EXC_INFO_STACK
+    exc_state->previous_item = tstate->exc_info;
+    tstate->exc_info = exc_state;
+#else
+    if (exc_state->exc_type) {
+        __Pyx_ExceptionSwap(&exc_state->exc_type, &exc_state->exc_value, &exc_state->exc_traceback);
     } else {
-        __Pyx_Coroutine_ExceptionClear(self);
-        __Pyx_ExceptionSave(&self->exc_type, &self->exc_value, &self->exc_traceback);
+        __Pyx_Coroutine_ExceptionClear(exc_state);
+        __Pyx_ExceptionSave(&exc_state->exc_type, &exc_state->exc_value, &exc_state->exc_traceback);
     }
+#endif
     self->is_running = 1;
     retval = self->body((PyObject *) self, tstate, value);
     self->is_running = 0;
+#if CYTHON_USE_EXC_INFO_STACK
+    exc_state = &self->gi_exc_state;
+    tstate->exc_info = exc_state->previous_item;
+    exc_state->previous_item = NULL;
+    __Pyx_Coroutine_ResetFrameBackpointer(exc_state);
+#endif
     return retval;
 }
-static CYTHON_INLINE void __Pyx_Coroutine_ResetFrameBackpointer(__pyx_CoroutineObject *self) {
-    if (likely(self->exc_traceback)) {
+static CYTHON_INLINE void __Pyx_Coroutine_ResetFrameBackpointer(__Pyx_ExcInfoStruct *exc_state) {
+    PyObject *exc_tb = exc_state->exc_traceback;
+    if (likely(exc_tb)) {
 #if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_PYSTON
 #else
-        PyTracebackObject *tb = (PyTracebackObject *) self->exc_traceback;
+        PyTracebackObject *tb = (PyTracebackObject *) exc_tb;
         PyFrameObject *f = tb->tb_frame;
         Py_CLEAR(f->f_back);
 #endif
@@ -7201,6 +9585,30 @@ PyObject *__Pyx_Coroutine_MethodReturn(CYTHON_UNUSED PyObject* gen, PyObject *re
     }
     return retval;
 }
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03030000 && (defined(__linux__) || PY_VERSION_HEX >= 0x030600B3)
+static CYTHON_INLINE
+PyObject *__Pyx_PyGen_Send(PyGenObject *gen, PyObject *arg) {
+#if PY_VERSION_HEX <= 0x030A00A1
+    return _PyGen_Send(gen, arg);
+#else
+    PyObject *result;
+    if (PyIter_Send((PyObject*)gen, arg ? arg : Py_None, &result) == PYGEN_RETURN) {
+        if (PyAsyncGen_CheckExact(gen)) {
+            assert(result == Py_None);
+            PyErr_SetNone(PyExc_StopAsyncIteration);
+        }
+        else if (result == Py_None) {
+            PyErr_SetNone(PyExc_StopIteration);
+        }
+        else {
+            _PyGen_SetStopIterationValue(result);
+        }
+        Py_CLEAR(result);
+    }
+    return result;
+#endif
+}
+#endif
 static CYTHON_INLINE
 PyObject *__Pyx_Coroutine_FinishDelegation(__pyx_CoroutineObject *gen) {
     PyObject *ret;
@@ -7237,12 +9645,12 @@ static PyObject *__Pyx_Coroutine_Send(PyObject *self, PyObject *value) {
         #endif
         #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03030000 && (defined(__linux__) || PY_VERSION_HEX >= 0x030600B3)
         if (PyGen_CheckExact(yf)) {
-            ret = _PyGen_Send((PyGenObject*)yf, value == Py_None ? NULL : value);
+            ret = __Pyx_PyGen_Send((PyGenObject*)yf, value == Py_None ? NULL : value);
         } else
         #endif
         #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03050000 && defined(PyCoro_CheckExact) && (defined(__linux__) || PY_VERSION_HEX >= 0x030600B3)
         if (PyCoro_CheckExact(yf)) {
-            ret = _PyGen_Send((PyGenObject*)yf, value == Py_None ? NULL : value);
+            ret = __Pyx_PyGen_Send((PyGenObject*)yf, value == Py_None ? NULL : value);
         } else
         #endif
         {
@@ -7278,7 +9686,7 @@ static int __Pyx_Coroutine_CloseIter(__pyx_CoroutineObject *gen, PyObject *yf) {
             return -1;
     } else
     if (__Pyx_CoroutineAwait_CheckExact(yf)) {
-        retval = __Pyx_CoroutineAwait_Close((__pyx_CoroutineAwaitObject*)yf);
+        retval = __Pyx_CoroutineAwait_Close((__pyx_CoroutineAwaitObject*)yf, NULL);
         if (!retval)
             return -1;
     } else
@@ -7326,7 +9734,7 @@ static PyObject *__Pyx_Generator_Next(PyObject *self) {
         #endif
         #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03030000 && (defined(__linux__) || PY_VERSION_HEX >= 0x030600B3)
         if (PyGen_CheckExact(yf)) {
-            ret = _PyGen_Send((PyGenObject*)yf, NULL);
+            ret = __Pyx_PyGen_Send((PyGenObject*)yf, NULL);
         } else
         #endif
         #ifdef __Pyx_Coroutine_USED
@@ -7343,6 +9751,9 @@ static PyObject *__Pyx_Generator_Next(PyObject *self) {
     }
     return __Pyx_Coroutine_SendEx(gen, Py_None, 0);
 }
+static PyObject *__Pyx_Coroutine_Close_Method(PyObject *self, CYTHON_UNUSED PyObject *arg) {
+    return __Pyx_Coroutine_Close(self);
+}
 static PyObject *__Pyx_Coroutine_Close(PyObject *self) {
     __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
     PyObject *retval, *raised_exception;
@@ -7459,29 +9870,31 @@ static PyObject *__Pyx_Coroutine_Throw(PyObject *self, PyObject *args) {
         return NULL;
     return __Pyx__Coroutine_Throw(self, typ, val, tb, args, 1);
 }
+static CYTHON_INLINE int __Pyx_Coroutine_traverse_excstate(__Pyx_ExcInfoStruct *exc_state, visitproc visit, void *arg) {
+    Py_VISIT(exc_state->exc_type);
+    Py_VISIT(exc_state->exc_value);
+    Py_VISIT(exc_state->exc_traceback);
+    return 0;
+}
 static int __Pyx_Coroutine_traverse(__pyx_CoroutineObject *gen, visitproc visit, void *arg) {
     Py_VISIT(gen->closure);
     Py_VISIT(gen->classobj);
     Py_VISIT(gen->yieldfrom);
-    Py_VISIT(gen->exc_type);
-    Py_VISIT(gen->exc_value);
-    Py_VISIT(gen->exc_traceback);
-    return 0;
+    return __Pyx_Coroutine_traverse_excstate(&gen->gi_exc_state, visit, arg);
 }
 static int __Pyx_Coroutine_clear(PyObject *self) {
     __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
     Py_CLEAR(gen->closure);
     Py_CLEAR(gen->classobj);
     Py_CLEAR(gen->yieldfrom);
-    Py_CLEAR(gen->exc_type);
-    Py_CLEAR(gen->exc_value);
-    Py_CLEAR(gen->exc_traceback);
+    __Pyx_Coroutine_ExceptionClear(&gen->gi_exc_state);
 #ifdef __Pyx_AsyncGen_USED
     if (__Pyx_AsyncGen_CheckExact(self)) {
         Py_CLEAR(((__pyx_PyAsyncGenObject*)gen)->ag_finalizer);
     }
 #endif
     Py_CLEAR(gen->gi_code);
+    Py_CLEAR(gen->gi_frame);
     Py_CLEAR(gen->gi_name);
     Py_CLEAR(gen->gi_qualname);
     Py_CLEAR(gen->gi_modulename);
@@ -7498,7 +9911,7 @@ static void __Pyx_Coroutine_dealloc(PyObject *self) {
         if (PyObject_CallFinalizerFromDealloc(self))
 #else
         Py_TYPE(gen)->tp_del(self);
-        if (self->ob_refcnt > 0)
+        if (Py_REFCNT(self) > 0)
 #endif
         {
             return;
@@ -7525,7 +9938,7 @@ static void __Pyx_Coroutine_del(PyObject *self) {
     }
 #if !CYTHON_USE_TP_FINALIZE
     assert(self->ob_refcnt == 0);
-    self->ob_refcnt = 1;
+    __Pyx_SET_REFCNT(self, 1);
 #endif
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&error_type, &error_value, &error_traceback);
@@ -7592,17 +10005,17 @@ static void __Pyx_Coroutine_del(PyObject *self) {
     }
     __Pyx_ErrRestore(error_type, error_value, error_traceback);
 #if !CYTHON_USE_TP_FINALIZE
-    assert(self->ob_refcnt > 0);
+    assert(Py_REFCNT(self) > 0);
     if (--self->ob_refcnt == 0) {
         return;
     }
     {
-        Py_ssize_t refcnt = self->ob_refcnt;
+        Py_ssize_t refcnt = Py_REFCNT(self);
         _Py_NewReference(self);
-        self->ob_refcnt = refcnt;
+        __Pyx_SET_REFCNT(self, refcnt);
     }
 #if CYTHON_COMPILING_IN_CPYTHON
-    assert(PyType_IS_GC(self->ob_type) &&
+    assert(PyType_IS_GC(Py_TYPE(self)) &&
            _Py_AS_GC(self)->gc.gc_refs != _PyGC_REFS_UNTRACKED);
     _Py_DEC_REFTOTAL;
 #endif
@@ -7613,7 +10026,7 @@ static void __Pyx_Coroutine_del(PyObject *self) {
 #endif
 }
 static PyObject *
-__Pyx_Coroutine_get_name(__pyx_CoroutineObject *self)
+__Pyx_Coroutine_get_name(__pyx_CoroutineObject *self, CYTHON_UNUSED void *context)
 {
     PyObject *name = self->gi_name;
     if (unlikely(!name)) name = Py_None;
@@ -7621,14 +10034,15 @@ __Pyx_Coroutine_get_name(__pyx_CoroutineObject *self)
     return name;
 }
 static int
-__Pyx_Coroutine_set_name(__pyx_CoroutineObject *self, PyObject *value)
+__Pyx_Coroutine_set_name(__pyx_CoroutineObject *self, PyObject *value, CYTHON_UNUSED void *context)
 {
     PyObject *tmp;
 #if PY_MAJOR_VERSION >= 3
-    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
 #else
-    if (unlikely(value == NULL || !PyString_Check(value))) {
+    if (unlikely(value == NULL || !PyString_Check(value)))
 #endif
+    {
         PyErr_SetString(PyExc_TypeError,
                         "__name__ must be set to a string object");
         return -1;
@@ -7640,7 +10054,7 @@ __Pyx_Coroutine_set_name(__pyx_CoroutineObject *self, PyObject *value)
     return 0;
 }
 static PyObject *
-__Pyx_Coroutine_get_qualname(__pyx_CoroutineObject *self)
+__Pyx_Coroutine_get_qualname(__pyx_CoroutineObject *self, CYTHON_UNUSED void *context)
 {
     PyObject *name = self->gi_qualname;
     if (unlikely(!name)) name = Py_None;
@@ -7648,14 +10062,15 @@ __Pyx_Coroutine_get_qualname(__pyx_CoroutineObject *self)
     return name;
 }
 static int
-__Pyx_Coroutine_set_qualname(__pyx_CoroutineObject *self, PyObject *value)
+__Pyx_Coroutine_set_qualname(__pyx_CoroutineObject *self, PyObject *value, CYTHON_UNUSED void *context)
 {
     PyObject *tmp;
 #if PY_MAJOR_VERSION >= 3
-    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
 #else
-    if (unlikely(value == NULL || !PyString_Check(value))) {
+    if (unlikely(value == NULL || !PyString_Check(value)))
 #endif
+    {
         PyErr_SetString(PyExc_TypeError,
                         "__qualname__ must be set to a string object");
         return -1;
@@ -7666,6 +10081,27 @@ __Pyx_Coroutine_set_qualname(__pyx_CoroutineObject *self, PyObject *value)
     Py_XDECREF(tmp);
     return 0;
 }
+static PyObject *
+__Pyx_Coroutine_get_frame(__pyx_CoroutineObject *self, CYTHON_UNUSED void *context)
+{
+    PyObject *frame = self->gi_frame;
+    if (!frame) {
+        if (unlikely(!self->gi_code)) {
+            Py_RETURN_NONE;
+        }
+        frame = (PyObject *) PyFrame_New(
+            PyThreadState_Get(),            /*PyThreadState *tstate,*/
+            (PyCodeObject*) self->gi_code,  /*PyCodeObject *code,*/
+            __pyx_d,                 /*PyObject *globals,*/
+            0                               /*PyObject *locals*/
+        );
+        if (unlikely(!frame))
+            return NULL;
+        self->gi_frame = frame;
+    }
+    Py_INCREF(frame);
+    return frame;
+}
 static __pyx_CoroutineObject *__Pyx__Coroutine_New(
             PyTypeObject* type, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
             PyObject *name, PyObject *qualname, PyObject *module_name) {
@@ -7684,9 +10120,12 @@ static __pyx_CoroutineObject *__Pyx__Coroutine_NewInit(
     gen->resume_label = 0;
     gen->classobj = NULL;
     gen->yieldfrom = NULL;
-    gen->exc_type = NULL;
-    gen->exc_value = NULL;
-    gen->exc_traceback = NULL;
+    gen->gi_exc_state.exc_type = NULL;
+    gen->gi_exc_state.exc_value = NULL;
+    gen->gi_exc_state.exc_traceback = NULL;
+#if CYTHON_USE_EXC_INFO_STACK
+    gen->gi_exc_state.previous_item = NULL;
+#endif
     gen->gi_weakreflist = NULL;
     Py_XINCREF(qualname);
     gen->gi_qualname = qualname;
@@ -7696,12 +10135,13 @@ static __pyx_CoroutineObject *__Pyx__Coroutine_NewInit(
     gen->gi_modulename = module_name;
     Py_XINCREF(code);
     gen->gi_code = code;
+    gen->gi_frame = NULL;
     PyObject_GC_Track(gen);
     return gen;
 }
 
 /* PatchModuleWithCoroutine */
-            static PyObject* __Pyx_Coroutine_patch_module(PyObject* module, const char* py_code) {
+static PyObject* __Pyx_Coroutine_patch_module(PyObject* module, const char* py_code) {
 #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
     int result;
     PyObject *globals, *result_obj;
@@ -7741,7 +10181,7 @@ ignore:
 }
 
 /* PatchGeneratorABC */
-            #ifndef CYTHON_REGISTER_ABCS
+#ifndef CYTHON_REGISTER_ABCS
 #define CYTHON_REGISTER_ABCS 1
 #endif
 #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
@@ -7798,12 +10238,12 @@ static int __Pyx_patch_abc(void) {
 }
 
 /* Generator */
-            static PyMethodDef __pyx_Generator_methods[] = {
+static PyMethodDef __pyx_Generator_methods[] = {
     {"send", (PyCFunction) __Pyx_Coroutine_Send, METH_O,
      (char*) PyDoc_STR("send(arg) -> send 'arg' into generator,\nreturn next yielded value or raise StopIteration.")},
     {"throw", (PyCFunction) __Pyx_Coroutine_Throw, METH_VARARGS,
      (char*) PyDoc_STR("throw(typ[,val[,tb]]) -> raise exception in generator,\nreturn next yielded value or raise StopIteration.")},
-    {"close", (PyCFunction) __Pyx_Coroutine_Close, METH_NOARGS,
+    {"close", (PyCFunction) __Pyx_Coroutine_Close_Method, METH_NOARGS,
      (char*) PyDoc_STR("close() -> raise GeneratorExit inside generator.")},
     {0, 0, 0, 0}
 };
@@ -7819,6 +10259,8 @@ static PyGetSetDef __pyx_Generator_getsets[] = {
      (char*) PyDoc_STR("name of the generator"), 0},
     {(char *) "__qualname__", (getter)__Pyx_Coroutine_get_qualname, (setter)__Pyx_Coroutine_set_qualname,
      (char*) PyDoc_STR("qualified name of the generator"), 0},
+    {(char *) "gi_frame", (getter)__Pyx_Coroutine_get_frame, NULL,
+     (char*) PyDoc_STR("Frame of the generator"), 0},
     {0, 0, 0, 0, 0}
 };
 static PyTypeObject __pyx_GeneratorType_type = {
@@ -7878,6 +10320,18 @@ static PyTypeObject __pyx_GeneratorType_type = {
 #elif PY_VERSION_HEX >= 0x030400a1
     0,
 #endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
+#endif
 };
 static int __pyx_Generator_init(void) {
     __pyx_GeneratorType_type.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
@@ -7890,12 +10344,34 @@ static int __pyx_Generator_init(void) {
 }
 
 /* CheckBinaryVersion */
-            static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+static int __Pyx_check_binary_version(void) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -7905,93 +10381,10 @@ static int __pyx_Generator_init(void) {
     return 0;
 }
 
-/* ModuleImport */
-            #ifndef __PYX_HAVE_RT_ImportModule
-#define __PYX_HAVE_RT_ImportModule
-static PyObject *__Pyx_ImportModule(const char *name) {
-    PyObject *py_name = 0;
-    PyObject *py_module = 0;
-    py_name = __Pyx_PyIdentifier_FromString(name);
-    if (!py_name)
-        goto bad;
-    py_module = PyImport_Import(py_name);
-    Py_DECREF(py_name);
-    return py_module;
-bad:
-    Py_XDECREF(py_name);
-    return 0;
-}
-#endif
-
-/* TypeImport */
-            #ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
-    size_t size, int strict)
-{
-    PyObject *py_module = 0;
-    PyObject *result = 0;
-    PyObject *py_name = 0;
-    char warning[200];
-    Py_ssize_t basicsize;
-#ifdef Py_LIMITED_API
-    PyObject *py_basicsize;
-#endif
-    py_module = __Pyx_ImportModule(module_name);
-    if (!py_module)
-        goto bad;
-    py_name = __Pyx_PyIdentifier_FromString(class_name);
-    if (!py_name)
-        goto bad;
-    result = PyObject_GetAttr(py_module, py_name);
-    Py_DECREF(py_name);
-    py_name = 0;
-    Py_DECREF(py_module);
-    py_module = 0;
-    if (!result)
-        goto bad;
-    if (!PyType_Check(result)) {
-        PyErr_Format(PyExc_TypeError,
-            "%.200s.%.200s is not a type object",
-            module_name, class_name);
-        goto bad;
-    }
-#ifndef Py_LIMITED_API
-    basicsize = ((PyTypeObject *)result)->tp_basicsize;
-#else
-    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
-    if (!py_basicsize)
-        goto bad;
-    basicsize = PyLong_AsSsize_t(py_basicsize);
-    Py_DECREF(py_basicsize);
-    py_basicsize = 0;
-    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
-        goto bad;
-#endif
-    if (!strict && (size_t)basicsize > size) {
-        PyOS_snprintf(warning, sizeof(warning),
-            "%s.%s size changed, may indicate binary incompatibility. Expected %zd, got %zd",
-            module_name, class_name, basicsize, size);
-        if (PyErr_WarnEx(NULL, warning, 0) < 0) goto bad;
-    }
-    else if ((size_t)basicsize != size) {
-        PyErr_Format(PyExc_ValueError,
-            "%.200s.%.200s has the wrong size, try recompiling. Expected %zd, got %zd",
-            module_name, class_name, basicsize, size);
-        goto bad;
-    }
-    return (PyTypeObject *)result;
-bad:
-    Py_XDECREF(py_module);
-    Py_XDECREF(result);
-    return NULL;
-}
-#endif
-
 /* FunctionImport */
-            #ifndef __PYX_HAVE_RT_ImportFunction
-#define __PYX_HAVE_RT_ImportFunction
-static int __Pyx_ImportFunction(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
+#ifndef __PYX_HAVE_RT_ImportFunction_0_29_37
+#define __PYX_HAVE_RT_ImportFunction_0_29_37
+static int __Pyx_ImportFunction_0_29_37(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
     PyObject *d = 0;
     PyObject *cobj = 0;
     union {
@@ -8043,7 +10436,7 @@ bad:
 #endif
 
 /* InitStrings */
-            static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
+static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
     while (t->p) {
         #if PY_MAJOR_VERSION < 3
         if (t->is_unicode) {
@@ -8152,6 +10545,13 @@ static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
    if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
    else return PyObject_IsTrue(x);
 }
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
 static PyObject* __Pyx_PyNumber_IntOrLongWrongResultType(PyObject* result, const char* type_name) {
 #if PY_MAJOR_VERSION >= 3
     if (PyLong_Check(result)) {
@@ -8229,7 +10629,7 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
     if (sizeof(Py_ssize_t) >= sizeof(long))
         return PyInt_AS_LONG(b);
     else
-        return PyInt_AsSsize_t(x);
+        return PyInt_AsSsize_t(b);
   }
 #endif
   if (likely(PyLong_CheckExact(b))) {
@@ -8283,6 +10683,23 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
   return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
 }
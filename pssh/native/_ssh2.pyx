@@ -17,8 +17,12 @@
 
 """Cython functions for interfacing directly with ssh2-python's C-API"""
 
-from libc.stdlib cimport malloc, free
-from libc.stdio cimport fopen, fclose, fwrite, fread, FILE
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memchr, memcpy
+from libc.stdio cimport fopen, fclose, fwrite, fread, ferror, FILE
+from libc.errno cimport errno
+from libc.string cimport strerror
+from cpython.bytes cimport PyBytes_FromStringAndSize
 
 from gevent.select import select
 
@@ -30,24 +34,80 @@ from ssh2.c_sftp cimport libssh2_sftp_read, libssh2_sftp_write, \
     LIBSSH2_SFTP_HANDLE
 from ssh2.session cimport Session
 from ssh2.sftp_handle cimport SFTPHandle
-from ssh2.exceptions import SFTPHandleError
-from ssh2.utils cimport to_bytes
+from ssh2.utils cimport to_bytes, handle_error_codes
 
 from ..exceptions import SessionError, Timeout
 
 
-cdef bytes LINESEP = b'\n'
+cdef Py_ssize_t _MIN_BUFFER_SIZE = 1024
 
 
-def _read_output(Session session, read_func, timeout=None):
+cdef class _LineBuffer:
+    """Growable buffer for partial lines spanning more than one chunk"""
+    cdef char *_buf
+    cdef Py_ssize_t _len
+    cdef Py_ssize_t _size
+
+    def __cinit__(self):
+        self._buf = NULL
+        self._len = 0
+        self._size = 0
+
+    def __dealloc__(self):
+        free(self._buf)
+
+    cdef int append(self, const char *data, Py_ssize_t size) except -1:
+        cdef Py_ssize_t new_size
+        cdef char *new_buf
+        if self._len + size > self._size:
+            new_size = max(self._size * 2, self._len + size, _MIN_BUFFER_SIZE)
+            new_buf = <char *>realloc(self._buf, new_size)
+            if new_buf is NULL:
+                raise MemoryError
+            self._buf = new_buf
+            self._size = new_size
+        memcpy(self._buf + self._len, data, size)
+        self._len += size
+        return 0
+
+    cdef bytes pop(self, bint strip=True):
+        cdef Py_ssize_t size = _rstrip_size(self._buf, self._len) \
+            if strip else self._len
+        cdef bytes line = PyBytes_FromStringAndSize(self._buf, size)
+        self._len = 0
+        return line
+
+
+cdef inline Py_ssize_t _rstrip_size(const char *data, Py_ssize_t size) nogil:
+    """Size of data without trailing whitespace, as per ``bytes.rstrip``"""
+    cdef char c
+    while size > 0:
+        c = data[size - 1]
+        if c == b' ' or c == b'\t' or c == b'\n' or c == b'\r' \
+           or c == b'\x0b' or c == b'\x0c':
+            size -= 1
+        else:
+            break
+    return size
+
+
+def _read_output(Session session, read_func, timeout=None, bint chunks=False):
+    """Read output from ``read_func`` until EOF and yield lines of output
+    with trailing whitespace stripped.
+
+    Each chunk of data read is scanned for line separators once, partial
+    lines are kept in a native buffer until their line separator is read.
+
+    :param chunks: Yield chunks of data as they are read instead of lines.
+    :type chunks: bool"""
     cdef Py_ssize_t _size
     cdef bytes _data
-    cdef bytes remainder = b""
-    cdef Py_ssize_t remainder_len = 0
+    cdef _LineBuffer remainder = _LineBuffer()
     cdef LIBSSH2_SESSION *_session = session._session
     cdef int _sock = session._sock
-    cdef size_t _pos = 0
-    cdef Py_ssize_t linesep
+    cdef const char *_pos
+    cdef const char *_end
+    cdef const char *linesep
     _size, _data = read_func()
     while _size == LIBSSH2_ERROR_EAGAIN or _size > 0:
         if _size == LIBSSH2_ERROR_EAGAIN:
@@ -56,35 +116,50 @@ def _read_output(Session session, read_func, timeout=None):
             if timeout is not None and _size == LIBSSH2_ERROR_EAGAIN:
                 raise Timeout
         while _size > 0:
-            while _pos < _size:
-                linesep = _data[:_size].find(LINESEP, _pos)
-                if linesep >= 0:
-                    if remainder_len > 0:
-                        yield remainder + _data[_pos:linesep].rstrip()
-                        remainder = b""
-                        remainder_len = 0
-                    else:
-                        yield _data[_pos:linesep].rstrip()
-                    _pos = linesep + 1
-                else:
-                    remainder += _data[_pos:]
-                    remainder_len = len(remainder)
+            if chunks:
+                yield _data if len(_data) == _size else _data[:_size]
+                _size, _data = read_func()
+                continue
+            _pos = _data
+            _end = _pos + _size
+            while _pos < _end:
+                linesep = <const char *>memchr(_pos, b'\n', _end - _pos)
+                if linesep is NULL:
+                    remainder.append(_pos, _end - _pos)
                     break
+                if remainder._len > 0:
+                    remainder.append(_pos, linesep - _pos)
+                    yield remainder.pop()
+                else:
+                    yield PyBytes_FromStringAndSize(
+                        _pos, _rstrip_size(_pos, linesep - _pos))
+                _pos = linesep + 1
             _size, _data = read_func()
-            _pos = 0
-    if remainder_len > 0:
+    if remainder._len > 0:
         # Finished reading without finding ending linesep
-        yield remainder
+        yield remainder.pop(strip=False)
 
 
 def sftp_put(Session session, SFTPHandle handle,
-             local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
-    """Native function for reading from SFTP and writing to local file"""
+             local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+             progress=None):
+    """Native function for reading from local file and writing to SFTP.
+
+    Local file is read in blocks of ``buffer_maxlen`` bytes. Each block is
+    written by libssh2 as several outstanding SFTP write requests.
+
+    ``progress``, if set, is called with total number of bytes written after
+    each block is written.
+
+    :rtype: int - total number of bytes written"""
     cdef bytes b_local_file = to_bytes(local_file)
     cdef char *_local_file = b_local_file
     cdef FILE *local_fh
-    cdef int rc
-    cdef int nread
+    cdef ssize_t rc
+    cdef size_t nread
+    cdef unsigned long long total = 0
+    cdef bint has_progress = progress is not None
+    cdef int _errno
     cdef char *cbuf
     cdef char *ptr
     cdef LIBSSH2_SFTP_HANDLE *_handle = handle._handle
@@ -94,17 +169,16 @@ def sftp_put(Session session, SFTPHandle handle,
     with nogil:
         local_fh = fopen(_local_file, 'rb')
         if local_fh is NULL:
+            _errno = errno
             with gil:
-                raise OSError
+                raise IOError(_errno, strerror(_errno).decode(), local_file)
         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
         if cbuf is NULL:
+            fclose(local_fh)
             with gil:
                 raise MemoryError
         try:
             nread = fread(cbuf, 1, buffer_maxlen, local_fh)
-            if nread < 0:
-                with gil:
-                    raise IOError
             while nread > 0:
                 ptr = cbuf
                 rc = libssh2_sftp_write(_handle, ptr, nread)
@@ -115,35 +189,64 @@ def sftp_put(Session session, SFTPHandle handle,
                     else:
                         ptr += rc
                         nread -= rc
+                        total += rc
                     rc = libssh2_sftp_write(_handle, ptr, nread)
                 if rc < 0:
                     with gil:
-                        raise SFTPHandleError(rc)
+                        handle_error_codes(rc)
+                if has_progress:
+                    with gil:
+                        progress(total)
                 nread = fread(cbuf, 1, buffer_maxlen, local_fh)
+            if ferror(local_fh):
+                with gil:
+                    raise IOError("Error reading from local file %s" % (
+                        local_file,))
         finally:
             free(cbuf)
             fclose(local_fh)
+    return total
 
 
 def sftp_get(Session session, SFTPHandle handle,
-             local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT):
-    """Native function for reading from local file and writing to SFTP"""
+             local_file, size_t buffer_maxlen=LIBSSH2_CHANNEL_WINDOW_DEFAULT,
+             bint append=False, progress=None):
+    """Native function for reading from SFTP and writing to local file.
+
+    Remote file is read into a single buffer of ``buffer_maxlen`` bytes,
+    with libssh2 keeping several SFTP read requests outstanding to fill it.
+    No Python objects are created for data read.
+
+    Data is appended to local file if ``append`` is set, otherwise local file
+    is truncated.
+
+    ``progress``, if set, is called with total number of bytes read after
+    each read.
+
+    Waits cooperatively on session socket whenever reading would block.
+
+    :rtype: int - total number of bytes read"""
     cdef bytes b_local_file = to_bytes(local_file)
     cdef char *_local_file = b_local_file
     cdef FILE *local_fh
-    cdef int rc
+    cdef ssize_t rc
+    cdef unsigned long long total = 0
+    cdef bint has_progress = progress is not None
+    cdef int _errno
     cdef char *cbuf
     cdef LIBSSH2_SFTP_HANDLE *_handle = handle._handle
     cdef LIBSSH2_SESSION *_session = session._session
     cdef int _sock = session._sock
 
     with nogil:
-        local_fh = fopen(_local_file, 'wb')
+        local_fh = fopen(_local_file, 'ab' if append else 'wb')
         if local_fh is NULL:
+            _errno = errno
             with gil:
-                raise OSError
+                raise IOError(_errno, strerror(_errno).decode(), local_file)
         cbuf = <char *>malloc(sizeof(char) * buffer_maxlen)
         if cbuf is NULL:
+            fclose(local_fh)
             with gil:
                 raise MemoryError
         try:
@@ -152,15 +255,24 @@ def sftp_get(Session session, SFTPHandle handle,
                 if rc == LIBSSH2_ERROR_EAGAIN:
                     with gil:
                         _wait_select(_sock, _session, None)
-                elif fwrite(cbuf, 1, rc, local_fh) < 0:
+                elif fwrite(cbuf, 1, rc, local_fh) != <size_t>rc:
+                    _errno = errno
                     with gil:
-                        raise IOError
+                        raise IOError(_errno, strerror(_errno).decode(),
+                                      local_file)
+                else:
+                    total += rc
+                    if has_progress:
+                        with gil:
+                            progress(total)
                 rc = libssh2_sftp_read(_handle, cbuf, buffer_maxlen)
+            if rc < 0:
+                with gil:
+                    handle_error_codes(rc)
         finally:
             free(cbuf)
             fclose(local_fh)
-    if rc < 0 and rc != LIBSSH2_ERROR_EAGAIN:
-        raise SFTPHandleError(rc)
+    return total
 
 
 cdef int _wait_select(int _socket, LIBSSH2_SESSION *_session,
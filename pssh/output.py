@@ -25,10 +25,12 @@ class HostOutput(dict):
     """Class to hold host output"""
 
     __slots__ = ('host', 'cmd', 'channel', 'stdout', 'stderr', 'stdin',
-                 'exit_code', 'exception')
+                 'exit_code', 'exception', 'encoding', 'output_mode',
+                 'client', '__weakref__')
 
     def __init__(self, host, cmd, channel, stdout, stderr, stdin,
-                 exit_code=None, exception=None):
+                 exit_code=None, exception=None, encoding=None,
+                 output_mode=None, client=None):
         """
         :param host: Host name output is for
         :type host: str
@@ -46,11 +48,23 @@ class HostOutput(dict):
         :type exit_code: int or None
         :param exception: Exception from host if any
         :type exception: :py:class:`Exception` or ``None``
+        :param encoding: Encoding output generators were made with, if known
+        :type encoding: str or ``None``
+        :param output_mode: Output mode output generators were made with, if
+          known
+        :type output_mode: str or ``None``
+        :param client: Client command was run with, if not kept by the
+          parallel client
+        :type client: :py:class:`pssh.clients.native.single.SSHClient` or
+          ``None``
         """
         dict.__init__(self, (('host', host), ('cmd', cmd), ('channel', channel),
                              ('stdout', stdout), ('stderr', stderr),
                              ('stdin', stdin), ('exit_code', exit_code),
-                             ('exception', exception)))
+                             ('exception', exception),
+                             ('encoding', encoding),
+                             ('output_mode', output_mode),
+                             ('client', client)))
         self.host = host
         self.cmd = cmd
         self.channel = channel
@@ -59,6 +73,9 @@ class HostOutput(dict):
         self.stdin = stdin
         self.exception = exception
         self.exit_code = exit_code
+        self.encoding = encoding
+        self.output_mode = output_mode
+        self.client = client
 
     def __setattr__(self, name, value):
         object.__setattr__(self, name, value)
@@ -84,3 +101,40 @@ class HostOutput(dict):
 
     def __str__(self):
         return self.__repr__()
+
+
+class TransferStats(object):
+    """Class to hold statistics of a file transfer to or from a host"""
+
+    __slots__ = ('host', 'files', 'transferred', 'duration')
+
+    def __init__(self, host, files=0, transferred=0, duration=0.0):
+        """
+        :param host: Host name transfer is for
+        :type host: str
+        :param files: Number of files transferred
+        :type files: int
+        :param transferred: Number of bytes transferred
+        :type transferred: int
+        :param duration: Duration of transfer in seconds
+        :type duration: float
+        """
+        self.host = host
+        self.files = files
+        self.transferred = transferred
+        self.duration = duration
+
+    @property
+    def rate(self):
+        """Transfer rate in MB/s"""
+        if not self.duration:
+            return 0.0
+        return self.transferred / self.duration / 1048576
+
+    def __repr__(self):
+        return "TransferStats(host={host}, files={files}, " \
+            "transferred={transferred}, duration={duration:.3f}, " \
+            "rate={rate:.2f}MB/s)".format(
+                host=self.host, files=self.files,
+                transferred=self.transferred, duration=self.duration,
+                rate=self.rate)
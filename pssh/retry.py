@@ -0,0 +1,177 @@
+# This file is part of parallel-ssh.
+
+# Copyright (C) 2014-2018 Panos Kittenis.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""Connection retry policy and per-host circuit breaker"""
+
+import logging
+from random import uniform
+from time import time
+
+from gevent import sleep
+
+from .constants import DEFAULT_RETRIES, RETRY_DELAY, RETRY_MAX_DELAY, \
+    RETRY_BACKOFF, CIRCUIT_BREAKER_FAILURES, CIRCUIT_BREAKER_RESET_TIMEOUT
+from .exceptions import ConnectionErrorException
+
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy(object):
+    """Policy for number of connection attempts and delay between them.
+
+    Delay after each failed attempt grows exponentially by ``backoff``, up to
+    ``max_delay``, and with ``jitter`` a random delay between zero and that
+    delay is used so that retries to many hosts are spread out.
+    """
+
+    def __init__(self, num_retries=DEFAULT_RETRIES, retry_delay=RETRY_DELAY,
+                 backoff=RETRY_BACKOFF, max_delay=RETRY_MAX_DELAY,
+                 jitter=True):
+        """
+        :param num_retries: Number of connection attempts before giving up.
+          Defaults to :py:class:`pssh.constants.DEFAULT_RETRIES`
+        :type num_retries: int
+        :param retry_delay: Delay in seconds after first failed attempt.
+          Defaults to :py:class:`pssh.constants.RETRY_DELAY`
+        :type retry_delay: float
+        :param backoff: Factor to multiply delay by after each subsequent
+          failed attempt. Defaults to
+          :py:class:`pssh.constants.RETRY_BACKOFF`. ``1`` for a fixed delay.
+        :type backoff: float
+        :param max_delay: Maximum delay in seconds between attempts. Defaults
+          to :py:class:`pssh.constants.RETRY_MAX_DELAY`
+        :type max_delay: float
+        :param jitter: Use random delay between zero and calculated delay.
+        :type jitter: bool
+        """
+        self.num_retries = num_retries
+        self.retry_delay = retry_delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt):
+        """Delay in seconds before next attempt after ``attempt`` number of
+        failed attempts.
+
+        :rtype: float
+        """
+        delay = min(self.retry_delay * self.backoff ** (attempt - 1),
+                    self.max_delay)
+        if self.jitter:
+            return uniform(0, delay)
+        return delay
+
+    def sleep(self, attempt):
+        """Sleep for delay before next attempt after ``attempt`` number of
+        failed attempts."""
+        sleep(self.delay(attempt))
+
+
+class CircuitBreaker(object):
+    """Per-host circuit breaker for failing fast on hosts known to be
+    unreachable.
+
+    After ``failures`` consecutive failures to connect to a host, connection
+    attempts to that host fail immediately for ``reset_timeout`` seconds.
+    One attempt is then allowed through - success resets the host's failure
+    count and failure opens the circuit for another ``reset_timeout``.
+
+    A circuit breaker may be shared by any number of clients and keeps
+    failures across runs.
+    """
+
+    def __init__(self, failures=CIRCUIT_BREAKER_FAILURES,
+                 reset_timeout=CIRCUIT_BREAKER_RESET_TIMEOUT):
+        """
+        :param failures: Number of consecutive failures after which
+          connections to host fail fast. Defaults to
+          :py:class:`pssh.constants.CIRCUIT_BREAKER_FAILURES`
+        :type failures: int
+        :param reset_timeout: Number of seconds to fail fast for before
+          allowing another attempt. Defaults to
+          :py:class:`pssh.constants.CIRCUIT_BREAKER_RESET_TIMEOUT`
+        :type reset_timeout: float
+        """
+        self.failures = failures
+        self.reset_timeout = reset_timeout
+        # Host -> (consecutive failures, time circuit was opened)
+        self._hosts = {}
+
+    def is_open(self, host):
+        """Whether circuit for host is open and reset timeout has not yet
+        elapsed. Has no side effects - see :py:func:`allow_request` for
+        letting an attempt through.
+
+        :rtype: bool
+        """
+        opened = self._hosts.get(host, (0, None))[1]
+        return opened is not None and time() - opened < self.reset_timeout
+
+    def allow_request(self, host):
+        """Whether a connection attempt to host should be made.
+
+        Once reset timeout has elapsed for an open circuit, one attempt is
+        allowed through and the circuit is opened again until that attempt
+        succeeds.
+
+        :rtype: bool
+        """
+        failures, opened = self._hosts.get(host, (0, None))
+        if opened is None:
+            return True
+        if time() - opened < self.reset_timeout:
+            return False
+        # Half open - other attempts fail fast until this one's outcome is
+        # recorded
+        self._hosts[host] = (failures, time())
+        return True
+
+    def check(self, host):
+        """Raise if connections to host should fail fast, otherwise allow
+        an attempt as per :py:func:`allow_request`.
+
+        :raises: :py:class:`pssh.exceptions.ConnectionErrorException` if
+          circuit for host is open.
+        """
+        if not self.allow_request(host):
+            failures = self._hosts[host][0]
+            raise ConnectionErrorException(
+                "Not connecting to host %s after %s consecutive failures - "
+                "next attempt allowed within %s seconds", host, failures,
+                self.reset_timeout)
+
+    def record_failure(self, host):
+        """Record failure to connect to host."""
+        failures, opened = self._hosts.get(host, (0, None))
+        failures += 1
+        if failures >= self.failures:
+            if opened is None:
+                logger.warning("Host %s failed %s consecutive times - "
+                               "failing fast for %s seconds", host, failures,
+                               self.reset_timeout)
+            opened = time()
+        self._hosts[host] = (failures, opened)
+
+    def record_success(self, host):
+        """Record successful connection to host, closing its circuit."""
+        self._hosts.pop(host, None)
+
+    def reset(self):
+        """Forget failures of all hosts."""
+        self._hosts.clear()
@@ -22,20 +22,23 @@
 from __future__ import print_function
 
 import unittest
+import gc
 import pwd
 import logging
 import os
 import shutil
 import sys
 import string
-from socket import timeout as socket_timeout
+from socket import timeout as socket_timeout, SHUT_RDWR
 from sys import version_info
+from weakref import ref
 import random
 import time
 
 
-from gevent import joinall, spawn
-from pssh.clients.native import ParallelSSHClient
+from gevent import joinall, spawn, sleep
+from pssh.clients.native import ParallelSSHClient, SessionPool
+from pssh.retry import CircuitBreaker
 from pssh.exceptions import UnknownHostException, \
     AuthenticationException, ConnectionErrorException, SessionError, \
     HostArgumentException, SFTPError, SFTPIOError, Timeout, SCPError, \
@@ -1393,3 +1396,440 @@ class ParallelSSHClientTest(unittest.TestCase):
     def test_bad_hosts_value(self):
         self.assertRaises(TypeError, ParallelSSHClient, 'a host')
         self.assertRaises(TypeError, ParallelSSHClient, b'a host')
+
+    def test_imap_run_command(self):
+        output = list(self.client.imap_run_command(self.cmd))
+        self.assertEqual(len(output), 1)
+        host_out = output[0]
+        self.assertEqual(host_out.host, self.host)
+        self.client.join({host_out.host: host_out})
+        self.assertEqual(list(host_out.stdout), [self.resp])
+        self.assertEqual(host_out.exit_code, 0)
+
+    def test_imap_run_command_stop_on_errors(self):
+        hosts = [self.host, '127.1.1.100']
+        client = ParallelSSHClient(hosts, port=self.port,
+                                   pkey=self.user_key,
+                                   num_retries=1)
+        output = dict((host_out.host, host_out) for host_out in
+                      client.imap_run_command(self.cmd, stop_on_errors=False))
+        self.assertEqual(len(output), len(hosts))
+        self.assertTrue(output[self.host].exception is None)
+        self.assertIsInstance(output[hosts[1]].exception,
+                              ConnectionErrorException)
+        self.assertRaises(ConnectionErrorException, list,
+                          client.imap_run_command(self.cmd))
+
+    def test_imap_run_command_generator_host_args(self):
+        hosts = [self.host for _ in range(5)]
+        client = ParallelSSHClient((host for host in hosts), port=self.port,
+                                   pkey=self.user_key, pool_size=2,
+                                   num_retries=1)
+        host_args = (str(i) for i in range(len(hosts)))
+        stdout = []
+        for host_out in client.imap_run_command('echo %s', host_args=host_args):
+            self.assertTrue(len(client.pool) <= 2)
+            stdout.extend(host_out.stdout)
+        self.assertEqual(sorted(stdout), [str(i) for i in range(len(hosts))])
+        self.assertTrue(client.cmds is None)
+        client.hosts = [self.host, self.host]
+        self.assertRaises(HostArgumentException, list,
+                          client.imap_run_command(
+                              'echo %s', host_args=iter(['a'])))
+        self.assertRaises(HostArgumentException, client.run_command,
+                          'echo %s', host_args=iter(['a']))
+
+    def test_imap_run_command_releases_clients(self):
+        hosts = (self.host for _ in range(6))
+        client = ParallelSSHClient(hosts, port=self.port,
+                                   pkey=self.user_key, pool_size=2,
+                                   num_retries=1)
+        client_refs = []
+        for host_out in client.imap_run_command(self.cmd):
+            # Clients of hosts with yielded output are not kept
+            self.assertFalse(host_out.host in client.host_clients)
+            self.assertTrue(len(client.host_clients) <= 2)
+            client.join({host_out.host: host_out})
+            self.assertEqual(list(host_out.stdout), [self.resp])
+            client_refs.append(ref(host_out.client))
+        del host_out
+        gc.collect()
+        self.assertEqual(client.host_clients, {})
+        self.assertEqual(len(client_refs), 6)
+        # Clients are freed, and disconnected, along with their output
+        self.assertEqual([_ref() for _ref in client_refs], [None] * 6)
+
+    def test_run_command_chunks_output_mode(self):
+        output = self.client.run_command(
+            'head -c 100000 /dev/zero', output_mode='chunks')
+        self.client.join(output, output_mode='chunks')
+        stdout = b''.join(output[self.host].stdout)
+        self.assertEqual(stdout, b'\0' * 100000)
+        self.assertEqual(output[self.host].exit_code, 0)
+
+    def test_join_keeps_output_mode(self):
+        output = self.client.run_command(self.cmd, output_mode='bytes')
+        self.assertEqual(output[self.host].output_mode, 'bytes')
+        self.client.join(output)
+        self.assertEqual(list(output[self.host].stdout),
+                         [self.resp.encode('utf-8')])
+        self.assertEqual(output[self.host].exit_code, 0)
+
+    def test_connect_all(self):
+        client = ParallelSSHClient([self.host], port=self.port,
+                                   pkey=self.user_key, num_retries=1)
+        self.assertEqual(client.connect_all(), {self.host: None})
+        ssh_client = client.host_clients[self.host]
+        self.assertTrue(ssh_client is not None)
+        output = client.run_command(self.cmd)
+        client.join(output)
+        self.assertEqual(list(output[self.host].stdout), [self.resp])
+        self.assertTrue(client.host_clients[self.host] is ssh_client)
+        client = ParallelSSHClient([self.host], port=self.port + 100,
+                                   pkey=self.user_key, num_retries=1)
+        res = client.connect_all()
+        self.assertIsInstance(res[self.host], ConnectionErrorException)
+
+    def test_run_commands(self):
+        commands = ['echo %s' % i for i in range(5)]
+        outputs = self.client.run_commands(commands)
+        self.assertEqual(len(outputs), len(commands))
+        for i, output in enumerate(outputs):
+            self.client.join(output)
+            self.assertEqual(list(output[self.host].stdout), [str(i)])
+            self.assertEqual(output[self.host].exit_code, 0)
+        self.assertEqual(list(self.client.host_clients), [self.host])
+
+    def test_run_commands_pool_size_bounds_hosts(self):
+        client = ParallelSSHClient([self.host], port=self.port,
+                                   pkey=self.user_key, pool_size=1,
+                                   num_retries=1)
+        client.connect_all()
+        # Commands of one host all start within its pool slot
+        start = time.time()
+        outputs = client.run_commands(['sleep 1; echo %s' % i
+                                       for i in range(3)])
+        for i, output in enumerate(outputs):
+            client.join(output)
+            self.assertEqual(list(output[self.host].stdout), [str(i)])
+        self.assertTrue(time.time() - start < 2)
+        outputs = client.run_commands(['echo me'], stop_on_errors=False)
+        self.assertEqual(list(outputs[0]), [self.host])
+        client.hosts = ['127.1.1.100']
+        outputs = client.run_commands(['echo 1', 'echo 2'],
+                                      stop_on_errors=False)
+        for output in outputs:
+            self.assertIsInstance(output['127.1.1.100'].exception,
+                                  ConnectionErrorException)
+
+    def test_imap_run_command_completion_order(self):
+        # Server that accepts connections but never responds
+        slow_host = '127.0.0.3'
+        slow_sock = make_socket(slow_host)
+        slow_sock.listen(10)
+        slow_port = slow_sock.getsockname()[1]
+        hosts = [slow_host, self.host]
+        host_config = {slow_host: {'port': slow_port},
+                       self.host: {'port': self.port}}
+        client = ParallelSSHClient(hosts, pkey=self.user_key,
+                                   host_config=host_config,
+                                   timeout=1, num_retries=1)
+        try:
+            output = list(client.imap_run_command(
+                self.cmd, stop_on_errors=False))
+        finally:
+            slow_sock.close()
+        self.assertEqual(len(output), len(hosts))
+        self.assertEqual(output[0].host, self.host)
+        self.assertTrue(output[0].exception is None)
+        self.assertEqual(output[1].host, slow_host)
+        self.assertTrue(output[1].exception is not None)
+
+    def test_copy_dir_concurrency(self):
+        local_test_path = 'directory_test_concurrency'
+        remote_test_path = os.sep.join((os.path.dirname(__file__),
+                                        'directory_test_concurrency_copied'))
+        for path in [local_test_path, remote_test_path]:
+            shutil.rmtree(path, ignore_errors=True)
+        file_paths = []
+        for i in range(3):
+            local_dir = os.path.join(local_test_path, 'sub_dir', 'dir_%s' % i)
+            os.makedirs(local_dir)
+            for j in range(5):
+                file_path = os.path.join(local_dir, 'file_%s' % j)
+                with open(file_path, 'w') as fh:
+                    fh.write('data %s %s\n' % (i, j))
+                file_paths.append(os.path.relpath(file_path, local_test_path))
+        os.mkdir(os.path.join(local_test_path, 'empty_dir'))
+        try:
+            cmds = self.client.copy_file(local_test_path, remote_test_path,
+                                         recurse=True, concurrency=4)
+            joinall(cmds, raise_error=True)
+            for path in file_paths:
+                with open(os.path.join(local_test_path, path)) as fh:
+                    local_data = fh.read()
+                with open(os.path.join(remote_test_path, path)) as fh:
+                    self.assertEqual(fh.read(), local_data)
+            self.assertTrue(os.path.isdir(
+                os.path.join(remote_test_path, 'empty_dir')))
+        finally:
+            for path in [local_test_path, remote_test_path]:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def test_copy_file_dir_no_recurse(self):
+        local_test_path = 'directory_test_no_recurse'
+        remote_test_path = os.sep.join((os.path.dirname(__file__),
+                                        'directory_test_no_recurse_copied'))
+        for path in [local_test_path, remote_test_path]:
+            shutil.rmtree(path, ignore_errors=True)
+        os.mkdir(local_test_path)
+        with open(os.path.join(local_test_path, 'file'), 'w') as fh:
+            fh.write('data\n')
+        try:
+            cmds = self.client.copy_file(local_test_path, remote_test_path)
+            self.assertRaises(ValueError, joinall, cmds, raise_error=True)
+            cmds = self.client.copy_file(
+                local_test_path + '%s', remote_test_path + '%s',
+                copy_args=[('',)], recurse=False)
+            self.assertRaises(ValueError, joinall, cmds, raise_error=True)
+            self.assertFalse(os.path.exists(remote_test_path))
+        finally:
+            for path in [local_test_path, remote_test_path]:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def test_sync_dir(self):
+        local_test_path = 'directory_test_sync'
+        remote_test_path = os.sep.join((os.path.dirname(__file__),
+                                        'directory_test_sync_copied'))
+        for path in [local_test_path, remote_test_path]:
+            shutil.rmtree(path, ignore_errors=True)
+        file_paths = []
+        for i in range(2):
+            local_dir = os.path.join(local_test_path, 'dir_%s' % i)
+            os.makedirs(local_dir)
+            for j in range(3):
+                file_path = os.path.join(local_dir, 'file_%s' % j)
+                with open(file_path, 'w') as fh:
+                    fh.write('data %s %s\n' % (i, j))
+                file_paths.append('/'.join(['dir_%s' % i, 'file_%s' % j]))
+        os.mkdir(os.path.join(local_test_path, 'empty_dir'))
+        try:
+            cmds = self.client.sync_dir(local_test_path, remote_test_path,
+                                        concurrency=2)
+            self.assertEqual(cmds[0].get(), sorted(file_paths))
+            for path in file_paths:
+                with open(os.path.join(local_test_path, path)) as fh:
+                    local_data = fh.read()
+                with open(os.path.join(remote_test_path, path)) as fh:
+                    self.assertEqual(fh.read(), local_data)
+            self.assertTrue(os.path.isdir(
+                os.path.join(remote_test_path, 'empty_dir')))
+            cmds = self.client.sync_dir(local_test_path, remote_test_path)
+            self.assertEqual(cmds[0].get(), [])
+            changed = os.path.join(local_test_path, 'dir_1', 'file_2')
+            with open(changed, 'w') as fh:
+                fh.write('changed data\n')
+            for checksum, scp_min_size in ((False, 1), (True, None)):
+                cmds = self.client.sync_dir(
+                    local_test_path, remote_test_path, checksum=checksum,
+                    scp_min_size=scp_min_size)
+                self.assertEqual(cmds[0].get(), ['dir_1/file_2'])
+                with open(os.path.join(remote_test_path, 'dir_1',
+                                       'file_2')) as fh:
+                    self.assertEqual(fh.read(), 'changed data\n')
+                os.unlink(os.path.join(remote_test_path, 'dir_1', 'file_2'))
+            # Remote file with same size and modification time but different
+            # data is copied with checksum
+            self.client.sync_dir(local_test_path, remote_test_path)
+            remote_changed = os.path.join(remote_test_path, 'dir_1', 'file_2')
+            mtime = os.stat(changed).st_mtime
+            with open(remote_changed, 'w') as fh:
+                fh.write('changed dat4\n')
+            os.utime(remote_changed, (mtime, mtime))
+            cmds = self.client.sync_dir(local_test_path, remote_test_path,
+                                        checksum=True)
+            self.assertEqual(cmds[0].get(), ['dir_1/file_2'])
+            with open(remote_changed) as fh:
+                self.assertEqual(fh.read(), 'changed data\n')
+            self.assertRaises(ValueError, self.client.sync_dir,
+                              changed, remote_test_path)
+        finally:
+            for path in [local_test_path, remote_test_path]:
+                shutil.rmtree(path, ignore_errors=True)
+
+    def test_distribute_file(self):
+        host2 = '127.0.0.8'
+        server2 = OpenSSHServer(listen_ip=host2, port=self.port)
+        server2.start_server()
+        hosts = [self.host, host2]
+        client = ParallelSSHClient(hosts, port=self.port, pkey=self.user_key,
+                                   num_retries=1)
+        local_file = 'test_file_distribute'
+        remote_file = os.sep.join((os.path.dirname(__file__),
+                                   'distribute_dir', 'test_file_distributed'))
+        with open(local_file, 'w') as fh:
+            fh.write('test data\n')
+        try:
+            # Relay command that only checks relay host has the file
+            cmds = client.distribute_file(local_file, remote_file, fanout=1,
+                                          relay_cmd='test -f %(source)s')
+            joinall(cmds, raise_error=True)
+            self.assertEqual([cmd.get() for cmd in cmds], [None, self.host])
+            self.assertTrue(os.path.isdir(os.path.dirname(remote_file)))
+            os.unlink(remote_file)
+            # Failed relay falls back to direct copy
+            cmds = client.distribute_file(local_file, remote_file, fanout=1,
+                                          relay_cmd='false')
+            self.assertEqual([cmd.get() for cmd in cmds], [None, None])
+            with open(remote_file) as fh:
+                self.assertEqual(fh.read(), 'test data\n')
+            self.assertRaises(ValueError, client.distribute_file,
+                              local_file, remote_file, fanout=0)
+        finally:
+            server2.stop()
+            os.unlink(local_file)
+            shutil.rmtree(os.path.dirname(remote_file), ignore_errors=True)
+
+    def test_session_pool(self):
+        pool = SessionPool(max_sessions=1)
+        client1 = ParallelSSHClient([self.host], port=self.port,
+                                    pkey=self.user_key, num_retries=1,
+                                    session_pool=pool)
+        client2 = ParallelSSHClient([self.host], port=self.port,
+                                    pkey=self.user_key, num_retries=1,
+                                    session_pool=pool)
+        output = client1.run_command(self.cmd)
+        client1.join(output)
+        output = client2.run_command(self.cmd)
+        self.assertEqual(list(output[self.host].stdout), [self.resp])
+        self.assertIs(client1.host_clients[self.host],
+                      client2.host_clients[self.host])
+        self.assertEqual(len(pool), 1)
+        # Dead sessions are replaced
+        ssh_client = client1.host_clients[self.host]
+        ssh_client.sock.close()
+        output = client1.run_command(self.cmd)
+        self.assertEqual(list(output[self.host].stdout), [self.resp])
+        self.assertIsNot(client1.host_clients[self.host], ssh_client)
+        # Least recently used session over max sessions is removed from
+        # pool but not disconnected while leased
+        ssh_client = client1.host_clients[self.host]
+        other = pool.get(self.host, port=self.port, pkey=self.user_key,
+                         user=self.user, num_retries=1)
+        self.assertEqual(len(pool), 1)
+        self.assertFalse(ssh_client in pool)
+        self.assertFalse(ssh_client.sock.closed)
+        output = client1.run_command(self.cmd)
+        self.assertEqual(list(output[self.host].stdout), [self.resp])
+        # Disconnected once released
+        client1._release_client(ssh_client)
+        self.assertTrue(ssh_client.sock.closed)
+        # Released sessions are kept in pool until closed
+        pool.release(other)
+        self.assertTrue(other in pool)
+        self.assertFalse(other.sock.closed)
+        pool.close()
+        self.assertEqual(len(pool), 0)
+        self.assertTrue(other.sock.closed)
+
+    def test_session_pool_idle_client_dropped(self):
+        pool = SessionPool()
+        ssh_client = pool.get(self.host, port=self.port, pkey=self.user_key,
+                              user=self.user, num_retries=1)
+        pool.release(ssh_client)
+        # Live idle clients are reused
+        self.assertIs(pool.get(self.host, port=self.port, pkey=self.user_key,
+                               user=self.user, num_retries=1), ssh_client)
+        pool.release(ssh_client)
+        # Connection of idle client dropped without its socket being closed
+        ssh_client.sock.shutdown(SHUT_RDWR)
+        self.assertTrue(ssh_client.is_alive())
+        other = pool.get(self.host, port=self.port, pkey=self.user_key,
+                         user=self.user, num_retries=1)
+        self.assertIsNot(other, ssh_client)
+        self.assertTrue(ssh_client.sock.closed)
+        self.assertFalse(ssh_client in pool)
+        self.assertTrue(other in pool)
+        pool.release(other)
+        pool.close()
+
+    def test_keepalive(self):
+        client = ParallelSSHClient([self.host], port=self.port,
+                                   pkey=self.user_key, num_retries=1,
+                                   keepalive_seconds=1)
+        client.connect_all()
+        ssh_client = client.host_clients[self.host]
+        last_activity = ssh_client.last_activity
+        sleep(2.5)
+        self.assertTrue(ssh_client.last_activity > last_activity)
+        # Dead sessions are reconnected by keepalive greenlet
+        ssh_client.sock.close()
+        sleep(2.5)
+        self.assertIsNot(client.host_clients[self.host], ssh_client)
+        self.assertIsNotNone(client.host_clients[self.host])
+        output = client.run_command(self.cmd)
+        self.assertEqual(list(output[self.host].stdout), [self.resp])
+        del client
+
+    def test_reconnect_dead_session(self):
+        client = ParallelSSHClient([self.host], port=self.port,
+                                   pkey=self.user_key, num_retries=1)
+        output = client.run_command(self.cmd)
+        client.join(output)
+        # Keepalive is disabled by default
+        self.assertIsNone(client._keepalive_greenlet)
+        ssh_client = client.host_clients[self.host]
+        self.assertTrue(ssh_client.is_alive())
+        ssh_client.sock.close()
+        self.assertFalse(ssh_client.is_alive())
+        output = client.run_command(self.cmd)
+        self.assertEqual(list(output[self.host].stdout), [self.resp])
+        self.assertIsNot(client.host_clients[self.host], ssh_client)
+        self.assertEqual(client.reconnects[self.host], 1)
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(failures=1)
+        client = ParallelSSHClient(['127.0.0.100'], port=self.port,
+                                   num_retries=2, retry_delay=1,
+                                   circuit_breaker=breaker)
+        self.assertRaises(ConnectionErrorException, client.run_command,
+                          self.cmd)
+        self.assertTrue(breaker.is_open('127.0.0.100'))
+        # Known dead host fails fast without retries
+        start = time.time()
+        self.assertRaises(ConnectionErrorException, client.run_command,
+                          self.cmd)
+        self.assertTrue(time.time() - start < 1)
+        breaker.reset()
+        self.assertFalse(breaker.is_open('127.0.0.100'))
+
+    def test_resolved_hosts(self):
+        client = ParallelSSHClient([self.host], port=self.port,
+                                   pkey=self.user_key, num_retries=1)
+        output = client.run_command(self.cmd)
+        self.assertIsNotNone(client.resolver.get(self.host))
+        self.assertEqual(list(output.keys()), [self.host])
+        self.assertEqual(list(output[self.host].stdout), [self.resp])
+
+    def test_connect_all_timeout_pool_full(self):
+        # Servers that accept connections but never respond
+        hosts = ['127.0.0.3', '127.0.0.4']
+        socks = [make_socket(host) for host in hosts]
+        host_config = {}
+        for host, sock in zip(hosts, socks):
+            sock.listen(10)
+            host_config[host] = {'port': sock.getsockname()[1]}
+        client = ParallelSSHClient(hosts, pkey=self.user_key, pool_size=1,
+                                   host_config=host_config,
+                                   timeout=5, num_retries=1)
+        start = time.time()
+        try:
+            results = client.connect_all(timeout=1)
+        finally:
+            for sock in socks:
+                sock.close()
+        # Host waiting for pool slot is not connected to past timeout
+        self.assertTrue(time.time() - start < 2)
+        self.assertEqual(list(results), hosts)
+        for result in results.values():
+            self.assertIsInstance(result, Timeout)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+# This file is part of parallel-ssh.
+
+# Copyright (C) 2015- Panos Kittenis
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+"""Unittests for :mod:`pssh.clients.native.resolver` host resolver"""
+
+
+import unittest
+from socket import gaierror
+from time import sleep
+
+from gevent import get_hub
+
+from pssh.clients.native.resolver import HostResolver, AresResolver
+
+
+class TestHostResolver(unittest.TestCase):
+
+    def test_resolve(self):
+        resolver = HostResolver(ttl=.5)
+        addr_infos = resolver.resolve('127.0.0.1')
+        self.assertEqual(addr_infos[0][4][0], '127.0.0.1')
+        self.assertIs(resolver.get('127.0.0.1'), addr_infos)
+        self.assertIs(resolver.resolve('127.0.0.1'), addr_infos)
+        sleep(.6)
+        self.assertIsNone(resolver.get('127.0.0.1'))
+        self.assertRaises(gaierror, resolver.resolve, 'bad.host.invalid')
+        self.assertIsNone(resolver.get('bad.host.invalid'))
+
+    def test_resolve_all(self):
+        resolver = HostResolver(concurrency=2)
+        hosts = ['127.0.0.1', '127.0.0.2', '127.0.0.1', 'bad.host.invalid']
+        resolver.resolve_all(hosts)
+        self.assertIsNotNone(resolver.get('127.0.0.1'))
+        self.assertIsNotNone(resolver.get('127.0.0.2'))
+        self.assertIsNone(resolver.get('bad.host.invalid'))
+        resolver.clear()
+        self.assertIsNone(resolver.get('127.0.0.1'))
+
+    def test_cache_max_size(self):
+        resolver = HostResolver(max_size=2)
+        hosts = ['127.0.0.1', '127.0.0.2', '127.0.0.3']
+        for host in hosts:
+            resolver.resolve(host)
+        self.assertEqual(len(resolver._cache), 2)
+        self.assertIsNone(resolver.get('127.0.0.1'))
+        self.assertIsNotNone(resolver.get('127.0.0.3'))
+
+    def test_cache_evicts_expired(self):
+        resolver = HostResolver(ttl=.5)
+        resolver.resolve('127.0.0.1')
+        resolver.resolve('127.0.0.2')
+        sleep(.6)
+        resolver.resolve('127.0.0.3')
+        self.assertEqual(list(resolver._cache), ['127.0.0.3'])
+
+    def test_configured_resolver(self):
+        resolver = HostResolver()
+        addr_infos = resolver.resolve('localhost')
+        self.assertTrue(len(addr_infos) > 0)
+        self.assertIsNone(resolver._ares)
+
+    @unittest.skipIf(AresResolver is None, "gevent built without c-ares")
+    def test_ares_resolver(self):
+        resolver = HostResolver(use_ares=True)
+        addr_infos = resolver.resolve('127.0.0.1')
+        self.assertEqual(addr_infos[0][4][0], '127.0.0.1')
+        self.assertIs(resolver._ares.hub, get_hub())
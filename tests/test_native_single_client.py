@@ -3,6 +3,7 @@ import os
 import logging
 import time
 import subprocess
+import shutil
 
 from gevent import socket, sleep, spawn
 
@@ -63,6 +64,23 @@ class SSH2ClientTest(SSH2TestCase):
         self.assertListEqual(expected, stderr)
         self.assertTrue(len(output) == 0)
 
+    def test_last_activity_on_read(self):
+        self.assertIsNone(self.client.keepalive_seconds)
+        channel, host, stdout, stderr, stdin = self.client.run_command(
+            'sleep 1; echo me')
+        last_activity = self.client.last_activity
+        self.assertEqual(list(stdout), ['me'])
+        # Reads only update last activity with keepalive enabled
+        self.assertEqual(self.client.last_activity, last_activity)
+        client = SSHClient(self.host, port=self.port,
+                           pkey=self.user_key,
+                           num_retries=1, keepalive_seconds=60)
+        channel, host, stdout, stderr, stdin = client.run_command(
+            'sleep 1; echo me')
+        last_activity = client.last_activity
+        self.assertEqual(list(stdout), ['me'])
+        self.assertTrue(client.last_activity >= last_activity + 1)
+
     def test_long_running_cmd(self):
         channel, host, stdout, stderr, stdin = self.client.run_command(
             'sleep 2; exit 2')
@@ -125,6 +143,227 @@ class SSH2ClientTest(SSH2TestCase):
         output = list(stdout)
         self.assertEqual(lines, len(output))
 
+    def test_many_lines_output_parsing(self):
+        lines = 100000
+        channel, host, stdout, stderr, stdin = self.client.run_command(
+            'seq 1 %s; printf "last  "' % (lines,))
+        output = list(stdout)
+        self.assertEqual(len(output), lines + 1)
+        self.assertEqual(output[:3], ['1', '2', '3'])
+        self.assertEqual(output[lines - 1], str(lines))
+        self.assertEqual(output[-1], 'last  ')
+
+    def test_output_modes(self):
+        channel, host, stdout, stderr, stdin = self.client.run_command(
+            'printf "a\\nb\\n"; echo err >&2', output_mode='bytes')
+        self.assertEqual(list(stdout), [b'a', b'b'])
+        self.assertEqual(list(stderr), [b'err'])
+        channel, host, stdout, stderr, stdin = self.client.run_command(
+            'printf "a\\nb\\n"', output_mode='chunks')
+        self.client.wait_finished(channel)
+        self.assertEqual(b''.join(stdout), b'a\nb\n')
+        self.assertRaises(ValueError, self.client.run_command, self.cmd,
+                          output_mode='fake mode')
+
+    def test_read_output_buffer_host_logger(self):
+        from pssh.clients.native.single import host_logger
+        level = host_logger.level
+        try:
+            for _level in (logging.WARNING, logging.INFO):
+                host_logger.setLevel(_level)
+                output = list(self.client.read_output_buffer(
+                    iter([b'line one', b'line two']), prefix='\t[err]'))
+                self.assertEqual(output, ['line one', 'line two'])
+        finally:
+            host_logger.setLevel(level)
+
+    def test_copy_file_block_size(self):
+        local_dir = 'test_dir_block_size'
+        local_file = os.path.join(local_dir, 'test_file_block_size')
+        remote_file = os.path.join(os.path.dirname(__file__),
+                                   'test_file_block_size_copied')
+        data = os.urandom(100000) + b'\n' * 1000
+        os.mkdir(local_dir)
+        with open(local_file, 'wb') as fh:
+            fh.write(data)
+        try:
+            for block_size in (1024, 65536):
+                self.client.copy_file(local_file, remote_file,
+                                      block_size=block_size)
+                with open(remote_file, 'rb') as fh:
+                    self.assertEqual(fh.read(), data)
+                os.unlink(remote_file)
+                self.client.copy_file(local_dir, remote_file, recurse=True,
+                                      concurrency=2, block_size=block_size)
+                with open(os.path.join(
+                        remote_file, 'test_file_block_size'), 'rb') as fh:
+                    self.assertEqual(fh.read(), data)
+                shutil.rmtree(remote_file)
+        finally:
+            shutil.rmtree(local_dir)
+            if os.path.isfile(remote_file):
+                os.unlink(remote_file)
+            elif os.path.isdir(remote_file):
+                shutil.rmtree(remote_file)
+
+    def test_copy_remote_file_block_size(self):
+        remote_file = os.path.join(os.path.dirname(__file__),
+                                   'test_remote_file_block_size')
+        local_file = 'test_remote_file_block_size_copied'
+        data = os.urandom(100000)
+        with open(remote_file, 'wb') as fh:
+            fh.write(data)
+        try:
+            for block_size in (1024, 65536):
+                self.client.copy_remote_file(remote_file, local_file,
+                                             block_size=block_size)
+                with open(local_file, 'rb') as fh:
+                    self.assertEqual(fh.read(), data)
+        finally:
+            os.unlink(remote_file)
+            if os.path.isfile(local_file):
+                os.unlink(local_file)
+
+    def test_copy_file_sync(self):
+        local_file = 'test_file_sync'
+        remote_file = os.path.join(os.path.dirname(__file__),
+                                   'test_file_sync_copied')
+        data = os.urandom(200000)
+        with open(local_file, 'wb') as fh:
+            fh.write(data)
+        try:
+            for src, dst, copy in (
+                    (local_file, remote_file, self.client.copy_file),
+                    (remote_file, local_file + '_2',
+                     self.client.copy_remote_file)):
+                copy(src, dst, sync=True)
+                mtime = int(os.stat(src).st_mtime)
+                self.assertEqual(int(os.stat(dst).st_mtime), mtime)
+                # Up to date destination is not copied again
+                os.utime(dst, (mtime, mtime))
+                with open(dst, 'r+b') as fh:
+                    fh.write(b'a')
+                os.utime(dst, (mtime, mtime))
+                copy(src, dst, sync=True)
+                with open(dst, 'rb') as fh:
+                    self.assertEqual(fh.read(1), b'a')
+                # Smaller destination that is not a partial file is
+                # copied whole
+                with open(dst, 'r+b') as fh:
+                    fh.truncate(150000)
+                copy(src, dst, sync=True)
+                with open(dst, 'rb') as fh:
+                    self.assertEqual(fh.read(), data)
+                # Partial file is resumed and renamed to destination
+                part = dst + '.part'
+                with open(part, 'wb') as fh:
+                    fh.write(b'a' + data[1:150000])
+                copy(src, dst, sync=True)
+                self.assertFalse(os.path.exists(part))
+                with open(dst, 'rb') as fh:
+                    self.assertEqual(fh.read(), b'a' + data[1:])
+                # Partial file that does not match is copied whole
+                with open(part, 'wb') as fh:
+                    fh.write(data[:149999])
+                    fh.write(b'\0' if data[149999:150000] != b'\0'
+                             else b'\1')
+                copy(src, dst, sync=True)
+                self.assertFalse(os.path.exists(part))
+                with open(dst, 'rb') as fh:
+                    self.assertEqual(fh.read(), data)
+        finally:
+            for _file in (local_file, remote_file, local_file + '_2',
+                          remote_file + '.part', local_file + '_2.part'):
+                if os.path.isfile(_file):
+                    os.unlink(_file)
+
+    def test_scp_recv_blocks(self):
+        remote_file = os.path.join(os.path.dirname(__file__),
+                                   'test_file_scp_recv')
+        local_file = 'test_file_scp_recv_copied'
+        data = os.urandom(300000)
+        with open(remote_file, 'wb') as fh:
+            fh.write(data)
+        progress = []
+        try:
+            stats = self.client.scp_recv(
+                remote_file, local_file, block_size=64 * 1024,
+                preallocate=True,
+                progress=lambda *args: progress.append(args))
+            with open(local_file, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+            self.assertEqual(progress[-1],
+                             (self.host, remote_file, len(data), len(data)))
+            self.assertEqual((stats.files, stats.transferred), (1, len(data)))
+        finally:
+            for _file in (local_file, remote_file):
+                if os.path.isfile(_file):
+                    os.unlink(_file)
+
+    def test_scp_send_blocks(self):
+        local_file = 'test_file_scp_send'
+        remote_file = os.path.join(os.path.dirname(__file__),
+                                   'test_file_scp_send_copied')
+        data = os.urandom(300000)
+        with open(local_file, 'wb') as fh:
+            fh.write(data)
+        os.chmod(local_file, 0o640)
+        try:
+            progress = []
+            stats = self.client.scp_send(
+                local_file, remote_file, block_size=64 * 1024,
+                progress=lambda *args: progress.append(args))
+            with open(remote_file, 'rb') as fh:
+                self.assertEqual(fh.read(), data)
+            self.assertEqual(os.stat(remote_file).st_mode & 0o777, 0o640)
+            self.assertEqual(progress[-1],
+                             (self.host, local_file, len(data), len(data)))
+            self.assertEqual((stats.files, stats.transferred),
+                             (1, len(data)))
+        finally:
+            for _file in (local_file, remote_file):
+                if os.path.isfile(_file):
+                    os.unlink(_file)
+
+    def test_copy_file_progress(self):
+        local_dir = 'test_dir_progress'
+        remote_dir = os.path.join(os.path.dirname(__file__),
+                                  'test_dir_progress_copied')
+        local_copy_dir = local_dir + '_2'
+        os.mkdir(local_dir)
+        data = os.urandom(100000)
+        for i in range(3):
+            with open(os.path.join(local_dir, 'file_%s' % i), 'wb') as fh:
+                fh.write(data)
+        try:
+            for args, kwargs, path_dir in (
+                    ((local_dir, remote_dir), {}, local_dir),
+                    ((local_dir, remote_dir), {'sync': True}, local_dir),
+                    ((remote_dir, local_copy_dir), {}, remote_dir)):
+                progress = []
+                copy = self.client.copy_file if path_dir == local_dir \
+                    else self.client.copy_remote_file
+                if kwargs.get('sync'):
+                    shutil.rmtree(remote_dir)
+                stats = copy(*args, recurse=True,
+                             progress=lambda *call: progress.append(call),
+                             **kwargs)
+                self.assertEqual((stats.host, stats.files, stats.transferred),
+                                 (self.host, 3, 3 * len(data)))
+                self.assertTrue(stats.duration > 0)
+                self.assertTrue(stats.rate > 0)
+                completed = sorted(call[1] for call in progress
+                                   if call[2] == call[3])
+                self.assertEqual(completed, [
+                    os.path.join(path_dir, 'file_%s' % i) for i in range(3)])
+            # Up to date files are not counted
+            stats = self.client.copy_file(local_dir, remote_dir, recurse=True,
+                                          sync=True)
+            self.assertEqual((stats.files, stats.transferred), (0, 0))
+        finally:
+            for _dir in (local_dir, remote_dir, local_copy_dir):
+                shutil.rmtree(_dir, ignore_errors=True)
+
     def test_identity_auth_failure(self):
         self.assertRaises(AuthenticationException,
                           SSHClient, self.host, port=self.port, num_retries=1,
@@ -152,3 +391,30 @@ class SSH2ClientTest(SSH2TestCase):
         # Should fail within greenlet timeout, otherwise greenlet will
         # raise timeout which will fail the test
         self.assertRaises(ConnectionErrorException, cmd.get, timeout=1.1)
+
+    def test_connect_addrs(self):
+        listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listen_sock.bind((self.host, 0))
+        listen_sock.listen(1)
+        port = listen_sock.getsockname()[1]
+        closed_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        closed_sock.bind((self.host, 0))
+        closed_port = closed_sock.getsockname()[1]
+        try:
+            # Failed attempt on first address is followed by attempt on next
+            # address without waiting for attempt delay
+            start = time.time()
+            sock = self.client._connect_addrs(
+                [(socket.AF_INET, (self.host, closed_port)),
+                 (socket.AF_INET, (self.host, port))])
+            self.assertTrue(time.time() - start < 0.25)
+            self.assertEqual(sock.getpeername(), (self.host, port))
+            sock.close()
+            self.assertRaises(
+                socket.error, self.client._connect_addrs,
+                [(socket.AF_INET, (self.host, closed_port)),
+                 (socket.AF_INET, (self.host, closed_port))])
+            self.assertRaises(socket.gaierror, self.client._connect_addrs, [])
+        finally:
+            listen_sock.close()
+            closed_sock.close()
@@ -152,6 +152,79 @@ class TunnelTest(unittest.TestCase):
         finally:
             server.stop()
 
+    def test_tunnel_notify(self):
+        in_q, out_q = deque(), deque()
+        tunnel = Tunnel(self.proxy_host, in_q, out_q, port=self.port,
+                        pkey=self.user_key, num_retries=1)
+        tunnel.daemon = True
+        tunnel.start()
+        self.assertTrue(tunnel.tunnel_open.wait(5))
+        in_q.append((self.host, self.port))
+        tunnel.notify_in_q()
+        self.assertTrue(tunnel.out_q_ready.wait(timeout=1))
+        self.assertEqual(len(out_q), 1)
+        key, listen_port = out_q.pop()
+        self.assertEqual(key, (self.host, self.port))
+        self.assertTrue(listen_port > 0)
+
+    def test_tunnel_out_q_direct_consumer(self):
+        in_q, out_q = deque(), deque()
+        tunnel = Tunnel(self.proxy_host, in_q, out_q, port=self.port,
+                        pkey=self.user_key, num_retries=1)
+        tunnel.daemon = True
+        tunnel.start()
+        self.assertTrue(tunnel.tunnel_open.wait(5))
+        # Requests appended to in_q directly are left in out_q by the
+        # dispatcher of request_tunnel results
+        in_q.append((self.host, self.port))
+        tunnel.notify_in_q()
+        result = tunnel.request_tunnel(self.host, self.port + 1)
+        self.assertTrue(result.get(timeout=1) is not None)
+        while len(out_q) == 0:
+            self.assertTrue(tunnel.out_q_ready.wait(timeout=1))
+            tunnel.out_q_ready.clear()
+        sleep(.5)
+        self.assertEqual(len(out_q), 1)
+        key, listen_port = out_q.popleft()
+        self.assertEqual(key, (self.host, self.port))
+        self.assertTrue(listen_port > 0)
+        self.assertTrue(listen_port in tunnel._listen_sockets)
+        self.assertEqual(tunnel._cancelled, {})
+
+    def test_tunnel_request_correlation(self):
+        in_q, out_q = deque(), deque()
+        tunnel = Tunnel(self.proxy_host, in_q, out_q, port=self.port,
+                        pkey=self.user_key, num_retries=1)
+        tunnel.daemon = True
+        tunnel.start()
+        self.assertTrue(tunnel.tunnel_open.wait(5))
+        results = [tunnel.request_tunnel(self.host, port)
+                   for port in (self.port, self.port + 1, self.port)]
+        listen_ports = [result.get(timeout=1) for result in results]
+        self.assertEqual(len(set(listen_ports)), len(listen_ports))
+        self.assertEqual(len(out_q), 0)
+        self.assertEqual(tunnel._port_waiters, {})
+
+    def test_tunnel_cancel_request(self):
+        in_q, out_q = deque(), deque()
+        tunnel = Tunnel(self.proxy_host, in_q, out_q, port=self.port,
+                        pkey=self.user_key, num_retries=1)
+        tunnel.daemon = True
+        tunnel.start()
+        self.assertTrue(tunnel.tunnel_open.wait(5))
+        cancelled = tunnel.request_tunnel(self.host, self.port)
+        tunnel.cancel_request(self.host, self.port, cancelled)
+        self.assertEqual(tunnel._port_waiters, {})
+        # Listen port of cancelled request is closed and does not block
+        # dispatch of listen ports of later requests
+        result = tunnel.request_tunnel(self.host, self.port + 1)
+        self.assertTrue(result.get(timeout=1) is not None)
+        sleep(.5)
+        self.assertFalse(cancelled.ready())
+        self.assertEqual(len(out_q), 0)
+        self.assertEqual(tunnel._cancelled, {})
+        self.assertEqual(list(tunnel._listen_sockets), [result.get()])
+
     def test_tunnel_channel_exc(self):
         remote_host = '127.0.0.69'
         server = OpenSSHServer(listen_ip=remote_host, port=self.port)
@@ -164,7 +237,7 @@ class TunnelTest(unittest.TestCase):
             tunnel_accept = spawn(tunnel._start_tunnel, '127.0.0.255', self.port)
             while len(out_q) == 0:
                 sleep(1)
-            listen_port = out_q.pop()
+            _, listen_port = out_q.pop()
             client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             client_socket.connect(('127.0.0.1', listen_port))
             client = spawn(self._connect_client, client_socket)
@@ -195,7 +268,7 @@ class TunnelTest(unittest.TestCase):
             self.assertIsNotNone(tunnel.client)
             while True:
                 try:
-                    _port = out_q.pop()
+                    _, _port = out_q.pop()
                 except IndexError:
                     sleep(.5)
                 else:
@@ -232,7 +305,7 @@ class TunnelTest(unittest.TestCase):
             self.assertIsNotNone(tunnel.client)
             while True:
                 try:
-                    _port = out_q.pop()
+                    _, _port = out_q.pop()
                 except IndexError:
                     sleep(.5)
                 else:
@@ -22,7 +22,7 @@
 
 
 import unittest
-from pssh.output import HostOutput
+from pssh.output import HostOutput, TransferStats
 
 
 class TestHostOutput(unittest.TestCase):
@@ -61,3 +61,16 @@ class TestHostOutput(unittest.TestCase):
         self.assertEqual(self.output.exit_code, self.output['exit_code'])
         self.assertEqual(exception, self.output.exception)
         self.assertEqual(self.output.exception, self.output['exception'])
+        self.assertIsNone(self.output.encoding)
+        self.assertIsNone(self.output.output_mode)
+        self.assertIsNone(self.output.client)
+
+
+class TestTransferStats(unittest.TestCase):
+
+    def test_rate(self):
+        stats = TransferStats('host', files=2, transferred=3 * 1048576,
+                              duration=1.5)
+        self.assertEqual(stats.rate, 2.0)
+        self.assertTrue(str(stats))
+        self.assertEqual(TransferStats('host').rate, 0.0)
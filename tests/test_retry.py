@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+
+# This file is part of parallel-ssh.
+
+# Copyright (C) 2015- Panos Kittenis
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation, version 2.1.
+
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
+
+
+
+"""Unittests for :mod:`pssh.retry` retry policy and circuit breaker"""
+
+
+import unittest
+from time import sleep
+
+from pssh.retry import RetryPolicy, CircuitBreaker
+from pssh.clients.base_pssh import BaseParallelSSHClient
+from pssh.exceptions import ConnectionErrorException
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_backoff(self):
+        policy = RetryPolicy(retry_delay=1, backoff=2, max_delay=5,
+                             jitter=False)
+        self.assertEqual([policy.delay(attempt) for attempt in range(1, 6)],
+                         [1, 2, 4, 5, 5])
+
+    def test_jitter(self):
+        policy = RetryPolicy(retry_delay=1, backoff=2, max_delay=5)
+        for attempt in range(1, 6):
+            delay = policy.delay(attempt)
+            self.assertTrue(0 <= delay <= min(2 ** (attempt - 1), 5))
+
+    def test_legacy_retry_args_fixed_delay(self):
+        client = BaseParallelSSHClient(['host'], num_retries=5,
+                                       retry_delay=120)
+        policy = client.retry_policy
+        self.assertEqual(policy.num_retries, 5)
+        self.assertEqual([policy.delay(attempt) for attempt in range(1, 6)],
+                         [120] * 5)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+
+    def test_circuit_breaker(self):
+        breaker = CircuitBreaker(failures=2, reset_timeout=.5)
+        host = 'host'
+        breaker.record_failure(host)
+        self.assertFalse(breaker.is_open(host))
+        breaker.record_failure(host)
+        self.assertTrue(breaker.is_open(host))
+        self.assertRaises(ConnectionErrorException, breaker.check, host)
+        self.assertFalse(breaker.is_open('other_host'))
+        sleep(.6)
+        # Checking state does not let attempts through
+        self.assertFalse(breaker.is_open(host))
+        self.assertFalse(breaker.is_open(host))
+        # One attempt allowed after reset timeout, failure opens again
+        self.assertTrue(breaker.allow_request(host))
+        self.assertTrue(breaker.is_open(host))
+        self.assertFalse(breaker.allow_request(host))
+        breaker.record_failure(host)
+        self.assertTrue(breaker.is_open(host))
+        sleep(.6)
+        breaker.check(host)
+        breaker.record_success(host)
+        self.assertFalse(breaker.is_open(host))
+        breaker.record_failure(host)
+        self.assertFalse(breaker.is_open(host))